@@ -8,7 +8,7 @@ from sqlalchemy import desc, or_, and_
 from datetime import datetime, timedelta
 from backend.app.extensions import db
 from backend.models.app_models import Party, PartyMember
-from backend.utils.utils_performance_optimizer import measure_performance, optimize_database_query, cache_query_result
+from backend.utils.utils_performance_optimizer import measure_performance
 from backend.utils.safe_jsonify import safe_jsonify
 
 # 파티 Blueprint 생성
@@ -90,7 +90,6 @@ def create_party():
                     employee_id=attendee['employee_id']
                 )
                 db.session.add(member)
-                new_party.current_members += 1
 
         db.session.commit()
 
@@ -119,86 +118,41 @@ def create_party():
 
 @parties_bp.route('/', methods=['GET'])
 @measure_performance('get_all_parties')
-@cache_query_result('parties_list', ttl=60)  # 1분 캐시
 def get_all_parties():
-    """파티 목록 조회"""
+    """
+    파티 목록 조회 (날짜 범위 단위 페이지)
+
+    Query:
+        date: 조회 시작 날짜 (기본값: 오늘)
+        days: 한 페이지의 날짜 수 (기본 7일, 최대 31일)
+        is_from_match: 지정하면 employee_id 사용자의 랜덤런치 그룹 조회
+    """
     try:
+        from backend.services.party_feed import PartyFeedService
+
         # 개발 환경에서는 인증 우회
         employee_id = request.args.get('employee_id', '1')  # 기본값으로 '1' 사용
-
-        # 프로덕션 환경에서는 인증 확인
-        # if not hasattr(request, 'current_user') or not request.current_user:
-        #     return jsonify({'error': '인증이 필요합니다.'}), 401
-        # employee_id = request.current_user.get('employee_id')
-
         is_from_match = request.args.get('is_from_match')
+        start_date = request.args.get('date') or get_seoul_today().isoformat()
+        days = request.args.get('days', PartyFeedService.DEFAULT_DAYS, type=int)
 
-        # 데이터베이스에서 파티 조회 (최적화된 쿼리)
-        from backend.models.app_models import Party, PartyMember
-
-        print(f"🔍 [get_all_parties] is_from_match: {is_from_match}")
-
-        if is_from_match:
-            # 특정 사용자의 랜덤런치 그룹 조회 (최적화)
-            print("🔍 [get_all_parties] 랜덤런치 그룹 조회 경로")
-            query = Party.query.join(PartyMember).filter(
-                Party.is_from_match == True,
-                PartyMember.employee_id == employee_id
-            ).order_by(desc(Party.id))
-            parties = optimize_database_query(query).all()
-        else:
-            # 일반 파티 조회 (랜덤런치 제외, 최적화)
-            print("🔍 [get_all_parties] 일반 파티 조회 경로")
-            query = Party.query.filter_by(is_from_match=False).order_by(desc(Party.id))
-            parties = optimize_database_query(query).all()
-
-        print(f"🔍 [get_all_parties] 조회된 파티 수: {len(parties)}")
-
-        parties_data = []
-        for party in parties:
-            # 멤버 정보 조회
-            members = PartyMember.query.filter_by(party_id=party.id).all()
-            member_ids = [member.employee_id for member in members]
-
-            # 디버그: 멤버 정보 출력
-            print(f"🔍 [get_all_parties] 파티 ID: {party.id}")
-            print(f"   - 실제 멤버 수: {len(members)}")
-            print(f"   - 멤버 ID 목록: {member_ids}")
-            print(f"   - party.current_members: {party.current_members}")
-            print(f"   - 계산된 멤버 수: {len(members)}")
-
-            # 호스트 정보 조회
-            from models.app_models import User
-            host = User.query.filter_by(employee_id=party.host_employee_id).first()
-            host_info = {
-                'employee_id': host.employee_id if host else party.host_employee_id,
-                'name': getattr(host, 'nickname', f'사용자 {party.host_employee_id}') if host else 'Unknown'
-            } if host else {'employee_id': party.host_employee_id, 'name': 'Unknown'}
-
-            parties_data.append({
-                'id': party.id,
-                'title': party.title,
-                'restaurant_name': party.restaurant_name,
-                'restaurant_address': party.restaurant_address,
-                'meeting_location': party.meeting_location,
-                'current_members': len(members),  # 실제 멤버 수 계산
-                'max_members': party.max_members,
-                'party_date': party.party_date,
-                'party_time': party.party_time,
-                'is_from_match': party.is_from_match,
-                'description': party.description,
-                'host': host_info,
-                'member_count': len(member_ids)
-            })
+        try:
+            if is_from_match:
+                # 특정 사용자의 랜덤런치 그룹 조회
+                page = PartyFeedService.get_member_feed(employee_id, start_date, days, is_from_match=True)
+            else:
+                # 일반 파티 조회 (랜덤런치 제외, 날짜별 캐시)
+                page = PartyFeedService.get_feed(start_date, days)
+        except ValueError:
+            return jsonify({'error': '날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)'}), 400
 
-        # JSON 응답 최적화
         response_data = {
             'success': True,
             'message': '파티 목록 조회 성공',
             'employee_id': employee_id,
             'is_from_match': bool(is_from_match),
-            'total_parties': len(parties_data),
-            'parties': parties_data
+            'total_parties': len(page['parties']),
+            **page
         }
 
         # 안전한 JSON 응답 반환
@@ -356,33 +310,22 @@ def join_party(party_id):
         #     return jsonify({'error': '인증이 필요합니다.'}), 401
         # employee_id = request.current_user.get('employee_id')
 
-        # 데이터베이스에서 파티 조회
-        from backend.models.app_models import Party, PartyMember
+        # 조건부 UPDATE로 좌석을 먼저 확보한 뒤 멤버 추가 (정원 초과/중복 참여 방지)
         from backend.app.extensions import db
+        from backend.services import party_membership
+        from backend.services.party_membership import PartyMembershipService
 
-        party = Party.query.get(party_id)
-        if not party:
+        result = PartyMembershipService.join(party_id, employee_id)
+        if result == party_membership.PARTY_NOT_FOUND:
+            db.session.rollback()
             return jsonify({'error': '파티를 찾을 수 없습니다.'}), 404
-
-        # 이미 참여 중인지 확인
-        existing_member = PartyMember.query.filter_by(
-            party_id=party_id,
-            employee_id=employee_id
-        ).first()
-
-        if existing_member:
+        if result == party_membership.ALREADY_MEMBER:
+            db.session.rollback()
             return jsonify({'error': '이미 참여 중인 파티입니다.'}), 400
-
-        # 파티 인원 확인
-        if party.current_members >= party.max_members:
+        if result == party_membership.PARTY_FULL:
+            db.session.rollback()
             return jsonify({'error': '파티 인원이 가득 찼습니다.'}), 400
 
-        # 멤버 추가
-        member = PartyMember(
-            party_id=party_id,
-            employee_id=employee_id
-        )
-        db.session.add(member)
         db.session.commit()
 
         return jsonify({
@@ -429,7 +372,7 @@ def leave_party(party_id):
         if party.host_employee_id == employee_id and not party.is_from_match:
             return jsonify({'error': '일반 파티의 파티장은 파티를 나갈 수 없습니다. 파티 삭제를 사용해주세요.'}), 400
 
-        # 멤버 제거
+        # 멤버 제거 (매퍼 이벤트에서 인원 카운터 감소)
         db.session.delete(member)
         db.session.commit()
 
@@ -457,37 +400,9 @@ def get_my_parties():
         if not employee_id:
             return jsonify({'error': '사용자 정보를 찾을 수 없습니다.'}), 400
 
-        # 데이터베이스에서 내 파티 조회
-        from backend.models.app_models import Party, PartyMember
-        from backend.app.extensions import db
-
         # 내가 참여한 파티들 (호스트이거나 멤버인 경우)
-        my_parties = Party.query.filter(
-            or_(
-                Party.host_employee_id == employee_id,
-                Party.id.in_(db.session.query(PartyMember.party_id).filter(PartyMember.employee_id == employee_id))
-            )
-        ).all()
-
-        parties_data = []
-        for party in my_parties:
-            # 멤버 정보 조회
-            members = PartyMember.query.filter_by(party_id=party.id).all()
-            member_ids = [member.employee_id for member in members]
-
-            parties_data.append({
-                'id': party.id,
-                'title': party.title,
-                'restaurant_name': party.restaurant_name,
-                'restaurant_address': party.restaurant_address,
-                'party_date': party.party_date,
-                'party_time': party.party_time,
-                'meeting_location': party.meeting_location,
-                'max_members': party.max_members,
-                'current_members': party.current_members,
-                'is_from_match': party.is_from_match,
-                'member_count': len(member_ids)
-            })
+        from backend.services.party_feed import PartyFeedService
+        parties_data = PartyFeedService.get_member_feed(employee_id)['parties']
 
         return jsonify({
             'success': True,
@@ -536,32 +451,14 @@ def get_parties():
     total = parties_query.count()
     parties = parties_query.offset((page - 1) * per_page).limit(per_page).all()
 
+    # 호스트/멤버는 IN 쿼리 한 번씩으로 조회
+    from backend.services.party_feed import PartyFeedService
     parties_data = []
-    for party in parties:
-        # 호스트 정보 (User 모델 없이 간단하게 처리)
-        host_name = f"사용자 {party.host_employee_id}"
-
-        # 멤버 수
-        member_count = PartyMember.query.filter_by(party_id=party.id).count()
-
-        party_info = {
-            "id": party.id,
-            "title": party.title,
-            "restaurant_name": party.restaurant_name,
-            "restaurant_address": party.restaurant_address,
-            "party_date": party.party_date.isoformat() if party.party_date else None,
-            "party_time": party.party_time.isoformat() if party.party_time else None,
-            "meeting_location": party.meeting_location,
-            "max_members": party.max_members,
-            "current_members": member_count + 1,  # 호스트 포함
-            "host": {
-                "employee_id": party.host_employee_id,
-                "name": host_name
-            },
-            "is_from_match": party.is_from_match,
-            "created_at": party.created_at.isoformat() if party.created_at else None
-        }
-        parties_data.append(party_info)
+    for card in PartyFeedService.hydrate(parties):
+        parties_data.append({
+            **card,
+            "current_members": card["member_count"] + 1,  # 호스트 포함
+        })
 
     return jsonify({
         "parties": parties_data,
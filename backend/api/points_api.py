@@ -16,12 +16,22 @@ def earn_points():
         activity_type = data.get('activity_type')
         points = data.get('points', 0)
         description = data.get('description')
+        # 재시도 시 중복 적립 방지 키 (다른 사용자의 키와 겹치지 않도록 사용자별로 구분)
+        client_key = request.headers.get('Idempotency-Key') or data.get('idempotency_key')
+        idempotency_key = f"earn:{user_id}:{client_key}" if client_key else None
 
         if not user_id or not activity_type:
             return jsonify({'error': '필수 파라미터가 누락되었습니다.'}), 400
 
-        # 포인트 획득 처리
-        success = PointsSystem.earn_points(user_id, activity_type, points, description)
+        # 연속 활동 보너스에 쓰는 키까지 길이 확인 (보너스만 조용히 거부되지 않도록)
+        from backend.services.points_ledger import PointsLedgerWriter
+        invalid = PointsLedgerWriter.validate(user_id, activity_type, f"{idempotency_key}:bonus" if idempotency_key else None)
+        if invalid:
+            return jsonify({'error': invalid}), 400
+
+        # 포인트 획득 처리 (연속 활동 확인을 위해 즉시 기록)
+        success = PointsSystem.earn_points(user_id, activity_type, points, description,
+                                           idempotency_key=idempotency_key, wait=True)
 
         if success:
             # 연속 활동 확인 및 추가 포인트 지급
@@ -32,7 +42,8 @@ def earn_points():
                     user_id,
                     f"{activity_type}_consecutive_{consecutive_days}",
                     bonus_points,
-                    f"연속 {consecutive_days}일 {description}"
+                    f"연속 {consecutive_days}일 {description}",
+                    idempotency_key=f"{idempotency_key}:bonus" if idempotency_key else None
                 )
 
             return jsonify({
@@ -117,12 +128,13 @@ def get_user_challenges(user_id):
     try:
         challenges = ChallengeSystem.get_user_challenges(user_id)
 
-        # 각 챌린지의 진행률 및 완료 여부 확인
+        # 각 챌린지의 진행률 및 완료 여부 확인 (기간별 진행 카운터는 한 번만 조회)
+        counts = ChallengeSystem.get_progress_counts(user_id)
         challenge_data = {}
         for challenge_type, challenge_list in challenges.items():
             challenge_data[challenge_type] = []
             for challenge in challenge_list:
-                progress, is_completed = ChallengeSystem.check_challenge_progress(user_id, challenge)
+                progress, is_completed = ChallengeSystem.check_challenge_progress(user_id, challenge, counts)
 
                 challenge_data[challenge_type].append({
                     'id': challenge.challenge_id,
@@ -166,12 +178,17 @@ def complete_challenge(user_id, challenge_id):
         if not is_completed:
             return jsonify({'error': '챌린지 조건을 충족하지 않았습니다.'}), 400
 
-        # 포인트 지급
+        # 포인트 지급 (챌린지 기간당 한 번만 적립)
+        from backend.services.progress_counters import ProgressCounterService
+
+        period = ProgressCounterService.current_period(target_challenge.challenge_type.value)
         success = PointsSystem.earn_points(
             user_id,
             f"challenge_{target_challenge.challenge_type.value}",
             target_challenge.points,
-            f"챌린지 완료: {target_challenge.name}"
+            f"챌린지 완료: {target_challenge.name}",
+            idempotency_key=f"challenge:{challenge_id}:{user_id}:{period}",
+            wait=True
         )
 
         if success:
@@ -292,7 +309,8 @@ def like_review():
             user_id=liker_id,
             activity_type="review_like_given",
             points=5,
-            description="리뷰 좋아요 활동"
+            description="리뷰 좋아요 활동",
+            idempotency_key=f"review_like:{review_id}:{liker_id}:given"
         )
 
         # 리뷰 작성자에게 포인트 지급 (좋아요 받음)
@@ -300,7 +318,8 @@ def like_review():
             user_id=review_author_id,
             activity_type="review_like_received",
             points=10,
-            description="리뷰가 도움이 되었다고 평가받음"
+            description="리뷰가 도움이 되었다고 평가받음",
+            idempotency_key=f"review_like:{review_id}:{liker_id}:received"
         )
 
         if liker_success and author_success:
@@ -8,6 +8,9 @@ from backend.utils.safe_jsonify import safe_jsonify
 from datetime import datetime
 from backend.app.extensions import db
 from backend.models.restaurant_models import RestaurantV2, RestaurantReviewV2, RestaurantVisitV2, RestaurantRecommendV2, RestaurantSavedV2
+from backend.services.geo_index import restaurant_geo_index
+from backend.services.restaurant_counters import RestaurantCounterService
+from backend.services.restaurant_search import restaurant_search_index
 import logging
 import math
 
@@ -27,7 +30,7 @@ def get_restaurants():
     - category: 카테고리 필터
     - lat, lng: 현재 위치 (거리순 정렬용)
     - radius: 검색 반경 (km, 기본값: 5)
-    - sort: 정렬 기준 (distance, rating, name, created_at)
+    - sort: 정렬 기준 (distance, relevance, rating, name, created_at)
     - limit: 페이지 크기 (기본값: 20)
     - offset: 오프셋 (기본값: 0)
     """
@@ -38,65 +41,85 @@ def get_restaurants():
         lat = request.args.get('lat', type=float)
         lng = request.args.get('lng', type=float)
         radius = request.args.get('radius', 5, type=float)
-        sort = request.args.get('sort', 'distance' if lat and lng else 'name')
+        sort = request.args.get('sort', 'distance' if lat and lng else ('relevance' if search else 'name'))
         limit = min(request.args.get('limit', 20, type=int), 100)  # 최대 100개
         offset = request.args.get('offset', 0, type=int)
 
         # 기본 쿼리
         query = RestaurantV2.query.filter(RestaurantV2.is_active == True)
 
-        # 검색 필터
+        # 검색 필터 (n-gram 검색 색인에서 관련도순 ID 조회)
+        ranked_ids = []
         if search:
-            search_filter = f"%{search}%"
-            query = query.filter(
-                db.or_(
-                    RestaurantV2.name.ilike(search_filter),
-                    RestaurantV2.address.ilike(search_filter),
-                    RestaurantV2.category.ilike(search_filter)
-                )
-            )
+            ranked_ids = [restaurant_id for restaurant_id, _ in restaurant_search_index.search(search)]
+            query = query.filter(RestaurantV2.id.in_(ranked_ids))
 
         # 카테고리 필터
         if category:
             query = query.filter(RestaurantV2.category.ilike(f"%{category}%"))
 
-        # 위치 기반 필터링 (선택적)
-        if lat and lng and radius:
-            # 간단한 경계 박스 필터링 (성능 최적화)
-            lat_delta = radius / 111.0  # 대략적인 위도 차이
-            lng_delta = radius / (111.0 * math.cos(math.radians(lat)))  # 경도 차이
-
-            query = query.filter(
-                db.and_(
-                    RestaurantV2.latitude.between(lat - lat_delta, lat + lat_delta),
-                    RestaurantV2.longitude.between(lng - lng_delta, lng + lng_delta)
-                )
-            )
-
         # 정렬
         if sort == 'distance' and lat and lng:
-            # 거리순 정렬은 애플리케이션 레벨에서 처리
-            restaurants = query.all()
-            # 거리 계산 및 정렬
-            for restaurant in restaurants:
-                restaurant.distance = restaurant.calculate_distance(lat, lng)
-            restaurants = [r for r in restaurants if r.distance <= radius]
-            restaurants.sort(key=lambda x: x.distance)
-        elif sort == 'rating':
-            query = query.order_by(RestaurantV2.rating.desc(), RestaurantV2.review_count.desc())
-            restaurants = query.all()
-        elif sort == 'name':
-            query = query.order_by(RestaurantV2.name.asc())
-            restaurants = query.all()
-        elif sort == 'created_at':
-            query = query.order_by(RestaurantV2.created_at.desc())
-            restaurants = query.all()
+            # 거리순 정렬은 위치 인덱스에서 처리하고 현재 페이지만 DB에서 로드
+            candidate_ids = None
+            if search or category:
+                candidate_ids = [row[0] for row in query.with_entities(RestaurantV2.id).all()]
+
+            page, total_count = restaurant_geo_index.query_radius(
+                lat, lng, radius, candidate_ids=candidate_ids, offset=offset, limit=limit
+            )
+            distances = dict(page)
+            restaurant_map = {
+                r.id: r for r in RestaurantV2.query.filter(RestaurantV2.id.in_(distances.keys())).all()
+            } if distances else {}
+            paginated_restaurants = []
+            for restaurant_id, distance in page:
+                restaurant = restaurant_map.get(restaurant_id)
+                if restaurant:
+                    restaurant.distance = distance
+                    paginated_restaurants.append(restaurant)
+        elif sort == 'relevance' and search:
+            # 관련도순 정렬은 검색 색인 순위를 유지하고 현재 페이지만 DB에서 로드
+            if category:
+                allowed_ids = {row[0] for row in query.with_entities(RestaurantV2.id).all()}
+                ranked_ids = [restaurant_id for restaurant_id in ranked_ids if restaurant_id in allowed_ids]
+
+            total_count = len(ranked_ids)
+            page_ids = ranked_ids[offset:offset + limit]
+            restaurant_map = {
+                r.id: r for r in query.filter(RestaurantV2.id.in_(page_ids)).all()
+            } if page_ids else {}
+            paginated_restaurants = [restaurant_map[rid] for rid in page_ids if rid in restaurant_map]
+            if lat and lng:
+                for restaurant in paginated_restaurants:
+                    restaurant.distance = restaurant.calculate_distance(lat, lng)
         else:
-            restaurants = query.all()
+            # 위치 기반 필터링 (선택적)
+            if lat and lng and radius:
+                # 간단한 경계 박스 필터링 (성능 최적화)
+                lat_delta = radius / 111.0  # 대략적인 위도 차이
+                lng_delta = radius / (111.0 * math.cos(math.radians(lat)))  # 경도 차이
+
+                query = query.filter(
+                    db.and_(
+                        RestaurantV2.latitude.between(lat - lat_delta, lat + lat_delta),
+                        RestaurantV2.longitude.between(lng - lng_delta, lng + lng_delta)
+                    )
+                )
+
+            if sort == 'rating':
+                query = query.order_by(RestaurantV2.rating.desc(), RestaurantV2.review_count.desc())
+            elif sort == 'name':
+                query = query.order_by(RestaurantV2.name.asc())
+            elif sort == 'created_at':
+                query = query.order_by(RestaurantV2.created_at.desc())
 
-        # 페이지네이션
-        total_count = len(restaurants)
-        paginated_restaurants = restaurants[offset:offset + limit]
+            # 페이지네이션
+            total_count = query.order_by(None).count()
+            paginated_restaurants = query.offset(offset).limit(limit).all()
+            if lat and lng:
+                for restaurant in paginated_restaurants:
+                    restaurant.distance = restaurant.calculate_distance(lat, lng)
 
         # 응답 데이터 구성
         restaurants_data = []
@@ -105,9 +128,9 @@ def get_restaurants():
             if lat and lng:
                 restaurant_dict['distance'] = restaurant.distance
 
-            # 추천 수와 저장 수 추가
-            restaurant_dict['recommend_count'] = RestaurantRecommendV2.query.filter_by(restaurant_id=restaurant.id).count()
-            restaurant_dict['saved_count'] = RestaurantSavedV2.query.filter_by(restaurant_id=restaurant.id).count()
+            # 추천 수와 저장 수 추가 (비정규화 카운터)
+            restaurant_dict['recommend_count'] = restaurant.recommend_count or 0
+            restaurant_dict['saved_count'] = restaurant.saved_count or 0
 
             restaurants_data.append(restaurant_dict)
 
@@ -214,6 +237,44 @@ def get_categories():
         }), 500
 
 
+@restaurants_v2_bp.route('/autocomplete', methods=['GET'])
+def autocomplete_restaurants():
+    """
+    식당명 자동완성
+    쿼리 파라미터:
+    - q: 입력 중인 검색어 (필수)
+    - limit: 결과 수 (기본값: 10, 최대 20)
+    """
+    try:
+        prefix = request.args.get('q', '').strip()
+        limit = min(request.args.get('limit', 10, type=int), 20)
+
+        if not prefix:
+            return safe_jsonify({
+                'success': False,
+                'error': '검색어가 필요합니다.'
+            }), 400
+
+        suggestions = restaurant_search_index.autocomplete(prefix, limit=limit)
+
+        return safe_jsonify({
+            'success': True,
+            'message': '자동완성 조회 성공',
+            'data': {
+                'query': prefix,
+                'suggestions': suggestions
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Error in autocomplete_restaurants: {e}")
+        return safe_jsonify({
+            'success': False,
+            'error': '자동완성 조회 중 오류가 발생했습니다.',
+            'details': str(e)
+        }), 500
+
+
 @restaurants_v2_bp.route('/nearby', methods=['GET'])
 def get_nearby_restaurants():
     """
@@ -238,29 +299,31 @@ def get_nearby_restaurants():
                 'error': '위도와 경도가 필요합니다.'
             }), 400
 
-        # 기본 쿼리
-        query = RestaurantV2.query.filter(RestaurantV2.is_active == True)
-
-        # 카테고리 필터
+        # 카테고리 필터 (ID만 조회)
+        candidate_ids = None
         if category:
-            query = query.filter(RestaurantV2.category.ilike(f"%{category}%"))
-
-        # 모든 식당 조회 후 거리 계산
-        restaurants = query.all()
-        nearby_restaurants = []
-
-        for restaurant in restaurants:
-            distance = restaurant.calculate_distance(lat, lng)
-            if distance <= radius:
+            candidate_ids = [
+                row[0] for row in db.session.query(RestaurantV2.id).filter(
+                    RestaurantV2.is_active == True,
+                    RestaurantV2.category.ilike(f"%{category}%")
+                ).all()
+            ]
+
+        # 위치 인덱스에서 가까운 순으로 결과 수만큼 조회
+        page, _ = restaurant_geo_index.query_radius(
+            lat, lng, radius, candidate_ids=candidate_ids, limit=limit
+        )
+        restaurant_map = {
+            r.id: r for r in RestaurantV2.query.filter(RestaurantV2.id.in_([rid for rid, _ in page])).all()
+        } if page else {}
+
+        results = []
+        for restaurant_id, distance in page:
+            restaurant = restaurant_map.get(restaurant_id)
+            if restaurant:
                 restaurant_dict = restaurant.to_dict()
                 restaurant_dict['distance'] = distance
-                nearby_restaurants.append(restaurant_dict)
-
-        # 거리순 정렬
-        nearby_restaurants.sort(key=lambda x: x['distance'])
-
-        # 결과 제한
-        results = nearby_restaurants[:limit]
+                results.append(restaurant_dict)
 
         return safe_jsonify({
             'success': True,
@@ -487,6 +550,7 @@ def toggle_restaurant_recommend(restaurant_id):
         if existing_recommend:
             # 추천 취소
             db.session.delete(existing_recommend)
+            RestaurantCounterService.increment(restaurant_id, 'recommend_count', -1)
             action = 'cancelled'
             message = '오찬추천이 취소되었습니다.'
         else:
@@ -496,13 +560,14 @@ def toggle_restaurant_recommend(restaurant_id):
                 user_id=user_id
             )
             db.session.add(recommend)
+            RestaurantCounterService.increment(restaurant_id, 'recommend_count', 1)
             action = 'added'
             message = '오찬추천이 등록되었습니다!'
 
         db.session.commit()
 
-        # 추천 수 계산
-        recommend_count = RestaurantRecommendV2.query.filter_by(restaurant_id=restaurant_id).count()
+        # 추천 수 조회
+        recommend_count = RestaurantCounterService.get_counts(restaurant_id)['recommend_count']
 
         return safe_jsonify({
             'success': True,
@@ -549,6 +614,7 @@ def toggle_restaurant_save(restaurant_id):
         if existing_save:
             # 저장 해제
             db.session.delete(existing_save)
+            RestaurantCounterService.increment(restaurant_id, 'saved_count', -1)
             action = 'removed'
             message = '저장이 해제되었습니다.'
         else:
@@ -558,13 +624,14 @@ def toggle_restaurant_save(restaurant_id):
                 user_id=user_id
             )
             db.session.add(saved)
+            RestaurantCounterService.increment(restaurant_id, 'saved_count', 1)
             action = 'saved'
             message = '식당이 저장되었습니다!'
 
         db.session.commit()
 
-        # 저장 수 계산
-        saved_count = RestaurantSavedV2.query.filter_by(restaurant_id=restaurant_id).count()
+        # 저장 수 조회
+        saved_count = RestaurantCounterService.get_counts(restaurant_id)['saved_count']
 
         return safe_jsonify({
             'success': True,
@@ -607,7 +674,7 @@ def get_restaurant_recommend_status(restaurant_id):
         ).first() is not None
 
         # 전체 추천 수
-        recommend_count = RestaurantRecommendV2.query.filter_by(restaurant_id=restaurant_id).count()
+        recommend_count = restaurant.recommend_count or 0
 
         return safe_jsonify({
             'success': True,
@@ -650,7 +717,7 @@ def get_restaurant_save_status(restaurant_id):
         ).first() is not None
 
         # 전체 저장 수
-        saved_count = RestaurantSavedV2.query.filter_by(restaurant_id=restaurant_id).count()
+        saved_count = restaurant.saved_count or 0
 
         return safe_jsonify({
             'success': True,
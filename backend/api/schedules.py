@@ -9,11 +9,11 @@ import logging
 
 # 지연 import로 순환 참조 방지
 def get_schedule_service():
-    from services.schedule_service import ScheduleService
+    from backend.services.schedule_service import ScheduleService
     return ScheduleService
 
 def get_schedule_models():
-    from models.schedule_models import PersonalSchedule, ScheduleException
+    from backend.models.schedule_models import PersonalSchedule, ScheduleException
     return PersonalSchedule, ScheduleException
 
 def get_db():
@@ -55,17 +55,13 @@ def get_schedules():
                 'format': 'YYYY-MM-DD'
             }), 400
 
-        # 일정 조회
-        ScheduleService = get_schedule_service()
-        schedules = ScheduleService.get_schedules_for_period(
-            employee_id=employee_id,
-            start_date=start_date,
-            end_date=end_date
-        )
+        # 일정 조회 (사용자/월 단위 캐시, 변경이 없으면 304)
+        from backend.services.calendar_cache import CalendarCacheService
+        schedules, etag = CalendarCacheService.get_range(employee_id, start_date, end_date)
 
         logger.info(f"일정 조회 성공: {employee_id}, {start_date} ~ {end_date}")
 
-        return jsonify({
+        response = jsonify({
             'success': True,
             'data': schedules,
             'period': {
@@ -74,6 +70,9 @@ def get_schedules():
             },
             'total_dates': len(schedules)
         })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response.make_conditional(request)
 
     except Exception as e:
         logger.error(f"일정 조회 중 오류 발생: {e}")
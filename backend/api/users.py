@@ -119,113 +119,10 @@ def get_user_activity_stats():
         # 기간 파라미터 (기본값: month)
         period = request.args.get('period', 'month')
 
-        # 데이터베이스에서 통계 데이터 조회
-        from backend.models.app_models import Party, PartyMember
-        from backend.models.restaurant_models import RestaurantVisitV2, RestaurantReviewV2
-        from backend.models.schedule_models import PersonalSchedule
-        from datetime import datetime, timedelta
-        from sqlalchemy import and_
-
-        # 기간 설정
-        end_date = datetime.now()
-        if period == 'week':
-            start_date = end_date - timedelta(days=7)
-        elif period == 'month':
-            start_date = end_date - timedelta(days=30)
-        elif period == 'year':
-            start_date = end_date - timedelta(days=365)
-        else:
-            start_date = end_date - timedelta(days=30)
-
-        # 1. 총 활동 수
-        total_activities = 0
-
-        # 2. 리뷰 작성 수
-        reviews_written = RestaurantReviewV2.query.filter(
-            and_(
-                RestaurantReviewV2.user_id == employee_id,
-                RestaurantReviewV2.created_at >= start_date
-            )
-        ).count()
-        total_activities += reviews_written
-
-        # 3. 파티 참여 수 (호스트 + 멤버)
-        parties_hosted = Party.query.filter(
-            and_(
-                Party.host_employee_id == employee_id,
-                Party.created_at >= start_date
-            )
-        ).count()
-
-        parties_joined = PartyMember.query.join(Party).filter(
-            and_(
-                PartyMember.employee_id == employee_id,
-                Party.created_at >= start_date
-            )
-        ).count()
-
-        parties_joined_total = parties_hosted + parties_joined
-        total_activities += parties_joined_total
-
-        # 4. 랜덤런치 수 (랜덤런치 관련 파티)
-        random_lunches = Party.query.filter(
-            and_(
-                Party.host_employee_id == employee_id,
-                Party.is_from_match == True,
-                Party.created_at >= start_date
-            )
-        ).count()
-
-        # 5. 개인 약속 수
-        personal_schedules = PersonalSchedule.query.filter(
-            and_(
-                PersonalSchedule.employee_id == employee_id,
-                PersonalSchedule.created_at >= start_date
-            )
-        ).count()
-        total_activities += personal_schedules
-
-        # 6. 약속 타입별 분석
-        appointment_type_breakdown = {
-            '랜덤런치': random_lunches,
-            '파티 참여': parties_joined,
-            '개인 약속': personal_schedules,
-            '단골파티': parties_hosted,
-            '기타': 0
-        }
-
-        # 7. 카테고리별 분석 (식당 방문 기록 기반)
-        category_breakdown = {}
-        visits = RestaurantVisitV2.query.filter(
-            and_(
-                RestaurantVisitV2.user_id == employee_id,
-                RestaurantVisitV2.visit_date >= start_date.date()
-            )
-        ).all()
-
-        for visit in visits:
-            # 식당 정보에서 카테고리 가져오기
-            from models.restaurant_models import RestaurantV2
-            restaurant = RestaurantV2.query.get(visit.restaurant_id)
-            if restaurant and restaurant.category:
-                category = restaurant.category
-                category_breakdown[category] = category_breakdown.get(category, 0) + 1
-
-        # 8. 선호 카테고리
-        favorite_category = max(category_breakdown.items(), key=lambda x: x[1])[0] if category_breakdown else '한식'
-
-        stats = {
-            'total_activities': total_activities,
-            'reviews_written': reviews_written,
-            'parties_joined': parties_joined_total,
-            'random_lunches': random_lunches,
-            'favorite_category': favorite_category,
-            'appointment_type_breakdown': appointment_type_breakdown,
-            'category_breakdown': category_breakdown,
-            'period': period,
-            'start_date': start_date.isoformat(),
-            'end_date': end_date.isoformat()
-        }
+        # 집계 엔진에서 조회 (사용자/기간 단위 캐시, 새 활동은 증분 반영)
+        from backend.services.activity_stats import ActivityStatsService
+
+        stats = ActivityStatsService.get_activity_stats(employee_id, period)
 
         return jsonify({
             'success': True,
@@ -249,108 +146,23 @@ def get_user_dashboard():
         if not employee_id:
             return jsonify({'error': '사용자 정보를 찾을 수 없습니다.'}), 400
 
-        # 데이터베이스에서 대시보드 데이터 조회
-        from backend.models.app_models import Party, PartyMember
-        from backend.models.restaurant_models import RestaurantVisitV2, RestaurantReviewV2
-        from datetime import datetime, timedelta
-        from sqlalchemy import func, and_
-
-        # 1. 총 런치 수 (식당 방문 기록)
-        total_lunches = RestaurantVisitV2.query.filter(
-            RestaurantVisitV2.user_id == employee_id
-        ).count()
-
-        # 2. 총 파티 수
-        parties_hosted = Party.query.filter(
-            Party.host_employee_id == employee_id
-        ).count()
-
-        parties_joined = PartyMember.query.filter(
-            PartyMember.employee_id == employee_id
-        ).count()
-
-        total_parties = parties_hosted + parties_joined
-
-        # 3. 총 리뷰 수
-        total_reviews = RestaurantReviewV2.query.filter(
-            RestaurantReviewV2.user_id == employee_id
-        ).count()
-
-        # 4. 선호 카테고리
-        visits = RestaurantVisitV2.query.filter(
-            RestaurantVisitV2.user_id == employee_id
-        ).all()
-
-        category_count = {}
-        for visit in visits:
-            from models.restaurant_models import RestaurantV2
-            restaurant = RestaurantV2.query.get(visit.restaurant_id)
-            if restaurant and restaurant.category:
-                category = restaurant.category
-                category_count[category] = category_count.get(category, 0) + 1
-
-        favorite_category = max(category_count.items(), key=lambda x: x[1])[0] if category_count else '한식'
-
-        # 5. 주간 목표 및 진행률
-        weekly_goal = 3  # 기본 주간 목표
-        week_start = datetime.now() - timedelta(days=datetime.now().weekday())
-        week_visits = RestaurantVisitV2.query.filter(
-            and_(
-                RestaurantVisitV2.user_id == employee_id,
-                RestaurantVisitV2.visit_date >= week_start.date()
-            )
-        ).count()
-
-        weekly_progress = min(week_visits, weekly_goal)
-
-        # 6. 연속 활동 일수 (스트릭)
-        streak = 0
-        current_date = datetime.now().date()
-
-        for i in range(30):  # 최대 30일 체크
-            check_date = current_date - timedelta(days=i)
-            has_activity = (
-                RestaurantVisitV2.query.filter(
-                    and_(
-                        RestaurantVisitV2.user_id == employee_id,
-                        RestaurantVisitV2.visit_date == check_date
-                    )
-                ).first() is not None or
-                Party.query.filter(
-                    and_(
-                        Party.host_employee_id == employee_id,
-                        func.date(Party.party_date) == check_date
-                    )
-                ).first() is not None
-            )
-
-            if has_activity:
-                streak += 1
-            else:
-                break
-
-        # 7. 랭킹 (전체 사용자 중 포인트 기준)
-        from backend.auth.models import User
-        user = User.query.filter_by(employee_id=employee_id).first()
-        user_points = user.total_points if user else 0
-
-        # 포인트가 더 높은 사용자 수
-        higher_points_users = User.query.filter(User.total_points > user_points).count()
-        total_users = User.query.count()
-        rank = higher_points_users + 1 if total_users > 0 else 1
-
-        dashboard_data = {
-            'total_lunches': total_lunches,
-            'total_parties': total_parties,
-            'total_reviews': total_reviews,
-            'favorite_category': favorite_category,
-            'weekly_goal': weekly_goal,
-            'weekly_progress': weekly_progress,
-            'streak': streak,
+        # 활동 통계 (집계 엔진에서 조회, 사용자 단위 캐시)
+        from backend.services.activity_stats import ActivityStatsService
+
+        dashboard_data = ActivityStatsService.get_dashboard_stats(employee_id)
+
+        # 랭킹 (전체 사용자 중 포인트 기준, 정렬된 리더보드에서 조회)
+        from backend.services.leaderboard import leaderboard
+        standing = leaderboard.rank(employee_id)
+        user_points = standing['score']
+        total_users = standing['total']
+        rank = standing['rank']
+
+        dashboard_data.update({
             'rank': rank,
             'total_users': total_users,
             'user_points': user_points
-        }
+        })
 
         return jsonify({
             'success': True,
@@ -534,6 +346,41 @@ def get_user_points():
         print(f"Error in get_user_points: {e}")
         return jsonify({'error': '포인트 정보 조회 중 오류가 발생했습니다.', 'details': str(e)}), 500
 
+@api_users_bp.route('/leaderboard', methods=['GET'])
+def get_leaderboard():
+    """포인트 리더보드 조회 (board: all_time/weekly/daily)"""
+    try:
+        # 인증 확인
+        if not hasattr(request, 'current_user') or not request.current_user:
+            return jsonify({'error': '인증이 필요합니다.'}), 401
+
+        employee_id = getattr(request.current_user, 'employee_id', None)
+        if not employee_id:
+            return jsonify({'error': '사용자 정보를 찾을 수 없습니다.'}), 400
+
+        from backend.services.leaderboard import BOARDS, leaderboard
+
+        board = request.args.get('board', 'all_time')
+        if board not in BOARDS:
+            return jsonify({'error': f"board는 {', '.join(BOARDS)} 중 하나여야 합니다."}), 400
+        limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
+        radius = min(max(request.args.get('radius', 2, type=int), 0), 10)
+
+        return jsonify({
+            'success': True,
+            'message': '리더보드 조회 성공',
+            'data': {
+                'board': board,
+                'top': leaderboard.top(limit, board),
+                'me': leaderboard.rank(employee_id, board),
+                'around_me': leaderboard.around(employee_id, radius, board)
+            }
+        })
+
+    except Exception as e:
+        print(f"Error in get_leaderboard: {e}")
+        return jsonify({'error': '리더보드 조회 중 오류가 발생했습니다.', 'details': str(e)}), 500
+
 @api_users_bp.route('/badges', methods=['GET'])
 def get_user_badges():
     """사용자 배지 목록 조회"""
@@ -10,7 +10,6 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_cors import CORS
-from flask_socketio import SocketIO
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -34,7 +33,10 @@ app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'jwt-secret-key'
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
 CORS(app, origins=os.environ.get('ALLOWED_ORIGINS', '*').split(','))
-socketio = SocketIO(app, cors_allowed_origins=os.environ.get('ALLOWED_ORIGINS', '*').split(','))
+
+# 실시간 통신 (eventlet 워커, 워커 간 Redis 메시지 큐, 접속 현황)
+from backend.app.realtime_system import setup_realtime_communication, socketio
+setup_realtime_communication(app)
 
 # 기존 라우트들 등록 (호환성 유지)
 try:
@@ -231,6 +231,118 @@ def create_app(config_name=None):
     except ImportError as e:
         print(f"[WARNING] 데이터베이스 초기화 실패: {e}")
 
+    # 식당 위치 인덱스 설정
+    try:
+        from backend.services.geo_index import setup_geo_index
+        setup_geo_index(app)
+        print("[SUCCESS] 식당 위치 인덱스가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 식당 위치 인덱스 설정 실패: {e}")
+
+    # 식당 검색 색인 설정
+    try:
+        from backend.services.restaurant_search import setup_search_index
+        setup_search_index(app)
+        print("[SUCCESS] 식당 검색 색인이 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 식당 검색 색인 설정 실패: {e}")
+
+    # 채팅 읽지 않은 메시지 카운터 설정
+    try:
+        from backend.services.chat_unread import setup_chat_unread
+        setup_chat_unread(app)
+        print("[SUCCESS] 채팅 읽지 않은 메시지 카운터가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 채팅 읽지 않은 메시지 카운터 설정 실패: {e}")
+
+    # 채팅방 목록(inbox) 설정
+    try:
+        from backend.services.chat_inbox import setup_chat_inbox
+        setup_chat_inbox(app)
+        print("[SUCCESS] 채팅방 목록 비정규화가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 채팅방 목록 설정 실패: {e}")
+
+    # 사용자 호환성 엔진 설정
+    try:
+        from backend.services.compatibility import setup_compatibility_engine
+        setup_compatibility_engine(app)
+        print("[SUCCESS] 사용자 호환성 엔진이 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 사용자 호환성 엔진 설정 실패: {e}")
+
+    # 날짜별 참여 가능 사용자 캐시 설정
+    try:
+        from backend.services.availability import setup_availability
+        setup_availability(app)
+        print("[SUCCESS] 참여 가능 사용자 캐시가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 참여 가능 사용자 캐시 설정 실패: {e}")
+
+    # 파티 목록 조회 모델 설정
+    try:
+        from backend.services.party_feed import setup_party_feed
+        setup_party_feed(app)
+        print("[SUCCESS] 파티 목록 조회 모델이 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 파티 목록 조회 모델 설정 실패: {e}")
+
+    # 파티 좌석 카운터 설정
+    try:
+        from backend.services.party_membership import setup_party_membership
+        setup_party_membership(app)
+        print("[SUCCESS] 파티 좌석 카운터가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 파티 좌석 카운터 설정 실패: {e}")
+
+    # 반복 일정 구체화 설정
+    try:
+        from backend.services.schedule_materializer import setup_schedule_materializer
+        setup_schedule_materializer(app)
+        print("[SUCCESS] 반복 일정 구체화가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 반복 일정 구체화 설정 실패: {e}")
+
+    # 캘린더 응답 캐시 설정
+    try:
+        from backend.services.calendar_cache import setup_calendar_cache
+        setup_calendar_cache(app)
+        print("[SUCCESS] 캘린더 응답 캐시가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 캘린더 응답 캐시 설정 실패: {e}")
+
+    # 인증 토큰 캐시 설정
+    try:
+        from backend.auth.token_cache import setup_token_cache
+        setup_token_cache(app)
+        print("[SUCCESS] 인증 토큰 캐시가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 인증 토큰 캐시 설정 실패: {e}")
+
+    # 사용자 활동 통계 캐시 설정
+    try:
+        from backend.services.activity_stats import setup_activity_stats
+        setup_activity_stats(app)
+        print("[SUCCESS] 사용자 활동 통계 캐시가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 사용자 활동 통계 캐시 설정 실패: {e}")
+
+    # 포인트 원장 기록기 설정
+    try:
+        from backend.services.points_ledger import setup_points_ledger
+        setup_points_ledger(app)
+        print("[SUCCESS] 포인트 원장 기록기가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 포인트 원장 기록기 설정 실패: {e}")
+
+    # 이미지 변형 생성기 설정
+    try:
+        from backend.services.image_variants import setup_image_variants
+        setup_image_variants(app)
+        print("[SUCCESS] 이미지 변형 생성기가 성공적으로 설정되었습니다.")
+    except ImportError as e:
+        print(f"[WARNING] 이미지 변형 생성기 설정 실패: {e}")
+
     # 포인트 시스템 설정
     try:
         from backend.app.points_system import setup_points_system
@@ -315,7 +427,7 @@ if __name__ == "__main__":
         from backend.app.realtime_system import socketio
         if socketio:
             # Socket.IO와 함께 실행
-            socketio.run(app, host="0.0.0.0", port=5000, debug=True)
+            socketio.run(app, host="0.0.0.0", port=5000, debug=True, allow_unsafe_werkzeug=True)
         else:
             # 일반 Flask로 실행
             app.run(debug=True, host="0.0.0.0", port=5000)
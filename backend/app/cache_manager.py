@@ -220,6 +220,60 @@ def get_cached_party_list(party_type: str) -> Any | None:
     key = f"parties:{party_type}"
     return cache_manager.get_cache(key)
 
+def invalidate_party_list(*party_types: str) -> int:
+    """파티 목록 캐시 무효화"""
+    return sum(cache_manager.delete_cache(f"parties:{party_type}") for party_type in party_types)
+
+def cache_calendar_month(employee_id: str, month: str, data: Any, expire_seconds: int = 600):
+    """사용자 월별 캘린더 캐싱"""
+    key = f"calendar:{employee_id}:{month}"
+    return cache_manager.set_cache(key, data, expire_seconds)
+
+def get_cached_calendar_month(employee_id: str, month: str) -> Any | None:
+    """사용자 월별 캘린더 캐시 조회"""
+    key = f"calendar:{employee_id}:{month}"
+    return cache_manager.get_cache(key)
+
+def set_calendar_version(employee_id: str, version: str, expire_seconds: int = 86400 * 7):
+    """사용자 캘린더 버전 저장 (버전이 바뀌면 모든 월 캐시가 무효)"""
+    return cache_manager.set_cache(f"calendar_version:{employee_id}", version, expire_seconds)
+
+def get_calendar_version(employee_id: str) -> Any | None:
+    """사용자 캘린더 버전 조회"""
+    return cache_manager.get_cache(f"calendar_version:{employee_id}")
+
+def invalidate_calendar_versions(*employee_ids: str) -> int:
+    """사용자 캘린더 캐시 무효화"""
+    return sum(cache_manager.delete_cache(f"calendar_version:{employee_id}") for employee_id in employee_ids)
+
+def cache_activity_stats(employee_id: str, period: str, data: Any, expire_seconds: int = 900):
+    """사용자 기간별 활동 통계 캐싱"""
+    key = f"activity_stats:{employee_id}:{period}"
+    return cache_manager.set_cache(key, data, expire_seconds)
+
+def get_cached_activity_stats(employee_id: str, period: str) -> Any | None:
+    """사용자 기간별 활동 통계 캐시 조회"""
+    key = f"activity_stats:{employee_id}:{period}"
+    return cache_manager.get_cache(key)
+
+def invalidate_activity_stats(employee_id: str, *periods: str) -> int:
+    """사용자 활동 통계 캐시 무효화"""
+    return sum(cache_manager.delete_cache(f"activity_stats:{employee_id}:{period}") for period in periods)
+
+def cache_attachment_meta(attachment_id: int, data: Any, expire_seconds: int = 3600):
+    """첨부파일 메타데이터 캐싱 (파일 서빙 시 DB 조회 생략)"""
+    key = f"attachment:{attachment_id}"
+    return cache_manager.set_cache(key, data, expire_seconds)
+
+def get_cached_attachment_meta(attachment_id: int) -> Any | None:
+    """첨부파일 메타데이터 캐시 조회"""
+    key = f"attachment:{attachment_id}"
+    return cache_manager.get_cache(key)
+
+def invalidate_attachment_meta(*attachment_ids: int) -> int:
+    """첨부파일 메타데이터 캐시 무효화"""
+    return sum(cache_manager.delete_cache(f"attachment:{attachment_id}") for attachment_id in attachment_ids)
+
 def cache_recommendations(date: str, data: Any, expire_seconds: int = 3600):
     """추천 데이터 캐싱"""
     key = f"recommendations:{date}"
@@ -48,6 +48,11 @@ def create_celery(app):
 
     celery.Task = FlaskTask
 
+    # 요청 밖에서 실행할 태스크 등록 (이름으로 send_task 호출)
+    celery.task(name='celery_config.send_bulk_notification_task')(send_bulk_notification_task)
+    celery.task(name='celery_config.generate_image_variants_task')(generate_image_variants_task)
+
+    app.extensions['celery'] = celery
     return celery
 
 # 주기적 작업 스케줄링
@@ -70,11 +75,11 @@ def setup_periodic_tasks(celery_app):
             name='daily-recommendation-cache'
         )
 
-        # 매주 일요일 새벽 3시에 만료 데이터 정리
+        # 매일 새벽 3시에 만료 데이터 정리 (보존 정책별 묶음 삭제 - 매일 조금씩)
         sender.add_periodic_task(
-            crontab(day_of_week=0, hour=3, minute=0),
+            crontab(hour=3, minute=0),
             cleanup_expired_data_task,
-            name='weekly-data-cleanup'
+            name='daily-data-cleanup'
         )
 
         # 매일 오전 9시에 점심 추천 알림 준비
@@ -98,6 +103,20 @@ def setup_periodic_tasks(celery_app):
             name='daily-points-settlement'
         )
 
+        # 매일 새벽 4시에 식당 추천/저장 카운터 보정
+        sender.add_periodic_task(
+            crontab(hour=4, minute=0),
+            reconcile_restaurant_counters_task,
+            name='daily-restaurant-counter-reconcile'
+        )
+
+        # 매일 새벽 3시 30분에 반복 일정 구체화 범위 연장
+        sender.add_periodic_task(
+            crontab(hour=3, minute=30),
+            extend_schedule_horizon_task,
+            name='daily-schedule-materialization'
+        )
+
 # 백그라운드 작업 태스크들
 def generate_daily_recommendations_task():
     """매일 자정에 일일 추천 생성 (APScheduler 대체)"""
@@ -111,18 +130,18 @@ def generate_daily_recommendations_task():
 def generate_recommendation_cache_task():
     """추천 그룹 캐시 생성을 백그라운드에서 처리"""
     try:
-        from backend.services.recommendation_service import generate_recommendation_cache
+        from backend.utils.recommendation_utils import generate_recommendation_cache
         result = generate_recommendation_cache()
         return f"추천 캐시 생성 완료: {result}"
     except Exception as e:
         return f"추천 캐시 생성 실패: {e}"
 
 def cleanup_expired_data_task():
-    """만료된 데이터 정리"""
+    """만료된 데이터 정리 (알림, 검색 인덱스, 무효화 토큰, 임시 업로드)"""
     try:
-        from backend.services.maintenance_service import cleanup_expired_data
-        result = cleanup_expired_data()
-        return f"데이터 정리 완료: {result}"
+        from backend.services.retention import run_retention
+        result = run_retention()
+        return f"데이터 정리 완료: {result['rows']}개 삭제, {result['bytes']}바이트 회수"
     except Exception as e:
         return f"데이터 정리 실패: {e}"
 
@@ -153,6 +172,44 @@ def daily_points_settlement_task():
     except Exception as e:
         return f"포인트 정산 실패: {e}"
 
+def reconcile_restaurant_counters_task():
+    """식당 추천/저장 카운터 보정"""
+    try:
+        from backend.services.restaurant_counters import reconcile_restaurant_counters
+        result = reconcile_restaurant_counters()
+        return f"식당 카운터 보정 완료: {result}"
+    except Exception as e:
+        return f"식당 카운터 보정 실패: {e}"
+
+def extend_schedule_horizon_task():
+    """반복 일정 구체화 범위 연장"""
+    try:
+        from backend.services.schedule_materializer import extend_schedule_horizon
+        result = extend_schedule_horizon()
+        return f"반복 일정 구체화 완료: {result}"
+    except Exception as e:
+        return f"반복 일정 구체화 실패: {e}"
+
+def send_bulk_notification_task(user_ids, notification_type, title, message, **kwargs):
+    """대량 알림 전송 (설정 조회, INSERT, 커밋, 실시간 전송을 한 번씩)"""
+    try:
+        from backend.utils.notification_manager import notification_manager
+        success, result = notification_manager.send_bulk_notification(
+            user_ids, notification_type, title, message, **kwargs
+        )
+        return result if success else f"대량 알림 전송 실패: {result}"
+    except Exception as e:
+        return f"대량 알림 전송 실패: {e}"
+
+def generate_image_variants_task(content_hash, source_path, variants_folder):
+    """이미지 변형(썸네일, 중간 크기, WebP) 생성"""
+    try:
+        from backend.services.image_variants import image_variants
+        ready = image_variants.process(content_hash, source_path, variants_folder)
+        return f"이미지 변형 생성 {'완료' if ready else '실패'}: {content_hash}"
+    except Exception as e:
+        return f"이미지 변형 생성 실패: {e}"
+
 # 개발 환경용 즉시 실행 태스크
 def test_celery_connection():
     """Celery 연결 테스트"""
@@ -3,7 +3,6 @@
 개발/프로덕션 환경에서 공통으로 사용하는 그룹 생성 및 점수 계산 로직
 """
 
-import random
 from datetime import datetime
 
 def calculate_group_score(members, users_data, date):
@@ -61,37 +60,36 @@ def calculate_group_score(members, users_data, date):
 
     return score
 
+def _group_data(group_members, score, target_date, group_idx):
+    group_size = len(group_members)
+    return {
+        'id': f'group_{target_date}_{group_idx}',
+        'date': target_date,
+        'members': group_members,
+        'status': 'matched',
+        'created_at': datetime.now().isoformat(),
+        'score': score,
+        'max_members': group_size + 1,  # 현재 사용자 포함 가능
+        'current_members': group_size
+    }
+
+def partition_groups(available_users, target_date, seed=None, time_limit=10.0):
+    """참여 가능한 사용자 전체를 2-4명 그룹으로 편성 (그룹 점수 총합 최대화)"""
+    from backend.services.group_formation import form_groups
+
+    result = form_groups(available_users, target_date, seed=seed, time_limit=time_limit)
+    return [
+        _group_data(group_members, score, target_date, group_idx)
+        for group_idx, (group_members, score) in enumerate(zip(result['groups'], result['group_scores'], strict=True))
+    ]
+
 def generate_groups(available_users, target_date, current_user_id, num_groups=10):
-    """그룹 생성 공통 로직"""
-    groups = []
-
-    for group_idx in range(num_groups):
-        # 그룹 크기 (2-4명, 3명이 최적)
-        group_size = random.choices([2, 3, 4], weights=[0.2, 0.6, 0.2])[0]
-
-        # 사용 가능한 유저에서 그룹 크기만큼 선택
-        available_user_ids = list(available_users.keys())
-        if len(available_user_ids) >= group_size:
-            group_members = random.sample(available_user_ids, group_size)
-
-            # 그룹 점수 계산
-            score = calculate_group_score(group_members, available_users, target_date)
-
-            group_data = {
-                'id': f'group_{target_date}_{group_idx}',
-                'date': target_date,
-                'members': group_members,
-                'status': 'matched',
-                'created_at': datetime.now().isoformat(),
-                'score': score,
-                'max_members': group_size + 1,  # 현재 사용자 포함 가능
-                'current_members': group_size
-            }
-            groups.append(group_data)
-
-    # 점수 순으로 정렬
-    groups.sort(key=lambda x: x['score'], reverse=True)
-
-    return groups
+    """그룹 생성 공통 로직 (전체 편성 결과 중 점수 상위 그룹, 점수 순 정렬)"""
+    if len(available_users) < 2:
+        return []
+
+    # 같은 날짜에는 같은 편성 결과를 반환
+    seed = int(target_date.replace('-', ''))
+    return partition_groups(available_users, target_date, seed=seed)[:num_groups]
 
 # 가상 사용자 데이터 함수들 제거 - 실제 데이터베이스만 사용
@@ -1,11 +1,73 @@
 """
 실시간 통신 시스템
+Flask-SocketIO 서버를 앱에 연결하고 알림/채팅 이벤트 핸들러를 등록합니다.
+  - 비동기 모드: eventlet으로 monkey patch된 프로세스(gunicorn eventlet 워커)면 eventlet, 아니면 threading
+  - 메시지 큐(Redis pub/sub)로 워커 간 팬아웃 (backend.realtime.fanout)
+  - 접속 현황은 모든 워커가 공유하는 레지스트리에 기록 (backend.realtime.presence)
 """
 
+import logging
+import os
+import sys
+
+from backend.realtime.fanout import CHANNEL, message_queue_url, socketio
+
+logger = logging.getLogger(__name__)
+
+_heartbeat_started = False
+
+
+def resolve_async_mode(app=None) -> str:
+    """Socket.IO 비동기 모드 (설정값 > eventlet monkey patch 여부 > threading)"""
+    mode = (app.config.get('SOCKETIO_ASYNC_MODE') if app is not None else None) or os.getenv('SOCKETIO_ASYNC_MODE')
+    if mode:
+        return mode
+    # monkey patch된 프로세스라면 eventlet은 이미 import되어 있음
+    if 'eventlet' in sys.modules:
+        from eventlet.patcher import is_monkey_patched
+
+        if is_monkey_patched('socket'):
+            return 'eventlet'
+    return 'threading'
+
+
 def setup_realtime_communication(app):
     """실시간 통신 시스템 설정"""
-    print("[SUCCESS] 실시간 통신 시스템이 설정되었습니다.")
-    return True
+    global _heartbeat_started
+
+    from backend.app.extensions import db
+    from backend.realtime.advanced_chat_system import AdvancedChatSystem
+    from backend.realtime.notification_system import NotificationSystem
+    from backend.realtime.presence import presence
+
+    queue = message_queue_url(app)
+    options = {
+        'async_mode': resolve_async_mode(app),
+        'message_queue': queue,
+        'channel': CHANNEL,
+        'cors_allowed_origins': os.environ.get('ALLOWED_ORIGINS', '*').split(','),
+    }
+    # 여러 워커가 한 포트를 나눠 받을 때는 sticky session이 없으므로 websocket만 허용
+    transports = app.config.get('SOCKETIO_TRANSPORTS') or os.getenv('SOCKETIO_TRANSPORTS')
+    if transports:
+        options['transports'] = [transport.strip() for transport in transports.split(',') if transport.strip()]
+
+    # 이전 설정의 메시지 큐 매니저가 남지 않도록 (앱을 여러 번 만드는 테스트)
+    socketio.server_options.pop('client_manager', None)
+    socketio.init_app(app, **options)
 
-# Socket.IO 객체 (None으로 설정)
-socketio = None
+    notification_system = NotificationSystem(socketio, db)
+    notification_system.setup_socket_events()
+    app.extensions['notification_system'] = notification_system
+    AdvancedChatSystem(socketio)
+
+    # 다른 워커에서도 보이도록 접속 현황 만료 시각을 주기적으로 연장
+    if presence.shared and not app.config.get('TESTING') and not _heartbeat_started:
+        socketio.start_background_task(presence.run_heartbeat, socketio.sleep)
+        _heartbeat_started = True
+
+    logger.info(
+        f"실시간 통신 설정: async_mode={socketio.async_mode}, "
+        f"메시지 큐={'Redis' if queue else '없음 (단일 프로세스)'}"
+    )
+    return True
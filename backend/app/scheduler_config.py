@@ -24,9 +24,9 @@ def setup_scheduler(app):
                     'task': 'celery_config.generate_recommendation_cache_task',
                     'schedule': 60.0 * 60 * 24,  # 24시간마다
                 },
-                'weekly-data-cleanup': {
+                'daily-data-cleanup': {
                     'task': 'celery_config.cleanup_expired_data_task',
-                    'schedule': 60.0 * 60 * 24 * 7,  # 7일마다
+                    'schedule': 60.0 * 60 * 24,  # 24시간마다 (보존 정책별 묶음 삭제)
                 },
                 'daily-lunch-recommendations': {
                     'task': 'celery_config.prepare_lunch_recommendations_task',
@@ -40,6 +40,14 @@ def setup_scheduler(app):
                     'task': 'celery_config.daily_points_settlement_task',
                     'schedule': 60.0 * 60 * 24,  # 24시간마다
                 },
+                'daily-restaurant-counter-reconcile': {
+                    'task': 'celery_config.reconcile_restaurant_counters_task',
+                    'schedule': 60.0 * 60 * 24,  # 24시간마다
+                },
+                'daily-schedule-materialization': {
+                    'task': 'celery_config.extend_schedule_horizon_task',
+                    'schedule': 60.0 * 60 * 24,  # 24시간마다
+                },
             }
 
             print("[SUCCESS] Celery Beat 스케줄러가 설정되었습니다.")
@@ -49,6 +57,8 @@ def setup_scheduler(app):
             print("   - 점심 추천 준비")
             print("   - 실시간 통계 업데이트")
             print("   - 포인트 정산")
+            print("   - 식당 카운터 보정")
+            print("   - 반복 일정 구체화")
 
             return celery_app
         else:
@@ -73,16 +73,17 @@ class PartyService:
                 if not self._can_join_party(party, user.id.value, uow):
                     raise PartyDomainError("파티에 참가할 수 없습니다")
 
-                # 4. 파티 멤버 추가
-                from backend.core.entities.party_member import PartyMember
-                from backend.core.value_objects.party_id import PartyId
-                from backend.core.value_objects.user_id import UserId
-                party_member = PartyMember.create(
-                    party_id=PartyId(party_id),
-                    user_id=UserId(user.id.value)
+                # 4. 좌석 확보 후 파티 멤버 추가 (정원/중복 참여는 조건부 UPDATE와 유니크 제약으로 판정)
+                from backend.services.party_membership import (
+                    ALREADY_MEMBER, PARTY_FULL, PARTY_NOT_FOUND, PartyMembershipService
                 )
-
-                uow.party_members.save(party_member)
+                result = PartyMembershipService.join(party_id, user_employee_id)
+                if result == ALREADY_MEMBER:
+                    raise PartyDomainError("이미 참가한 파티입니다")
+                if result == PARTY_FULL:
+                    raise PartyDomainError("파티 인원이 가득 찼습니다")
+                if result == PARTY_NOT_FOUND:
+                    raise ValidationError(f"파티 ID {party_id}를 찾을 수 없습니다")
 
                 logger.info("파티 참가 완료", party_id=party_id, user_id=user.id.value)
                 return True
@@ -283,20 +284,11 @@ class PartyService:
         if party.is_past():
             return False
 
-        # 3. 이미 멤버인지 확인
-        existing_membership = uow.party_members.find_by_party_and_user(party.id, user_id)
-        if existing_membership:
-            return False
-
-        # 4. 호스트인지 확인
+        # 3. 호스트인지 확인
         if party.is_host(user_id):
             return False
 
-        # 5. 파티가 가득 찼는지 확인
-        current_member_count = uow.party_members.count_by_party(party.id)
-        if party.is_full(current_member_count):
-            return False
-
+        # 이미 멤버인지, 파티가 가득 찼는지는 좌석 확보 시점에 원자적으로 판정 (PartyMembershipService.join)
         return True
 
     def _update_party_entity(self, party: Party, update_data: dict[str, Any]) -> None:
@@ -285,6 +285,10 @@ def logout():
 
         # 리프레시 토큰 무효화
         if AuthUtils.revoke_refresh_token(refresh_token):
+            # 현재 액세스 토큰도 무효화 (토큰 캐시의 블룸 필터에 즉시 반영)
+            auth_header = request.headers.get('Authorization', '')
+            if auth_header.startswith('Bearer '):
+                AuthUtils.revoke_access_token(auth_header.split(' ', 1)[1])
             return jsonify({'message': '로그아웃 되었습니다.'}), 200
         else:
             return jsonify({'error': '유효하지 않은 토큰입니다.'}), 400
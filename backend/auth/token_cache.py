@@ -0,0 +1,268 @@
+"""
+인증 빠른 경로 캐시
+매 요청마다 반복되던 JWT 디코딩, 무효화 토큰 조회, 사용자 조회를 워커 메모리에서 처리합니다.
+  - 검증된 액세스 토큰: 토큰 해시 → 페이로드 LRU (만료 시각까지만 유효)
+  - 무효화 토큰: 블룸 필터 (시작 시 DB에서 적재, 이후 주기적으로 증분 적재, 로그아웃 시 즉시 추가)
+    필터가 '있을 수 있음'이라고 답할 때만 DB에서 확인합니다.
+  - 사용자: 짧은 TTL의 컬럼 스냅샷을 세션에 merge(load=False)하여 DB 조회 없이 사용
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from backend.app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+def token_hash(token: str) -> str:
+    """토큰 → RevokedToken.token_hash와 같은 SHA-256 hex"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class BloomFilter:
+    """SHA-256 hex 문자열용 블룸 필터 (이중 해싱)"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str):
+        digest = value if len(value) == 64 else hashlib.sha256(value.encode()).hexdigest()
+        first = int(digest[:16], 16)
+        second = int(digest[16:32], 16) | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class TokenCache:
+    """검증 토큰 LRU + 무효화 블룸 필터 + 사용자 스냅샷 캐시 (워커 단위)"""
+
+    MAX_VERIFIED_TOKENS = 10_000
+    MAX_PRINCIPALS = 5_000
+    PRINCIPAL_TTL = 30
+    # 다른 워커에서 무효화된 토큰을 반영하는 주기 (초)
+    REVOKED_REFRESH_SECONDS = 30
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._verified: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._principals: OrderedDict[int, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._revoked = BloomFilter()
+        self._confirmed_revoked: set[str] = set()
+        self._revoked_last_id = 0
+        self._revoked_loaded_at = 0.0
+        self.stats = {'token_hits': 0, 'token_misses': 0, 'principal_hits': 0,
+                      'principal_misses': 0, 'revocation_db_checks': 0}
+
+    # ------------------------------------------------------------------
+    # 검증된 토큰
+    # ------------------------------------------------------------------
+    def get_verified(self, hashed: str) -> dict[str, Any] | None:
+        """만료 전의 검증된 페이로드 (없으면 None)"""
+        with self._lock:
+            entry = self._verified.get(hashed)
+            if entry is None:
+                self.stats['token_misses'] += 1
+                return None
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._verified[hashed]
+                self.stats['token_misses'] += 1
+                return None
+            self._verified.move_to_end(hashed)
+            self.stats['token_hits'] += 1
+            return payload
+
+    def remember(self, hashed: str, payload: dict[str, Any]) -> None:
+        expires_at = payload.get('exp')
+        if not isinstance(expires_at, (int, float)):
+            return
+        with self._lock:
+            self._verified[hashed] = (float(expires_at), payload)
+            self._verified.move_to_end(hashed)
+            while len(self._verified) > self.MAX_VERIFIED_TOKENS:
+                self._verified.popitem(last=False)
+
+    def forget(self, hashed: str) -> None:
+        with self._lock:
+            self._verified.pop(hashed, None)
+
+    # ------------------------------------------------------------------
+    # 무효화 토큰
+    # ------------------------------------------------------------------
+    def _refresh_revoked(self) -> None:
+        """새로 무효화된 토큰 해시를 증분 적재 (PK 범위 조회)"""
+        if time.monotonic() - self._revoked_loaded_at < self.REVOKED_REFRESH_SECONDS:
+            return
+        with self._lock:
+            if time.monotonic() - self._revoked_loaded_at < self.REVOKED_REFRESH_SECONDS:
+                return
+            rows = self._fetch_revoked(self._revoked_last_id)
+            if self._revoked.count + len(rows) > self._revoked.capacity:
+                # 용량을 넘으면 더 큰 필터로 전체를 다시 적재
+                capacity = 2 * max(self._revoked.capacity, self._revoked.count + len(rows))
+                self._revoked = BloomFilter(capacity, self._revoked.error_rate)
+                rows = self._fetch_revoked(0)
+            for revoked_id, hashed in rows:
+                self._revoked.add(hashed)
+                self._verified.pop(hashed, None)
+                self._revoked_last_id = max(self._revoked_last_id, revoked_id)
+            self._revoked_loaded_at = time.monotonic()
+
+    @staticmethod
+    def _fetch_revoked(after_id: int) -> list[tuple[int, str]]:
+        from sqlalchemy import select
+
+        from backend.auth.models import RevokedToken
+
+        return db.session.execute(
+            select(RevokedToken.id, RevokedToken.token_hash)
+            .where(RevokedToken.id > after_id)
+            .order_by(RevokedToken.id)
+        ).all()
+
+    def mark_revoked(self, hashed: str) -> None:
+        """이 워커에서 무효화된 토큰 즉시 반영"""
+        with self._lock:
+            if self._revoked.is_full:
+                # 다음 확인 시 더 큰 필터로 전체를 다시 적재
+                self._revoked = BloomFilter(self._revoked.capacity * 2, self._revoked.error_rate)
+                self._revoked_last_id = 0
+                self._revoked_loaded_at = 0.0
+            self._revoked.add(hashed)
+            self._verified.pop(hashed, None)
+
+    def is_revoked(self, hashed: str) -> bool:
+        """블룸 필터에 없으면 DB 조회 없이 False"""
+        from backend.auth.utils import AuthUtils
+
+        try:
+            self._refresh_revoked()
+        except Exception as e:
+            # 적재 실패 시 매 요청 DB 확인으로 안전하게 후퇴
+            logger.warning(f"무효화 토큰 적재 실패: {e}")
+            self.stats['revocation_db_checks'] += 1
+            return AuthUtils.is_token_revoked(hashed)
+
+        with self._lock:
+            if hashed in self._confirmed_revoked:
+                return True
+            if hashed not in self._revoked:
+                return False
+        self.stats['revocation_db_checks'] += 1
+        revoked = AuthUtils.is_token_revoked(hashed)
+        if revoked:
+            with self._lock:
+                self._confirmed_revoked.add(hashed)
+                self._verified.pop(hashed, None)
+        return revoked
+
+    # ------------------------------------------------------------------
+    # 사용자 스냅샷
+    # ------------------------------------------------------------------
+    def get_user(self, user_id: int):
+        """현재 세션에 연결된 사용자 (스냅샷이 유효하면 DB 조회 없음)"""
+        from sqlalchemy.orm import make_transient_to_detached
+        from sqlalchemy.orm.attributes import set_committed_value
+
+        from backend.auth.models import User
+
+        # 같은 세션에 이미 로드된 경우 그대로 사용
+        identity = db.session.identity_map.get(db.session.identity_key(User, user_id))
+        if identity is not None:
+            return identity
+
+        with self._lock:
+            entry = self._principals.get(user_id)
+            if entry is not None and entry[0] > time.monotonic():
+                self._principals.move_to_end(user_id)
+                values = entry[1]
+            else:
+                values = None
+
+        if values is None:
+            self.stats['principal_misses'] += 1
+            user = db.session.get(User, user_id)
+            if user is not None:
+                self.remember_user(user)
+            return user
+
+        self.stats['principal_hits'] += 1
+        snapshot = User.__mapper__.class_manager.new_instance()
+        for key, value in values.items():
+            set_committed_value(snapshot, key, value)
+        make_transient_to_detached(snapshot)
+        return db.session.merge(snapshot, load=False)
+
+    def remember_user(self, user) -> None:
+        values = {attr.key: getattr(user, attr.key) for attr in user.__mapper__.column_attrs}
+        with self._lock:
+            self._principals[user.id] = (time.monotonic() + self.PRINCIPAL_TTL, values)
+            self._principals.move_to_end(user.id)
+            while len(self._principals) > self.MAX_PRINCIPALS:
+                self._principals.popitem(last=False)
+
+    def forget_user(self, user_id: int) -> None:
+        with self._lock:
+            self._principals.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._verified.clear()
+            self._principals.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self.stats, 'verified_tokens': len(self._verified),
+                    'principals': len(self._principals), 'revoked_tokens': self._revoked.count}
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트
+    # ------------------------------------------------------------------
+    def on_user_change(self, mapper, connection, target):
+        self.forget_user(target.id)
+
+    def on_token_revoked(self, mapper, connection, target):
+        self.mark_revoked(target.token_hash)
+
+
+# 전역 토큰 캐시 인스턴스
+token_cache = TokenCache()
+
+
+def setup_token_cache(app):
+    """사용자 변경/토큰 무효화 매퍼 이벤트 연결"""
+    from sqlalchemy import event
+
+    from backend.auth.models import RevokedToken, User
+
+    listeners = [
+        (User, 'after_update', token_cache.on_user_change),
+        (User, 'after_delete', token_cache.on_user_change),
+        (RevokedToken, 'after_insert', token_cache.on_token_revoked),
+    ]
+    for target, event_name, handler in listeners:
+        if not event.contains(target, event_name, handler):
+            event.listen(target, event_name, handler)
+    return True
@@ -10,6 +10,7 @@ from flask import request, jsonify
 from typing import Any
 from collections.abc import Callable
 
+from backend.auth.token_cache import token_cache
 from backend.auth.utils import AuthUtils
 
 class UnifiedAuthMiddleware:
@@ -101,26 +102,30 @@ class UnifiedAuthMiddleware:
     def handle_jwt_token(self, token: str, endpoint: str) -> tuple[bool, Any | None, str]:
         """JWT 토큰 처리"""
         try:
-            # JWT 토큰 검증
-            payload = AuthUtils.verify_jwt_token(token)
-            if not payload:
-                self.log_auth_attempt(endpoint, False, 'jwt')
-                return False, None, "Invalid or expired JWT token"
+            token_hash = hashlib.sha256(token.encode()).hexdigest()
 
-            # 토큰 타입 확인
-            if payload.get('token_type') != 'access':
-                self.log_auth_attempt(endpoint, False, 'jwt')
-                return False, None, "Invalid token type"
+            # JWT 토큰 검증 (검증된 토큰은 만료 전까지 디코딩 생략)
+            payload = token_cache.get_verified(token_hash)
+            if payload is None:
+                payload = AuthUtils.verify_jwt_token(token)
+                if not payload:
+                    self.log_auth_attempt(endpoint, False, 'jwt')
+                    return False, None, "Invalid or expired JWT token"
 
-            # 토큰 무효화 여부 확인
-            token_hash = hashlib.sha256(token.encode()).hexdigest()
-            if AuthUtils.is_token_revoked(token_hash):
+                # 토큰 타입 확인
+                if payload.get('token_type') != 'access':
+                    self.log_auth_attempt(endpoint, False, 'jwt')
+                    return False, None, "Invalid token type"
+
+                token_cache.remember(token_hash, payload)
+
+            # 토큰 무효화 여부 확인 (블룸 필터에 있을 때만 DB 확인)
+            if token_cache.is_revoked(token_hash):
                 self.log_auth_attempt(endpoint, False, 'jwt')
                 return False, None, "Token has been revoked"
 
-            # 사용자 조회
-            from backend.auth.models import User
-            user = User.query.get(payload['user_id'])
+            # 사용자 조회 (짧은 TTL 스냅샷)
+            user = token_cache.get_user(payload['user_id'])
             if not user or not user.is_active:
                 self.log_auth_attempt(endpoint, False, 'jwt')
                 return False, None, "User not found or inactive"
@@ -163,7 +168,8 @@ class UnifiedAuthMiddleware:
                 if self.auth_stats['total_requests'] > 0 else 0
             ),
             'is_development': self.is_development,
-            'debug_mode': self.debug_mode
+            'debug_mode': self.debug_mode,
+            'token_cache': token_cache.get_stats()
         }
 
     def reset_auth_stats(self):
@@ -1,11 +1,14 @@
 import jwt
 import secrets
 import hashlib
+import logging
 from datetime import datetime
 from typing import Any
 from backend.config.auth_config import AuthConfig
 # db 객체는 지연 import로 처리
 
+logger = logging.getLogger(__name__)
+
 class AuthUtils:
     """인증 관련 유틸리티 클래스"""
 
@@ -30,21 +33,17 @@ class AuthUtils:
     def verify_jwt_token(token: str) -> dict[str, Any] | None:
         """JWT 토큰 검증"""
         try:
-            print(f"DEBUG: Verifying JWT token with secret key: {AuthConfig.JWT_SECRET_KEY[:20]}...")
-            payload = jwt.decode(token, AuthConfig.JWT_SECRET_KEY, algorithms=['HS256'])
-            print(f"DEBUG: JWT token verified successfully: {payload}")
-            return payload
-        except jwt.ExpiredSignatureError as e:
-            print(f"DEBUG: JWT token expired: {e}")
+            return jwt.decode(token, AuthConfig.JWT_SECRET_KEY, algorithms=['HS256'])
+        except jwt.ExpiredSignatureError:
+            logger.debug("JWT 토큰 만료")
             return None
         except jwt.InvalidTokenError as e:
-            print(f"DEBUG: JWT token invalid: {e}")
+            logger.debug(f"JWT 토큰 검증 실패: {e}")
             return None
         except Exception as e:
-            print(f"DEBUG: JWT token verification error: {e}")
+            logger.warning(f"JWT 토큰 검증 오류: {e}")
             return None
 
-
     @staticmethod
     def create_refresh_token(user_id: int) -> tuple[str, str]:
         """리프레시 토큰 생성"""
@@ -134,6 +133,24 @@ class AuthUtils:
 
         return True
 
+    @staticmethod
+    def revoke_access_token(token: str) -> bool:
+        """액세스 토큰 무효화 (로그아웃 시 현재 토큰을 블랙리스트에 추가)"""
+        # 지연 import로 순환 참조 방지
+        from .models import RevokedToken, db
+
+        payload = AuthUtils.verify_jwt_token(token)
+        if not payload or payload.get('token_type') != 'access':
+            return False
+
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        if AuthUtils.is_token_revoked(token_hash):
+            return True
+
+        db.session.add(RevokedToken(token_hash=token_hash, user_id=payload['user_id']))
+        db.session.commit()
+        return True
+
     @staticmethod
     def generate_employee_id() -> str:
         """고유한 직원 ID 생성"""
@@ -197,7 +214,7 @@ def require_auth(f):
                 return jsonify({'error': 'User not found or inactive'}), 401
 
             # 토큰 무효화 여부 확인
-            if AuthUtils.is_token_revoked(token):
+            if AuthUtils.is_token_revoked(hashlib.sha256(token.encode()).hexdigest()):
                 print(f"DEBUG: Token revoked for {request.endpoint}")
                 return jsonify({'error': 'Token has been revoked'}), 401
 
@@ -0,0 +1,80 @@
+"""Add activity_counter progress table
+
+Revision ID: add_activity_counters
+Revises: add_schedule_instances
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from collections import Counter
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_activity_counters'
+down_revision = 'add_schedule_instances'
+branch_labels = None
+depends_on = None
+
+# backend/services/progress_counters.py의 distinct 카운터 대상 (마이그레이션 시점 고정)
+DISTINCT_ACTIVITY_TYPES = ('emotion_expression', 'random_lunch_participate', 'friend_meal')
+
+
+def _period_keys(moment):
+    year, week, _ = moment.isocalendar()
+    return ['all', f"day:{moment:%Y-%m-%d}", f"week:{year}-W{week:02d}", f"month:{moment:%Y-%m}"]
+
+
+def upgrade() -> None:
+    activity_counter = op.create_table(
+        'activity_counter',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.String(length=50), nullable=False),
+        sa.Column('activity_type', sa.String(length=64), nullable=False),
+        sa.Column('period', sa.String(length=20), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'period', 'activity_type', name='uq_activity_counter_user_period_type')
+    )
+
+    with op.batch_alter_table('user_activity', schema=None) as batch_op:
+        batch_op.create_index('idx_user_activity_user_type', ['user_id', 'activity_type', 'created_at'], unique=False)
+
+    # 기존 활동 기록으로 카운터 채우기
+    counts = Counter()
+    seen = set()
+    user_activity = sa.table(
+        'user_activity',
+        sa.column('user_id', sa.String),
+        sa.column('activity_type', sa.String),
+        sa.column('description', sa.Text),
+        sa.column('created_at', sa.DateTime),
+    )
+    rows = op.get_bind().execute(
+        sa.select(user_activity.c.user_id, user_activity.c.activity_type,
+                  user_activity.c.description, user_activity.c.created_at)
+        .where(user_activity.c.created_at.is_not(None))
+        .order_by(user_activity.c.created_at)
+    )
+    for user_id, activity_type, description, created_at in rows:
+        for period in _period_keys(created_at):
+            counts[(user_id, activity_type, period)] += 1
+            if activity_type in DISTINCT_ACTIVITY_TYPES and description:
+                if (user_id, activity_type, period, description) not in seen:
+                    seen.add((user_id, activity_type, period, description))
+                    counts[(user_id, f"{activity_type}:distinct", period)] += 1
+
+    if counts:
+        op.bulk_insert(activity_counter, [
+            {'user_id': user_id, 'activity_type': activity_type, 'period': period, 'count': count}
+            for (user_id, activity_type, period), count in counts.items()
+        ])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user_activity', schema=None) as batch_op:
+        batch_op.drop_index('idx_user_activity_user_type')
+
+    op.drop_table('activity_counter')
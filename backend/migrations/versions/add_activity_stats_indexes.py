@@ -0,0 +1,31 @@
+"""Add user indexes for activity stats aggregation
+
+Revision ID: add_activity_stats_indexes
+Revises: add_activity_counters
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_activity_stats_indexes'
+down_revision = 'add_activity_counters'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('restaurant_visits_v2', schema=None) as batch_op:
+        batch_op.create_index('idx_visit_v2_user_date', ['user_id', 'visit_date'], unique=False)
+
+    with op.batch_alter_table('restaurant_reviews_v2', schema=None) as batch_op:
+        batch_op.create_index('idx_review_v2_user_created', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('restaurant_reviews_v2', schema=None) as batch_op:
+        batch_op.drop_index('idx_review_v2_user_created')
+
+    with op.batch_alter_table('restaurant_visits_v2', schema=None) as batch_op:
+        batch_op.drop_index('idx_visit_v2_user_date')
@@ -0,0 +1,54 @@
+"""Add inbox projection columns to chat_room
+
+Revision ID: add_chat_room_inbox_columns
+Revises: add_chat_room_member_unread_count
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_chat_room_inbox_columns'
+down_revision = 'add_chat_room_member_unread_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('chat_room', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('last_message_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('last_message_at', sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column('member_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.create_foreign_key('fk_chat_room_last_message', 'chat_message', ['last_message_id'], ['id'])
+        batch_op.create_index('idx_chat_room_last_message_at', ['last_message_at'], unique=False)
+
+    op.create_index('idx_chat_participant_employee', 'chat_participant', ['employee_id', 'chat_id'], unique=False)
+
+    # 기존 메시지/참여자로 비정규화 컬럼 채우기
+    op.execute(
+        "UPDATE chat_room SET last_message_id = ("
+        "SELECT m.id FROM chat_message m "
+        "WHERE m.chat_type = chat_room.type AND m.chat_id = chat_room.id "
+        "ORDER BY m.created_at DESC, m.id DESC LIMIT 1)"
+    )
+    op.execute(
+        "UPDATE chat_room SET last_message_at = ("
+        "SELECT m.created_at FROM chat_message m WHERE m.id = chat_room.last_message_id)"
+    )
+    op.execute(
+        "UPDATE chat_room SET member_count = ("
+        "SELECT COUNT(*) FROM chat_participant p WHERE p.chat_id = chat_room.id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_chat_participant_employee', table_name='chat_participant')
+
+    with op.batch_alter_table('chat_room', schema=None) as batch_op:
+        batch_op.drop_index('idx_chat_room_last_message_at')
+        batch_op.drop_constraint('fk_chat_room_last_message', type_='foreignkey')
+        batch_op.drop_column('member_count')
+        batch_op.drop_column('last_message_at')
+        batch_op.drop_column('last_message_id')
@@ -0,0 +1,37 @@
+"""Add unread_count to chat_room_member
+
+Revision ID: add_chat_room_member_unread_count
+Revises: widen_chat_message_chat_index
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_chat_room_member_unread_count'
+down_revision = 'widen_chat_message_chat_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('chat_room_member', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('unread_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 읽음 커서 기준으로 카운터 초기화
+    op.execute(
+        "UPDATE chat_room_member SET unread_count = ("
+        "SELECT COUNT(*) FROM chat_message m "
+        "WHERE m.chat_type = chat_room_member.chat_type "
+        "AND m.chat_id = chat_room_member.chat_id "
+        "AND m.sender_employee_id != chat_room_member.user_id "
+        "AND (m.is_deleted IS NULL OR m.is_deleted = false) "
+        "AND m.id > COALESCE(chat_room_member.last_read_message_id, 0))"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('chat_room_member', schema=None) as batch_op:
+        batch_op.drop_column('unread_count')
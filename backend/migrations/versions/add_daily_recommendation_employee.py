@@ -0,0 +1,28 @@
+"""Add employee_id to daily_recommendation
+
+Revision ID: add_daily_recommendation_employee
+Revises: add_chat_room_inbox_columns
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_daily_recommendation_employee'
+down_revision = 'add_chat_room_inbox_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('daily_recommendation', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('employee_id', sa.String(length=50), nullable=True))
+        batch_op.create_index('idx_daily_recommendation_date_employee', ['date', 'employee_id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('daily_recommendation', schema=None) as batch_op:
+        batch_op.drop_index('idx_daily_recommendation_date_employee')
+        batch_op.drop_column('employee_id')
@@ -0,0 +1,29 @@
+"""Add content hash to message attachments for deduplicated storage
+
+Revision ID: add_message_attachment_content_hash
+Revises: add_points_ledger_idempotency
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_message_attachment_content_hash'
+down_revision = 'add_points_ledger_idempotency'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 기존 첨부파일은 해시가 없으므로(NULL) 각자 자기 파일을 단독으로 참조
+    with op.batch_alter_table('message_attachment', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+        batch_op.create_index('idx_message_attachment_content_hash', ['content_hash'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('message_attachment', schema=None) as batch_op:
+        batch_op.drop_index('idx_message_attachment_content_hash')
+        batch_op.drop_column('content_hash')
@@ -0,0 +1,27 @@
+"""Add image variant status to message attachments
+
+Revision ID: add_message_attachment_variant_status
+Revises: add_message_attachment_content_hash
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_message_attachment_variant_status'
+down_revision = 'add_message_attachment_content_hash'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 기존 첨부파일은 상태가 없으므로(NULL) 저장된 thumbnail_path를 그대로 사용
+    with op.batch_alter_table('message_attachment', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('variant_status', sa.String(length=20), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('message_attachment', schema=None) as batch_op:
+        batch_op.drop_column('variant_status')
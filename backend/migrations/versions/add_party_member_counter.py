@@ -0,0 +1,43 @@
+"""Add party.current_members counter and unique party membership
+
+Revision ID: add_party_member_counter
+Revises: add_daily_recommendation_employee
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_party_member_counter'
+down_revision = 'add_daily_recommendation_employee'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('party', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('current_members', sa.Integer(), nullable=False, server_default='0'))
+
+    # 중복 멤버십 정리 (가장 먼저 참여한 행만 유지)
+    op.execute(
+        "DELETE FROM party_member WHERE id NOT IN ("
+        "SELECT keep_id FROM (SELECT MIN(id) AS keep_id FROM party_member GROUP BY party_id, employee_id) AS keep)"
+    )
+    # 기존 멤버 수로 카운터 채우기
+    op.execute(
+        "UPDATE party SET current_members = ("
+        "SELECT COUNT(*) FROM party_member WHERE party_member.party_id = party.id)"
+    )
+
+    with op.batch_alter_table('party_member', schema=None) as batch_op:
+        batch_op.create_unique_constraint('uq_party_member_party_employee', ['party_id', 'employee_id'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('party_member', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_party_member_party_employee', type_='unique')
+
+    with op.batch_alter_table('party', schema=None) as batch_op:
+        batch_op.drop_column('current_members')
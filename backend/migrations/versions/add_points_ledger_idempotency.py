@@ -0,0 +1,29 @@
+"""Add idempotency key to user_activity points ledger
+
+Revision ID: add_points_ledger_idempotency
+Revises: add_activity_stats_indexes
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_points_ledger_idempotency'
+down_revision = 'add_activity_stats_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 기존 행은 키가 없으므로(NULL) 유니크 제약과 충돌하지 않음
+    with op.batch_alter_table('user_activity', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=128), nullable=True))
+        batch_op.create_unique_constraint('uq_user_activity_idempotency_key', ['idempotency_key'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('user_activity', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_user_activity_idempotency_key', type_='unique')
+        batch_op.drop_column('idempotency_key')
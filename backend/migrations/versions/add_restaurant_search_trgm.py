@@ -0,0 +1,39 @@
+"""Add pg_trgm search indexes to restaurants_v2
+
+Revision ID: add_restaurant_search_trgm
+Revises: add_restaurant_v2_counters
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_restaurant_search_trgm'
+down_revision = 'add_restaurant_v2_counters'
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = ('name', 'address', 'category')
+
+
+def upgrade() -> None:
+    # ILIKE '%검색어%' 폴백 검색용 trigram GIN 인덱스 (PostgreSQL 전용)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_restaurants_v2_{column}_trgm "
+            f"ON restaurants_v2 USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS idx_restaurants_v2_{column}_trgm")
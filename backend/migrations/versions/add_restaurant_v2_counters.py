@@ -0,0 +1,38 @@
+"""Add recommend/saved counters to restaurants_v2
+
+Revision ID: add_restaurant_v2_counters
+Revises: c1fdd46a7c6f
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_restaurant_v2_counters'
+down_revision = 'c1fdd46a7c6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('restaurants_v2', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('recommend_count', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('saved_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # 기존 추천/저장 데이터로 카운터 초기화
+    op.execute(
+        "UPDATE restaurants_v2 SET recommend_count = "
+        "(SELECT COUNT(*) FROM restaurant_recommends_v2 r WHERE r.restaurant_id = restaurants_v2.id)"
+    )
+    op.execute(
+        "UPDATE restaurants_v2 SET saved_count = "
+        "(SELECT COUNT(*) FROM restaurant_saved_v2 s WHERE s.restaurant_id = restaurants_v2.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('restaurants_v2', schema=None) as batch_op:
+        batch_op.drop_column('saved_count')
+        batch_op.drop_column('recommend_count')
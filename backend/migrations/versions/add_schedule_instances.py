@@ -0,0 +1,50 @@
+"""Add materialized schedule_instances table
+
+Revision ID: add_schedule_instances
+Revises: add_party_member_counter
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_schedule_instances'
+down_revision = 'add_party_member_counter'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('personal_schedules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('materialized_from', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('materialized_until', sa.Date(), nullable=True))
+
+    # 인스턴스는 구체화 주기 작업(extend_schedule_horizon)이 채우며, 그 전까지는 규칙 계산으로 조회
+    op.create_table(
+        'schedule_instances',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('master_schedule_id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.String(length=50), nullable=False),
+        sa.Column('instance_date', sa.Date(), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('time', sa.String(length=10), nullable=False),
+        sa.Column('restaurant', sa.String(length=200), nullable=True),
+        sa.Column('location', sa.String(length=500), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('exception_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['master_schedule_id'], ['personal_schedules.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('master_schedule_id', 'instance_date', name='uq_schedule_instance_master_date')
+    )
+    op.create_index('idx_schedule_instance_employee_date', 'schedule_instances', ['employee_id', 'instance_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_schedule_instance_employee_date', table_name='schedule_instances')
+    op.drop_table('schedule_instances')
+
+    with op.batch_alter_table('personal_schedules', schema=None) as batch_op:
+        batch_op.drop_column('materialized_until')
+        batch_op.drop_column('materialized_from')
@@ -0,0 +1,26 @@
+"""Widen idx_chat_message_chat for keyset pagination
+
+Revision ID: widen_chat_message_chat_index
+Revises: add_restaurant_search_trgm
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'widen_chat_message_chat_index'
+down_revision = 'add_restaurant_search_trgm'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (chat_type, chat_id) 범위 안에서 (created_at, id) 순서로 바로 탐색하도록 인덱스 확장
+    op.drop_index('idx_chat_message_chat', table_name='chat_message', if_exists=True)
+    op.create_index('idx_chat_message_chat', 'chat_message', ['chat_type', 'chat_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_chat_message_chat', table_name='chat_message')
+    op.create_index('idx_chat_message_chat', 'chat_message', ['chat_type', 'chat_id'], unique=False)
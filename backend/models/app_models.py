@@ -22,6 +22,8 @@ class Party(db.Model):
     party_time = db.Column(db.Time, nullable=False)
     meeting_location = db.Column(db.String(200), nullable=True)
     max_members = db.Column(db.Integer, nullable=False, default=4)
+    # 멤버 수 카운터 (PartyMembershipService의 조건부 UPDATE로 좌석 확보)
+    current_members = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     is_from_match = db.Column(db.Boolean, default=False)
     description = db.Column(db.Text, nullable=True)  # 파티 설명 필드 추가
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -34,10 +36,6 @@ class Party(db.Model):
 
     # __init__ 메서드 제거 - SQLAlchemy가 자동으로 처리하도록 함
 
-    @property
-    def current_members(self):
-        return PartyMember.query.filter_by(party_id=self.id).count()
-
     @property
     def member_ids(self):
         """파티 멤버 ID 목록 반환"""
@@ -60,6 +58,7 @@ class PartyMember(db.Model):
     is_host = db.Column(db.Boolean, default=False)
 
     __table_args__ = (
+        db.UniqueConstraint('party_id', 'employee_id', name='uq_party_member_party_employee'),
         db.Index('idx_party_member', 'party_id', 'employee_id'),
         db.Index('idx_member_party', 'employee_id', 'party_id'),
         {'extend_existing': True},
@@ -120,6 +119,14 @@ class ChatRoom(db.Model):
     party_id = db.Column(db.Integer, db.ForeignKey('party.id'), nullable=True)
     dangolpot_id = db.Column(db.Integer, db.ForeignKey('dangol_pot.id'), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # 채팅방 목록 조회용 비정규화 컬럼 (ChatInboxService가 메시지/참여자 변경 시 갱신)
+    last_message_id = db.Column(db.Integer, db.ForeignKey('chat_message.id'), nullable=True)
+    last_message_at = db.Column(db.DateTime, nullable=True)
+    member_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    __table_args__ = (
+        db.Index('idx_chat_room_last_message_at', 'last_message_at'),
+    )
 
     def __init__(self, name=None, title=None, type=None, party_id=None, dangolpot_id=None):
         self.name = name
@@ -136,6 +143,10 @@ class ChatParticipant(db.Model):
     employee_id = db.Column(db.String(50), nullable=False)
     joined_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('idx_chat_participant_employee', 'employee_id', 'chat_id'),
+    )
+
     def __init__(self, chat_type, chat_id, employee_id):
         self.chat_type = chat_type
         self.chat_id = chat_id
@@ -185,7 +196,8 @@ class ChatMessage(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     __table_args__ = (
-        db.Index('idx_chat_message_chat', 'chat_type', 'chat_id'),
+        # (created_at, id) 키셋 페이지네이션을 인덱스 범위 스캔으로 처리
+        db.Index('idx_chat_message_chat', 'chat_type', 'chat_id', 'created_at', 'id'),
         db.Index('idx_chat_message_sender', 'sender_employee_id'),
         db.Index('idx_chat_message_created', 'created_at'),
     )
@@ -237,11 +249,16 @@ class MessageAttachment(db.Model):
     file_type = db.Column(db.String(50), nullable=False)
     mime_type = db.Column(db.String(100), nullable=False)
     thumbnail_path = db.Column(db.String(500), nullable=True)
+    # 내용 SHA-256 - 같은 내용의 첨부파일은 파일 하나를 공유하며, 이 값을 가진 행 수가 참조 수
+    content_hash = db.Column(db.String(64), nullable=True)
+    # 이미지 변형 생성 상태: 'pending', 'ready', 'failed' (이미지가 아니면 NULL)
+    variant_status = db.Column(db.String(20), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         db.Index('idx_message_attachment_message', 'message_id'),
         db.Index('idx_message_attachment_type', 'file_type'),
+        db.Index('idx_message_attachment_content_hash', 'content_hash'),
     )
 
 class ChatRoomMember(db.Model):
@@ -255,6 +272,8 @@ class ChatRoomMember(db.Model):
     role = db.Column(db.String(20), default='member')  # 'admin', 'member'
     joined_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_read_message_id = db.Column(db.Integer, db.ForeignKey('chat_message.id'), nullable=True)
+    # 읽음 커서 이후 다른 멤버가 보낸 메시지 수 (ChatUnreadService가 갱신)
+    unread_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     is_muted = db.Column(db.Boolean, default=False)
     is_left = db.Column(db.Boolean, default=False)
     left_at = db.Column(db.DateTime, nullable=True)
@@ -443,14 +462,36 @@ class UserActivity(db.Model):
     activity_type = db.Column(db.String(50), nullable=False)
     description = db.Column(db.Text, nullable=True)
     points_earned = db.Column(db.Integer, default=0)
+    # 포인트 원장 중복 적립 방지 키 (재시도 시 같은 키는 한 번만 기록)
+    idempotency_key = db.Column(db.String(128), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('idx_user_activity_user_type', 'user_id', 'activity_type', 'created_at'),
+        db.UniqueConstraint('idempotency_key', name='uq_user_activity_idempotency_key'),
+    )
+
     def __init__(self, user_id, activity_type, description=None, points_earned=0):
         self.user_id = user_id
         self.activity_type = activity_type
         self.description = description
         self.points_earned = points_earned
 
+class ActivityCounter(db.Model):
+    """사용자 활동 진행 카운터 (사용자, 활동 유형, 기간 단위 집계)"""
+    __tablename__ = 'activity_counter'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.String(50), nullable=False)
+    activity_type = db.Column(db.String(64), nullable=False)
+    period = db.Column(db.String(20), nullable=False)  # all, day:YYYY-MM-DD, week:YYYY-Www, month:YYYY-MM
+    count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'period', 'activity_type', name='uq_activity_counter_user_period_type'),
+    )
+
 class RestaurantVisit(db.Model):
     """식당 방문 기록 모델"""
     id = db.Column(db.Integer, primary_key=True)
@@ -584,12 +625,18 @@ class DailyRecommendation(db.Model):
     """일별 추천 그룹 모델"""
     id = db.Column(db.Integer, primary_key=True)
     date = db.Column(db.String(20), nullable=False)  # YYYY-MM-DD 형식
+    employee_id = db.Column(db.String(50), nullable=True)  # 추천 대상 사용자 (사용자별 추천 캐시)
     group_members = db.Column(db.Text, nullable=False)  # JSON 형태로 멤버 정보 저장
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    def __init__(self, date, group_members):
+    __table_args__ = (
+        db.Index('idx_daily_recommendation_date_employee', 'date', 'employee_id'),
+    )
+
+    def __init__(self, date, group_members, employee_id=None):
         self.date = date
         self.group_members = group_members
+        self.employee_id = employee_id
 
 class RestaurantRequest(db.Model):
     """식당 신청/수정/삭제 요청 모델"""
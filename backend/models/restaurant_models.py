@@ -25,6 +25,10 @@ class RestaurantV2(db.Model):
     price_range = db.Column(db.String(50))  # 가격대
     is_active = db.Column(db.Boolean, default=True)  # 활성 상태
 
+    # 비정규화 카운터 (RestaurantCounterService에서 갱신/보정)
+    recommend_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # 오찬추천 수
+    saved_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # 저장 수
+
     # 타임스탬프
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -92,6 +96,10 @@ class RestaurantReviewV2(db.Model):
     # 관계 설정
     restaurant = db.relationship('RestaurantV2', backref=db.backref('reviews', lazy=True))
 
+    __table_args__ = (
+        Index('idx_review_v2_user_created', 'user_id', 'created_at'),  # 사용자 활동 통계용
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -121,6 +129,10 @@ class RestaurantVisitV2(db.Model):
     # 관계 설정
     restaurant = db.relationship('RestaurantV2', backref=db.backref('visits', lazy=True))
 
+    __table_args__ = (
+        Index('idx_visit_v2_user_date', 'user_id', 'visit_date'),  # 사용자 활동 통계/스트릭용
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
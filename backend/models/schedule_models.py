@@ -4,7 +4,7 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, ForeignKey, Text, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from backend.app.extensions import db
 
@@ -29,6 +29,10 @@ class PersonalSchedule(db.Model):
     recurrence_end_date = Column(DateTime)  # 반복 종료 날짜
     master_schedule_id = Column(Integer, ForeignKey('personal_schedules.id'), nullable=True, index=True)  # 마스터 일정 ID
 
+    # 구체화(schedule_instances)된 날짜 범위 (범위 밖 조회는 규칙으로 직접 계산)
+    materialized_from = Column(Date, nullable=True)
+    materialized_until = Column(Date, nullable=True)
+
     # 시스템 정보
     created_by = Column(String(50), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -105,6 +109,31 @@ class ScheduleException(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+class ScheduleInstance(db.Model):
+    """마스터 일정을 날짜별로 펼쳐 둔 구체화 인스턴스 (예외 적용 완료)"""
+    __tablename__ = 'schedule_instances'
+
+    id = Column(Integer, primary_key=True)
+    master_schedule_id = Column(Integer, ForeignKey('personal_schedules.id', ondelete='CASCADE'), nullable=False)
+    employee_id = Column(String(50), nullable=False)
+    instance_date = Column(Date, nullable=False)
+
+    # 예외가 반영된 최종 값
+    title = Column(String(200), nullable=False)
+    time = Column(String(10), nullable=False)
+    restaurant = Column(String(200))
+    location = Column(String(500))
+    description = Column(Text)
+    exception_id = Column(Integer, nullable=True)  # 수정 예외가 적용된 경우
+
+    __table_args__ = (
+        UniqueConstraint('master_schedule_id', 'instance_date', name='uq_schedule_instance_master_date'),
+        Index('idx_schedule_instance_employee_date', 'employee_id', 'instance_date'),
+    )
+
+    def __repr__(self):
+        return f'<ScheduleInstance {self.master_schedule_id}: {self.instance_date}>'
+
 class ScheduleAttendee(db.Model):
     """일정 참석자 모델"""
     __tablename__ = 'schedule_attendees'
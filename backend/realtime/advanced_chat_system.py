@@ -3,12 +3,18 @@
 WebSocket을 사용한 고급 채팅 기능들을 제공합니다.
 """
 
-from flask_socketio import emit
+from flask import request
+from flask_socketio import emit, join_room, leave_room
 from backend.app.extensions import db
 from backend.models.app_models import (
     MessageStatus, MessageReaction, MessageSearchIndex, ChatMessage, ChatRoomMember
 )
+from backend.realtime.presence import presence
+from backend.services.chat_unread import ChatUnreadService
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 class AdvancedChatSystem:
     """고급 실시간 채팅 시스템"""
@@ -20,6 +26,40 @@ class AdvancedChatSystem:
     def setup_event_handlers(self):
         """WebSocket 이벤트 핸들러 설정"""
 
+        @self.socketio.on("join_chat")
+        def handle_join_chat(data):
+            """
+            채팅방 참가 (방 단위 emit은 메시지 큐를 통해 모든 워커의 참가자에게 전달)
+            사용자별 방과 접속 현황은 authenticate에서만 등록합니다. (요청 데이터의 user_id는 믿지 않음)
+            """
+            try:
+                chat_type = data.get("chat_type")
+                chat_id = data.get("chat_id")
+
+                if not all([chat_type, chat_id]):
+                    return
+
+                join_room(f"{chat_type}_{chat_id}")
+                logger.debug(f"채팅방 참가: {presence.user_for(request.sid) or request.sid} -> {chat_type}_{chat_id}")
+
+            except Exception as e:
+                logger.error(f"채팅방 참가 처리 실패: {e}")
+
+        @self.socketio.on("leave_chat")
+        def handle_leave_chat(data):
+            """채팅방 나가기"""
+            try:
+                chat_type = data.get("chat_type")
+                chat_id = data.get("chat_id")
+
+                if not all([chat_type, chat_id]):
+                    return
+
+                leave_room(f"{chat_type}_{chat_id}")
+
+            except Exception as e:
+                logger.error(f"채팅방 나가기 처리 실패: {e}")
+
         @self.socketio.on("typing_start")
         def handle_typing_start(data):
             """타이핑 시작 이벤트"""
@@ -104,6 +144,9 @@ class AdvancedChatSystem:
                     )
                     db.session.add(message_status)
 
+                # 채팅방 읽음 커서도 함께 이동
+                ChatUnreadService.mark_read(user_id, chat_type, chat_id, message_id)
+
                 db.session.commit()
 
                 # 읽음 상태를 채팅방에 브로드캐스트
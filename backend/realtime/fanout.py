@@ -0,0 +1,85 @@
+"""
+실시간 이벤트 팬아웃
+Socket.IO 객체와 워커 간 emit 헬퍼를 제공합니다. (서버 설정은 backend.app.realtime_system)
+  - 메시지 큐(Redis pub/sub)가 있으면 어느 워커에서 emit해도 모든 워커의 연결로 전달
+    (소켓 서버가 없는 프로세스(Celery 등)는 같은 큐에 쓰기 전용으로 emit)
+  - 사용자별 방(user_<사용자 ID>)에는 인증한 모든 세션이 참가
+"""
+
+import logging
+import os
+from typing import Any
+
+from flask_socketio import SocketIO
+
+logger = logging.getLogger(__name__)
+
+# 메시지 큐 채널 (같은 Redis를 쓰는 다른 앱과 분리)
+CHANNEL = 'lunch-app-socketio'
+
+# Socket.IO 객체 (backend.app.realtime_system.setup_realtime_communication에서 앱과 연결)
+socketio = SocketIO()
+
+# 소켓 서버가 없는 프로세스에서 쓰는 쓰기 전용 emitter
+_external_emitter: SocketIO | None = None
+
+
+def user_room(user_id: str) -> str:
+    """사용자별 방 이름 (인증한 모든 세션이 참가)"""
+    return f"user_{user_id}"
+
+
+def message_queue_url(app=None) -> str | None:
+    """워커 간 팬아웃에 사용할 메시지 큐 URL (없으면 단일 프로세스 모드)"""
+    config = app.config if app is not None else {}
+    url = config.get('SOCKETIO_MESSAGE_QUEUE') or os.getenv('SOCKETIO_MESSAGE_QUEUE')
+    if url:
+        return url
+    if config.get('TESTING'):
+        return None
+
+    from backend.app.cache_manager import cache_manager
+
+    if cache_manager.offline_mode or not cache_manager.redis_client:
+        return None
+    return os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+
+def get_emitter() -> SocketIO | None:
+    """emit에 사용할 Socket.IO 객체 (서버가 없고 메시지 큐도 없으면 None)"""
+    global _external_emitter
+
+    if socketio.server is not None:
+        return socketio
+    if _external_emitter is None:
+        url = message_queue_url()
+        if not url:
+            return None
+        _external_emitter = SocketIO(message_queue=url, channel=CHANNEL)
+    return _external_emitter
+
+
+def emit_to_room(event: str, data: Any, room: str | list[str] | None = None) -> bool:
+    """방(방 목록, 없으면 전체)으로 이벤트 전송 - 메시지 큐가 있으면 모든 워커의 연결에 전달"""
+    emitter = get_emitter()
+    if emitter is None:
+        return False
+    try:
+        emitter.emit(event, data, to=room)
+        return True
+    except Exception as e:
+        logger.warning(f"실시간 이벤트 전송 실패: {event} -> {room} - {e}")
+        return False
+
+
+def emit_to_user(user_id: str, event: str, data: Any) -> bool:
+    """사용자의 모든 세션(어느 워커에 연결되어 있든)으로 이벤트 전송"""
+    return emit_to_room(event, data, user_room(user_id))
+
+
+def emit_to_users(user_ids: list[str], event: str, data: Any) -> bool:
+    """여러 사용자에게 같은 이벤트 전송 (방 목록으로 emit 1회 - 메시지 큐 발행도 1회)"""
+    rooms = [user_room(user_id) for user_id in dict.fromkeys(user_ids)]
+    if not rooms:
+        return False
+    return emit_to_room(event, data, rooms)
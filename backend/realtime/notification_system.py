@@ -7,6 +7,9 @@ from datetime import datetime
 from flask_socketio import emit, join_room
 from flask import request
 
+from backend.realtime.fanout import emit_to_room, emit_to_user, emit_to_users, user_room
+from backend.realtime.presence import presence
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -14,11 +17,15 @@ logger = logging.getLogger(__name__)
 class NotificationSystem:
     """실시간 알림 시스템"""
 
+    # 채팅과 무관한 알림(점심 추천 등)을 chat_notification에 저장할 때의 채팅 정보
+    SYSTEM_CHAT_TYPE = 'system'
+    SYSTEM_CHAT_ID = 0
+
     def __init__(self, socketio, db):
         self.socketio = socketio
         self.db = db
-        self.user_sessions: dict[str, str] = {}  # user_id -> session_id
-        self.active_users: set[str] = set()  # 현재 온라인 사용자들
+        # 모든 워커가 공유하는 접속 현황 (사용자 → 세션)
+        self.presence = presence
 
         # 알림 타입별 템플릿
         self.notification_templates = {
@@ -81,18 +88,18 @@ class NotificationSystem:
 
                 session_id = request.sid
 
-                # 사용자 세션 등록
-                self.user_sessions[user_id] = session_id
-                self.active_users.add(user_id)
+                # 사용자 세션 등록 (모든 워커가 공유)
+                first_session = self.presence.connect(user_id, session_id)
 
-                # 사용자별 방에 참가
-                join_room(f"user_{user_id}")
+                # 사용자별 방에 참가 (어느 워커에서 보낸 알림이든 이 방으로 전달)
+                join_room(user_room(user_id))
 
-                # 온라인 상태 브로드캐스트
-                self.socketio.emit('user_online', {
-                    'user_id': user_id,
-                    'timestamp': datetime.now().isoformat()
-                }, room=f"user_{user_id}")
+                # 첫 세션일 때만 온라인 상태 브로드캐스트
+                if first_session:
+                    self.socketio.emit('user_online', {
+                        'user_id': user_id,
+                        'timestamp': datetime.now().isoformat()
+                    }, room=user_room(user_id))
 
                 logger.info(f"✅ 사용자 인증 성공: {user_id} -> {session_id}")
 
@@ -115,23 +122,16 @@ class NotificationSystem:
             """클라이언트 연결 해제 시"""
             session_id = request.sid
 
-            # 사용자 ID 찾기
-            user_id = None
-            for uid, sid in self.user_sessions.items():
-                if sid == session_id:
-                    user_id = uid
-                    break
+            # 사용자 세션 제거
+            user_id, last_session = self.presence.disconnect(session_id)
 
             if user_id:
-                # 사용자 세션 제거
-                del self.user_sessions[user_id]
-                self.active_users.discard(user_id)
-
-                # 오프라인 상태 브로드캐스트
-                self.socketio.emit('user_offline', {
-                    'user_id': user_id,
-                    'timestamp': datetime.now().isoformat()
-                }, room=f"user_{user_id}")
+                # 다른 기기/탭의 세션이 남아 있으면 온라인 유지
+                if last_session:
+                    self.socketio.emit('user_offline', {
+                        'user_id': user_id,
+                        'timestamp': datetime.now().isoformat()
+                    }, room=user_room(user_id))
 
                 logger.info(f"🔌 사용자 연결 해제: {user_id}")
             else:
@@ -163,8 +163,8 @@ class NotificationSystem:
 
     def send_notification(self, user_id: str, notification_type: str,
                          message: str = None, data: dict = None,
-                         priority: str = 'normal') -> bool:
-        """사용자에게 알림 전송"""
+                         priority: str = 'normal', online: bool | None = None) -> bool:
+        """사용자에게 알림 전송 (online: 미리 조회한 접속 여부, 없으면 조회)"""
         try:
             # 알림 템플릿 가져오기
             template = self.notification_templates.get(notification_type, {})
@@ -186,15 +186,15 @@ class NotificationSystem:
             self.save_notification_to_db(user_id, notification)
 
             # 실시간 알림 전송
-            if user_id in self.user_sessions:
-                session_id = self.user_sessions[user_id]
-
-                # 개별 사용자에게 알림 전송
-                self.socketio.emit('new_notification', notification, room=session_id)
+            if online is None:
+                online = self.presence.is_online(user_id)
+            if online:
+                # 사용자의 모든 세션에 전송 (메시지 큐를 통해 다른 워커의 연결에도 전달)
+                emit_to_user(user_id, 'new_notification', notification)
 
                 # 우선순위가 높은 알림은 모든 사용자에게 브로드캐스트
                 if priority == 'high':
-                    self.socketio.emit('urgent_notification', notification)
+                    emit_to_room('urgent_notification', notification)
 
                 logger.info(f"📨 알림 전송 성공: {user_id} - {notification_type}")
                 return True
@@ -209,16 +209,49 @@ class NotificationSystem:
 
     def send_bulk_notification(self, user_ids: list[str], notification_type: str,
                               message: str = None, data: dict = None,
-                              priority: str = 'normal') -> int:
-        """여러 사용자에게 일괄 알림 전송"""
-        success_count = 0
+                              priority: str = 'normal', chat_type: str = None,
+                              chat_id: int = None) -> int:
+        """
+        여러 사용자에게 일괄 알림 전송 (저장 1회, 접속 조회 1회, 전송 1회)
+
+        chat_type/chat_id가 없으면 data의 값, 그것도 없으면 시스템 알림으로 저장합니다.
+        """
+        try:
+            user_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+            template = self.notification_templates.get(notification_type, {})
+
+            # 모든 수신자가 같은 알림을 받으므로 한 번만 구성
+            notification = {
+                'id': f"notif_{datetime.now().timestamp()}",
+                'type': notification_type,
+                'title': template.get('title', '알림'),
+                'icon': template.get('icon', '🔔'),
+                'message': message or template.get('default_message', '새로운 알림이 있습니다.'),
+                'data': data or {},
+                'priority': priority,
+                'timestamp': datetime.now().isoformat(),
+                'read': False
+            }
+            data = data or {}
+            self.save_notifications_to_db(
+                user_ids, notification,
+                chat_type=chat_type or data.get('chat_type') or self.SYSTEM_CHAT_TYPE,
+                chat_id=chat_id if chat_id is not None else data.get('chat_id', self.SYSTEM_CHAT_ID)
+            )
+
+            # 접속 중인 사용자의 방 목록으로 한 번에 전송 (메시지 큐 발행도 1회)
+            online_users = self.presence.online_users(user_ids)
+            if online_users:
+                emit_to_users(online_users, 'new_notification', notification)
+                if priority == 'high':
+                    emit_to_room('urgent_notification', notification)
 
-        for user_id in user_ids:
-            if self.send_notification(user_id, notification_type, message, data, priority):
-                success_count += 1
+            logger.info(f"📨 일괄 알림 전송 완료: {len(online_users)}/{len(user_ids)} 성공")
+            return len(online_users)
 
-        logger.info(f"📨 일괄 알림 전송 완료: {success_count}/{len(user_ids)} 성공")
-        return success_count
+        except Exception as e:
+            logger.error(f"❌ 일괄 알림 전송 실패: {notification_type} - {e}")
+            return 0
 
     def send_party_notification(self, party_id: int, notification_type: str,
                                message: str = None, data: dict = None,
@@ -233,7 +266,8 @@ class NotificationSystem:
 
             # 알림 전송
             success_count = self.send_bulk_notification(
-                participants, notification_type, message, data
+                participants, notification_type, message, data,
+                chat_type='party', chat_id=party_id
             )
 
             logger.info(f"🎉 파티 알림 전송 완료: {party_id} - {success_count}명")
@@ -281,6 +315,13 @@ class NotificationSystem:
             logger.error(f"❌ 알림 히스토리 조회 실패: {user_id} - {e}")
             return []
 
+    def send_unread_notifications(self, user_id: str) -> int:
+        """방금 인증한 세션으로 읽지 않은 알림 전송"""
+        unread = [n for n in self.get_user_notifications(user_id) if not n.get('read')]
+        for notification in unread:
+            emit('new_notification', notification)
+        return len(unread)
+
     def mark_notification_as_read(self, notification_id: str, user_id: str) -> bool:
         """알림을 읽음으로 표시"""
         try:
@@ -297,16 +338,17 @@ class NotificationSystem:
             return False
 
     def get_online_users(self) -> list[str]:
-        """현재 온라인 사용자 목록 반환"""
-        return list(self.active_users)
+        """현재 온라인 사용자 목록 반환 (모든 워커)"""
+        return self.presence.online_users()
 
     def get_user_session(self, user_id: str) -> str | None:
-        """사용자의 세션 ID 반환"""
-        return self.user_sessions.get(user_id)
+        """사용자의 세션 ID 반환 (여러 세션이면 그중 하나)"""
+        sessions = self.presence.sessions(user_id)
+        return sessions[0] if sessions else None
 
     def is_user_online(self, user_id: str) -> bool:
         """사용자 온라인 상태 확인"""
-        return user_id in self.active_users
+        return self.presence.is_online(user_id)
 
     # 데이터베이스 관련 메서드들 (구현 필요)
     def save_notification_to_db(self, user_id: str, notification: dict) -> bool:
@@ -315,6 +357,40 @@ class NotificationSystem:
         logger.debug(f"💾 알림 저장: {user_id} - {notification['id']}")
         return True
 
+    def save_notifications_to_db(self, user_ids: list[str], notification: dict,
+                                 chat_type: str, chat_id: int) -> int:
+        """같은 알림을 여러 사용자에게 한 번에 저장 (일괄 INSERT 1회, 커밋 1회, 저장한 수 반환)"""
+        from sqlalchemy import insert
+
+        from backend.models.app_models import ChatNotification
+
+        if not user_ids:
+            return 0
+
+        created_at = datetime.utcnow()
+        session = self.db.session
+        try:
+            session.execute(insert(ChatNotification), [
+                {
+                    'user_id': user_id,
+                    'chat_type': chat_type,
+                    'chat_id': chat_id,
+                    'notification_type': notification['type'],
+                    'title': notification['title'],
+                    'message': notification['message'],
+                    'is_read': False,
+                    'created_at': created_at,
+                }
+                for user_id in user_ids
+            ])
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        logger.debug(f"💾 일괄 알림 저장: {len(user_ids)}명 - {notification['id']}")
+        return len(user_ids)
+
     def get_notifications_from_db(self, user_id: str, limit: int) -> list[dict]:
         """데이터베이스에서 알림 조회"""
         # TODO: 실제 데이터베이스 조회 로직 구현
@@ -329,9 +405,15 @@ class NotificationSystem:
 
     def get_party_participants(self, party_id: int) -> list[str]:
         """파티 참여자 목록 조회"""
-        # TODO: 실제 데이터베이스 조회 로직 구현
-        logger.debug(f"👥 파티 참여자 조회: {party_id}")
-        return []
+        from sqlalchemy import select
+
+        from backend.models.app_models import PartyMember
+
+        participants = self.db.session.execute(
+            select(PartyMember.employee_id).where(PartyMember.party_id == party_id)
+        ).scalars().all()
+        logger.debug(f"👥 파티 참여자 조회: {party_id} - {len(participants)}명")
+        return [str(employee_id) for employee_id in participants]
 
 # 개발 환경에서 테스트용 함수
 if __name__ == '__main__':
@@ -0,0 +1,214 @@
+"""
+실시간 접속 현황 (presence) 레지스트리
+Socket.IO 연결을 사용자별로 기록해 모든 워커가 같은 온라인 상태를 보도록 합니다.
+  - Redis가 있으면 presence:user:<사용자> sorted set(세션 → 만료 시각)과
+    presence:online sorted set(사용자 → 만료 시각)을 모든 워커가 공유
+  - 각 워커는 HEARTBEAT_SECONDS마다 자기 연결의 만료 시각을 연장하므로,
+    종료/장애로 연결 해제를 기록하지 못한 워커의 세션은 TTL_SECONDS 뒤 자동으로 사라짐
+  - Redis가 없으면 (단일 프로세스 개발 환경) 워커 메모리에만 기록
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+ONLINE_KEY = 'presence:online'
+
+
+def session_key(user_id: str) -> str:
+    return f"presence:user:{user_id}"
+
+
+class PresenceRegistry:
+    """사용자별 Socket.IO 세션 레지스트리"""
+
+    TTL_SECONDS = 90
+    HEARTBEAT_SECONDS = 30
+
+    def __init__(self, client=None):
+        # 테스트 등에서 직접 주입한 Redis 클라이언트 (없으면 캐시 관리자의 클라이언트 사용)
+        self.client = client
+        self._lock = threading.Lock()
+        # 이 워커의 연결: 세션 ID → 사용자 ID
+        self._local: dict[str, str] = {}
+
+    def _redis(self):
+        if self.client is not None:
+            return self.client
+        from backend.app.cache_manager import cache_manager
+
+        if cache_manager.offline_mode or not cache_manager.redis_client:
+            return None
+        return cache_manager.redis_client
+
+    @property
+    def shared(self) -> bool:
+        """모든 워커가 공유하는 Redis에 기록하는지 여부"""
+        return self._redis() is not None
+
+    @staticmethod
+    def _decode(value) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    # ------------------------------------------------------------------
+    # 연결/해제
+    # ------------------------------------------------------------------
+    def connect(self, user_id: str, sid: str) -> bool:
+        """세션 등록 (사용자의 첫 세션이면 True)"""
+        user_id = str(user_id)
+        with self._lock:
+            previous = self._local.get(sid)
+            first_local = user_id not in self._local.values()
+            self._local[sid] = user_id
+
+        client = self._redis()
+        if client is None:
+            return first_local
+
+        expires_at = time.time() + self.TTL_SECONDS
+        try:
+            if previous and previous != user_id:
+                # 같은 연결에서 다른 사용자로 다시 인증한 경우
+                self._remove(client, previous, sid)
+            pipe = client.pipeline()
+            pipe.zremrangebyscore(session_key(user_id), '-inf', time.time())
+            pipe.zcard(session_key(user_id))
+            pipe.zadd(session_key(user_id), {sid: expires_at})
+            pipe.expire(session_key(user_id), self.TTL_SECONDS)
+            pipe.zadd(ONLINE_KEY, {user_id: expires_at})
+            _, active, *_ = pipe.execute()
+            return active == 0
+        except Exception as e:
+            logger.warning(f"접속 현황 기록 실패: {user_id} - {e}")
+            return first_local
+
+    def disconnect(self, sid: str) -> tuple[str | None, bool]:
+        """
+        세션 해제
+
+        Returns:
+            (사용자 ID, 사용자의 마지막 세션이었는지 여부)
+        """
+        with self._lock:
+            user_id = self._local.pop(sid, None)
+            last_local = user_id is not None and user_id not in self._local.values()
+        if user_id is None:
+            return None, False
+
+        client = self._redis()
+        if client is None:
+            return user_id, last_local
+        try:
+            return user_id, self._remove(client, user_id, sid)
+        except Exception as e:
+            logger.warning(f"접속 해제 기록 실패: {user_id} - {e}")
+            return user_id, last_local
+
+    def _remove(self, client, user_id: str, sid: str) -> bool:
+        # 해제와 다른 워커의 새 연결이 겹쳐 온라인 표시가 지워져도
+        # 그 워커의 다음 하트비트에서 다시 기록됨
+        pipe = client.pipeline()
+        pipe.zrem(session_key(user_id), sid)
+        pipe.zremrangebyscore(session_key(user_id), '-inf', time.time())
+        pipe.zcard(session_key(user_id))
+        _, _, remaining = pipe.execute()
+        if remaining == 0:
+            client.zrem(ONLINE_KEY, user_id)
+            return True
+        return False
+
+    def heartbeat(self) -> int:
+        """이 워커 연결의 만료 시각 연장 및 만료된 사용자 정리 (연장한 세션 수)"""
+        client = self._redis()
+        if client is None:
+            return 0
+        with self._lock:
+            sessions = list(self._local.items())
+
+        now = time.time()
+        expires_at = now + self.TTL_SECONDS
+        pipe = client.pipeline()
+        for sid, user_id in sessions:
+            pipe.zadd(session_key(user_id), {sid: expires_at})
+            pipe.expire(session_key(user_id), self.TTL_SECONDS)
+        for user_id in {user_id for _, user_id in sessions}:
+            pipe.zadd(ONLINE_KEY, {user_id: expires_at})
+        pipe.zremrangebyscore(ONLINE_KEY, '-inf', now)
+        pipe.execute()
+        return len(sessions)
+
+    def run_heartbeat(self, sleep=time.sleep) -> None:
+        """하트비트 루프 (Socket.IO 백그라운드 작업으로 실행)"""
+        while True:
+            sleep(self.HEARTBEAT_SECONDS)
+            try:
+                self.heartbeat()
+            except Exception as e:
+                logger.warning(f"접속 현황 하트비트 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def is_online(self, user_id: str) -> bool:
+        user_id = str(user_id)
+        client = self._redis()
+        if client is None:
+            with self._lock:
+                return user_id in self._local.values()
+        try:
+            score = client.zscore(ONLINE_KEY, user_id)
+            return score is not None and score > time.time()
+        except Exception as e:
+            logger.warning(f"접속 현황 조회 실패: {user_id} - {e}")
+            return False
+
+    def online_users(self, user_ids: list[str] | None = None) -> list[str]:
+        """온라인 사용자 목록 (user_ids를 주면 그중 온라인인 사용자만)"""
+        client = self._redis()
+        if client is None:
+            with self._lock:
+                online = set(self._local.values())
+            if user_ids is None:
+                return sorted(online)
+            return [str(user_id) for user_id in user_ids if str(user_id) in online]
+
+        now = time.time()
+        try:
+            if user_ids is None:
+                return [self._decode(member) for member in client.zrangebyscore(ONLINE_KEY, now, '+inf')]
+            user_ids = [str(user_id) for user_id in user_ids]
+            if not user_ids:
+                return []
+            scores = client.zmscore(ONLINE_KEY, user_ids)
+            return [user_id for user_id, score in zip(user_ids, scores, strict=True) if score is not None and score > now]
+        except Exception as e:
+            logger.warning(f"온라인 사용자 조회 실패: {e}")
+            return []
+
+    def sessions(self, user_id: str) -> list[str]:
+        """사용자의 활성 세션 ID 목록 (모든 워커)"""
+        user_id = str(user_id)
+        client = self._redis()
+        if client is None:
+            with self._lock:
+                return [sid for sid, owner in self._local.items() if owner == user_id]
+        try:
+            return [self._decode(sid) for sid in client.zrangebyscore(session_key(user_id), time.time(), '+inf')]
+        except Exception as e:
+            logger.warning(f"세션 조회 실패: {user_id} - {e}")
+            return []
+
+    def user_for(self, sid: str) -> str | None:
+        """이 워커에 연결된 세션의 사용자 ID"""
+        with self._lock:
+            return self._local.get(sid)
+
+    def local_count(self) -> int:
+        with self._lock:
+            return len(self._local)
+
+
+# 전역 접속 현황 레지스트리
+presence = PresenceRegistry()
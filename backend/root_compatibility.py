@@ -149,6 +149,44 @@ def root_dev_my_dangolpots(employee_id):
             'employee_id': employee_id
         }), 500
 
+def _dev_schedules_from_calendar(employee_id, start_date, end_date):
+    """캘린더 캐시의 개인일정을 개발용 일정 응답 형식으로 변환 (날짜 형식 오류 시 None)"""
+    from datetime import datetime
+    from backend.services.calendar_cache import CalendarCacheService
+
+    try:
+        start = datetime.strptime(start_date, '%Y-%m-%d').date()
+        end = datetime.strptime(end_date, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+    groups, etag = CalendarCacheService.get_range(employee_id, start, end)
+    schedules = [
+        {
+            'id': event['master_schedule_id'],
+            'title': event['title'],
+            'schedule_date': group['date'],
+            'time': event['time'],
+            'restaurant': event['restaurant'],
+            'location': event['location'],
+            'description': event['description']
+        }
+        for group in groups
+        for event in group['events']
+        if event.get('type') == 'personal_schedule'
+    ]
+    response = jsonify({
+        'success': True,
+        'schedules': schedules,
+        'employee_id': employee_id,
+        'start_date': start_date,
+        'end_date': end_date,
+        'message': '일정 조회 완료'
+    })
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
 @root_compatibility_bp.route('/dev/schedules', methods=['GET'])
 def root_dev_schedules():
     """루트 레벨 개발용 일정 조회 API - 안전한 방식으로 재작성"""
@@ -161,6 +199,12 @@ def root_dev_schedules():
 
         logger.info(f"요청 파라미터: employee_id={employee_id}, start_date={start_date}, end_date={end_date}")
 
+        # 기간이 주어지면 사용자/월 단위 캘린더 캐시에서 응답 (변경이 없으면 304)
+        if start_date and end_date:
+            cached_response = _dev_schedules_from_calendar(employee_id, start_date, end_date)
+            if cached_response is not None:
+                return cached_response
+
         # 기본 응답 구조
         response_data = {
             'success': True,
@@ -777,47 +821,24 @@ def root_dev_parties():
 
     # 실제 파티 데이터 조회
     try:
-        from models.app_models import Party, PartyMember
-        from backend.auth.models import User
+        from backend.services.party_feed import PartyFeedService
 
         # 쿼리 파라미터
         employee_id = request.args.get('employee_id', '1')
         is_from_match = request.args.get('is_from_match', 'false').lower() == 'true'
 
-        # 사용자가 참여한 파티 조회
-        party_memberships = PartyMember.query.filter_by(employee_id=employee_id).all()
-        party_ids = [pm.party_id for pm in party_memberships]
-
-        # 파티 목록 조회
-        parties = Party.query.filter(Party.id.in_(party_ids)).all()
+        # 사용자가 참여한 파티 조회 (멤버/사용자 정보는 IN 쿼리 한 번씩)
+        cards = PartyFeedService.get_member_feed(employee_id, is_from_match=is_from_match)['parties']
 
         # 파티 데이터 포맷팅
         party_list = []
-        for party in parties:
-            # 파티 멤버 조회
-            members = PartyMember.query.filter_by(party_id=party.id).all()
-            member_list = []
-            for member in members:
-                user = User.query.filter_by(employee_id=member.employee_id).first()
-                if user:
-                    member_list.append({
-                        'employee_id': user.employee_id,
-                        'nickname': user.nickname,
-                        'email': user.email
-                    })
-
+        for card in cards:
             party_list.append({
-                'id': party.id,
-                'title': party.title,
-                'description': party.description,
-                'restaurant_name': party.restaurant_name,
-                'restaurant_address': party.restaurant_address,
-                'meeting_time': party.meeting_time.isoformat() if party.meeting_time else None,
-                'max_participants': party.max_participants,
-                'current_participants': len(member_list),
-                'host_employee_id': party.host_employee_id,
-                'members': member_list,
-                'created_at': party.created_at.isoformat() if party.created_at else None
+                **card,
+                'meeting_time': f"{card['party_date']}T{card['party_time']}" if card['party_date'] and card['party_time'] else None,
+                'max_participants': card['max_members'],
+                'current_participants': card['member_count'],
+                'host_employee_id': card['host']['employee_id'],
             })
 
         return jsonify({
@@ -6,6 +6,9 @@ from backend.models.app_models import (
     ChatRoomSettings, MessageSearchIndex
 )
 from backend.auth.models import User
+from backend.utils.utils_query_optimizer import QueryOptimizer
+from backend.services.chat_unread import ChatUnreadService
+from backend.services.chat_inbox import ChatInboxService
 from datetime import datetime, timedelta
 # Blueprint 생성
 chats_bp = Blueprint('chats', __name__)
@@ -19,88 +22,85 @@ def get_seoul_today():
 
 @chats_bp.route("/chats/<employee_id>", methods=["GET"])
 def get_user_chats(employee_id):
-    """사용자의 채팅방 목록 조회"""
+    """사용자의 채팅방 목록 조회 (최근 활동순, cursor로 다음 페이지 조회)"""
     try:
-        # 사용자가 참여한 채팅방들
-        user_chats = ChatRoom.query.join(ChatParticipant).filter(
-            ChatParticipant.user_id == employee_id
-        ).all()
-
-        chats_data = []
-        for chat in user_chats:
-            # 마지막 메시지 조회
-            last_message = ChatMessage.query.filter_by(
-                chat_type=chat.type,
-                chat_id=chat.id
-            ).order_by(desc(ChatMessage.created_at)).first()
-
-            # 참여자 수
-            participant_count = ChatParticipant.query.filter_by(
-                room_id=chat.id
-            ).count()
-
-            chat_info = {
-                "id": chat.id,
-                "type": chat.type,
-                "name": chat.name,
-                "last_message_content": last_message.message if last_message else "",
-                "last_message_sender": last_message.sender_employee_id if last_message else None,
-                "last_message_timestamp": last_message.created_at.isoformat() if last_message else None,
-                "participant_count": participant_count,
-                "created_at": chat.created_at.isoformat() if chat.created_at else None
-            }
-            chats_data.append(chat_info)
+        page = ChatInboxService.get_inbox(
+            employee_id,
+            chat_type=request.args.get("type"),
+            limit=request.args.get("limit", ChatInboxService.DEFAULT_LIMIT, type=int),
+            cursor=request.args.get("cursor")
+        )
 
         return jsonify({
             "success": True,
-            "chats": chats_data
+            "chats": page["chats"],
+            "has_more": page["has_more"],
+            "next_cursor": page["next_cursor"]
         })
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         print(f"채팅방 목록 조회 오류: {e}")
         return jsonify({"error": str(e)}), 500
 
 @chats_bp.route("/chat/messages/<chat_type>/<int:chat_id>", methods=["GET"])
 def get_chat_messages(chat_type, chat_id):
-    """채팅 메시지 조회"""
+    """
+    채팅 메시지 조회 (커서 기반 페이지네이션)
+
+    Query params:
+        per_page: 페이지 크기 (최대 100)
+        before / after: 이전 응답의 pagination.before_cursor / after_cursor
+        include_total: true이면 채팅방 전체 메시지 수 포함
+    """
     try:
-        page = request.args.get("page", 1, type=int)
-        per_page = min(request.args.get("per_page", 50, type=int), 100)
+        per_page = max(1, min(request.args.get("per_page", 50, type=int), 100))
+        before = request.args.get("before")
+        after = request.args.get("after")
+        include_total = request.args.get("include_total", "false").lower() == "true"
+
+        try:
+            page = QueryOptimizer.get_message_page(
+                chat_type, chat_id, limit=per_page, before=before, after=after
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
 
-        messages_query = ChatMessage.query.filter_by(
-            chat_type=chat_type,
-            chat_id=chat_id
-        ).order_by(desc(ChatMessage.created_at))
+        messages = page["messages"]
 
-        total = messages_query.count()
-        messages = messages_query.offset((page - 1) * per_page).limit(per_page).all()
+        # 닉네임이 없는 메시지의 발신자만 한 번에 조회
+        nicknames = QueryOptimizer.get_sender_nicknames(
+            message.sender_employee_id for message in messages if not message.sender_nickname
+        )
 
         messages_data = []
         for message in messages:
-            # 발신자 정보 조회
-            sender = User.query.filter_by(employee_id=message.sender_employee_id).first()
-
             message_info = {
                 "id": message.id,
                 "content": message.message,
                 "sender": {
                     "employee_id": message.sender_employee_id,
-                    "nickname": message.sender_nickname if message.sender_nickname else (sender.nickname if sender else "알 수 없음")
+                    "nickname": message.sender_nickname or nicknames.get(message.sender_employee_id, "알 수 없음")
                 },
                 "created_at": message.created_at.isoformat() if message.created_at else None,
                 "message_type": message.message_type or "text"
             }
             messages_data.append(message_info)
 
+        pagination = {
+            "per_page": per_page,
+            "has_more": page["has_more"],
+            "before_cursor": page["before_cursor"],
+            "after_cursor": page["after_cursor"],
+        }
+        if include_total:
+            pagination["total"] = ChatMessage.query.filter_by(chat_type=chat_type, chat_id=chat_id).count()
+
         return jsonify({
             "success": True,
             "messages": messages_data,
-            "pagination": {
-                "page": page,
-                "per_page": per_page,
-                "total": total,
-                "pages": (total + per_page - 1) // per_page
-            }
+            "pagination": pagination
         })
 
     except Exception as e:
@@ -141,6 +141,9 @@ def send_chat_message():
         )
         db.session.add(search_index)
 
+        # 발신자를 제외한 멤버의 읽지 않은 수 증가
+        ChatUnreadService.on_message_sent(data["chat_type"], data["chat_id"], data["sender_id"])
+
         db.session.commit()
 
         return jsonify({
@@ -168,23 +171,17 @@ def mark_messages_read():
         if not all([employee_id, chat_type, chat_id]):
             return jsonify({"error": "모든 필드가 필요합니다."}), 400
 
-        # 읽지 않은 메시지들을 읽음으로 표시
-        unread_messages = ChatMessage.query.filter(
-            and_(
-                ChatMessage.chat_type == chat_type,
-                ChatMessage.chat_id == chat_id,
-                ChatMessage.sender_id != employee_id
-            )
-        ).all()
-
-        for message in unread_messages:
-            message.is_read = True
+        # 읽음 커서를 이동 (message_id가 없으면 최신 메시지까지)
+        result = ChatUnreadService.mark_read(employee_id, chat_type, chat_id, data.get("message_id"))
+        if result is None:
+            return jsonify({"error": "채팅방 멤버가 아닙니다."}), 404
 
         db.session.commit()
 
         return jsonify({
-            "message": f"{len(unread_messages)}개의 메시지를 읽음으로 표시했습니다.",
-            "read_count": len(unread_messages)
+            "message": f"{result['read_count']}개의 메시지를 읽음으로 표시했습니다.",
+            "read_count": result["read_count"],
+            "unread_count": result["unread_count"]
         })
 
     except Exception as e:
@@ -192,6 +189,22 @@ def mark_messages_read():
         print(f"메시지 읽음 표시 오류: {e}")
         return jsonify({"error": str(e)}), 500
 
+@chats_bp.route("/chat/unread/<employee_id>", methods=["GET"])
+def get_unread_counts(employee_id):
+    """참여 중인 모든 채팅방의 읽지 않은 메시지 수 조회"""
+    try:
+        counts = ChatUnreadService.get_unread_counts(employee_id)
+
+        return jsonify({
+            "success": True,
+            "unread_counts": counts,
+            "total": sum(counts.values())
+        })
+
+    except Exception as e:
+        print(f"읽지 않은 메시지 수 조회 오류: {e}")
+        return jsonify({"error": str(e)}), 500
+
 @chats_bp.route("/chat/messages/search", methods=["GET"])
 def search_chat_messages():
     """채팅 메시지 검색"""
@@ -459,38 +472,22 @@ def get_filtered_chats():
         if not employee_id:
             return jsonify({"error": "사용자 ID가 필요합니다."}), 400
 
-        chats_query = ChatRoom.query.join(ChatParticipant).filter(
-            ChatParticipant.employee_id == employee_id
+        page = ChatInboxService.get_inbox(
+            employee_id,
+            chat_type=chat_type,
+            limit=request.args.get("limit", ChatInboxService.DEFAULT_LIMIT, type=int),
+            cursor=request.args.get("cursor")
         )
 
-        if chat_type:
-            chats_query = chats_query.filter(ChatRoom.type == chat_type)
-
-        chats = chats_query.all()
-
-        chats_data = []
-        for chat in chats:
-            # 마지막 메시지 조회
-            last_message = ChatMessage.query.filter_by(
-                chat_type=chat.type,
-                chat_id=chat.id
-            ).order_by(desc(ChatMessage.created_at)).first()
-
-            chat_info = {
-                "id": chat.id,
-                "type": chat.type,
-                "title": chat.title,
-                "last_message": last_message.content if last_message else "",
-                "last_message_time": last_message.created_at.isoformat() if last_message else None,
-                "created_at": chat.created_at.isoformat() if chat.created_at else None
-            }
-            chats_data.append(chat_info)
-
         return jsonify({
-            "chats": chats_data,
-            "total": len(chats_data)
+            "chats": page["chats"],
+            "total": len(page["chats"]),
+            "has_more": page["has_more"],
+            "next_cursor": page["next_cursor"]
         })
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         print(f"필터링된 채팅방 조회 오류: {e}")
         return jsonify({"error": str(e)}), 500
@@ -564,6 +561,11 @@ def mark_message_read(message_id):
             )
             db.session.add(message_status)
 
+        # 채팅방 읽음 커서도 함께 이동
+        message = db.session.get(ChatMessage, message_id)
+        if message:
+            ChatUnreadService.mark_read(user_id, message.chat_type, message.chat_id, message_id)
+
         db.session.commit()
 
         return jsonify({
@@ -842,6 +844,7 @@ def add_chat_room_member(chat_type, chat_id):
                 existing_member.is_left = False
                 existing_member.left_at = None
                 existing_member.joined_at = datetime.utcnow()
+                ChatUnreadService.forget(user_id)
             else:
                 return jsonify({"error": "이미 채팅방 멤버입니다."}), 400
         else:
@@ -853,6 +856,7 @@ def add_chat_room_member(chat_type, chat_id):
                 role='member'
             )
             db.session.add(new_member)
+            ChatUnreadService.forget(user_id)
 
         db.session.commit()
 
@@ -899,6 +903,7 @@ def remove_chat_room_member(chat_type, chat_id, user_id):
         # 소프트 삭제 (나가기)
         member.is_left = True
         member.left_at = datetime.utcnow()
+        ChatUnreadService.forget(user_id)
 
         db.session.commit()
 
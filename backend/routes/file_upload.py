@@ -3,9 +3,11 @@
 이미지, 문서, 비디오, 오디오 파일 업로드를 처리합니다.
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response
 from backend.app.extensions import db
 from backend.models.app_models import MessageAttachment
+from backend.services.file_delivery import FileDeliveryService
+from backend.services.image_variants import PLACEHOLDER_SVG, VARIANTS, variant_path, variant_paths
 from backend.utils.file_manager import file_manager
 # 인증 미들웨어는 UnifiedBlueprintManager에서 중앙 관리됨
 import os
@@ -15,6 +17,35 @@ file_upload_bp = Blueprint('file_upload', __name__)  # url_prefix는 UnifiedBlue
 
 # 인증 미들웨어는 UnifiedBlueprintManager에서 중앙 관리됨
 
+def _create_attachment(message_id, file_metadata):
+    """첨부파일 행 생성 (같은 내용의 파일은 content_hash로 공유)"""
+    attachment = MessageAttachment(
+        message_id=int(message_id),
+        file_name=file_metadata['original_filename'],
+        file_path=file_metadata['file_path'],
+        file_size=file_metadata['file_size'],
+        file_type=file_metadata['file_type'],
+        mime_type=file_metadata['mime_type'],
+        thumbnail_path=file_metadata['thumbnail_path'],
+        content_hash=file_metadata['file_hash'],
+        variant_status=file_metadata.get('variant_status')
+    )
+    db.session.add(attachment)
+    return attachment
+
+def _placeholder(variant_status):
+    """변형이 준비되기 전 자리표시 이미지 (캐시하지 않음 - 준비되면 바로 실제 이미지로 교체)"""
+    response = Response(PLACEHOLDER_SVG, mimetype='image/svg+xml')
+    response.headers['Cache-Control'] = 'no-store'
+    response.headers['X-Variant-Status'] = variant_status or 'missing'
+    return response
+
+def _reference_count(attachment):
+    """같은 내용 파일을 참조하는 첨부파일 수 (해시가 없는 기존 첨부파일은 단독 참조)"""
+    if not attachment.content_hash:
+        return 1
+    return MessageAttachment.query.filter_by(content_hash=attachment.content_hash).count()
+
 @file_upload_bp.route('/upload', methods=['POST'])
 def upload_file():
     """파일 업로드"""
@@ -40,20 +71,15 @@ def upload_file():
 
         # 데이터베이스에 파일 정보 저장
         if message_id:
-            attachment = MessageAttachment(
-                message_id=int(message_id),
-                file_name=file_metadata['original_filename'],
-                file_path=file_metadata['file_path'],
-                file_size=file_metadata['file_size'],
-                file_type=file_metadata['file_type'],
-                mime_type=file_metadata['mime_type'],
-                thumbnail_path=file_metadata['thumbnail_path']
-            )
-            db.session.add(attachment)
+            attachment = _create_attachment(message_id, file_metadata)
             db.session.commit()
 
             file_metadata['attachment_id'] = attachment.id
 
+        # 행을 커밋한 뒤 저장소로 옮기고, 이미지 변형은 요청 밖에서 생성
+        file_manager.finalize_blob(file_metadata)
+        file_manager.schedule_variants(file_metadata)
+
         return jsonify({
             "success": True,
             "message": message,
@@ -66,8 +92,11 @@ def upload_file():
 
 @file_upload_bp.route('/upload/multiple', methods=['POST'])
 def upload_multiple_files():
-    """다중 파일 업로드"""
+    """다중 파일 업로드 (upload_id가 있으면 재개 가능한 조각 업로드)"""
     try:
+        if request.form.get('upload_id'):
+            return _upload_chunk()
+
         files = request.files.getlist('files')
         if not files:
             return jsonify({"error": "파일이 선택되지 않았습니다."}), 400
@@ -78,6 +107,7 @@ def upload_multiple_files():
 
         uploaded_files = []
         failed_files = []
+        attachments = []
 
         for file in files:
             if file.filename == '':
@@ -88,17 +118,7 @@ def upload_multiple_files():
             if file_metadata:
                 # 데이터베이스에 파일 정보 저장
                 if message_id:
-                    attachment = MessageAttachment(
-                        message_id=int(message_id),
-                        file_name=file_metadata['original_filename'],
-                        file_path=file_metadata['file_path'],
-                        file_size=file_metadata['file_size'],
-                        file_type=file_metadata['file_type'],
-                        mime_type=file_metadata['mime_type'],
-                        thumbnail_path=file_metadata['thumbnail_path']
-                    )
-                    db.session.add(attachment)
-                    file_metadata['attachment_id'] = attachment.id
+                    attachments.append((_create_attachment(message_id, file_metadata), file_metadata))
 
                 uploaded_files.append(file_metadata)
             else:
@@ -108,6 +128,11 @@ def upload_multiple_files():
                 })
 
         db.session.commit()
+        for attachment, file_metadata in attachments:
+            file_metadata['attachment_id'] = attachment.id
+        for file_metadata in uploaded_files:
+            file_manager.finalize_blob(file_metadata)
+            file_manager.schedule_variants(file_metadata)
 
         return jsonify({
             "success": True,
@@ -121,6 +146,63 @@ def upload_multiple_files():
         db.session.rollback()
         return jsonify({"error": f"다중 파일 업로드 중 오류가 발생했습니다: {str(e)}"}), 500
 
+def _upload_chunk():
+    """
+    재개 가능한 조각 업로드
+    form: upload_id, offset, total_size, filename, file_type, user_id, message_id / 파일: chunk
+    끊긴 경우 GET /upload/multiple?upload_id=...로 받은 위치를 확인하고 그 위치부터 다시 보냅니다.
+    """
+    chunk = request.files.get('chunk')
+    if chunk is None:
+        return jsonify({"error": "조각 파일(chunk)이 없습니다."}), 400
+
+    try:
+        offset = int(request.form.get('offset', 0))
+        total_size = int(request.form.get('total_size', 0))
+    except ValueError:
+        return jsonify({"error": "offset과 total_size는 숫자여야 합니다."}), 400
+
+    message_id = request.form.get('message_id')
+    result, message = file_manager.append_upload_chunk(
+        upload_id=request.form['upload_id'],
+        offset=offset,
+        stream=chunk.stream,
+        filename=request.form.get('filename') or chunk.filename,
+        total_size=total_size,
+        file_type=request.form.get('file_type', 'image'),
+        user_id=request.form.get('user_id')
+    )
+    if not result:
+        return jsonify({"error": message}), 400
+    if result.get('conflict'):
+        return jsonify({"error": message, **result}), 409
+    if not result['complete']:
+        return jsonify({"success": True, "message": message, **result}), 202
+
+    file_metadata = result['file_metadata']
+    if message_id:
+        attachment = _create_attachment(message_id, file_metadata)
+        db.session.commit()
+        file_metadata['attachment_id'] = attachment.id
+    file_manager.finalize_blob(file_metadata)
+    file_manager.schedule_variants(file_metadata)
+
+    return jsonify({"success": True, "message": message, **result}), 200
+
+@file_upload_bp.route('/upload/multiple', methods=['GET'])
+def get_upload_status():
+    """재개 가능한 업로드의 받은 위치 조회"""
+    upload_id = request.args.get('upload_id')
+    received = file_manager.get_upload_offset(upload_id)
+    if received is None:
+        return jsonify({"error": "유효하지 않은 업로드 ID입니다."}), 400
+
+    return jsonify({
+        "success": True,
+        "upload_id": upload_id,
+        "received": received
+    }), 200
+
 @file_upload_bp.route('/<int:attachment_id>', methods=['GET'])
 def get_file_info(attachment_id):
     """파일 정보 조회"""
@@ -145,6 +227,9 @@ def get_file_info(attachment_id):
                 "file_type": attachment.file_type,
                 "mime_type": attachment.mime_type,
                 "thumbnail_path": attachment.thumbnail_path,
+                "content_hash": attachment.content_hash,
+                "reference_count": _reference_count(attachment),
+                "variant_status": attachment.variant_status,
                 "created_at": attachment.created_at.isoformat()
             },
             "file_info": file_info
@@ -161,24 +246,42 @@ def delete_file(attachment_id):
         if not attachment:
             return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
 
-        # 파일 삭제
-        success, message = file_manager.delete_file(attachment.file_path)
-
-        # 썸네일도 삭제
-        if attachment.thumbnail_path:
-            file_manager.delete_file(attachment.thumbnail_path)
-
-        if success:
-            # 데이터베이스에서도 삭제
-            db.session.delete(attachment)
-            db.session.commit()
-
-            return jsonify({
-                "success": True,
-                "message": "파일이 성공적으로 삭제되었습니다."
-            }), 200
-        else:
-            return jsonify({"error": message}), 500
+        FileDeliveryService.invalidate(attachment_id)
+
+        # 같은 내용의 업로드 마무리(finalize_blob)와 겹치지 않도록 해시 잠금 안에서 참조 수를 세고 삭제
+        with file_manager.blob_lock(attachment.content_hash):
+            # 다른 첨부파일이 같은 내용을 참조하면 행만 삭제
+            if _reference_count(attachment) > 1:
+                db.session.delete(attachment)
+                db.session.commit()
+
+                return jsonify({
+                    "success": True,
+                    "message": "파일이 성공적으로 삭제되었습니다."
+                }), 200
+
+            # 파일 삭제
+            success, message = file_manager.delete_file(attachment.file_path)
+
+            # 썸네일과 이미지 변형도 삭제
+            if attachment.thumbnail_path:
+                file_manager.delete_file(attachment.thumbnail_path)
+            if attachment.variant_status:
+                for path in variant_paths(file_manager.variants_folder, attachment.content_hash).values():
+                    if os.path.exists(path):
+                        file_manager.delete_file(path)
+
+            if success:
+                # 데이터베이스에서도 삭제
+                db.session.delete(attachment)
+                db.session.commit()
+
+                return jsonify({
+                    "success": True,
+                    "message": "파일이 성공적으로 삭제되었습니다."
+                }), 200
+            else:
+                return jsonify({"error": message}), 500
 
     except Exception as e:
         db.session.rollback()
@@ -200,6 +303,7 @@ def get_message_attachments(message_id):
                 "file_type": attachment.file_type,
                 "mime_type": attachment.mime_type,
                 "thumbnail_path": attachment.thumbnail_path,
+                "variant_status": attachment.variant_status,
                 "created_at": attachment.created_at.isoformat(),
                 "exists": file_info is not None
             })
@@ -234,11 +338,13 @@ def cleanup_files():
     """임시 파일 정리"""
     try:
         max_age_hours = request.json.get('max_age_hours', 24) if request.json else 24
-        file_manager.cleanup_temp_files(max_age_hours)
+        result = file_manager.cleanup_temp_files(max_age_hours)
 
         return jsonify({
             "success": True,
-            "message": f"{max_age_hours}시간 이상 된 임시 파일이 정리되었습니다."
+            "message": f"{max_age_hours}시간 이상 된 임시 파일이 정리되었습니다.",
+            "deleted_files": result['rows'],
+            "reclaimed_bytes": result['bytes']
         }), 200
 
     except Exception as e:
@@ -246,21 +352,21 @@ def cleanup_files():
 
 @file_upload_bp.route('/serve/<int:attachment_id>', methods=['GET'])
 def serve_file(attachment_id):
-    """파일 서빙 (다운로드)"""
+    """파일 서빙 (ETag/Range 지원, 동영상/오디오는 바로 재생)"""
     try:
-        attachment = MessageAttachment.query.get(attachment_id)
+        attachment = FileDeliveryService.load_attachment(attachment_id)
         if not attachment:
             return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
 
-        if not os.path.exists(attachment.file_path):
+        if not os.path.exists(attachment['file_path']):
             return jsonify({"error": "파일이 서버에 존재하지 않습니다."}), 404
 
-        from flask import send_file
-        return send_file(
-            attachment.file_path,
-            as_attachment=True,
-            download_name=attachment.file_name,
-            mimetype=attachment.mime_type
+        return FileDeliveryService.send(
+            attachment['file_path'],
+            mimetype=attachment['mime_type'],
+            etag=FileDeliveryService.etag(attachment['content_hash']),
+            download_name=attachment['file_name'],
+            as_attachment=attachment['file_type'] not in ('video', 'audio')
         )
 
     except Exception as e:
@@ -268,21 +374,34 @@ def serve_file(attachment_id):
 
 @file_upload_bp.route('/thumbnail/<int:attachment_id>', methods=['GET'])
 def serve_thumbnail(attachment_id):
-    """썸네일 서빙"""
+    """썸네일 서빙 (생성 전이면 자리표시 이미지)"""
+    return serve_variant(attachment_id, 'thumb')
+
+@file_upload_bp.route('/variant/<int:attachment_id>/<variant>', methods=['GET'])
+def serve_variant(attachment_id, variant):
+    """이미지 변형 서빙 (thumb, medium, webp - 생성 전이면 자리표시 이미지)"""
     try:
-        attachment = MessageAttachment.query.get(attachment_id)
+        if variant not in VARIANTS:
+            return jsonify({"error": "지원하지 않는 이미지 변형입니다."}), 400
+
+        attachment = FileDeliveryService.load_attachment(attachment_id)
         if not attachment:
             return jsonify({"error": "파일을 찾을 수 없습니다."}), 404
 
-        if not attachment.thumbnail_path or not os.path.exists(attachment.thumbnail_path):
-            return jsonify({"error": "썸네일을 찾을 수 없습니다."}), 404
+        etag = None
+        if attachment['variant_status']:
+            path = variant_path(file_manager.variants_folder, attachment['content_hash'], variant)
+            etag = FileDeliveryService.etag(attachment['content_hash'], variant)
+        else:
+            # 변형 생성 이전에 올라온 첨부파일은 썸네일만 있음
+            path = attachment['thumbnail_path'] if variant == 'thumb' else None
 
-        from flask import send_file
-        return send_file(
-            attachment.thumbnail_path,
-            as_attachment=False,
-            mimetype='image/jpeg'
-        )
+        if path and os.path.exists(path):
+            return FileDeliveryService.send(path, mimetype=VARIANTS[variant]['mimetype'], etag=etag)
+
+        if attachment['file_type'] == 'image':
+            return _placeholder(attachment['variant_status'])
+        return jsonify({"error": "썸네일을 찾을 수 없습니다."}), 404
 
     except Exception as e:
         return jsonify({"error": f"썸네일 서빙 중 오류가 발생했습니다: {str(e)}"}), 500
@@ -3,8 +3,10 @@ from sqlalchemy import or_, and_
 from backend.app.extensions import db
 from backend.models.app_models import MatchRequest, Match
 from backend.auth.models import User
+from backend.services.compatibility import compatibility_engine
 from datetime import datetime, timedelta
 import random
+import numpy as np
 
 # Blueprint 생성
 matching_bp = Blueprint('matching', __name__)
@@ -17,83 +19,30 @@ def get_seoul_today():
     return korean_time.date()
 
 def calculate_compatibility_score(user1, user2):
-    """두 사용자 간의 호환성 점수 계산"""
-    score = 0
-
-    # 부서가 같으면 +30점
-    if user1.department == user2.department:
-        score += 30
-
-    # 직급이 비슷하면 +20점
-    level_diff = abs(user1.level - user2.level) if hasattr(user1, 'level') and hasattr(user2, 'level') else 0
-    if level_diff <= 1:
-        score += 20
-    elif level_diff <= 2:
-        score += 10
-
-    # 나이가 비슷하면 +15점
-    age_diff = abs(user1.age - user2.age) if hasattr(user1, 'age') and hasattr(user2, 'age') else 0
-    if age_diff <= 3:
-        score += 15
-    elif age_diff <= 5:
-        score += 10
-
-    # 취미가 겹치면 +25점
-    if hasattr(user1, 'hobbies') and hasattr(user2, 'hobbies'):
-        user1_hobbies = set(user1.hobbies.split(',') if user1.hobbies else [])
-        user2_hobbies = set(user2.hobbies.split(',') if user2.hobbies else [])
-        common_hobbies = user1_hobbies.intersection(user2_hobbies)
-        score += len(common_hobbies) * 5
-
-    # 선호도가 겹치면 +20점
-    if hasattr(user1, 'preferences') and hasattr(user2, 'preferences'):
-        user1_prefs = set(user1.preferences.split(',') if user1.preferences else [])
-        user2_prefs = set(user2.preferences.split(',') if user2.preferences else [])
-        common_prefs = user1_prefs.intersection(user2_prefs)
-        score += len(common_prefs) * 4
-
-    return min(score, 100)  # 최대 100점
+    """두 사용자 간의 호환성 점수 계산 (규칙은 CompatibilityEngine._match_scores 참고)"""
+    return compatibility_engine.pair_score(user1.employee_id, user2.employee_id)
 
 def find_best_match(user_id, exclude_ids=None):
     """사용자에게 가장 적합한 매칭 상대 찾기"""
-    # 지연 import로 SQLAlchemy 충돌 방지
+    excluded = set(exclude_ids or [])
+    excluded.add(user_id)
 
-    if exclude_ids is None:
-        exclude_ids = []
-
-    user = User.query.filter_by(employee_id=user_id).first()
-    if not user:
+    # 엔진에 인코딩된 활성 사용자 전체와의 점수를 한 번에 계산
+    candidate_ids, scores = compatibility_engine.scores_for(user_id)
+    if not candidate_ids:
         return None
 
-    # 이미 매칭된 사용자들 제외
-    exclude_ids.append(user_id)
-
-    # 매칭 가능한 사용자들 조회
-    available_users = User.query.filter(
-        and_(
-            User.employee_id.notin_(exclude_ids),
-            User.is_active == True
-        )
-    ).all()
-
-    if not available_users:
+    keep = np.fromiter((cid not in excluded for cid in candidate_ids), dtype=bool, count=len(candidate_ids))
+    candidate_ids = [cid for cid, k in zip(candidate_ids, keep, strict=True) if k]
+    scores = scores[keep]
+    if not candidate_ids:
         return None
 
-    # 호환성 점수 계산 및 정렬
-    user_scores = []
-    for candidate in available_users:
-        score = calculate_compatibility_score(user, candidate)
-        user_scores.append((candidate, score))
-
-    # 점수 순으로 정렬 (높은 점수 우선)
-    user_scores.sort(key=lambda x: x[1], reverse=True)
-
     # 상위 3명 중에서 랜덤 선택 (다양성 확보)
-    top_candidates = user_scores[:3]
-    if top_candidates:
-        return random.choice(top_candidates)[0]
-
-    return None
+    top = min(3, len(candidate_ids))
+    top_idx = np.argpartition(-scores, top - 1)[:top]
+    chosen_id = candidate_ids[int(random.choice(top_idx))]
+    return User.query.filter_by(employee_id=chosen_id, is_active=True).first()
 
 @matching_bp.route("/match/status/<employee_id>", methods=["GET"])
 def get_match_status(employee_id):
@@ -360,3 +309,29 @@ def reject_match():
         db.session.rollback()
         print(f"매칭 거절 오류: {e}")
         return jsonify({"error": str(e)}), 500
+
+@matching_bp.route("/recommendations/<employee_id>", methods=["GET"])
+def get_recommendations(employee_id):
+    """야간 배치로 미리 계산된 사용자별 추천 그룹 조회 (기본값: 내일)"""
+    try:
+        from backend.utils.recommendation_utils import get_user_recommendations
+
+        target_date = request.args.get("date") or (get_seoul_today() + timedelta(days=1)).strftime("%Y-%m-%d")
+        try:
+            datetime.strptime(target_date, "%Y-%m-%d")
+        except ValueError:
+            return jsonify({"error": "날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)"}), 400
+
+        cached = get_user_recommendations(employee_id, target_date)
+        if cached is None:
+            return jsonify({
+                "date": target_date,
+                "recommendations": [],
+                "message": "아직 생성된 추천이 없습니다."
+            })
+
+        return jsonify(cached)
+
+    except Exception as e:
+        print(f"추천 조회 오류: {e}")
+        return jsonify({"error": str(e)}), 500
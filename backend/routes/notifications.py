@@ -69,7 +69,8 @@ def send_bulk_notification():
             chat_type=data.get('chat_type'),
             chat_id=data.get('chat_id'),
             message_id=data.get('message_id'),
-            related_data=data.get('related_data')
+            related_data=data.get('related_data'),
+            background=bool(data.get('background'))
         )
 
         if not success:
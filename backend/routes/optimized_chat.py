@@ -23,17 +23,25 @@ def get_messages_optimized(chat_type, chat_id):
         start_time = time.time()
 
         # 파라미터
-        limit = int(request.args.get('limit', 50))
-        offset = int(request.args.get('offset', 0))
+        limit = max(1, min(int(request.args.get('limit', 50)), 100))
+        before = request.args.get('before')
+        after = request.args.get('after')
         include_reactions = request.args.get('include_reactions', 'true').lower() == 'true'
         include_attachments = request.args.get('include_attachments', 'true').lower() == 'true'
 
+        try:
+            for cursor in (before, after):
+                if cursor:
+                    query_optimizer.decode_message_cursor(cursor)
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+
         # 캐시 키 생성
-        cache_key = f"messages:{chat_type}:{chat_id}:{limit}:{offset}:{include_reactions}:{include_attachments}"
+        cache_key = f"messages:{chat_type}:{chat_id}:{limit}:{before}:{after}:{include_reactions}:{include_attachments}"
 
         # 캐시에서 조회 시도
-        cached_messages = chat_cache_manager.get(cache_key)
-        if cached_messages:
+        cached_page = chat_cache_manager.get(cache_key)
+        if cached_page:
             performance_monitor.record_api_time(
                 endpoint='get_messages_optimized',
                 method='GET',
@@ -42,23 +50,25 @@ def get_messages_optimized(chat_type, chat_id):
             )
             return jsonify({
                 "success": True,
-                "messages": cached_messages,
-                "total": len(cached_messages),
+                "messages": cached_page['messages'],
+                "total": len(cached_page['messages']),
+                "pagination": {key: cached_page[key] for key in ('has_more', 'before_cursor', 'after_cursor')},
                 "cached": True
             }), 200
 
         # 데이터베이스에서 조회
-        messages = query_optimizer.get_messages_optimized(
+        page = query_optimizer.get_messages_optimized(
             chat_type=chat_type,
             chat_id=chat_id,
             limit=limit,
-            offset=offset,
+            before=before,
+            after=after,
             include_reactions=include_reactions,
             include_attachments=include_attachments
         )
 
         # 캐시에 저장 (5분)
-        chat_cache_manager.set(cache_key, messages, ttl=300)
+        chat_cache_manager.set(cache_key, page, ttl=300)
 
         performance_monitor.record_api_time(
             endpoint='get_messages_optimized',
@@ -69,8 +79,9 @@ def get_messages_optimized(chat_type, chat_id):
 
         return jsonify({
             "success": True,
-            "messages": messages,
-            "total": len(messages),
+            "messages": page['messages'],
+            "total": len(page['messages']),
+            "pagination": {key: page[key] for key in ('has_more', 'before_cursor', 'after_cursor')},
             "cached": False
         }), 200
 
@@ -98,34 +109,13 @@ def get_unread_count_optimized(user_id):
         chat_type = request.args.get('chat_type')
         chat_id = request.args.get('chat_id', type=int)
 
-        # 캐시 키 생성
-        cache_key = f"unread_count:{user_id}:{chat_type}:{chat_id}"
-
-        # 캐시에서 조회 시도
-        cached_count = chat_cache_manager.get_cached_unread_count(user_id, chat_type, chat_id)
-        if cached_count is not None:
-            performance_monitor.record_api_time(
-                endpoint='get_unread_count_optimized',
-                method='GET',
-                duration=time.time() - start_time,
-                status_code=200
-            )
-            return jsonify({
-                "success": True,
-                "unread_count": cached_count,
-                "cached": True
-            }), 200
-
-        # 데이터베이스에서 조회
+        # 채팅방별 카운터 조회 (Redis 해시, 없으면 DB 한 번)
         unread_count = query_optimizer.get_unread_count_optimized(
             user_id=user_id,
             chat_type=chat_type,
             chat_id=chat_id
         )
 
-        # 캐시에 저장 (5분)
-        chat_cache_manager.cache_unread_count(user_id, chat_type, chat_id, unread_count, ttl=300)
-
         performance_monitor.record_api_time(
             endpoint='get_unread_count_optimized',
             method='GET',
@@ -135,8 +125,7 @@ def get_unread_count_optimized(user_id):
 
         return jsonify({
             "success": True,
-            "unread_count": unread_count,
-            "cached": False
+            "unread_count": unread_count
         }), 200
 
     except Exception as e:
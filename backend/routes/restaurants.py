@@ -7,6 +7,7 @@ from backend.models.app_models import (
 from datetime import datetime, timedelta
 import random
 from backend.utils.safe_jsonify import safe_jsonify
+from backend.services.restaurant_search import legacy_restaurant_search_index
 
 def get_seoul_today():
     """한국 시간의 오늘 날짜를 datetime.date 타입으로 반환"""
@@ -126,15 +127,10 @@ def get_restaurants():
     # 기본 쿼리 시작
     restaurants_query = Restaurant.query
 
-    # 검색어 필터링
+    # 검색어 필터링 (n-gram 검색 색인)
     if query:
-        restaurants_query = restaurants_query.filter(
-            or_(
-                Restaurant.name.ilike(f"%{query}%"),
-                Restaurant.category.ilike(f"%{query}%"),
-                Restaurant.address.ilike(f"%{query}%"),
-            )
-        )
+        matched_ids = [restaurant_id for restaurant_id, _ in legacy_restaurant_search_index.search(query)]
+        restaurants_query = restaurants_query.filter(Restaurant.id.in_(matched_ids))
 
     # 카테고리 필터링
     if category_filter:
@@ -222,16 +218,14 @@ def search_restaurants():
     if not query:
         return safe_jsonify({"error": "검색어가 필요합니다."}), 400
 
-    restaurants = Restaurant.query.filter(
-        or_(
-            Restaurant.name.ilike(f"%{query}%"),
-            Restaurant.category.ilike(f"%{query}%"),
-            Restaurant.address.ilike(f"%{query}%")
-        )
-    ).limit(20).all()
+    # n-gram 검색 색인에서 관련도순 상위 20개 조회
+    ranked_ids = [restaurant_id for restaurant_id, _ in legacy_restaurant_search_index.search(query, limit=20)]
+    restaurant_map = {
+        r.id: r for r in Restaurant.query.filter(Restaurant.id.in_(ranked_ids)).all()
+    } if ranked_ids else {}
 
     results = []
-    for restaurant in restaurants:
+    for restaurant in (restaurant_map[rid] for rid in ranked_ids if rid in restaurant_map):
         results.append({
             "id": restaurant.id,
             "name": restaurant.name,
@@ -782,10 +776,12 @@ def award_badge(user_id, badge):
     # 실제 구현에서는 배지를 수여
     pass
 
-def earn_points(user_id, activity_type, points, description):
-    """포인트 획득"""
-    # 실제 구현에서는 포인트를 지급
-    pass
+def earn_points(user_id, activity_type, points, description, idempotency_key=None):
+    """포인트 획득 (포인트 원장 버퍼에 추가되어 묶어서 기록됨)"""
+    from backend.utils.points_system import PointsSystem
+
+    return PointsSystem.earn_points(user_id, activity_type, points, description,
+                                    idempotency_key=idempotency_key)
 
 def _award_category_badge(user_id, category):
     """카테고리별 배지 수여"""
@@ -812,17 +808,19 @@ def _award_category_badge(user_id, category):
         if badge:
             award_badge(user_id, badge)
 
-def _process_review_rewards(user_id, has_photo, restaurant):
+def _process_review_rewards(user_id, has_photo, restaurant, review_id=None):
     """리뷰 작성 보상 처리"""
     if not user_id:
         return
 
-    # 리뷰 작성 포인트
-    earn_points(user_id, "review_written", 20, "리뷰 작성")
+    # 리뷰 작성 포인트 (리뷰당 한 번만 적립)
+    earn_points(user_id, "review_written", 20, "리뷰 작성",
+                idempotency_key=f"review:{review_id}:written" if review_id else None)
 
     # 사진이 있으면 추가 포인트
     if has_photo:
-        earn_points(user_id, "review_with_photo", 15, "사진과 함께 리뷰 작성")
+        earn_points(user_id, "review_with_photo", 15, "사진과 함께 리뷰 작성",
+                    idempotency_key=f"review:{review_id}:photo" if review_id else None)
 
     # 첫 리뷰 배지 확인
     badge = check_badge_earned(user_id, "first_review")
@@ -900,7 +898,7 @@ def add_restaurant_review(restaurant_id):
         # 보상 처리
         user_id = data.get("user_id")
         has_photo = bool(data.get("photo_url"))
-        _process_review_rewards(user_id, has_photo, restaurant)
+        _process_review_rewards(user_id, has_photo, restaurant, new_review.id)
 
         return safe_jsonify({
             "message": "리뷰가 등록되었습니다!",
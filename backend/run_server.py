@@ -48,7 +48,7 @@ def main():
             from backend.app.realtime_system import socketio
             if socketio:
                 print("🔌 Socket.IO 지원 활성화")
-                socketio.run(app, host=args.host, port=args.port, debug=args.debug)
+                socketio.run(app, host=args.host, port=args.port, debug=args.debug, allow_unsafe_werkzeug=True)
             else:
                 raise ImportError("Socket.IO not available")
         except ImportError:
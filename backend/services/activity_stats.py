@@ -0,0 +1,382 @@
+"""
+사용자 활동 통계 엔진
+활동 통계(/api/users/activity-stats)와 대시보드(/api/users/dashboard)의 집계를
+스칼라 서브쿼리를 묶은 조회 한 번 + 식당 JOIN 그룹 집계 한 번으로 계산하고,
+스트릭은 정렬된 활동 날짜 목록 한 번으로 계산합니다.
+결과는 (사용자, 기간) 단위로 캐시하고, 새 방문/리뷰/파티/참여/개인 일정이 커밋되면
+다시 집계하지 않고 캐시된 값에 증분을 반영합니다. 수정/삭제는 해당 사용자 캐시를 무효화합니다.
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, select, union
+
+from backend.app.extensions import db
+from backend.services.commit_queue import CommitQueue
+
+logger = logging.getLogger(__name__)
+
+# 통계 기간 (일) - 알 수 없는 기간은 month로 처리
+PERIOD_DAYS = {'week': 7, 'month': 30, 'year': 365}
+DEFAULT_PERIOD = 'month'
+DASHBOARD = 'dashboard'
+CACHED_PERIODS = (*PERIOD_DAYS, DASHBOARD)
+
+# 스트릭 최대 확인 일수
+STREAK_DAYS = 30
+WEEKLY_GOAL = 3
+DEFAULT_CATEGORY = '한식'
+
+# 커밋 후 반영할 증분/무효화 목록 (session.info 키)
+PENDING_KEY = 'activity_stats_pending'
+INVALIDATE = 'invalidate'
+
+
+def normalize_period(period: str | None) -> str:
+    return period if period in PERIOD_DAYS else DEFAULT_PERIOD
+
+
+def week_start(today: date) -> date:
+    return today - timedelta(days=today.weekday())
+
+
+def streak_from_dates(dates: Iterable[date], today: date, limit: int = STREAK_DAYS) -> int:
+    """오늘부터 거꾸로 활동이 이어진 일수 (오늘 활동이 없으면 0)"""
+    active = set(dates)
+    streak = 0
+    while streak < limit and today - timedelta(days=streak) in active:
+        streak += 1
+    return streak
+
+
+def favorite_category(categories: dict[str, int]) -> str:
+    return max(categories.items(), key=lambda item: item[1])[0] if categories else DEFAULT_CATEGORY
+
+
+def _count(model, *conditions):
+    return select(func.count()).select_from(model).where(*conditions).scalar_subquery()
+
+
+def apply_delta(entry: dict[str, Any], period: str, kind: str, payload: dict[str, Any]) -> None:
+    """
+    캐시된 통계에 새 활동 1건 반영 (제자리 수정)
+
+    kind: visit / review / party / member / schedule
+    """
+    counts, categories = entry['counts'], entry['categories']
+
+    if period == DASHBOARD:
+        if kind == 'visit':
+            counts['total_lunches'] += 1
+            if payload.get('category'):
+                categories[payload['category']] = categories.get(payload['category'], 0) + 1
+            if payload['date'] >= entry['week_start']:
+                counts['week_visits'] += 1
+        elif kind == 'review':
+            counts['total_reviews'] += 1
+        elif kind == 'party':
+            counts['parties_hosted'] += 1
+        elif kind == 'member':
+            counts['parties_joined'] += 1
+        if kind in ('visit', 'party') and payload['date'] not in entry['activity_dates']:
+            entry['activity_dates'] = sorted([*entry['activity_dates'], payload['date']], reverse=True)
+        return
+
+    start = entry['start_date']
+    if kind == 'visit':
+        if payload.get('category') and payload['date'] >= start[:10]:
+            categories[payload['category']] = categories.get(payload['category'], 0) + 1
+    elif kind == 'review':
+        counts['reviews_written'] += 1
+    elif kind == 'party':
+        counts['parties_hosted'] += 1
+        if payload.get('is_from_match'):
+            counts['random_lunches'] += 1
+    elif kind == 'member':
+        if payload.get('party_created_at') and payload['party_created_at'] >= start:
+            counts['parties_joined'] += 1
+    elif kind == 'schedule':
+        counts['personal_schedules'] += 1
+
+
+class ActivityStatsService:
+    """사용자 활동 통계 집계 및 캐시"""
+
+    CACHE_TTL = 900
+    # 증분만 계속 반영하면 롤링 기간의 시작점이 밀리므로, 이 시간이 지나면 다시 집계
+    MAX_AGE = 600
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _category_counts(employee_id: str, since: date | None = None) -> dict[str, int]:
+        """방문 식당 카테고리별 횟수 (식당 JOIN 그룹 집계)"""
+        from backend.models.restaurant_models import RestaurantV2, RestaurantVisitV2
+
+        statement = (
+            select(RestaurantV2.category, func.count())
+            .select_from(RestaurantVisitV2)
+            .join(RestaurantV2, RestaurantV2.id == RestaurantVisitV2.restaurant_id)
+            .where(RestaurantVisitV2.user_id == employee_id, RestaurantV2.category.is_not(None),
+                   RestaurantV2.category != '')
+            .group_by(RestaurantV2.category)
+        )
+        if since is not None:
+            statement = statement.where(RestaurantVisitV2.visit_date >= since)
+        return dict(db.session.execute(statement).tuples().all())
+
+    @staticmethod
+    def compute_period(employee_id: str, period: str, now: datetime | None = None) -> dict[str, Any]:
+        """기간 활동 통계 집계"""
+        from backend.models.app_models import Party, PartyMember
+        from backend.models.restaurant_models import RestaurantReviewV2
+        from backend.models.schedule_models import PersonalSchedule
+
+        now = now or datetime.now()
+        start = now - timedelta(days=PERIOD_DAYS[normalize_period(period)])
+
+        counts = db.session.execute(select(
+            _count(RestaurantReviewV2, RestaurantReviewV2.user_id == employee_id,
+                   RestaurantReviewV2.created_at >= start).label('reviews_written'),
+            _count(Party, Party.host_employee_id == employee_id,
+                   Party.created_at >= start).label('parties_hosted'),
+            select(func.count()).select_from(PartyMember).join(Party, Party.id == PartyMember.party_id)
+            .where(PartyMember.employee_id == employee_id, Party.created_at >= start)
+            .scalar_subquery().label('parties_joined'),
+            _count(Party, Party.host_employee_id == employee_id, Party.is_from_match.is_(True),
+                   Party.created_at >= start).label('random_lunches'),
+            _count(PersonalSchedule, PersonalSchedule.employee_id == employee_id,
+                   PersonalSchedule.created_at >= start).label('personal_schedules'),
+        )).mappings().one()
+
+        return {
+            'computed_at': now.isoformat(),
+            'start_date': start.isoformat(),
+            'counts': dict(counts),
+            'categories': ActivityStatsService._category_counts(employee_id, start.date()),
+        }
+
+    @staticmethod
+    def compute_dashboard(employee_id: str, now: datetime | None = None) -> dict[str, Any]:
+        """대시보드 누적 통계 집계"""
+        from backend.models.app_models import Party, PartyMember
+        from backend.models.restaurant_models import RestaurantReviewV2, RestaurantVisitV2
+
+        now = now or datetime.now()
+        today = now.date()
+        current_week = week_start(today)
+
+        counts = db.session.execute(select(
+            _count(RestaurantVisitV2, RestaurantVisitV2.user_id == employee_id).label('total_lunches'),
+            _count(Party, Party.host_employee_id == employee_id).label('parties_hosted'),
+            _count(PartyMember, PartyMember.employee_id == employee_id).label('parties_joined'),
+            _count(RestaurantReviewV2, RestaurantReviewV2.user_id == employee_id).label('total_reviews'),
+            _count(RestaurantVisitV2, RestaurantVisitV2.user_id == employee_id,
+                   RestaurantVisitV2.visit_date >= current_week).label('week_visits'),
+        )).mappings().one()
+
+        # 스트릭 계산용 최근 활동 날짜 (방문 + 주최 파티, 최신순 한 번 조회)
+        window_start = today - timedelta(days=STREAK_DAYS - 1)
+        activity_days = union(
+            select(RestaurantVisitV2.visit_date.label('day')).where(
+                RestaurantVisitV2.user_id == employee_id,
+                RestaurantVisitV2.visit_date.between(window_start, today)),
+            select(Party.party_date.label('day')).where(
+                Party.host_employee_id == employee_id,
+                Party.party_date.between(window_start, today)),
+        ).subquery()
+        activity_dates = db.session.execute(
+            select(activity_days.c.day).order_by(activity_days.c.day.desc())
+        ).scalars().all()
+
+        return {
+            'computed_at': now.isoformat(),
+            'week_start': current_week.isoformat(),
+            'counts': dict(counts),
+            'categories': ActivityStatsService._category_counts(employee_id),
+            'activity_dates': [str(day)[:10] for day in activity_dates],
+        }
+
+    # ------------------------------------------------------------------
+    # 조회 (캐시)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _is_fresh(entry: dict[str, Any] | None, period: str, now: datetime) -> bool:
+        if not entry:
+            return False
+        if now - datetime.fromisoformat(entry['computed_at']) > timedelta(seconds=ActivityStatsService.MAX_AGE):
+            return False
+        return period != DASHBOARD or entry['week_start'] == week_start(now.date()).isoformat()
+
+    @staticmethod
+    def _get(employee_id: str, period: str, now: datetime) -> dict[str, Any]:
+        from backend.app.cache_manager import cache_activity_stats, get_cached_activity_stats
+
+        entry = get_cached_activity_stats(employee_id, period)
+        if ActivityStatsService._is_fresh(entry, period, now):
+            return entry
+        if period == DASHBOARD:
+            entry = ActivityStatsService.compute_dashboard(employee_id, now)
+        else:
+            entry = ActivityStatsService.compute_period(employee_id, period, now)
+        cache_activity_stats(employee_id, period, entry, expire_seconds=ActivityStatsService.CACHE_TTL)
+        return entry
+
+    @staticmethod
+    def get_activity_stats(employee_id: str, period: str | None = None) -> dict[str, Any]:
+        """/activity-stats 응답용 통계"""
+        now = datetime.now()
+        entry = ActivityStatsService._get(employee_id, normalize_period(period), now)
+        counts, categories = entry['counts'], entry['categories']
+        parties_joined_total = counts['parties_hosted'] + counts['parties_joined']
+
+        return {
+            'total_activities': counts['reviews_written'] + parties_joined_total + counts['personal_schedules'],
+            'reviews_written': counts['reviews_written'],
+            'parties_joined': parties_joined_total,
+            'random_lunches': counts['random_lunches'],
+            'favorite_category': favorite_category(categories),
+            'appointment_type_breakdown': {
+                '랜덤런치': counts['random_lunches'],
+                '파티 참여': counts['parties_joined'],
+                '개인 약속': counts['personal_schedules'],
+                '단골파티': counts['parties_hosted'],
+                '기타': 0
+            },
+            'category_breakdown': categories,
+            'period': period or DEFAULT_PERIOD,
+            'start_date': entry['start_date'],
+            'end_date': entry['computed_at']
+        }
+
+    @staticmethod
+    def get_dashboard_stats(employee_id: str) -> dict[str, Any]:
+        """/dashboard 응답용 활동 통계 (랭킹 제외)"""
+        now = datetime.now()
+        entry = ActivityStatsService._get(employee_id, DASHBOARD, now)
+        counts = entry['counts']
+
+        return {
+            'total_lunches': counts['total_lunches'],
+            'total_parties': counts['parties_hosted'] + counts['parties_joined'],
+            'total_reviews': counts['total_reviews'],
+            'favorite_category': favorite_category(entry['categories']),
+            'weekly_goal': WEEKLY_GOAL,
+            'weekly_progress': min(counts['week_visits'], WEEKLY_GOAL),
+            'streak': streak_from_dates(
+                (date.fromisoformat(day) for day in entry['activity_dates']), now.date()
+            ),
+        }
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트 / 커밋 후 증분 반영
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _queue(target, employee_id, kind: str, payload: dict[str, Any] | None = None) -> None:
+        if not employee_id:
+            return
+        _pending.pending(target).append((str(employee_id), kind, payload or {}))
+
+    @staticmethod
+    def on_visit_insert(mapper, connection, target):
+        from backend.models.restaurant_models import RestaurantV2
+
+        category = connection.execute(
+            select(RestaurantV2.category).where(RestaurantV2.id == target.restaurant_id)
+        ).scalar()
+        ActivityStatsService._queue(target, target.user_id, 'visit',
+                                    {'category': category, 'date': str(target.visit_date)[:10]})
+
+    @staticmethod
+    def on_review_insert(mapper, connection, target):
+        ActivityStatsService._queue(target, target.user_id, 'review')
+
+    @staticmethod
+    def on_party_insert(mapper, connection, target):
+        ActivityStatsService._queue(target, target.host_employee_id, 'party',
+                                    {'is_from_match': bool(target.is_from_match),
+                                     'date': str(target.party_date)[:10]})
+
+    @staticmethod
+    def on_member_insert(mapper, connection, target):
+        from backend.models.app_models import Party
+
+        created_at = connection.execute(select(Party.created_at).where(Party.id == target.party_id)).scalar()
+        ActivityStatsService._queue(target, target.employee_id, 'member',
+                                    {'party_created_at': created_at.isoformat() if created_at else None})
+
+    @staticmethod
+    def on_schedule_insert(mapper, connection, target):
+        ActivityStatsService._queue(target, target.employee_id, 'schedule')
+
+    @staticmethod
+    def on_change(mapper, connection, target):
+        # 수정/삭제는 증분으로 되돌리기 어려우므로 해당 사용자 캐시 무효화
+        for attribute in ('user_id', 'employee_id', 'host_employee_id'):
+            if hasattr(target, attribute):
+                ActivityStatsService._queue(target, getattr(target, attribute), INVALIDATE)
+                return
+
+    @staticmethod
+    def apply_pending(pending: list[tuple[str, str, dict[str, Any]]]) -> None:
+        try:
+            from backend.app.cache_manager import (
+                cache_activity_stats,
+                get_cached_activity_stats,
+                invalidate_activity_stats,
+            )
+
+            by_employee: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+            for employee_id, kind, payload in pending:
+                by_employee.setdefault(employee_id, []).append((kind, payload))
+
+            for employee_id, changes in by_employee.items():
+                if any(kind == INVALIDATE for kind, _ in changes):
+                    invalidate_activity_stats(employee_id, *CACHED_PERIODS)
+                    continue
+                for period in CACHED_PERIODS:
+                    entry = get_cached_activity_stats(employee_id, period)
+                    if not entry:
+                        continue
+                    for kind, payload in changes:
+                        apply_delta(entry, period, kind, payload)
+                    cache_activity_stats(employee_id, period, entry,
+                                         expire_seconds=ActivityStatsService.CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"활동 통계 캐시 갱신 실패: {e}")
+
+
+
+# 전역 서비스 인스턴스
+activity_stats_service = ActivityStatsService()
+_pending = CommitQueue(PENDING_KEY, ActivityStatsService.apply_pending, factory=list)
+
+
+def setup_activity_stats(app):
+    """활동 매퍼 이벤트 및 커밋 후 통계 캐시 증분 반영 연결"""
+    from sqlalchemy import event
+
+    from backend.models.app_models import Party, PartyMember
+    from backend.models.restaurant_models import RestaurantReviewV2, RestaurantVisitV2
+    from backend.models.schedule_models import PersonalSchedule
+
+    listeners = [
+        (RestaurantVisitV2, 'after_insert', ActivityStatsService.on_visit_insert),
+        (RestaurantReviewV2, 'after_insert', ActivityStatsService.on_review_insert),
+        (Party, 'after_insert', ActivityStatsService.on_party_insert),
+        (PartyMember, 'after_insert', ActivityStatsService.on_member_insert),
+        (PersonalSchedule, 'after_insert', ActivityStatsService.on_schedule_insert),
+    ]
+    for target in (RestaurantVisitV2, RestaurantReviewV2, Party, PartyMember, PersonalSchedule):
+        listeners.append((target, 'after_update', ActivityStatsService.on_change))
+        listeners.append((target, 'after_delete', ActivityStatsService.on_change))
+
+    for target, event_name, handler in listeners:
+        if not event.contains(target, event_name, handler):
+            event.listen(target, event_name, handler)
+    _pending.register()
+    return True
@@ -0,0 +1,256 @@
+"""
+날짜별 참여 가능 사용자 서비스
+활성 사용자 중 해당 날짜에 파티(호스트/멤버) 또는 개인 일정이 없는 사용자 집합을
+날짜별 비트맵(활성 사용자 목록의 위치 = 비트)으로 캐시합니다.
+바쁜 사용자는 날짜 범위 전체를 한 번의 UNION 쿼리로 조회하고,
+파티/멤버/일정/사용자 변경이 커밋되면 해당 날짜의 비트맵을 무효화합니다.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from sqlalchemy import select, union_all
+from sqlalchemy.orm import object_session
+
+from backend.app.extensions import db
+from backend.services.commit_queue import CommitQueue
+from backend.services.refreshable import RefreshableIndex
+from backend.utils.datetime_utils import to_date_key
+
+logger = logging.getLogger(__name__)
+
+# 커밋 후 무효화할 날짜 목록 (session.info 키, ALL_DATES는 전체 무효화)
+PENDING_KEY = 'availability_invalidate'
+ALL_DATES = '*'
+
+
+class AvailabilityService(RefreshableIndex):
+    """날짜별 참여 가능 사용자 비트맵 캐시 (활성 사용자 목록을 재구축 대상으로, 날짜별 비트맵도 같은 주기로 만료)"""
+
+    REFRESH_INTERVAL = 60
+    MAX_CACHED_DATES = 400
+    MAX_RANGE_DAYS = 366
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.RLock()
+        self._ids: list[str] = []
+        self._position: dict[str, int] = {}
+        self._all_mask = 0
+        self._bitmaps: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # 활성 사용자 목록 (비트 위치)
+    # ------------------------------------------------------------------
+    def rebuild(self) -> int:
+        """활성 사용자 목록(비트 위치)을 다시 읽음"""
+        from backend.auth.models import User
+
+        ids = db.session.execute(
+            select(User.employee_id).where(User.is_active == True).order_by(User.employee_id)
+        ).scalars().all()
+        self._ids = [str(employee_id) for employee_id in ids]
+        self._position = {employee_id: i for i, employee_id in enumerate(self._ids)}
+        self._all_mask = (1 << len(self._ids)) - 1
+        self._mark_built()
+        # 비트 위치가 바뀌었으므로 날짜별 비트맵도 폐기
+        self._bitmaps.clear()
+        return len(self._ids)
+
+    def _members(self, mask: int) -> set[str]:
+        members = set()
+        while mask:
+            low = mask & -mask
+            members.add(self._ids[low.bit_length() - 1])
+            mask ^= low
+        return members
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _query_busy(self, start_key: str, end_key: str) -> dict[str, set[str]]:
+        """기간 내 날짜별 바쁜 사용자 (파티 호스트 + 파티 멤버 + 개인 일정, 단일 쿼리)"""
+        from backend.models.app_models import Party, PartyMember
+        from backend.models.schedule_models import PersonalSchedule
+
+        start, end = date.fromisoformat(start_key), date.fromisoformat(end_key)
+        busy = union_all(
+            select(Party.host_employee_id, Party.party_date)
+            .where(Party.party_date.between(start, end)),
+            select(PartyMember.employee_id, Party.party_date)
+            .join(Party, Party.id == PartyMember.party_id)
+            .where(Party.party_date.between(start, end)),
+            select(PersonalSchedule.employee_id, PersonalSchedule.schedule_date)
+            .where(PersonalSchedule.schedule_date.between(start_key, end_key)),
+        )
+
+        result: dict[str, set[str]] = {}
+        for employee_id, busy_date in db.session.execute(busy):
+            if employee_id is None or busy_date is None:
+                continue
+            result.setdefault(to_date_key(busy_date), set()).add(str(employee_id))
+        return result
+
+    def _bitmaps_for(self, start_key: str, end_key: str) -> dict[str, int]:
+        """기간 내 날짜별 비트맵 (캐시에 없는 날짜만 조회)"""
+        start, end = date.fromisoformat(start_key), date.fromisoformat(end_key)
+        if end < start:
+            raise ValueError("종료 날짜가 시작 날짜보다 빠릅니다.")
+        days = (end - start).days + 1
+        if days > self.MAX_RANGE_DAYS:
+            raise ValueError(f"조회 기간은 최대 {self.MAX_RANGE_DAYS}일입니다.")
+        keys = [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+
+        with self._lock:
+            self._ensure_fresh()
+            now = time.monotonic()
+            bitmaps, missing = {}, []
+            for key in keys:
+                cached = self._bitmaps.get(key)
+                if cached and now - cached[0] <= self.REFRESH_INTERVAL:
+                    self._bitmaps.move_to_end(key)
+                    bitmaps[key] = cached[1]
+                else:
+                    missing.append(key)
+
+            if missing:
+                busy = self._query_busy(missing[0], missing[-1])
+                for key in missing:
+                    busy_mask = 0
+                    for employee_id in busy.get(key, ()):
+                        position = self._position.get(employee_id)
+                        if position is not None:
+                            busy_mask |= 1 << position
+                    bitmaps[key] = self._all_mask & ~busy_mask
+                    self._bitmaps[key] = (now, bitmaps[key])
+                while len(self._bitmaps) > self.MAX_CACHED_DATES:
+                    self._bitmaps.popitem(last=False)
+            return bitmaps
+
+    def get_available_user_ids(self, target_date) -> set[str]:
+        """해당 날짜에 참여 가능한 활성 사용자 ID 집합"""
+        key = to_date_key(target_date)
+        with self._lock:
+            return self._members(self._bitmaps_for(key, key)[key])
+
+    def get_available_user_ids_for_range(self, start_date, end_date) -> dict[str, set[str]]:
+        """기간 내 날짜별 참여 가능 사용자 ID 집합 ({'YYYY-MM-DD': {...}})"""
+        with self._lock:
+            bitmaps = self._bitmaps_for(to_date_key(start_date), to_date_key(end_date))
+            return {key: self._members(mask) for key, mask in bitmaps.items()}
+
+    def count_available(self, target_date) -> int:
+        key = to_date_key(target_date)
+        return self._bitmaps_for(key, key)[key].bit_count()
+
+    def is_available(self, employee_id, target_date) -> bool:
+        key = to_date_key(target_date)
+        with self._lock:
+            mask = self._bitmaps_for(key, key)[key]
+            position = self._position.get(str(employee_id))
+            return position is not None and bool(mask >> position & 1)
+
+    # ------------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------------
+    def invalidate(self, *dates) -> None:
+        with self._lock:
+            for value in dates:
+                self._bitmaps.pop(to_date_key(value), None)
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self.mark_dirty()
+            self._bitmaps.clear()
+
+    @staticmethod
+    def _queue(target, *dates) -> None:
+        _pending.pending(target).update(ALL_DATES if value == ALL_DATES else to_date_key(value) for value in dates if value)
+
+    @staticmethod
+    def _current_values(target, attribute: str) -> list:
+        """현재 값과 변경 전 값 (변경 전 값은 로드되어 있을 때만 포함)"""
+        from sqlalchemy import inspect
+
+        history = inspect(target).attrs[attribute].history
+        return [*history.added, *history.deleted, *history.unchanged]
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트
+    # ------------------------------------------------------------------
+    def on_party_change(self, mapper, connection, target):
+        self._queue(target, *self._current_values(target, 'party_date'))
+
+    def on_party_member_change(self, mapper, connection, target):
+        from backend.models.app_models import Party
+
+        party_date = connection.execute(
+            select(Party.party_date).where(Party.id == target.party_id)
+        ).scalar()
+        self._queue(target, party_date)
+
+    def on_schedule_change(self, mapper, connection, target):
+        self._queue(target, *self._current_values(target, 'schedule_date'))
+
+    def on_date_set(self, target, value, oldvalue, initiator):
+        """날짜가 옮겨지면 이전 날짜도 무효화 (만료된 객체도 변경 전 값을 로드하도록 active_history 사용)"""
+        from sqlalchemy.orm.base import NO_VALUE
+
+        if object_session(target) is not None and oldvalue not in (NO_VALUE, None) and oldvalue != value:
+            self._queue(target, oldvalue)
+        return value
+
+    def on_user_change(self, mapper, connection, target):
+        self._queue(target, ALL_DATES)
+
+    def on_user_update(self, mapper, connection, target):
+        from sqlalchemy import inspect
+
+        # 활성 여부가 바뀐 경우에만 비트 위치 재구성
+        if inspect(target).attrs.is_active.history.has_changes():
+            self._queue(target, ALL_DATES)
+
+    # ------------------------------------------------------------------
+    # 커밋 후 반영
+    # ------------------------------------------------------------------
+    def apply_pending(self, dates: set[str]) -> None:
+        if ALL_DATES in dates:
+            self.invalidate_all()
+        else:
+            self.invalidate(*dates)
+
+
+# 전역 서비스 인스턴스
+availability_service = AvailabilityService()
+_pending = CommitQueue(PENDING_KEY, availability_service.apply_pending)
+
+
+def setup_availability(app):
+    """파티/멤버/일정/사용자 매퍼 이벤트 및 커밋 후 무효화 연결"""
+    from sqlalchemy import event
+
+    from backend.auth.models import User
+    from backend.models.app_models import Party, PartyMember
+    from backend.models.schedule_models import PersonalSchedule
+
+    service = availability_service
+    listeners = [(User, 'after_insert', service.on_user_change),
+                 (User, 'after_update', service.on_user_update),
+                 (User, 'after_delete', service.on_user_change)]
+    for model, handler in ((Party, service.on_party_change),
+                           (PartyMember, service.on_party_member_change),
+                           (PersonalSchedule, service.on_schedule_change)):
+        listeners += [(model, event_name, handler) for event_name in ('after_insert', 'after_update', 'after_delete')]
+
+    for target, event_name, handler in listeners:
+        if not event.contains(target, event_name, handler):
+            event.listen(target, event_name, handler)
+
+    for attribute in (Party.party_date, PersonalSchedule.schedule_date):
+        if not event.contains(attribute, 'set', service.on_date_set):
+            event.listen(attribute, 'set', service.on_date_set, active_history=True)
+    _pending.register()
+    return True
@@ -0,0 +1,185 @@
+"""
+캘린더 응답 캐시
+ScheduleService.query_schedules_for_period의 날짜별 그룹 결과를 (사용자, 월) 단위로 캐시하고,
+응답마다 내용 기반 ETag를 붙여 변경되지 않은 달은 304로 응답할 수 있게 합니다.
+사용자별 캐시 버전을 두어, 해당 사용자의 일정/예외/파티 참여가 바뀐 트랜잭션이 커밋되면
+버전만 지워 그 사용자의 모든 월 캐시를 한 번에 무효화합니다.
+"""
+
+import hashlib
+import json
+import logging
+import uuid
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import select
+
+from backend.services.commit_queue import CommitQueue
+
+logger = logging.getLogger(__name__)
+
+# 커밋 후 무효화할 사용자 목록 (session.info 키)
+PENDING_KEY = 'calendar_cache_invalidate'
+
+
+def _content_etag(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def month_starts(start_date: date, end_date: date) -> list[date]:
+    """기간에 걸친 각 달의 1일"""
+    months = []
+    current = start_date.replace(day=1)
+    while current <= end_date:
+        months.append(current)
+        current = (current + timedelta(days=32)).replace(day=1)
+    return months
+
+
+class CalendarCacheService:
+    """(사용자, 월) 단위 캘린더 캐시"""
+
+    CACHE_TTL = 600
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _version(employee_id: str) -> str | None:
+        """사용자 캐시 버전 (캐시 저장소가 없으면 None)"""
+        from backend.app.cache_manager import get_calendar_version, set_calendar_version
+
+        version = get_calendar_version(employee_id)
+        if version is None:
+            version = uuid.uuid4().hex
+            if not set_calendar_version(employee_id, version):
+                return None
+        return version
+
+    @staticmethod
+    def get_month(employee_id: str, month_start: date, version: str | None = None) -> dict[str, Any]:
+        """
+        한 달 치 캘린더
+
+        Returns:
+            data: 날짜별 그룹 목록, etag: 내용 기반 ETag
+        """
+        from backend.app.cache_manager import cache_calendar_month, get_cached_calendar_month
+        from backend.services.schedule_service import ScheduleService
+
+        month_key = month_start.strftime('%Y-%m')
+        if version is not None:
+            cached = get_cached_calendar_month(employee_id, month_key)
+            if cached is not None and cached.get('version') == version:
+                return cached
+
+        month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        # 조회 오류는 그대로 전달 (빈 달을 캐시하거나 그 ETag로 304를 내보내지 않도록)
+        data = ScheduleService.query_schedules_for_period(employee_id, month_start, month_end)
+        # 캐시를 거친 응답과 같은 ETag가 나오도록 JSON 왕복 후 해시
+        data = json.loads(json.dumps(data, default=str))
+        entry = {'version': version, 'etag': _content_etag(data), 'data': data}
+        if version is not None:
+            cache_calendar_month(employee_id, month_key, entry, expire_seconds=CalendarCacheService.CACHE_TTL)
+        return entry
+
+    @staticmethod
+    def get_range(employee_id: str, start_date: date, end_date: date) -> tuple[list[dict[str, Any]], str]:
+        """
+        기간 캘린더 (월 캐시를 이어 붙여 기간만 잘라냄)
+
+        Returns:
+            (날짜별 그룹 목록, ETag)
+        """
+        if start_date > end_date:
+            return [], _content_etag(employee_id, start_date, end_date)
+
+        version = CalendarCacheService._version(employee_id)
+        start_key, end_key = start_date.isoformat(), end_date.isoformat()
+        groups, etags = [], []
+        for month_start in month_starts(start_date, end_date):
+            entry = CalendarCacheService.get_month(employee_id, month_start, version)
+            etags.append(entry['etag'])
+            groups.extend(group for group in entry['data'] if start_key <= group['date'] <= end_key)
+        return groups, _content_etag(employee_id, start_key, end_key, etags)
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트 / 커밋 후 무효화
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _queue(target, *employee_ids) -> None:
+        _pending.pending(target).update(
+            str(employee_id) for employee_id in employee_ids if employee_id
+        )
+
+    @staticmethod
+    def _party_member_ids(connection, party_id: int) -> list[str]:
+        from backend.models.app_models import PartyMember
+
+        return list(connection.execute(
+            select(PartyMember.employee_id).where(PartyMember.party_id == party_id)
+        ).scalars())
+
+    @staticmethod
+    def on_schedule_change(mapper, connection, target):
+        from sqlalchemy import inspect
+
+        history = inspect(target).attrs.employee_id.history
+        CalendarCacheService._queue(target, target.employee_id, *history.deleted)
+
+    @staticmethod
+    def on_exception_change(mapper, connection, target):
+        from backend.models.schedule_models import PersonalSchedule
+
+        employee_id = connection.execute(
+            select(PersonalSchedule.employee_id).where(PersonalSchedule.id == target.original_schedule_id)
+        ).scalar()
+        CalendarCacheService._queue(target, employee_id)
+
+    @staticmethod
+    def on_party_change(mapper, connection, target):
+        # 파티 정보/인원이 바뀌면 참여자 전원의 캘린더가 바뀜
+        CalendarCacheService._queue(target, *CalendarCacheService._party_member_ids(connection, target.id))
+
+    @staticmethod
+    def on_member_change(mapper, connection, target):
+        CalendarCacheService._queue(
+            target, target.employee_id, *CalendarCacheService._party_member_ids(connection, target.party_id)
+        )
+
+    @staticmethod
+    def invalidate_employees(employee_ids: set[str]) -> None:
+        try:
+            from backend.app.cache_manager import invalidate_calendar_versions
+            invalidate_calendar_versions(*employee_ids)
+        except Exception as e:
+            logger.warning(f"캘린더 캐시 무효화 실패: {e}")
+
+
+
+# 전역 서비스 인스턴스
+calendar_cache_service = CalendarCacheService()
+_pending = CommitQueue(PENDING_KEY, CalendarCacheService.invalidate_employees)
+
+
+def setup_calendar_cache(app):
+    """일정/예외/파티 매퍼 이벤트 및 커밋 후 캐시 무효화 연결"""
+    from sqlalchemy import event
+
+    from backend.models.app_models import Party, PartyMember
+    from backend.models.schedule_models import PersonalSchedule, ScheduleException
+
+    listeners = []
+    for event_name in ('after_insert', 'after_update', 'after_delete'):
+        listeners.append((PersonalSchedule, event_name, CalendarCacheService.on_schedule_change))
+        listeners.append((ScheduleException, event_name, CalendarCacheService.on_exception_change))
+        listeners.append((Party, event_name, CalendarCacheService.on_party_change))
+        listeners.append((PartyMember, event_name, CalendarCacheService.on_member_change))
+
+    for target, event_name, handler in listeners:
+        if not event.contains(target, event_name, handler):
+            event.listen(target, event_name, handler)
+    _pending.register()
+    return True
@@ -0,0 +1,227 @@
+"""
+채팅방 목록(inbox) 서비스
+chat_room의 last_message_id / last_message_at / member_count 비정규화 컬럼을
+메시지·참여자 매퍼 이벤트로 갱신하고, 목록은 최근 활동순 단일 쿼리 + 커서 페이지네이션으로 조회합니다.
+첫 페이지는 ChatCacheManager에 사용자별로 캐시하며 커밋된 변경이 있으면 무효화합니다.
+읽지 않은 수는 읽음 처리마다 바뀌므로 캐시에 넣지 않고 조회 시 ChatUnreadService에서 채웁니다.
+"""
+
+import base64
+import binascii
+import logging
+from datetime import datetime
+
+from sqlalchemy import and_, func, or_, select, update
+
+from backend.app.extensions import db
+from backend.services.commit_queue import CommitQueue
+
+logger = logging.getLogger(__name__)
+
+# 커밋 후 무효화할 사용자 목록 (session.info 키)
+PENDING_KEY = 'chat_inbox_invalidate'
+
+
+class ChatInboxService:
+    """채팅방 목록 조회 및 비정규화 컬럼 관리"""
+
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+    CACHE_TTL = 300
+
+    # ------------------------------------------------------------------
+    # 커서
+    # ------------------------------------------------------------------
+    @staticmethod
+    def encode_cursor(activity_at: datetime, room_id: int) -> str:
+        raw = f"{activity_at.isoformat()}|{room_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        """커서를 (활동 시각, 채팅방 ID)로 복원 (형식이 잘못되면 ValueError)"""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            activity_at, room_id = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+            return datetime.fromisoformat(activity_at), int(room_id)
+        except (ValueError, UnicodeDecodeError, binascii.Error) as e:
+            raise ValueError(f"잘못된 페이지 커서입니다: {cursor}") from e
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_inbox(employee_id: str, chat_type: str = None, limit: int = DEFAULT_LIMIT,
+                  cursor: str = None) -> dict:
+        """
+        사용자의 채팅방 목록을 최근 활동순으로 조회
+
+        Returns:
+            chats: 채팅방 목록
+            has_more: 다음 페이지 존재 여부
+            next_cursor: 다음 페이지 조회용 커서
+        """
+        from backend.utils.cache_manager import chat_cache_manager
+
+        limit = max(1, min(limit, ChatInboxService.MAX_LIMIT))
+        variant = f"{chat_type or '*'}:{limit}"
+        if cursor:
+            ChatInboxService.decode_cursor(cursor)
+        else:
+            cached = chat_cache_manager.get_cached_inbox(employee_id, variant)
+            if cached is not None:
+                return ChatInboxService._with_unread_counts(employee_id, cached)
+
+        page = ChatInboxService._query_inbox(employee_id, chat_type, limit, cursor)
+
+        if not cursor:
+            chat_cache_manager.cache_inbox(employee_id, variant, page, ttl=ChatInboxService.CACHE_TTL)
+        return ChatInboxService._with_unread_counts(employee_id, page)
+
+    @staticmethod
+    def _with_unread_counts(employee_id: str, page: dict) -> dict:
+        """채팅방 목록에 현재 읽지 않은 수를 채움 (캐시된 페이지는 변경하지 않음)"""
+        from backend.services.chat_unread import ChatUnreadService
+
+        unread_counts = ChatUnreadService.get_unread_counts(employee_id) if page['chats'] else {}
+        chats = [
+            {**chat, "unread_count": unread_counts.get(ChatUnreadService.room_key(chat['type'], chat['id']), 0)}
+            for chat in page['chats']
+        ]
+        return {**page, "chats": chats}
+
+    @staticmethod
+    def _query_inbox(employee_id: str, chat_type: str | None, limit: int, cursor: str | None) -> dict:
+        from backend.models.app_models import ChatMessage, ChatParticipant, ChatRoom
+
+        # 메시지가 없는 방은 생성 시각을 활동 시각으로 사용
+        activity_at = func.coalesce(ChatRoom.last_message_at, ChatRoom.created_at)
+
+        query = db.session.query(ChatRoom, ChatMessage, activity_at.label('activity_at'))\
+            .join(ChatParticipant, ChatParticipant.chat_id == ChatRoom.id)\
+            .outerjoin(ChatMessage, ChatMessage.id == ChatRoom.last_message_id)\
+            .filter(ChatParticipant.employee_id == employee_id)
+
+        if chat_type:
+            query = query.filter(ChatRoom.type == chat_type)
+
+        if cursor:
+            cursor_at, cursor_id = ChatInboxService.decode_cursor(cursor)
+            query = query.filter(or_(
+                activity_at < cursor_at,
+                and_(activity_at == cursor_at, ChatRoom.id < cursor_id)
+            ))
+
+        rows = query.order_by(activity_at.desc(), ChatRoom.id.desc()).limit(limit + 1).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        chats = []
+        for room, last_message, _ in rows:
+            chats.append({
+                "id": room.id,
+                "type": room.type,
+                "name": room.name,
+                "title": room.title,
+                "last_message_id": room.last_message_id,
+                "last_message": last_message.message if last_message else "",
+                "last_message_content": last_message.message if last_message else "",
+                "last_message_sender": last_message.sender_employee_id if last_message else None,
+                "last_message_time": room.last_message_at.isoformat() if room.last_message_at else None,
+                "last_message_timestamp": room.last_message_at.isoformat() if room.last_message_at else None,
+                "participant_count": room.member_count or 0,
+                "created_at": room.created_at.isoformat() if room.created_at else None
+            })
+
+        next_cursor = None
+        if has_more:
+            last_room, _, last_activity_at = rows[-1]
+            if isinstance(last_activity_at, str):
+                last_activity_at = datetime.fromisoformat(last_activity_at)
+            next_cursor = ChatInboxService.encode_cursor(last_activity_at, last_room.id)
+
+        return {"chats": chats, "has_more": has_more, "next_cursor": next_cursor}
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트 (같은 트랜잭션의 connection으로 갱신)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _queue_invalidate(connection, target, room_id: int, *extra_ids: str):
+        from backend.models.app_models import ChatParticipant
+
+        employee_ids = connection.execute(
+            select(ChatParticipant.employee_id).where(ChatParticipant.chat_id == room_id)
+        ).scalars().all()
+        _pending.pending(target).update(employee_ids, extra_ids)
+
+    @staticmethod
+    def on_message_insert(mapper, connection, target):
+        """메시지 저장 시 채팅방의 마지막 메시지 갱신"""
+        from backend.models.app_models import ChatRoom
+
+        created_at = target.created_at or datetime.utcnow()
+        result = connection.execute(
+            update(ChatRoom)
+            .where(
+                ChatRoom.id == target.chat_id,
+                ChatRoom.type == target.chat_type,
+                or_(ChatRoom.last_message_at.is_(None), ChatRoom.last_message_at <= created_at)
+            )
+            .values(last_message_id=target.id, last_message_at=created_at)
+        )
+        if result.rowcount:
+            ChatInboxService._queue_invalidate(connection, target, target.chat_id)
+
+    @staticmethod
+    def on_participant_insert(mapper, connection, target):
+        ChatInboxService._change_member_count(connection, target, 1)
+
+    @staticmethod
+    def on_participant_delete(mapper, connection, target):
+        ChatInboxService._change_member_count(connection, target, -1)
+
+    @staticmethod
+    def _change_member_count(connection, participant, delta: int):
+        from backend.models.app_models import ChatRoom
+
+        connection.execute(
+            update(ChatRoom)
+            .where(ChatRoom.id == participant.chat_id)
+            .values(member_count=func.coalesce(ChatRoom.member_count, 0) + delta)
+        )
+        # 삭제된 참여자는 조회 결과에 없으므로 직접 추가
+        ChatInboxService._queue_invalidate(connection, participant, participant.chat_id, participant.employee_id)
+
+    # ------------------------------------------------------------------
+    # 커밋 후 캐시 무효화
+    # ------------------------------------------------------------------
+    @staticmethod
+    def invalidate_inboxes(employee_ids: set[str]) -> None:
+        try:
+            from backend.utils.cache_manager import chat_cache_manager
+            chat_cache_manager.invalidate_inbox(*employee_ids)
+        except Exception as e:
+            logger.warning(f"채팅방 목록 캐시 무효화 실패: {e}")
+
+
+# 전역 서비스 인스턴스
+chat_inbox_service = ChatInboxService()
+_pending = CommitQueue(PENDING_KEY, ChatInboxService.invalidate_inboxes)
+
+
+def setup_chat_inbox(app):
+    """메시지/참여자 매퍼 이벤트 및 커밋 후 캐시 무효화 연결"""
+    from sqlalchemy import event
+
+    from backend.models.app_models import ChatMessage, ChatParticipant
+
+    listeners = (
+        (ChatMessage, 'after_insert', ChatInboxService.on_message_insert),
+        (ChatParticipant, 'after_insert', ChatInboxService.on_participant_insert),
+        (ChatParticipant, 'after_delete', ChatInboxService.on_participant_delete),
+    )
+    for target, event_name, handler in listeners:
+        if not event.contains(target, event_name, handler):
+            event.listen(target, event_name, handler)
+    _pending.register()
+    return True
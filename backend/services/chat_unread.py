@@ -0,0 +1,244 @@
+"""
+채팅방별 읽지 않은 메시지 카운터
+chat_room_member의 읽음 커서(last_read_message_id)와 unread_count를
+메시지 전송/읽음 처리와 같은 트랜잭션에서 갱신하고,
+사용자별 Redis 해시(chat_unread:<user_id>)에 캐시하여 전체 채팅방 배지를 한 번에 조회합니다.
+Redis를 사용할 수 없으면 DB의 카운터를 그대로 읽습니다.
+"""
+
+import logging
+
+from sqlalchemy import and_, func, update
+
+from backend.app.extensions import db
+from backend.services.commit_queue import CommitQueue
+
+logger = logging.getLogger(__name__)
+
+# 커밋 후 Redis에 반영할 작업 목록 (session.info 키)
+PENDING_KEY = 'chat_unread_pending'
+
+# 해시가 적재된 상태인지 구분하는 필드 (채팅방이 없는 사용자도 캐시)
+LOADED_FIELD = '__loaded__'
+
+# 해시가 이미 적재된 경우에만 갱신 (부분 적재된 해시로 다른 방 카운트가 누락되지 않도록)
+_INCR_IF_LOADED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+_SET_IF_LOADED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+
+class ChatUnreadService:
+    """읽지 않은 메시지 카운터 서비스"""
+
+    KEY_PREFIX = 'chat_unread'
+    CACHE_TTL = 86400
+
+    _scripts = {}
+
+    @staticmethod
+    def _redis():
+        try:
+            from backend.utils.cache_manager import chat_cache_manager
+            return chat_cache_manager.redis_client
+        except Exception:
+            return None
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"{ChatUnreadService.KEY_PREFIX}:{user_id}"
+
+    @staticmethod
+    def room_key(chat_type: str, chat_id: int) -> str:
+        return f"{chat_type}:{chat_id}"
+
+    @staticmethod
+    def _script(client, source: str):
+        script = ChatUnreadService._scripts.get((id(client), source))
+        if script is None:
+            script = client.register_script(source)
+            ChatUnreadService._scripts[(id(client), source)] = script
+        return script
+
+    @staticmethod
+    def _queue(*op):
+        _pending.pending().append(op)
+
+    # ------------------------------------------------------------------
+    # 쓰기 (커밋은 호출자가 수행)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def on_message_sent(chat_type: str, chat_id: int, sender_id: str) -> None:
+        """새 메시지 전송 시 발신자를 제외한 멤버의 카운터 1 증가"""
+        from backend.models.app_models import ChatRoomMember
+
+        member_filter = and_(
+            ChatRoomMember.chat_type == chat_type,
+            ChatRoomMember.chat_id == chat_id,
+            ChatRoomMember.user_id != sender_id,
+            ChatRoomMember.is_left == False
+        )
+        db.session.execute(
+            update(ChatRoomMember)
+            .where(member_filter)
+            .values(unread_count=func.coalesce(ChatRoomMember.unread_count, 0) + 1)
+            .execution_options(synchronize_session=False)
+        )
+        member_ids = [row[0] for row in db.session.query(ChatRoomMember.user_id).filter(member_filter).all()]
+        if member_ids:
+            ChatUnreadService._queue('incr', member_ids, ChatUnreadService.room_key(chat_type, chat_id))
+
+    @staticmethod
+    def mark_read(user_id: str, chat_type: str, chat_id: int, message_id: int | None = None) -> dict | None:
+        """
+        읽음 커서를 이동하고 남은 읽지 않은 메시지 수를 갱신
+
+        Args:
+            message_id: 마지막으로 읽은 메시지 ID (없으면 채팅방 최신 메시지까지 읽음)
+
+        Returns:
+            {'read_count': 이번에 읽음 처리된 수, 'unread_count': 남은 수}, 멤버가 아니면 None
+        """
+        from backend.models.app_models import ChatMessage, ChatRoomMember
+
+        member = ChatRoomMember.query.filter_by(
+            chat_type=chat_type, chat_id=chat_id, user_id=user_id
+        ).first()
+        if not member:
+            return None
+
+        previous = member.unread_count or 0
+        room_filter = and_(
+            ChatMessage.chat_type == chat_type,
+            ChatMessage.chat_id == chat_id
+        )
+        if message_id is None:
+            message_id = db.session.query(func.max(ChatMessage.id)).filter(room_filter).scalar()
+            remaining = 0
+        else:
+            # 커서 이후의 읽지 않은 구간만 센다 (일반적으로 몇 건 이내)
+            remaining = db.session.query(func.count(ChatMessage.id)).filter(
+                room_filter,
+                ChatMessage.id > message_id,
+                ChatMessage.sender_employee_id != user_id,
+                ChatMessage.is_deleted == False
+            ).scalar() or 0
+
+        # 커서는 앞으로만 이동
+        if message_id is None or (member.last_read_message_id and message_id <= member.last_read_message_id):
+            return {'read_count': 0, 'unread_count': previous}
+
+        member.last_read_message_id = message_id
+        member.unread_count = remaining
+        ChatUnreadService._queue('set', user_id, ChatUnreadService.room_key(chat_type, chat_id), remaining)
+        return {'read_count': max(previous - remaining, 0), 'unread_count': remaining}
+
+    @staticmethod
+    def forget(user_id: str) -> None:
+        """사용자 캐시 해시 삭제 (멤버십 변경 시 다음 조회에서 DB로 재적재)"""
+        ChatUnreadService._queue('forget', user_id)
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _load_from_db(user_id: str) -> dict[str, int]:
+        from backend.models.app_models import ChatRoomMember
+
+        rows = db.session.query(
+            ChatRoomMember.chat_type, ChatRoomMember.chat_id, ChatRoomMember.unread_count
+        ).filter(
+            ChatRoomMember.user_id == user_id,
+            ChatRoomMember.is_left == False
+        ).all()
+        return {
+            ChatUnreadService.room_key(chat_type, chat_id): unread_count or 0
+            for chat_type, chat_id, unread_count in rows
+        }
+
+    @staticmethod
+    def get_unread_counts(user_id: str) -> dict[str, int]:
+        """사용자가 참여한 모든 채팅방의 읽지 않은 수 ({'party:1': 3, ...})"""
+        client = ChatUnreadService._redis()
+        key = ChatUnreadService._key(user_id)
+        if client:
+            try:
+                cached = client.hgetall(key)
+                if cached:
+                    return {field: int(value) for field, value in cached.items() if field != LOADED_FIELD}
+            except Exception as e:
+                logger.warning(f"읽지 않은 메시지 캐시 조회 실패: {e}")
+                client = None
+
+        counts = ChatUnreadService._load_from_db(user_id)
+
+        if client:
+            try:
+                pipe = client.pipeline()
+                pipe.hset(key, mapping={LOADED_FIELD: 1, **counts})
+                pipe.expire(key, ChatUnreadService.CACHE_TTL)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"읽지 않은 메시지 캐시 저장 실패: {e}")
+        return counts
+
+    @staticmethod
+    def get_unread_count(user_id: str, chat_type: str, chat_id: int) -> int:
+        return ChatUnreadService.get_unread_counts(user_id).get(
+            ChatUnreadService.room_key(chat_type, chat_id), 0
+        )
+
+    # ------------------------------------------------------------------
+    # 커밋 후 캐시 반영
+    # ------------------------------------------------------------------
+    @staticmethod
+    def apply_pending(ops: list[tuple]) -> None:
+        """커밋된 변경만 Redis에 반영"""
+        client = ChatUnreadService._redis()
+        if not client:
+            return
+        try:
+            incr = ChatUnreadService._script(client, _INCR_IF_LOADED)
+            set_value = ChatUnreadService._script(client, _SET_IF_LOADED)
+            pipe = client.pipeline()
+            for op in ops:
+                if op[0] == 'incr':
+                    _, user_ids, field = op
+                    for user_id in user_ids:
+                        incr(keys=[ChatUnreadService._key(user_id)], args=[field, 1], client=pipe)
+                elif op[0] == 'set':
+                    _, user_id, field, value = op
+                    set_value(keys=[ChatUnreadService._key(user_id)], args=[field, value], client=pipe)
+                elif op[0] == 'forget':
+                    pipe.delete(ChatUnreadService._key(op[1]))
+            pipe.execute()
+        except Exception as e:
+            # 캐시와 DB가 어긋날 수 있으므로 관련 해시를 버리고 다음 조회에서 재적재
+            logger.warning(f"읽지 않은 메시지 캐시 반영 실패: {e}")
+            try:
+                users = set()
+                for op in ops:
+                    users.update(op[1] if op[0] == 'incr' else [op[1]])
+                client.delete(*(ChatUnreadService._key(user_id) for user_id in users))
+            except Exception:
+                pass
+
+
+
+# 전역 서비스 인스턴스
+chat_unread_service = ChatUnreadService()
+_pending = CommitQueue(PENDING_KEY, ChatUnreadService.apply_pending, factory=list)
+
+
+def setup_chat_unread(app):
+    """커밋/롤백 시 Redis 카운터 반영 이벤트 연결"""
+    _pending.register()
+    return True
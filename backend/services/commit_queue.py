@@ -0,0 +1,49 @@
+"""
+커밋 후 작업 큐
+매퍼 이벤트 등 트랜잭션 안에서 모은 캐시 반영/무효화 작업을 세션(session.info)에 쌓아 두었다가
+커밋되면 처리하고 롤백되면 버립니다. 커밋되지 않은 변경이 캐시에 새지 않도록 모든 서비스가 같은 규칙을 씁니다.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.orm import object_session
+
+from backend.app.extensions import db
+
+
+class CommitQueue:
+    """session.info 키 하나에 쌓이는 커밋 후 작업 목록"""
+
+    def __init__(self, key: str, on_commit: Callable[[Any], None], factory: Callable[[], Any] = set):
+        """
+        Args:
+            key: session.info 키
+            on_commit: 커밋 후 쌓인 작업 전체를 받아 처리하는 함수
+            factory: 작업 목록 컨테이너 (중복을 합치려면 set, 순서가 필요하면 list)
+        """
+        self.key = key
+        self.on_commit = on_commit
+        self.factory = factory
+
+    def pending(self, target=None):
+        """대상 객체가 속한 세션(없으면 현재 세션)의 작업 목록 (없으면 생성)"""
+        session = (object_session(target) if target is not None else None) or db.session
+        return session.info.setdefault(self.key, self.factory())
+
+    def flush(self, session) -> None:
+        items = session.info.pop(self.key, None)
+        if items:
+            self.on_commit(items)
+
+    def discard(self, session) -> None:
+        session.info.pop(self.key, None)
+
+    def register(self) -> None:
+        """커밋/롤백 이벤트 연결 (여러 번 호출해도 한 번만 연결)"""
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+
+        for event_name, handler in (('after_commit', self.flush), ('after_rollback', self.discard)):
+            if not event.contains(Session, event_name, handler):
+                event.listen(Session, event_name, handler)
@@ -0,0 +1,383 @@
+"""
+사용자 호환성 엔진
+사용자 프로필(부서, 직급, 나이, 취미, 선호도, 음식 취향, 점심 성향)을 한 번만 인코딩하여
+NumPy 배열로 보관하고, 한 사용자 대 전체 후보(또는 전체 행렬)의 호환성 점수를 벡터 연산으로 계산합니다.
+프로필이 바뀐 사용자는 해당 행만 다시 인코딩합니다.
+"""
+
+import logging
+import threading
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from backend.services.refreshable import RefreshableIndex
+
+logger = logging.getLogger(__name__)
+
+# 점수 계산에 쓰이는 User 컬럼 (이 컬럼이 바뀐 경우에만 행 갱신)
+PROFILE_FIELDS = (
+    'is_active', 'current_level', 'food_preferences', 'lunch_preference', 'main_dish_genre',
+)
+
+
+def split_tokens(value) -> list[str]:
+    """쉼표 구분 문자열을 공백 제거된 토큰 목록으로 변환 (빈 토큰 제외)"""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        items = value
+    else:
+        items = str(value).split(',')
+    return [token.strip() for token in items if token and str(token).strip()]
+
+
+def extract_profile(user) -> dict:
+    """User 객체에서 호환성 계산용 프로필 추출"""
+    preferences = getattr(user, 'preferences', None)
+    if isinstance(preferences, str):
+        preference_tokens = split_tokens(preferences)
+    else:
+        # User.preferences는 딕셔너리 속성이므로 음식 관련 컬럼을 선호도로 사용
+        preference_tokens = (
+            split_tokens(getattr(user, 'food_preferences', None))
+            + split_tokens(getattr(user, 'lunch_preference', None))
+            + split_tokens(getattr(user, 'main_dish_genre', None))
+        )
+
+    level = getattr(user, 'level', None)
+    if level is None:
+        level = getattr(user, 'current_level', None)
+
+    return {
+        'department': getattr(user, 'department', None) or None,
+        'level': level,
+        'age': getattr(user, 'age', None),
+        'hobbies': set(split_tokens(getattr(user, 'hobbies', None))),
+        'preferences': set(preference_tokens),
+        'food': set(split_tokens(getattr(user, 'food_preferences', None))),
+        'style': set(split_tokens(getattr(user, 'lunch_preference', None))),
+    }
+
+
+class _Vocabulary:
+    """토큰 → 열 번호"""
+
+    def __init__(self):
+        self.index: dict[str, int] = {}
+
+    def encode(self, tokens: Iterable[str], grow: bool = True) -> list[int] | None:
+        columns = []
+        for token in tokens:
+            column = self.index.get(token)
+            if column is None:
+                if not grow:
+                    return None
+                column = self.index[token] = len(self.index)
+            columns.append(column)
+        return columns
+
+    def __len__(self):
+        return len(self.index)
+
+
+class CompatibilityEngine(RefreshableIndex):
+    """사용자 호환성 벡터 엔진"""
+
+    REFRESH_INTERVAL = 600
+    SET_FEATURES = ('hobbies', 'preferences', 'food', 'style')
+    MATRIX_BLOCK = 1024
+
+    def __init__(self, auto_refresh: bool = True):
+        """
+        Args:
+            auto_refresh: 변경/주기에 따라 DB에서 재구축할지 여부
+                (False면 load()로 적재한 내용을 그대로 유지하는 스냅샷 엔진)
+        """
+        super().__init__()
+        self._lock = threading.RLock()
+        self._profiles: dict[str, dict] = {}
+        self.auto_refresh = auto_refresh
+        self._reset_arrays()
+
+    def _reset_arrays(self):
+        self._ids: list[str] = []
+        self._row: dict[str, int] = {}
+        self._departments = _Vocabulary()
+        self._vocab = {name: _Vocabulary() for name in self.SET_FEATURES}
+        self._dept = np.empty(0, dtype=np.int32)
+        self._level = np.empty(0, dtype=np.float32)
+        self._age = np.empty(0, dtype=np.float32)
+        self._sets = {name: np.zeros((0, 0), dtype=np.float32) for name in self.SET_FEATURES}
+        self._sizes = {name: np.empty(0, dtype=np.float32) for name in self.SET_FEATURES}
+
+    # ------------------------------------------------------------------
+    # 인코딩
+    # ------------------------------------------------------------------
+    def _encode_all(self):
+        """보관 중인 프로필 전체를 배열로 인코딩"""
+        self._reset_arrays()
+        self._ids = list(self._profiles)
+        self._row = {user_id: i for i, user_id in enumerate(self._ids)}
+        n = len(self._ids)
+
+        encoded = {name: [] for name in self.SET_FEATURES}
+        dept = np.full(n, -1, dtype=np.int32)
+        level = np.full(n, np.nan, dtype=np.float32)
+        age = np.full(n, np.nan, dtype=np.float32)
+        for i, user_id in enumerate(self._ids):
+            profile = self._profiles[user_id]
+            if profile['department']:
+                dept[i] = self._departments.encode([profile['department']])[0]
+            if profile['level'] is not None:
+                level[i] = profile['level']
+            if profile['age'] is not None:
+                age[i] = profile['age']
+            for name in self.SET_FEATURES:
+                encoded[name].append(self._vocab[name].encode(sorted(profile[name])))
+
+        self._dept, self._level, self._age = dept, level, age
+        for name in self.SET_FEATURES:
+            matrix = np.zeros((n, len(self._vocab[name])), dtype=np.float32)
+            for i, columns in enumerate(encoded[name]):
+                matrix[i, columns] = 1.0
+            self._sets[name] = matrix
+            self._sizes[name] = matrix.sum(axis=1)
+
+    def _encode_row(self, user_id: str) -> bool:
+        """기존 행만 다시 인코딩 (새 토큰/부서가 있으면 False)"""
+        row = self._row.get(user_id)
+        if row is None:
+            return False
+        profile = self._profiles[user_id]
+
+        dept = -1
+        if profile['department']:
+            columns = self._departments.encode([profile['department']], grow=False)
+            if columns is None:
+                return False
+            dept = columns[0]
+
+        set_columns = {}
+        for name in self.SET_FEATURES:
+            columns = self._vocab[name].encode(profile[name], grow=False)
+            if columns is None:
+                return False
+            set_columns[name] = columns
+
+        self._dept[row] = dept
+        self._level[row] = np.nan if profile['level'] is None else profile['level']
+        self._age[row] = np.nan if profile['age'] is None else profile['age']
+        for name, columns in set_columns.items():
+            self._sets[name][row, :] = 0.0
+            self._sets[name][row, columns] = 1.0
+            self._sizes[name][row] = len(columns)
+        return True
+
+    # ------------------------------------------------------------------
+    # 구축 / 증분 갱신
+    # ------------------------------------------------------------------
+    def load(self, users: Iterable) -> int:
+        """User(또는 같은 속성을 가진 객체) 목록으로 엔진을 교체"""
+        with self._lock:
+            self._profiles = {
+                str(user.employee_id): extract_profile(user)
+                for user in users
+                if getattr(user, 'is_active', True) is not False
+            }
+            self._encode_all()
+            self._mark_built()
+            return len(self._ids)
+
+    def rebuild(self) -> int:
+        """DB에서 활성 사용자를 읽어 재구축 (앱 컨텍스트 필요)"""
+        from backend.auth.models import User
+
+        count = self.load(User.query.filter(User.is_active == True).all())
+        logger.info(f"사용자 호환성 엔진 구축 완료: {count}명")
+        return count
+
+    def refresh_user(self, user) -> None:
+        """사용자 한 명의 프로필을 다시 인코딩 (비활성 사용자는 제거)"""
+        user_id = str(user.employee_id)
+        with self._lock:
+            if getattr(user, 'is_active', True) is False:
+                if self._profiles.pop(user_id, None) is not None:
+                    self._encode_all()
+                return
+
+            self._profiles[user_id] = extract_profile(user)
+            if not self._encode_row(user_id):
+                # 새 사용자 또는 새 토큰 → 열/행이 늘어나므로 전체 재인코딩 (DB 조회 없음)
+                self._encode_all()
+
+    def _on_user_insert(self, mapper, connection, target):
+        self.refresh_user(target)
+
+    def _on_user_update(self, mapper, connection, target):
+        """User 변경 이벤트 → 점수 관련 컬럼이 바뀐 경우에만 행 갱신"""
+        from sqlalchemy import inspect
+
+        state = inspect(target)
+        if any(state.attrs[name].history.has_changes() for name in PROFILE_FIELDS):
+            self.refresh_user(target)
+
+    def _on_user_delete(self, mapper, connection, target):
+        with self._lock:
+            if self._profiles.pop(str(target.employee_id), None) is not None:
+                self._encode_all()
+
+    def _ensure_fresh(self):
+        if self.auto_refresh:
+            super()._ensure_fresh()
+
+    def __contains__(self, user_id) -> bool:
+        return str(user_id) in self._row
+
+    @property
+    def size(self) -> int:
+        return len(self._ids)
+
+    # ------------------------------------------------------------------
+    # 점수 계산
+    # ------------------------------------------------------------------
+    def _rows(self, user_ids: Iterable | None) -> np.ndarray:
+        if user_ids is None:
+            return np.arange(len(self._ids))
+        rows = [self._row[uid] for uid in map(str, user_ids) if uid in self._row]
+        return np.asarray(rows, dtype=np.int64)
+
+    def _match_scores(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """
+        랜덤 런치 매칭 점수 행렬
+
+        부서 동일 +30, 직급 차 1 이하 +20 / 2 이하 +10, 나이 차 3 이하 +15 / 5 이하 +10,
+        공통 취미당 +5, 공통 선호도당 +4 (최대 100점). 직급/나이가 없으면 차이 0으로 간주합니다.
+        """
+        f32 = np.float32
+        dept_r = self._dept[rows][:, None]
+        same_dept = (dept_r >= 0) & (dept_r == self._dept[cols][None, :])
+
+        level_diff = np.nan_to_num(np.abs(self._level[rows][:, None] - self._level[cols][None, :]), nan=0.0)
+        age_diff = np.nan_to_num(np.abs(self._age[rows][:, None] - self._age[cols][None, :]), nan=0.0)
+
+        score = same_dept * f32(30)
+        score += np.where(level_diff <= 1, f32(20), np.where(level_diff <= 2, f32(10), f32(0)))
+        score += np.where(age_diff <= 3, f32(15), np.where(age_diff <= 5, f32(10), f32(0)))
+        score += f32(5) * (self._sets['hobbies'][rows] @ self._sets['hobbies'][cols].T)
+        score += f32(4) * (self._sets['preferences'][rows] @ self._sets['preferences'][cols].T)
+        return np.minimum(score, f32(100))
+
+    def _jaccard(self, name: str, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        matrix = self._sets[name]
+        intersection = matrix[rows] @ matrix[cols].T
+        sizes_r = self._sizes[name][rows][:, None]
+        sizes_c = self._sizes[name][cols][None, :]
+        union = sizes_r + sizes_c - intersection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            jaccard = np.where(
+                (sizes_r > 0) & (sizes_c > 0) & (union > 0), intersection / union * np.float32(100), np.float32(0)
+            )
+        return jaccard
+
+    def _preference_scores(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """추천용 선호도 점수 행렬 (음식 선호 자카드 60% + 점심 성향 자카드 40%)"""
+        return self._jaccard('food', rows, cols) * np.float32(0.6) + self._jaccard('style', rows, cols) * np.float32(0.4)
+
+    def _compute(self, kind: str, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        if kind == 'match':
+            return self._match_scores(rows, cols)
+        if kind == 'preference':
+            return self._preference_scores(rows, cols)
+        raise ValueError(f"지원하지 않는 점수 종류입니다: {kind}")
+
+    def scores_for(self, user_id, candidate_ids: Iterable | None = None,
+                   kind: str = 'match') -> tuple[list[str], np.ndarray]:
+        """
+        한 사용자 대 후보 전체의 호환성 점수
+
+        Returns:
+            (후보 ID 목록, 점수 배열) - 엔진에 없는 후보와 본인은 제외
+        """
+        self._ensure_fresh()
+        with self._lock:
+            user_id = str(user_id)
+            if user_id not in self._row:
+                return [], np.empty(0, dtype=np.float32)
+            cols = self._rows(candidate_ids)
+            cols = cols[cols != self._row[user_id]]
+            scores = self._compute(kind, np.asarray([self._row[user_id]]), cols)[0]
+            return [self._ids[c] for c in cols], scores
+
+    def score_matrix(self, user_ids: Iterable | None = None,
+                     kind: str = 'match') -> tuple[list[str], np.ndarray]:
+        """사용자 집합의 전체 호환성 행렬 (대각선은 0, 메모리 사용을 줄이기 위해 행 블록 단위로 계산)"""
+        self._ensure_fresh()
+        with self._lock:
+            rows = self._rows(user_ids)
+            matrix = np.empty((len(rows), len(rows)), dtype=np.float32)
+            for start in range(0, len(rows), self.MATRIX_BLOCK):
+                block = rows[start:start + self.MATRIX_BLOCK]
+                matrix[start:start + len(block)] = self._compute(kind, block, rows)
+            np.fill_diagonal(matrix, 0.0)
+            return [self._ids[r] for r in rows], matrix
+
+    def score_blocks(self, user_ids: Iterable | None = None,
+                     kind: str = 'match') -> tuple[list[str], Iterator[tuple[int, np.ndarray]]]:
+        """
+        사용자 집합의 호환성 행렬을 행 블록 단위로 생성 (n×n 행렬 전체를 메모리에 두지 않음)
+
+        Returns:
+            (사용자 ID 목록, (시작 행, MATRIX_BLOCK×n 블록) 이터레이터) - 대각선은 0
+            행/열 순서는 호출 시점에 고정되므로 배치 작업에는 스냅샷 엔진을 사용합니다.
+        """
+        self._ensure_fresh()
+        with self._lock:
+            rows = self._rows(user_ids)
+            ids = [self._ids[r] for r in rows]
+
+        def blocks():
+            for start in range(0, len(rows), self.MATRIX_BLOCK):
+                with self._lock:
+                    block = self._compute(kind, rows[start:start + self.MATRIX_BLOCK], rows)
+                block[np.arange(len(block)), np.arange(start, start + len(block))] = 0.0
+                yield start, block
+
+        return ids, blocks()
+
+    def pair_score(self, user1_id, user2_id, kind: str = 'match') -> float:
+        """두 사용자의 호환성 점수 (엔진에 없으면 0)"""
+        self._ensure_fresh()
+        with self._lock:
+            row1 = self._row.get(str(user1_id))
+            row2 = self._row.get(str(user2_id))
+            if row1 is None or row2 is None:
+                return 0.0
+            return float(self._compute(kind, np.asarray([row1]), np.asarray([row2]))[0, 0])
+
+
+# 전역 호환성 엔진 인스턴스
+compatibility_engine = CompatibilityEngine()
+
+
+def setup_compatibility_engine(app):
+    """User 변경 이벤트 연결 및 시작 시 엔진 구축"""
+    from sqlalchemy import event
+    from backend.auth.models import User
+
+    listeners = (
+        ('after_insert', compatibility_engine._on_user_insert),
+        ('after_update', compatibility_engine._on_user_update),
+        ('after_delete', compatibility_engine._on_user_delete),
+    )
+    for event_name, handler in listeners:
+        if not event.contains(User, event_name, handler):
+            event.listen(User, event_name, handler)
+
+    try:
+        with app.app_context():
+            compatibility_engine.rebuild()
+    except Exception as e:
+        # 테이블이 아직 없으면 첫 조회 시 구축
+        logger.warning(f"사용자 호환성 엔진 초기 구축 건너뜀: {e}")
+    return True
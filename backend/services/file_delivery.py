@@ -0,0 +1,161 @@
+"""
+첨부파일 전달
+  - 내용 해시 기반 강한 ETag, 내용 주소 저장소 파일은 Cache-Control: immutable
+  - If-None-Match → 304, Range → 206 (동영상/오디오 탐색)
+  - FILE_DELIVERY_MODE로 바이트 전송을 앞단 프록시에 위임
+      send_file (기본): Flask/Werkzeug가 직접 전송
+      x-accel: nginx X-Accel-Redirect (FILE_ACCEL_PREFIX를 업로드 폴더에 매핑한 internal location 필요)
+          location /protected-files/ { internal; alias /srv/app/uploads/; }
+      x-sendfile: Apache/lighttpd X-Sendfile (절대 경로)
+  - 첨부파일 메타데이터는 캐시해 반복 요청(썸네일 등)에서 DB 조회를 생략
+"""
+
+import logging
+import os
+import unicodedata
+from typing import Any
+from urllib.parse import quote
+
+from flask import current_app, request, send_file
+
+from backend.app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+SEND_FILE = 'send_file'
+X_ACCEL = 'x-accel'
+X_SENDFILE = 'x-sendfile'
+
+
+class FileDeliveryService:
+    """첨부파일 메타데이터 조회 및 파일 응답 생성"""
+
+    # 내용 주소 저장소 파일은 내용이 바뀌지 않으므로 1년 캐시
+    IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+    META_CACHE_TTL = 3600
+    DEFAULT_ACCEL_PREFIX = '/protected-files/'
+
+    # ------------------------------------------------------------------
+    # 메타데이터
+    # ------------------------------------------------------------------
+    @staticmethod
+    def load_attachment(attachment_id: int) -> dict[str, Any] | None:
+        """첨부파일 메타데이터 (캐시 우선, 없으면 DB)"""
+        from backend.app.cache_manager import cache_attachment_meta, get_cached_attachment_meta
+        from backend.models.app_models import MessageAttachment
+        from backend.services.image_variants import PENDING
+
+        cached = get_cached_attachment_meta(attachment_id)
+        if cached:
+            return cached
+
+        attachment = db.session.get(MessageAttachment, attachment_id)
+        if not attachment:
+            return None
+
+        meta = {
+            'id': attachment.id,
+            'file_name': attachment.file_name,
+            'file_path': attachment.file_path,
+            'file_type': attachment.file_type,
+            'mime_type': attachment.mime_type,
+            'thumbnail_path': attachment.thumbnail_path,
+            'content_hash': attachment.content_hash,
+            'variant_status': attachment.variant_status,
+        }
+        # 변형 생성 중인 상태는 곧 바뀌므로 캐시하지 않음
+        if attachment.variant_status != PENDING:
+            cache_attachment_meta(attachment_id, meta, expire_seconds=FileDeliveryService.META_CACHE_TTL)
+        return meta
+
+    @staticmethod
+    def invalidate(*attachment_ids: int) -> None:
+        from backend.app.cache_manager import invalidate_attachment_meta
+
+        invalidate_attachment_meta(*attachment_ids)
+
+    @staticmethod
+    def etag(content_hash: str | None, variant: str | None = None) -> str | None:
+        """내용 해시 기반 ETag (해시가 없는 기존 첨부파일은 None - 파일 시각/크기 기반 기본값 사용)"""
+        if not content_hash:
+            return None
+        return f"{content_hash}-{variant}" if variant else content_hash
+
+    # ------------------------------------------------------------------
+    # 응답
+    # ------------------------------------------------------------------
+    @staticmethod
+    def delivery_mode() -> str:
+        return (current_app.config.get('FILE_DELIVERY_MODE') or os.getenv('FILE_DELIVERY_MODE', SEND_FILE)).lower()
+
+    @staticmethod
+    def send(path: str, mimetype: str, etag: str | None = None, download_name: str | None = None,
+             as_attachment: bool = False):
+        """
+        파일 응답 생성
+
+        etag가 있으면 내용 주소 파일로 보고 강한 ETag와 immutable 캐시 헤더를 붙입니다.
+        업로드 경로는 작업 디렉터리 기준 상대 경로로 저장되므로 절대 경로로 바꿔 전달합니다.
+        """
+        path = os.path.abspath(path)
+        mode = FileDeliveryService.delivery_mode()
+
+        response = None
+        if mode in (X_ACCEL, X_SENDFILE):
+            response = FileDeliveryService._offload(path, mode, mimetype, download_name, as_attachment)
+            if response is not None and etag:
+                # 본문이 없으므로 ETag 일치 여부만 판단 (Range는 프록시가 처리)
+                response.set_etag(etag)
+                response.make_conditional(request)
+        if response is None:
+            response = send_file(
+                path,
+                mimetype=mimetype,
+                as_attachment=as_attachment,
+                download_name=download_name,
+                conditional=True,
+                etag=etag if etag else True,
+            )
+
+        if etag:
+            # 인증이 필요한 파일이므로 공유 캐시(프록시)에는 저장하지 않음
+            response.cache_control.no_cache = None
+            response.cache_control.private = True
+            response.cache_control.max_age = FileDeliveryService.IMMUTABLE_MAX_AGE
+            response.cache_control.immutable = True
+        response.headers['Accept-Ranges'] = 'bytes'
+        return response
+
+    @staticmethod
+    def _offload(path: str, mode: str, mimetype: str, download_name: str | None, as_attachment: bool):
+        """프록시가 전송하도록 헤더만 담은 응답 (조건부 요청은 여기서, Range는 프록시가 처리)"""
+        if mode == X_ACCEL:
+            from backend.utils.file_manager import file_manager
+
+            upload_root = os.path.abspath(file_manager.upload_folder)
+            if os.path.commonpath([upload_root, path]) != upload_root:
+                # 업로드 폴더 밖 파일은 internal location으로 매핑할 수 없음
+                logger.warning(f"X-Accel-Redirect 대상이 업로드 폴더 밖에 있습니다: {path}")
+                return None
+            prefix = current_app.config.get('FILE_ACCEL_PREFIX') or FileDeliveryService.DEFAULT_ACCEL_PREFIX
+            relative = os.path.relpath(path, upload_root).replace(os.sep, '/')
+            header, value = 'X-Accel-Redirect', prefix.rstrip('/') + '/' + quote(relative)
+        else:
+            header, value = 'X-Sendfile', path
+
+        response = current_app.response_class(mimetype=mimetype)
+        response.headers[header] = value
+        FileDeliveryService._set_disposition(response, download_name or os.path.basename(path), as_attachment)
+        return response
+
+    @staticmethod
+    def _set_disposition(response, download_name: str, as_attachment: bool) -> None:
+        """Content-Disposition (한글 파일명은 RFC 5987 filename*로 전달)"""
+        disposition = 'attachment' if as_attachment else 'inline'
+        try:
+            download_name.encode('ascii')
+            names = {'filename': download_name}
+        except UnicodeEncodeError:
+            simple = unicodedata.normalize('NFKD', download_name).encode('ascii', 'ignore').decode('ascii')
+            names = {'filename': simple, 'filename*': f"UTF-8''{quote(download_name, safe='')}"}
+        response.headers.set('Content-Disposition', disposition, **names)
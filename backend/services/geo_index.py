@@ -0,0 +1,189 @@
+"""
+식당 위치 인덱스
+restaurants_v2 테이블의 좌표를 프로세스 메모리에 NumPy 배열로 보관하고
+반경 검색을 벡터 연산으로 처리합니다.
+"""
+
+import logging
+import threading
+from collections.abc import Iterable
+
+import numpy as np
+
+from backend.services.refreshable import RefreshableIndex
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_LAT_DEGREE = 111.0
+
+
+class _GeoSnapshot:
+    """위도 기준으로 정렬된 좌표 배열 스냅샷 (불변)"""
+
+    __slots__ = ('ids', 'lats', 'lngs', 'lat_rad', 'lng_rad', 'cos_lat')
+
+    def __init__(self, ids: np.ndarray, lats: np.ndarray, lngs: np.ndarray):
+        order = np.argsort(lats, kind='stable')
+        self.ids = ids[order]
+        self.lats = lats[order]
+        self.lngs = lngs[order]
+        self.lat_rad = np.radians(self.lats)
+        self.lng_rad = np.radians(self.lngs)
+        self.cos_lat = np.cos(self.lat_rad)
+
+
+class RestaurantGeoIndex(RefreshableIndex):
+    """식당 좌표 인메모리 공간 인덱스"""
+
+    INDEXED_FIELDS = ('latitude', 'longitude', 'is_active')
+
+    def __init__(self):
+        super().__init__()
+        self._snapshot = _GeoSnapshot(
+            np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+        )
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 인덱스 구축
+    # ------------------------------------------------------------------
+    def load(self, rows: Iterable[tuple[int, float, float]]) -> int:
+        """(id, 위도, 경도) 목록으로 인덱스를 교체"""
+        rows = [r for r in rows if r[1] is not None and r[2] is not None]
+        ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+        lats = np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows))
+        lngs = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
+
+        self._snapshot = _GeoSnapshot(ids, lats, lngs)
+        self._mark_built()
+        return len(rows)
+
+    def rebuild(self) -> int:
+        """DB에서 활성 식당 좌표를 읽어 인덱스를 재구축 (앱 컨텍스트 필요)"""
+        from backend.models.restaurant_models import RestaurantV2
+
+        with self._lock:
+            rows = RestaurantV2.query.with_entities(
+                RestaurantV2.id, RestaurantV2.latitude, RestaurantV2.longitude
+            ).filter(RestaurantV2.is_active == True).all()
+            count = self.load(rows)
+
+        logger.info(f"식당 위치 인덱스 구축 완료: {count}개")
+        return count
+
+    def _on_update(self, mapper, connection, target):
+        """좌표나 활성 상태가 바뀐 경우에만 재구축 대상으로 표시"""
+        from sqlalchemy import inspect
+
+        state = inspect(target)
+        if any(state.attrs[name].history.has_changes() for name in self.INDEXED_FIELDS):
+            self.mark_dirty()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _haversine(snapshot: _GeoSnapshot, idx: np.ndarray, lat: float, lng: float) -> np.ndarray:
+        """선택된 인덱스에 대한 Haversine 거리 (km)"""
+        lat0 = np.radians(lat)
+        lng0 = np.radians(lng)
+        dlat = snapshot.lat_rad[idx] - lat0
+        dlng = snapshot.lng_rad[idx] - lng0
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat0) * snapshot.cos_lat[idx] * np.sin(dlng / 2) ** 2
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+    @staticmethod
+    def _bbox_candidates(snapshot: _GeoSnapshot, lat: float, lng: float, radius: float) -> np.ndarray:
+        """경계 박스 내 후보 위치 (정렬된 위도 배열에 이분 탐색)"""
+        lat_delta = radius / KM_PER_LAT_DEGREE
+        lo = np.searchsorted(snapshot.lats, lat - lat_delta, side='left')
+        hi = np.searchsorted(snapshot.lats, lat + lat_delta, side='right')
+        band = np.arange(lo, hi)
+
+        cos_lat = np.cos(np.radians(lat))
+        if cos_lat > 1e-9:
+            lng_delta = radius / (KM_PER_LAT_DEGREE * cos_lat)
+            if lng_delta < 180:
+                diff = np.abs(snapshot.lngs[band] - lng)
+                diff = np.minimum(diff, 360 - diff)
+                band = band[diff <= lng_delta]
+        return band
+
+    def query_radius(
+        self,
+        lat: float,
+        lng: float,
+        radius: float,
+        candidate_ids: Iterable[int] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[list[tuple[int, float]], int]:
+        """
+        반경 내 식당을 거리순으로 조회
+
+        Args:
+            lat, lng: 기준 좌표
+            radius: 반경 (km)
+            candidate_ids: 허용할 식당 ID 집합 (검색/카테고리 필터 결과)
+            offset, limit: 페이지 범위
+
+        Returns:
+            ([(식당 ID, 거리 km), ...] 페이지, 반경 내 전체 개수)
+        """
+        self._ensure_fresh()
+        snapshot = self._snapshot
+
+        idx = self._bbox_candidates(snapshot, lat, lng, radius)
+        if candidate_ids is not None and len(idx):
+            allowed = np.fromiter(candidate_ids, dtype=np.int64)
+            idx = idx[np.isin(snapshot.ids[idx], allowed)]
+        if not len(idx):
+            return [], 0
+
+        # 응답과 동일한 정밀도(소수 둘째 자리)로 반경 비교
+        distances = np.round(self._haversine(snapshot, idx, lat, lng), 2)
+        within = distances <= radius
+        idx, distances = idx[within], distances[within]
+        total = len(idx)
+
+        end = total if limit is None else min(total, offset + limit)
+        if offset >= end:
+            return [], total
+
+        # 필요한 페이지까지만 부분 정렬
+        if end < total:
+            part = np.argpartition(distances, end - 1)[:end]
+        else:
+            part = np.arange(total)
+        order = part[np.lexsort((snapshot.ids[idx[part]], distances[part]))][offset:end]
+
+        page = [(int(snapshot.ids[idx[i]]), float(distances[i])) for i in order]
+        return page, total
+
+
+# 전역 위치 인덱스 인스턴스
+restaurant_geo_index = RestaurantGeoIndex()
+
+
+def setup_geo_index(app):
+    """식당 변경 이벤트 연결 및 시작 시 인덱스 구축"""
+    from sqlalchemy import event
+    from backend.models.restaurant_models import RestaurantV2
+
+    listeners = (
+        ('after_insert', restaurant_geo_index.mark_dirty),
+        ('after_update', restaurant_geo_index._on_update),
+        ('after_delete', restaurant_geo_index.mark_dirty),
+    )
+    for event_name, handler in listeners:
+        if not event.contains(RestaurantV2, event_name, handler):
+            event.listen(RestaurantV2, event_name, handler)
+
+    try:
+        with app.app_context():
+            restaurant_geo_index.rebuild()
+    except Exception as e:
+        # 테이블이 아직 없으면 첫 조회 시 구축
+        logger.warning(f"식당 위치 인덱스 초기 구축 건너뜀: {e}")
+    return True
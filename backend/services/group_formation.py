@@ -0,0 +1,362 @@
+"""
+랜덤 런치 그룹 편성 엔진
+특정 날짜에 참여 가능한 사용자 전체를 2~4명 그룹으로 나누어
+group_matching.calculate_group_score의 총합이 최대가 되도록 시뮬레이티드 어닐링으로 탐색합니다.
+
+그룹 점수는 (그룹 크기 점수 + 날짜 점수 + 멤버 쌍 점수의 합)으로 분해되므로
+쌍 점수 행렬만 미리 계산해 두면 이동/교환 시 점수 변화를 그룹 크기만큼의 연산으로 구할 수 있습니다.
+사용자가 많아 행렬이 너무 커지면 쌍 점수를 비트셋으로 즉시 계산합니다.
+"""
+
+import logging
+import math
+import random
+import time
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# calculate_group_score와 동일한 그룹 크기 점수
+SIZE_SCORES = {1: 10, 2: 20, 3: 30, 4: 25}
+MIN_GROUP_SIZE = 2
+MAX_GROUP_SIZE = 4
+
+# 쌍 점수 가중치 (공통 음식 선호당, 공통 점심 성향당, 선호 시간 일치, 알러지 정보 일치)
+FOOD_WEIGHT = 15
+STYLE_WEIGHT = 20
+TIME_WEIGHT = 15
+ALLERGY_WEIGHT = 10
+
+
+def date_score(date: str) -> int:
+    """calculate_group_score의 날짜별 점수 (그룹마다 동일)"""
+    date_seed = int(date.replace('-', ''))
+    random_score = (date_seed * 9301 + 49297) % 233280
+    return int((random_score / 233280) * 16)
+
+
+def _hashable(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+class _PairScores:
+    """사용자 쌍 점수 (행렬 또는 비트셋 기반)"""
+
+    # 이 인원 이하이면 전체 쌍 점수 행렬을 미리 계산 (3,000명 ≈ 36MB)
+    MATRIX_LIMIT = 3000
+
+    def __init__(self, user_ids: list, users_data: dict):
+        self.n = len(user_ids)
+        food_vocab, style_vocab, time_codes, allergy_codes = {}, {}, {}, {}
+        food_bits, style_bits = [], []
+        food_cols, style_cols = [], []
+        times = np.empty(self.n, dtype=np.int64)
+        allergies = np.empty(self.n, dtype=np.int64)
+
+        for i, user_id in enumerate(user_ids):
+            data = users_data[user_id]
+            foods = set(data.get('foodPreferences') or ())
+            styles = set(data.get('lunchStyle') or ())
+            f_cols = [food_vocab.setdefault(token, len(food_vocab)) for token in foods]
+            s_cols = [style_vocab.setdefault(token, len(style_vocab)) for token in styles]
+            food_cols.append(f_cols)
+            style_cols.append(s_cols)
+            food_bits.append(sum(1 << c for c in f_cols))
+            style_bits.append(sum(1 << c for c in s_cols))
+            times[i] = time_codes.setdefault(_hashable(data.get('preferredTime')), len(time_codes))
+            allergies[i] = allergy_codes.setdefault(_hashable(data.get('allergies')), len(allergy_codes))
+
+        self.food_bits, self.style_bits = food_bits, style_bits
+        self.times, self.allergies = times.tolist(), allergies.tolist()
+        self._times_arr, self._allergies_arr = times, allergies
+
+        self._food = np.zeros((self.n, max(len(food_vocab), 1)), dtype=np.float32)
+        self._style = np.zeros((self.n, max(len(style_vocab), 1)), dtype=np.float32)
+        for i in range(self.n):
+            self._food[i, food_cols[i]] = 1.0
+            self._style[i, style_cols[i]] = 1.0
+
+        self.matrix = None
+        if self.n <= self.MATRIX_LIMIT:
+            self.matrix = self._rows(np.arange(self.n))
+            np.fill_diagonal(self.matrix, 0.0)
+
+    def _rows(self, rows: np.ndarray) -> np.ndarray:
+        """선택한 사용자들 대 전체 사용자의 쌍 점수"""
+        scores = FOOD_WEIGHT * (self._food[rows] @ self._food.T)
+        scores += STYLE_WEIGHT * (self._style[rows] @ self._style.T)
+        scores += TIME_WEIGHT * (self._times_arr[rows][:, None] == self._times_arr[None, :])
+        scores += ALLERGY_WEIGHT * (self._allergies_arr[rows][:, None] == self._allergies_arr[None, :])
+        return scores.astype(np.float32)
+
+    def row(self, i: int) -> np.ndarray:
+        if self.matrix is not None:
+            return self.matrix[i]
+        row = self._rows(np.asarray([i]))[0]
+        row[i] = 0.0
+        return row
+
+    def pair(self, i: int, j: int) -> float:
+        if self.matrix is not None:
+            return float(self.matrix[i, j])
+        return (
+            FOOD_WEIGHT * (self.food_bits[i] & self.food_bits[j]).bit_count()
+            + STYLE_WEIGHT * (self.style_bits[i] & self.style_bits[j]).bit_count()
+            + TIME_WEIGHT * (self.times[i] == self.times[j])
+            + ALLERGY_WEIGHT * (self.allergies[i] == self.allergies[j])
+        )
+
+
+def initial_group_sizes(n: int) -> list[int]:
+    """n명을 3명 위주의 2~4명 그룹 크기로 분할"""
+    if n < MIN_GROUP_SIZE:
+        return []
+    if n in (2, 4):
+        return [n]
+    sizes = [3] * (n // 3)
+    remainder = n % 3
+    if remainder == 1:
+        sizes[-1] = 4
+    elif remainder == 2:
+        sizes.append(2)
+    return sizes
+
+
+class GroupFormationSolver:
+    """그룹 편성 시뮬레이티드 어닐링 솔버"""
+
+    def __init__(self, users_data: dict, date: str, seed: int | None = None):
+        self.user_ids = list(users_data)
+        self.date = date
+        self.group_constant = date_score(date)
+        self.scores = _PairScores(self.user_ids, users_data)
+        self.rng = random.Random(seed)
+
+    # ------------------------------------------------------------------
+    # 점수
+    # ------------------------------------------------------------------
+    def group_score(self, members: list[int]) -> float:
+        """calculate_group_score와 동일한 그룹 점수 (멤버는 내부 인덱스)"""
+        if not members or len(members) > MAX_GROUP_SIZE:
+            return 0
+        pair_total = sum(
+            self.scores.pair(members[a], members[b])
+            for a in range(len(members)) for b in range(a + 1, len(members))
+        )
+        return SIZE_SCORES[len(members)] + self.group_constant + pair_total
+
+    def _affinity(self, user: int, members: list[int]) -> float:
+        pair = self.scores.pair
+        return sum(pair(user, other) for other in members if other != user)
+
+    # ------------------------------------------------------------------
+    # 초기해 (탐욕적 구성)
+    # ------------------------------------------------------------------
+    def _greedy_groups(self) -> list[list[int]]:
+        n = len(self.user_ids)
+        sizes = initial_group_sizes(n)
+        order = list(range(n))
+        self.rng.shuffle(order)
+        assigned = np.zeros(n, dtype=bool)
+        groups = []
+        cursor = 0
+        for size in sorted(sizes, reverse=True):
+            while assigned[order[cursor]]:
+                cursor += 1
+            seed = order[cursor]
+            assigned[seed] = True
+            members = [seed]
+            affinity = self.scores.row(seed).astype(np.float64)
+            while len(members) < size:
+                candidate_scores = np.where(assigned, -np.inf, affinity)
+                best = int(np.argmax(candidate_scores))
+                assigned[best] = True
+                members.append(best)
+                if len(members) < size:
+                    affinity = affinity + self.scores.row(best)
+            groups.append(members)
+        return groups
+
+    # ------------------------------------------------------------------
+    # 어닐링
+    # ------------------------------------------------------------------
+    def solve(self, max_iterations: int | None = None, time_limit: float = 10.0,
+              initial_temperature: float | None = None, final_temperature: float = 0.05) -> dict:
+        """
+        참여 가능한 사용자 전체를 그룹으로 분할
+
+        Returns:
+            groups: [[사용자 ID, ...], ...] (점수 내림차순)
+            group_scores: 그룹별 점수
+            total_score: 점수 총합
+            initial_score: 탐욕적 초기해의 점수 총합
+            iterations: 수행한 탐색 횟수
+        """
+        n = len(self.user_ids)
+        if n < MIN_GROUP_SIZE:
+            return {'groups': [], 'group_scores': [], 'total_score': 0, 'initial_score': 0, 'iterations': 0}
+
+        groups = self._greedy_groups()
+        group_of = [0] * n
+        for g, members in enumerate(groups):
+            for user in members:
+                group_of[user] = g
+        current = sum(self.group_score(members) for members in groups)
+        initial = best_total = current
+        best_groups = [list(m) for m in groups]
+
+        max_iterations = max_iterations or 200 * n
+        start_temperature = initial_temperature or self._estimate_temperature(groups, group_of)
+        final_temperature = min(final_temperature, start_temperature)
+        temperature = start_temperature
+        started = time.perf_counter()
+        rng = self.rng
+        iterations = 0
+
+        while iterations < max_iterations:
+            if iterations % 1024 == 0:
+                # 반복 횟수와 시간 중 먼저 소진되는 쪽 기준으로 지수 냉각
+                elapsed = time.perf_counter() - started
+                if elapsed > time_limit:
+                    break
+                progress = max(iterations / max_iterations, elapsed / time_limit)
+                temperature = start_temperature * (final_temperature / start_temperature) ** progress
+            iterations += 1
+
+            move = self._propose(groups, group_of)
+            if move is None:
+                continue
+            delta, apply = move
+            if delta >= 0 or rng.random() < math.exp(delta / temperature):
+                apply()
+                current += delta
+                if current > best_total + 1e-9:
+                    best_total = current
+                    best_groups = [list(m) for m in groups if m]
+
+        best_groups = [m for m in best_groups if m]
+        scored = sorted(
+            ((self.group_score(members), members) for members in best_groups),
+            key=lambda item: item[0], reverse=True
+        )
+        return {
+            'groups': [[self.user_ids[u] for u in members] for _, members in scored],
+            'group_scores': [score for score, _ in scored],
+            'total_score': sum(score for score, _ in scored),
+            'initial_score': initial,
+            'iterations': iterations,
+        }
+
+    def _estimate_temperature(self, groups, group_of, samples: int = 200) -> float:
+        deltas = []
+        for _ in range(samples):
+            move = self._propose(groups, group_of)
+            if move is not None:
+                deltas.append(abs(move[0]))
+        positive = [d for d in deltas if d > 0]
+        if not positive:
+            return 1.0
+        # 탐욕적 초기해가 이미 좋으므로 평균 변화량의 10% 수준에서 시작 (그 이상은 초기해를 흐트러뜨리기만 함)
+        return max(0.1 * sum(positive) / len(positive), 1.0)
+
+    def _propose(self, groups: list[list[int]], group_of: list[int]):
+        """무작위 이웃해 제안 → (점수 변화, 적용 함수) 또는 None"""
+        rng = self.rng
+        n = len(group_of)
+        u = rng.randrange(n)
+        a = group_of[u]
+        group_a = groups[a]
+        kind = rng.random()
+
+        if kind < 0.5:
+            # 서로 다른 그룹의 두 사용자 교환
+            v = rng.randrange(n)
+            b = group_of[v]
+            if a == b:
+                return None
+            group_b = groups[b]
+            pair = self.scores.pair
+            delta = (
+                self._affinity(u, group_b) - pair(u, v)
+                + self._affinity(v, group_a) - pair(u, v)
+                - self._affinity(u, group_a)
+                - self._affinity(v, group_b)
+            )
+
+            def apply():
+                group_a[group_a.index(u)] = v
+                group_b[group_b.index(v)] = u
+                group_of[u], group_of[v] = b, a
+            return delta, apply
+
+        if kind < 0.9:
+            # 한 사용자를 다른 그룹으로 이동 (크기 2~4 유지)
+            if len(group_a) <= MIN_GROUP_SIZE:
+                return None
+            b = group_of[rng.randrange(n)]
+            group_b = groups[b]
+            if a == b or len(group_b) >= MAX_GROUP_SIZE:
+                return None
+            delta = (
+                self._affinity(u, group_b) - self._affinity(u, group_a)
+                + SIZE_SCORES[len(group_a) - 1] - SIZE_SCORES[len(group_a)]
+                + SIZE_SCORES[len(group_b) + 1] - SIZE_SCORES[len(group_b)]
+            )
+
+            def apply():
+                group_a.remove(u)
+                group_b.append(u)
+                group_of[u] = b
+            return delta, apply
+
+        if len(group_a) == 4:
+            # 4명 그룹을 2명 + 2명으로 분할
+            partner = rng.choice([m for m in group_a if m != u])
+            rest = [m for m in group_a if m not in (u, partner)]
+            cross = sum(self.scores.pair(x, y) for x in (u, partner) for y in rest)
+            delta = 2 * SIZE_SCORES[2] + self.group_constant - SIZE_SCORES[4] - cross
+
+            def apply():
+                group_a[:] = [u, partner]
+                groups.append(rest)
+                for m in rest:
+                    group_of[m] = len(groups) - 1
+            return delta, apply
+
+        if len(group_a) == 2:
+            # 2명 그룹 두 개를 4명 그룹으로 병합
+            b = group_of[rng.randrange(n)]
+            group_b = groups[b]
+            if a == b or len(group_b) != 2:
+                return None
+            cross = sum(self.scores.pair(x, y) for x in group_a for y in group_b)
+            delta = SIZE_SCORES[4] + cross - 2 * SIZE_SCORES[2] - self.group_constant
+
+            def apply():
+                group_a.extend(group_b)
+                for m in group_b:
+                    group_of[m] = a
+                group_b.clear()
+            return delta, apply
+
+        return None
+
+
+def form_groups(users_data: dict, date: str, seed: int | None = None, **solve_options) -> dict:
+    """
+    참여 가능한 사용자 전체를 2~4명 그룹으로 편성
+
+    Args:
+        users_data: {사용자 ID: {'foodPreferences': [...], 'lunchStyle': [...],
+                     'preferredTime': ..., 'allergies': ...}}
+        date: 'YYYY-MM-DD'
+    """
+    started = time.perf_counter()
+    result = GroupFormationSolver(users_data, date, seed=seed).solve(**solve_options)
+    logger.info(
+        f"그룹 편성 완료: {len(users_data)}명 → {len(result['groups'])}개 그룹, "
+        f"점수 {result['initial_score']:.0f} → {result['total_score']:.0f} "
+        f"({time.perf_counter() - started:.2f}초)"
+    )
+    return result
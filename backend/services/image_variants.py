@@ -0,0 +1,256 @@
+"""
+이미지 변형 생성기
+업로드 요청은 원본을 디스크에 쓰는 것까지만 처리하고, 썸네일/중간 크기/WebP 변형은 요청 밖에서 만듭니다.
+  - 기본: 워커별 프로세스 풀 (spawn - gunicorn/eventlet 워커의 소켓과 DB 연결을 물려받지 않음)
+  - IMAGE_VARIANT_BACKEND=celery: Celery 워커에서 생성 (브로커를 쓸 수 없으면 프로세스 풀)
+  - 테스트/스크립트: 바로 생성
+원본을 한 번만 디코드하고(JPEG는 draft()로 DCT 축소 디코드) 큰 변형부터 차례로 줄여 저장합니다.
+변형은 내용 해시별로 한 번만 만들며, 상태는 같은 해시의 MessageAttachment.variant_status에 기록합니다.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from PIL import Image, ImageOps
+from sqlalchemy import update
+
+# 프로세스 풀 자식은 이 모듈만 import해 render_variants를 실행하므로 앱 패키지(backend.app)는 필요할 때 import
+
+logger = logging.getLogger(__name__)
+
+# 변형 상태
+PENDING = 'pending'
+READY = 'ready'
+FAILED = 'failed'
+
+# 변형 정의 (최대 크기 안에 비율 유지)
+VARIANTS: dict[str, dict[str, Any]] = {
+    'thumb': {'size': (200, 200), 'format': 'JPEG', 'ext': '.jpg', 'mimetype': 'image/jpeg', 'quality': 85},
+    'medium': {'size': (1280, 1280), 'format': 'JPEG', 'ext': '.jpg', 'mimetype': 'image/jpeg', 'quality': 85},
+    'webp': {'size': (1280, 1280), 'format': 'WEBP', 'ext': '.webp', 'mimetype': 'image/webp', 'quality': 80},
+}
+
+# 변형이 준비되기 전에 보여줄 자리표시 이미지
+PLACEHOLDER_SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="200" height="200" viewBox="0 0 200 200">'
+    b'<rect width="200" height="200" fill="#e5e7eb"/></svg>'
+)
+
+
+def variant_path(variants_folder: str, content_hash: str, name: str) -> str:
+    """변형 저장 경로 (uploads/blobs/variants/ab/<sha256>_<변형>.<확장자>)"""
+    return os.path.join(variants_folder, content_hash[:2], f"{content_hash}_{name}{VARIANTS[name]['ext']}")
+
+
+def variant_paths(variants_folder: str, content_hash: str) -> dict[str, str]:
+    return {name: variant_path(variants_folder, content_hash, name) for name in VARIANTS}
+
+
+def variants_ready(variants_folder: str, content_hash: str) -> bool:
+    return all(os.path.exists(path) for path in variant_paths(variants_folder, content_hash).values())
+
+
+def _flatten(image):
+    """JPEG 저장을 위해 RGB로 변환 (투명 영역은 흰 배경)"""
+    if image.mode in ('RGBA', 'LA', 'P'):
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        return background
+    if image.mode != 'RGB':
+        return image.convert('RGB')
+    return image
+
+
+def render_variants(source_path: str, content_hash: str, variants_folder: str) -> dict[str, str]:
+    """
+    원본 이미지로 모든 변형 생성 (프로세스 풀에서 실행되므로 앱/DB에 의존하지 않음)
+
+    Returns:
+        변형 이름 → 저장 경로
+    """
+    paths = variant_paths(variants_folder, content_hash)
+    largest = max(spec['size'] for spec in VARIANTS.values())
+
+    with Image.open(source_path) as source:
+        # JPEG는 필요한 크기 근처(1/2, 1/4, 1/8)까지만 디코드
+        source.draft('RGB', largest)
+        image = _flatten(ImageOps.exif_transpose(source))
+
+        # 큰 변형부터 같은 이미지를 차례로 줄여 재사용
+        for name, spec in sorted(VARIANTS.items(), key=lambda item: item[1]['size'], reverse=True):
+            image.thumbnail(spec['size'], Image.Resampling.LANCZOS)
+            path = paths[name]
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            image.save(temp_path, spec['format'], quality=spec['quality'], optimize=spec['format'] == 'JPEG')
+            os.replace(temp_path, path)
+
+    return paths
+
+
+def record_variant_status(content_hash: str, status: str) -> int:
+    """같은 내용의 첨부파일 전체에 변형 상태 기록"""
+    from backend.app.extensions import db
+    from backend.models.app_models import MessageAttachment
+
+    result = db.session.execute(
+        update(MessageAttachment)
+        .where(MessageAttachment.content_hash == content_hash)
+        .values(variant_status=status)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    return result.rowcount or 0
+
+
+class ImageVariantProcessor:
+    """이미지 변형 생성 작업 관리"""
+
+    MAX_WORKERS = 2
+    TASK_NAME = 'celery_config.generate_image_variants_task'
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._inflight: set[str] = set()
+        self.app = None
+        self.backend = 'pool'
+        self.max_workers = self.MAX_WORKERS
+        self.stats = {'queued': 0, 'ready': 0, 'failed': 0, 'duplicates': 0}
+
+    def start(self, app) -> None:
+        self.app = app
+        self.backend = (app.config.get('IMAGE_VARIANT_BACKEND') or os.getenv('IMAGE_VARIANT_BACKEND', 'pool')).lower()
+        self.max_workers = int(app.config.get('IMAGE_VARIANT_WORKERS') or os.getenv('IMAGE_VARIANT_WORKERS', self.MAX_WORKERS))
+        atexit.register(self.shutdown)
+
+    def shutdown(self) -> None:
+        """
+        프로세스 풀 종료 (남은 작업 취소)
+        eventlet 워커에서는 인터프리터 종료 시점의 풀 정리가 멈추므로 gunicorn worker_exit 훅에서 먼저 호출합니다.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._executor
+
+    def enqueue(self, content_hash: str, source_path: str, variants_folder: str) -> str:
+        """
+        변형 생성 예약
+
+        Returns:
+            'celery' / 'pool' / 'inline' / 'duplicate' (같은 내용이 이 워커에서 이미 처리 중)
+        """
+        with self._lock:
+            if content_hash in self._inflight:
+                self.stats['duplicates'] += 1
+                return 'duplicate'
+            self.stats['queued'] += 1
+
+        if self.app is None:
+            # 백그라운드 설정이 없으면 (테스트, 스크립트) 바로 생성
+            self.process(content_hash, source_path, variants_folder)
+            return 'inline'
+
+        if self.backend == 'celery' and self._send_to_celery(content_hash, source_path, variants_folder):
+            return 'celery'
+
+        with self._lock:
+            self._inflight.add(content_hash)
+        try:
+            future = self._pool().submit(render_variants, source_path, content_hash, variants_folder)
+        except Exception as e:
+            with self._lock:
+                self._inflight.discard(content_hash)
+            logger.error(f"이미지 변형 작업 등록 실패: {content_hash} - {e}")
+            self._record(content_hash, FAILED)
+            return 'pool'
+        future.add_done_callback(lambda done: self._on_done(content_hash, done))
+        return 'pool'
+
+    def _send_to_celery(self, content_hash: str, source_path: str, variants_folder: str) -> bool:
+        from backend.app.cache_manager import cache_manager
+
+        celery_app = self.app.extensions.get('celery')
+        if celery_app is None or cache_manager.offline_mode or not cache_manager.redis_client:
+            return False
+        try:
+            celery_app.send_task(self.TASK_NAME, args=[content_hash, source_path, variants_folder])
+            return True
+        except Exception as e:
+            logger.warning(f"이미지 변형 Celery 등록 실패, 프로세스 풀에서 생성합니다: {e}")
+            return False
+
+    def process(self, content_hash: str, source_path: str, variants_folder: str) -> bool:
+        """현재 프로세스에서 생성하고 상태 기록 (Celery 워커, 테스트)"""
+        try:
+            render_variants(source_path, content_hash, variants_folder)
+            status = READY
+        except Exception as e:
+            logger.error(f"이미지 변형 생성 실패: {content_hash} - {e}")
+            status = FAILED
+        record_variant_status(content_hash, status)
+        with self._lock:
+            self.stats[status] += 1
+        return status == READY
+
+    def _on_done(self, content_hash: str, future) -> None:
+        with self._lock:
+            self._inflight.discard(content_hash)
+        try:
+            future.result()
+            status = READY
+        except BrokenProcessPool as e:
+            # 자식 프로세스가 죽으면 다음 작업에서 풀을 새로 만듦
+            logger.error(f"이미지 변형 프로세스 풀 중단: {e}")
+            with self._lock:
+                self._executor = None
+            status = FAILED
+        except Exception as e:
+            logger.error(f"이미지 변형 생성 실패: {content_hash} - {e}")
+            status = FAILED
+        self._record(content_hash, status)
+
+    def _record(self, content_hash: str, status: str) -> None:
+        from backend.app.extensions import db
+
+        with self._lock:
+            self.stats[status] += 1
+        try:
+            with self.app.app_context():
+                record_variant_status(content_hash, status)
+                db.session.remove()
+        except Exception as e:
+            logger.error(f"이미지 변형 상태 기록 실패: {content_hash} - {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self.stats, 'in_progress': len(self._inflight), 'backend': self.backend}
+
+
+# 전역 이미지 변형 생성기
+image_variants = ImageVariantProcessor()
+
+
+def setup_image_variants(app):
+    """요청 밖 변형 생성 설정 (테스트 설정에서는 업로드 요청 안에서 바로 생성)"""
+    if app.config.get('TESTING'):
+        return False
+    image_variants.start(app)
+    return True
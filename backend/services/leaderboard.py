@@ -0,0 +1,322 @@
+"""
+포인트 리더보드
+누적/주간/일간 보드를 점수 순으로 정렬된 구조로 유지해 순위, 상위 N명, 내 주변 순위를 O(log n)에 조회합니다.
+  - Redis가 있으면 보드별 sorted set(leaderboard:<기간>)을 모든 워커가 공유
+    (만료되면 DB에서 다시 적재하고, 적재 중에 들어온 적립은 적재 후 해당 사용자만 다시 읽어 반영)
+  - 없으면 워커 메모리의 RankIndex를 DB에서 주기적으로 다시 적재하고, 이 워커의 적립은 즉시 반영
+점수: 누적 보드는 User.total_points, 주간/일간 보드는 해당 기간 UserActivity.points_earned 합계
+순위는 기존 대시보드와 같이 '나보다 점수가 높은 사용자 수 + 1' (동점은 같은 순위)
+"""
+
+import logging
+import threading
+import time
+import uuid
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select
+
+from backend.app.extensions import db
+from backend.services.progress_counters import ALL_TIME, ProgressCounterService, period_start
+
+logger = logging.getLogger(__name__)
+
+ALL_TIME_BOARD = 'all_time'
+WEEKLY_BOARD = 'weekly'
+DAILY_BOARD = 'daily'
+BOARDS = (ALL_TIME_BOARD, WEEKLY_BOARD, DAILY_BOARD)
+
+
+class RankIndex:
+    """점수 내림차순 정렬 인덱스 ((-점수, 사용자) 정렬 리스트 + 점수 사전)"""
+
+    def __init__(self, scores: dict[str, int] | None = None):
+        self._scores = dict(scores or {})
+        self._keys = sorted((-score, member) for member, score in self._scores.items())
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def score(self, member: str) -> int | None:
+        return self._scores.get(member)
+
+    def set(self, member: str, score: int) -> None:
+        old = self._scores.get(member)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (-old, member))]
+        self._scores[member] = score
+        insort(self._keys, (-score, member))
+
+    def add(self, member: str, delta: int) -> None:
+        self.set(member, self._scores.get(member, 0) + delta)
+
+    def position(self, member: str) -> int | None:
+        """정렬 순서상 위치 (0부터)"""
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        return bisect_left(self._keys, (-score, member))
+
+    def higher_count(self, score: int) -> int:
+        """점수가 더 높은 사용자 수"""
+        return bisect_left(self._keys, (-score,))
+
+    def ordered(self, start: int, stop: int) -> list[tuple[str, int]]:
+        return [(member, -negative) for negative, member in self._keys[max(start, 0):stop]]
+
+
+class RedisRankIndex:
+    """Redis sorted set 기반 인덱스 (RankIndex와 같은 조회 인터페이스)"""
+
+    def __init__(self, client, key: str):
+        self.client = client
+        self.key = key
+
+    def __len__(self) -> int:
+        return self.client.zcard(self.key)
+
+    def score(self, member: str) -> int | None:
+        score = self.client.zscore(self.key, member)
+        return None if score is None else int(score)
+
+    def position(self, member: str) -> int | None:
+        return self.client.zrevrank(self.key, member)
+
+    def higher_count(self, score: int) -> int:
+        return self.client.zcount(self.key, f"({score}", '+inf')
+
+    def ordered(self, start: int, stop: int) -> list[tuple[str, int]]:
+        if stop <= start:
+            return []
+        rows = self.client.zrevrange(self.key, max(start, 0), stop - 1, withscores=True)
+        return [(member.decode() if isinstance(member, bytes) else member, int(score)) for member, score in rows]
+
+
+class LeaderboardService:
+    """누적/주간/일간 포인트 리더보드"""
+
+    # 메모리 보드를 DB에서 다시 적재하는 주기 (다른 워커의 적립 반영)
+    REFRESH_SECONDS = 60
+    # Redis 보드 보관 시간 (누적 보드도 하루마다 DB에서 다시 적재해 다른 경로의 포인트 변경을 반영)
+    BOARD_TTL = {ALL_TIME_BOARD: 86400, DAILY_BOARD: 2 * 86400, WEEKLY_BOARD: 8 * 86400}
+    # 적재 중 표시 유지 시간 (적재가 중단되어도 풀리도록)
+    REBUILD_TIMEOUT = 60
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # 기간 키 → (적재 시각, RankIndex)
+        self._boards: dict[str, tuple[float, RankIndex]] = {}
+
+    # ------------------------------------------------------------------
+    # 보드 적재
+    # ------------------------------------------------------------------
+    @staticmethod
+    def period_for(board: str, moment: datetime | None = None) -> str:
+        if board not in BOARDS:
+            raise ValueError(f"알 수 없는 리더보드: {board}")
+        return ProgressCounterService.current_period(board, moment)
+
+    @staticmethod
+    def load_scores(period: str, members: list[str] | None = None) -> dict[str, int]:
+        """DB에서 보드 점수 적재 (한 번의 집계 조회, members가 있으면 해당 사용자만)"""
+        from backend.auth.models import User
+        from backend.models.app_models import UserActivity
+
+        if period == ALL_TIME:
+            statement = (
+                select(User.employee_id, func.coalesce(User.total_points, 0))
+                .where(User.employee_id.is_not(None))
+            )
+            if members is not None:
+                statement = statement.where(User.employee_id.in_(members))
+        else:
+            statement = (
+                select(UserActivity.user_id, func.sum(UserActivity.points_earned))
+                .where(UserActivity.created_at >= period_start(period))
+                .group_by(UserActivity.user_id)
+            )
+            if members is not None:
+                statement = statement.where(UserActivity.user_id.in_(members))
+        return {str(member): int(score or 0) for member, score in db.session.execute(statement)}
+
+    @staticmethod
+    def _redis():
+        from backend.app.cache_manager import cache_manager
+
+        if cache_manager.offline_mode or not cache_manager.redis_client:
+            return None
+        return cache_manager.redis_client
+
+    @staticmethod
+    def _keys(period: str) -> tuple[str, str, str]:
+        """(보드 키, 적재 중 표시 키, 적재 중 변경된 사용자 집합 키)"""
+        key = f"leaderboard:{period}"
+        return key, f"{key}:rebuilding", f"{key}:changed"
+
+    def _redis_index(self, client, board: str, period: str) -> RedisRankIndex | None:
+        """Redis 보드 (다른 워커가 적재 중이면 None)"""
+        key, rebuilding, changed = self._keys(period)
+        if client.exists(key):
+            return RedisRankIndex(client, key)
+        if not client.set(rebuilding, 1, nx=True, ex=self.REBUILD_TIMEOUT):
+            return None
+
+        try:
+            # 임시 키에 적재 후 RENAME으로 교체 (적재 중에도 조회 가능)
+            scores = self.load_scores(period)
+            if scores:
+                staging = f"{key}:{uuid.uuid4().hex}"
+                pipe = client.pipeline()
+                pipe.zadd(staging, scores)
+                pipe.rename(staging, key)
+                pipe.expire(key, self.BOARD_TTL[board])
+                pipe.execute()
+
+            # 적재 조회 이후 커밋된 적립은 보드에 없을 수 있으므로 해당 사용자만 DB에서 다시 읽음
+            pipe = client.pipeline()
+            pipe.smembers(changed)
+            pipe.delete(changed, rebuilding)
+            members = [
+                member.decode() if isinstance(member, bytes) else member for member in pipe.execute()[0]
+            ]
+            if members:
+                fresh = dict.fromkeys(members, 0)
+                fresh.update(self.load_scores(period, members))
+                pipe = client.pipeline()
+                pipe.zadd(key, fresh)
+                pipe.expire(key, self.BOARD_TTL[board])
+                pipe.execute()
+        except Exception:
+            client.delete(rebuilding)
+            raise
+        return RedisRankIndex(client, key)
+
+    def _memory_index(self, period: str) -> RankIndex:
+        with self._lock:
+            entry = self._boards.get(period)
+            if entry is not None and time.time() - entry[0] < self.REFRESH_SECONDS:
+                return entry[1]
+        loaded_at = time.time()
+        index = RankIndex(self.load_scores(period))
+        with self._lock:
+            # 같은 종류의 지난 기간 보드 정리
+            kind = period.split(':', 1)[0]
+            for key in [key for key in self._boards if key != period and key.split(':', 1)[0] == kind]:
+                del self._boards[key]
+            self._boards[period] = (loaded_at, index)
+        return index
+
+    def _index(self, board: str):
+        period = self.period_for(board)
+        client = self._redis()
+        if client is not None:
+            try:
+                index = self._redis_index(client, board, period)
+                if index is not None:
+                    return index
+            except Exception as e:
+                logger.warning(f"Redis 리더보드 사용 실패, 메모리 보드로 대체: {e}")
+        return self._memory_index(period)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _entries(index, start: int, stop: int) -> list[dict[str, Any]]:
+        """위치 구간의 항목 (동점은 같은 순위)"""
+        entries = []
+        previous_score, previous_rank = None, None
+        for offset, (member, score) in enumerate(index.ordered(start, stop)):
+            if score == previous_score:
+                rank = previous_rank
+            elif offset == 0:
+                rank = index.higher_count(score) + 1
+            else:
+                rank = start + offset + 1
+            entries.append({'employee_id': member, 'score': score, 'rank': rank})
+            previous_score, previous_rank = score, rank
+        return entries
+
+    def rank(self, employee_id: str, board: str = ALL_TIME_BOARD) -> dict[str, Any]:
+        """
+        내 순위 (보드에 없으면 0점으로 간주)
+
+        Returns:
+            rank, score, total
+        """
+        index = self._index(board)
+        score = index.score(str(employee_id)) or 0
+        return {'rank': index.higher_count(score) + 1, 'score': score, 'total': len(index)}
+
+    def top(self, limit: int = 10, board: str = ALL_TIME_BOARD) -> list[dict[str, Any]]:
+        """상위 N명"""
+        return self._entries(self._index(board), 0, limit)
+
+    def around(self, employee_id: str, radius: int = 2, board: str = ALL_TIME_BOARD) -> list[dict[str, Any]]:
+        """내 앞뒤 radius명 (보드에 없으면 빈 목록)"""
+        index = self._index(board)
+        position = index.position(str(employee_id))
+        if position is None:
+            return []
+        start = max(position - radius, 0)
+        return self._entries(index, start, position + radius + 1)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def record_points(self, employee_id: str, points: int, total_points: int,
+                      moment: datetime | None = None) -> None:
+        """
+        커밋된 포인트 적립 반영 (PointsSystem.earn_points에서 커밋 후 호출)
+
+        아직 적재되지 않은 보드는 건너뜀 (다음 적재 시 DB에서 반영됨)
+        적재 중인 보드는 사용자만 기록해 두고 적재가 끝나면 DB에서 다시 읽어 반영
+        """
+        employee_id = str(employee_id)
+        client = self._redis()
+        if client is not None:
+            try:
+                keys = {board: self._keys(self.period_for(board, moment)) for board in BOARDS}
+                watched = [name for board_keys in keys.values() for name in board_keys[:2]]
+                client.transaction(
+                    lambda pipe: self._apply_points(pipe, keys, employee_id, points, total_points), *watched
+                )
+                return
+            except Exception as e:
+                logger.warning(f"Redis 리더보드 갱신 실패: {e}")
+
+        with self._lock:
+            for board in BOARDS:
+                entry = self._boards.get(self.period_for(board, moment))
+                if entry is None:
+                    continue
+                if board == ALL_TIME_BOARD:
+                    entry[1].set(employee_id, total_points)
+                elif points:
+                    entry[1].add(employee_id, points)
+
+    def _apply_points(self, pipe, keys: dict[str, tuple[str, str, str]], employee_id: str,
+                      points: int, total_points: int) -> None:
+        """보드 존재/적재 중 여부 확인과 갱신을 한 트랜잭션으로 (WATCH 중 키가 바뀌면 재시도)"""
+        states = {board: (pipe.exists(key), pipe.exists(rebuilding)) for board, (key, rebuilding, _) in keys.items()}
+        pipe.multi()
+        for board, (key, _, changed) in keys.items():
+            exists, rebuilding = states[board]
+            if exists:
+                if board == ALL_TIME_BOARD:
+                    pipe.zadd(key, {employee_id: total_points})
+                elif points:
+                    pipe.zincrby(key, points, employee_id)
+            elif rebuilding:
+                pipe.sadd(changed, employee_id)
+                pipe.expire(changed, self.REBUILD_TIMEOUT)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._boards.clear()
+
+
+# 전역 리더보드 인스턴스
+leaderboard = LeaderboardService()
@@ -0,0 +1,244 @@
+"""
+파티 목록 조회 모델
+파티 카드(파티 + 호스트 + 멤버)를 날짜 단위로 구성합니다.
+멤버와 사용자 정보는 파티 수와 관계없이 IN 쿼리 한 번씩으로 불러오고,
+일반 파티의 날짜별 카드 목록은 캐시하여 파티/멤버 변경이 커밋되면 해당 날짜만 무효화합니다.
+"""
+
+import logging
+from datetime import date, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import object_session
+
+from backend.app.extensions import db
+from backend.services.commit_queue import CommitQueue
+from backend.utils.datetime_utils import to_date_key
+
+logger = logging.getLogger(__name__)
+
+# 커밋 후 무효화할 날짜 목록 (session.info 키)
+PENDING_KEY = 'party_feed_invalidate'
+
+
+class PartyFeedService:
+    """날짜별 파티 카드 조회 및 캐시 관리"""
+
+    DEFAULT_DAYS = 7
+    MAX_DAYS = 31
+    CACHE_TTL = 300
+
+    # ------------------------------------------------------------------
+    # 카드 구성
+    # ------------------------------------------------------------------
+    @staticmethod
+    def hydrate(parties: list) -> list[dict]:
+        """파티 목록을 카드로 변환 (멤버 1회 + 사용자 1회 조회)"""
+        from backend.auth.models import User
+        from backend.models.app_models import PartyMember
+
+        if not parties:
+            return []
+        party_ids = [party.id for party in parties]
+
+        members_by_party: dict[int, list[str]] = {party_id: [] for party_id in party_ids}
+        for party_id, employee_id in db.session.execute(
+            select(PartyMember.party_id, PartyMember.employee_id)
+            .where(PartyMember.party_id.in_(party_ids))
+            .order_by(PartyMember.party_id, PartyMember.id)
+        ):
+            members_by_party[party_id].append(employee_id)
+
+        employee_ids = {party.host_employee_id for party in parties}
+        for member_ids in members_by_party.values():
+            employee_ids.update(member_ids)
+        nicknames = dict(db.session.execute(
+            select(User.employee_id, User.nickname).where(User.employee_id.in_(employee_ids))
+        ).all())
+
+        cards = []
+        for party in parties:
+            member_ids = members_by_party[party.id]
+            host_name = nicknames.get(party.host_employee_id)
+            cards.append({
+                'id': party.id,
+                'title': party.title,
+                'restaurant_name': party.restaurant_name,
+                'restaurant_address': party.restaurant_address,
+                'meeting_location': party.meeting_location,
+                'current_members': len(member_ids),
+                'max_members': party.max_members,
+                'party_date': party.party_date.isoformat() if party.party_date else None,
+                'party_time': party.party_time.isoformat() if party.party_time else None,
+                'is_from_match': party.is_from_match,
+                'description': party.description,
+                'host': {
+                    'employee_id': party.host_employee_id,
+                    'name': host_name or 'Unknown'
+                },
+                'members': [
+                    {'employee_id': employee_id, 'nickname': nicknames.get(employee_id)}
+                    for employee_id in member_ids
+                ],
+                'member_count': len(member_ids),
+                'created_at': party.created_at.isoformat() if party.created_at else None
+            })
+        return cards
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _window(start_date, days: int) -> tuple[date, date]:
+        start = date.fromisoformat(to_date_key(start_date))
+        days = max(1, min(days, PartyFeedService.MAX_DAYS))
+        return start, start + timedelta(days=days - 1)
+
+    @staticmethod
+    def _next_date(base_filter, end: date) -> str | None:
+        from backend.models.app_models import Party
+
+        next_date = db.session.query(func.min(Party.party_date)).filter(
+            *base_filter, Party.party_date > end
+        ).scalar()
+        return to_date_key(next_date) if next_date else None
+
+    @staticmethod
+    def get_feed(start_date, days: int = DEFAULT_DAYS) -> dict:
+        """
+        일반 파티(랜덤런치 제외)를 날짜 범위 단위로 조회
+
+        Returns:
+            parties: 날짜/시간순 파티 카드
+            start_date, end_date: 이번 페이지의 날짜 범위
+            next_date: 다음 페이지 시작 날짜 (이후 파티가 없으면 None)
+        """
+        from backend.app.cache_manager import cache_party_list, get_cached_party_list
+        from backend.models.app_models import Party
+
+        start, end = PartyFeedService._window(start_date, days)
+        keys = [(start + timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)]
+
+        cards_by_date = {}
+        for key in keys:
+            cached = get_cached_party_list(f"date:{key}")
+            if cached is not None:
+                cards_by_date[key] = cached
+
+        missing = [key for key in keys if key not in cards_by_date]
+        if missing:
+            parties = Party.query.filter(
+                Party.is_from_match == False,
+                Party.party_date.between(date.fromisoformat(missing[0]), date.fromisoformat(missing[-1]))
+            ).order_by(Party.party_date, Party.party_time, Party.id).all()
+
+            fetched = {key: [] for key in missing}
+            for card in PartyFeedService.hydrate(parties):
+                if card['party_date'] in fetched:
+                    fetched[card['party_date']].append(card)
+            for key, cards in fetched.items():
+                cache_party_list(f"date:{key}", cards, expire_seconds=PartyFeedService.CACHE_TTL)
+            cards_by_date.update(fetched)
+
+        return {
+            'parties': [card for key in keys for card in cards_by_date[key]],
+            'start_date': start.isoformat(),
+            'end_date': end.isoformat(),
+            'next_date': PartyFeedService._next_date((Party.is_from_match == False,), end)
+        }
+
+    @staticmethod
+    def get_member_feed(employee_id: str, start_date=None, days: int = DEFAULT_DAYS,
+                        is_from_match: bool | None = None) -> dict:
+        """사용자가 호스트이거나 멤버인 파티 조회 (사용자별이므로 캐시하지 않음)"""
+        from sqlalchemy import or_
+
+        from backend.models.app_models import Party, PartyMember
+
+        membership = or_(
+            Party.host_employee_id == employee_id,
+            Party.id.in_(select(PartyMember.party_id).where(PartyMember.employee_id == employee_id))
+        )
+        base_filter = [membership]
+        if is_from_match is not None:
+            base_filter.append(Party.is_from_match == is_from_match)
+
+        query = Party.query.filter(*base_filter)
+        page = {}
+        if start_date is not None:
+            start, end = PartyFeedService._window(start_date, days)
+            query = query.filter(Party.party_date.between(start, end))
+            page = {
+                'start_date': start.isoformat(),
+                'end_date': end.isoformat(),
+                'next_date': PartyFeedService._next_date(base_filter, end)
+            }
+
+        parties = query.order_by(Party.party_date, Party.party_time, Party.id).all()
+        return {'parties': PartyFeedService.hydrate(parties), **page}
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트 / 커밋 후 캐시 무효화
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _queue(target, *dates) -> None:
+        _pending.pending(target).update(to_date_key(value) for value in dates if value)
+
+    @staticmethod
+    def on_party_change(mapper, connection, target):
+        from sqlalchemy import inspect
+
+        history = inspect(target).attrs.party_date.history
+        PartyFeedService._queue(target, *history.added, *history.deleted, *history.unchanged)
+
+    @staticmethod
+    def on_party_date_set(target, value, oldvalue, initiator):
+        """날짜가 옮겨지면 이전 날짜 카드도 무효화"""
+        from sqlalchemy.orm.base import NO_VALUE
+
+        if object_session(target) is not None and oldvalue not in (NO_VALUE, None) and oldvalue != value:
+            PartyFeedService._queue(target, oldvalue)
+        return value
+
+    @staticmethod
+    def on_member_change(mapper, connection, target):
+        from backend.models.app_models import Party
+
+        party_date = connection.execute(
+            select(Party.party_date).where(Party.id == target.party_id)
+        ).scalar()
+        PartyFeedService._queue(target, party_date)
+
+    @staticmethod
+    def invalidate_dates(dates: set[str]) -> None:
+        try:
+            from backend.app.cache_manager import invalidate_party_list
+            invalidate_party_list(*(f"date:{key}" for key in dates))
+        except Exception as e:
+            logger.warning(f"파티 목록 캐시 무효화 실패: {e}")
+
+
+
+# 전역 서비스 인스턴스
+party_feed_service = PartyFeedService()
+_pending = CommitQueue(PENDING_KEY, PartyFeedService.invalidate_dates)
+
+
+def setup_party_feed(app):
+    """파티/멤버 매퍼 이벤트 및 커밋 후 캐시 무효화 연결"""
+    from sqlalchemy import event
+
+    from backend.models.app_models import Party, PartyMember
+
+    listeners = []
+    for event_name in ('after_insert', 'after_update', 'after_delete'):
+        listeners.append((Party, event_name, PartyFeedService.on_party_change))
+        listeners.append((PartyMember, event_name, PartyFeedService.on_member_change))
+
+    for target, event_name, handler in listeners:
+        if not event.contains(target, event_name, handler):
+            event.listen(target, event_name, handler)
+    if not event.contains(Party.party_date, 'set', PartyFeedService.on_party_date_set):
+        event.listen(Party.party_date, 'set', PartyFeedService.on_party_date_set, active_history=True)
+    _pending.register()
+    return True
@@ -0,0 +1,147 @@
+"""
+파티 참여/나가기 서비스
+party.current_members 카운터를 조건부 UPDATE로 원자적으로 증가시켜 좌석을 먼저 확보한 뒤 멤버를 추가합니다.
+  UPDATE party SET current_members = current_members + 1
+  WHERE id = :party_id AND current_members < max_members
+행 잠금 없이도 동시 요청이 정원을 넘길 수 없고, 중복 참여는 (party_id, employee_id) 유니크 제약으로 막습니다.
+그 밖의 경로(파티 생성, 랜덤런치 등)에서 추가/삭제되는 멤버는 매퍼 이벤트로 카운터를 맞춥니다.
+"""
+
+import logging
+
+from sqlalchemy import case, select, update
+from sqlalchemy.exc import IntegrityError
+
+from backend.app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+# join() 결과
+JOINED = 'joined'
+ALREADY_MEMBER = 'already_member'
+PARTY_FULL = 'full'
+PARTY_NOT_FOUND = 'not_found'
+
+
+class PartyMembershipService:
+    """파티 좌석 확보 및 멤버십 관리"""
+
+    @staticmethod
+    def _change_count(connection_or_session, party_id: int, delta: int) -> None:
+        from backend.models.app_models import Party
+
+        new_value = Party.current_members + delta
+        connection_or_session.execute(
+            update(Party)
+            .where(Party.id == party_id)
+            .values(current_members=case((new_value < 0, 0), else_=new_value))
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def join(party_id: int, employee_id: str) -> str:
+        """
+        파티 참여 (커밋은 호출자가 수행)
+
+        Returns:
+            JOINED / ALREADY_MEMBER / PARTY_FULL / PARTY_NOT_FOUND
+        """
+        from backend.models.app_models import Party, PartyMember
+
+        # 좌석 확보와 멤버 추가를 하나의 세이브포인트로 묶어 중복 참여 시 함께 되돌림
+        savepoint = db.session.begin_nested()
+        try:
+            reserved = db.session.execute(
+                update(Party)
+                .where(Party.id == party_id, Party.current_members < Party.max_members)
+                .values(current_members=Party.current_members + 1)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            if not reserved:
+                savepoint.rollback()
+                return PartyMembershipService._classify_rejection(party_id, employee_id)
+
+            member = PartyMember(party_id=party_id, employee_id=employee_id)
+            # 이미 좌석을 확보했으므로 매퍼 이벤트에서 카운터를 다시 올리지 않음
+            member._seat_reserved = True
+            db.session.add(member)
+            db.session.flush()
+            savepoint.commit()
+            return JOINED
+        except IntegrityError:
+            savepoint.rollback()
+            return ALREADY_MEMBER
+
+    @staticmethod
+    def _classify_rejection(party_id: int, employee_id: str) -> str:
+        from backend.models.app_models import Party, PartyMember
+
+        if db.session.execute(select(Party.id).where(Party.id == party_id)).scalar() is None:
+            return PARTY_NOT_FOUND
+        is_member = db.session.execute(
+            select(PartyMember.id).where(
+                PartyMember.party_id == party_id, PartyMember.employee_id == employee_id
+            )
+        ).first()
+        return ALREADY_MEMBER if is_member else PARTY_FULL
+
+    @staticmethod
+    def leave(party_id: int, employee_id: str) -> bool:
+        """파티 나가기 (커밋은 호출자가 수행, 멤버가 아니면 False)"""
+        from backend.models.app_models import PartyMember
+
+        member = PartyMember.query.filter_by(party_id=party_id, employee_id=employee_id).first()
+        if not member:
+            return False
+        # 삭제 매퍼 이벤트에서 카운터 감소 및 캐시 무효화
+        db.session.delete(member)
+        db.session.flush()
+        return True
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트 (좌석 확보 경로 외의 멤버 추가/삭제)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def on_member_insert(mapper, connection, target):
+        if not getattr(target, '_seat_reserved', False):
+            PartyMembershipService._change_count(connection, target.party_id, 1)
+
+    @staticmethod
+    def on_member_delete(mapper, connection, target):
+        PartyMembershipService._change_count(connection, target.party_id, -1)
+
+    @staticmethod
+    def reconcile(party_id: int | None = None) -> int:
+        """카운터를 실제 멤버 수로 보정 (보정된 파티 수 반환, 커밋은 호출자가 수행)"""
+        from sqlalchemy import func
+
+        from backend.models.app_models import Party, PartyMember
+
+        actual = select(func.count(PartyMember.id))\
+            .where(PartyMember.party_id == Party.id)\
+            .scalar_subquery()
+        statement = update(Party).where(Party.current_members != actual).values(current_members=actual)
+        if party_id is not None:
+            statement = statement.where(Party.id == party_id)
+        return db.session.execute(statement.execution_options(synchronize_session=False)).rowcount
+
+
+# 전역 서비스 인스턴스
+party_membership_service = PartyMembershipService()
+
+
+def setup_party_membership(app):
+    """멤버 추가/삭제 매퍼 이벤트 연결"""
+    from sqlalchemy import event
+
+    from backend.models.app_models import PartyMember
+
+    listeners = (
+        ('after_insert', PartyMembershipService.on_member_insert),
+        ('after_delete', PartyMembershipService.on_member_delete),
+    )
+    for event_name, handler in listeners:
+        if not event.contains(PartyMember, event_name, handler):
+            event.listen(PartyMember, event_name, handler)
+    return True
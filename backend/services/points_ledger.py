@@ -0,0 +1,325 @@
+"""
+포인트 원장 버퍼 기록기
+PointsSystem.earn_points의 적립 요청을 워커 메모리 버퍼에 모았다가 한 트랜잭션으로 기록합니다.
+  - 원장: user_activity (추가 전용, idempotency_key 유니크)
+  - 활동 행은 일괄 INSERT, 포인트는 사용자별 UPDATE 한 번 (레벨도 같은 UPDATE에서 재계산)
+  - 배치가 MAX_BATCH에 도달하거나 FLUSH_INTERVAL이 지나면 백그라운드 스레드가 기록
+  - 같은 idempotency_key는 버퍼/DB 양쪽에서 걸러 재시도해도 한 번만 적립
+  - 컬럼 길이를 넘는 적립은 버퍼에 넣지 않고, 다시 실패한 배치는 한 건씩 기록해 문제 있는 적립만 포기
+백그라운드 스레드가 없으면(테스트, 스크립트) 요청마다 바로 기록합니다.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, insert, select, update
+
+from backend.app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+# 적립 요청 처리 결과
+APPLIED = 'applied'
+DUPLICATE = 'duplicate'
+UNKNOWN_USER = 'unknown_user'
+INVALID = 'invalid'
+FAILED = 'failed'
+
+# 길이를 확인할 원장 컬럼 (user_activity)
+LIMITED_FIELDS = ('user_id', 'activity_type', 'idempotency_key')
+
+
+class PointsLedgerWriter:
+    """포인트 적립 버퍼 및 일괄 기록기"""
+
+    MAX_BATCH = 200
+    FLUSH_INTERVAL = 1.0
+    # 기록 실패 시 버퍼에 되돌려 재시도하는 횟수
+    MAX_ATTEMPTS = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: list[dict[str, Any]] = []
+        self._pending_keys: set[str] = set()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.app = None
+        self.stats = {'submitted': 0, 'applied': 0, 'duplicates': 0, 'unknown_users': 0,
+                      'invalid': 0, 'failed': 0, 'flushes': 0}
+
+    # ------------------------------------------------------------------
+    # 적립 요청
+    # ------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @staticmethod
+    def validate(user_id: str, activity_type: str, idempotency_key: str | None = None) -> str | None:
+        """원장 컬럼 길이 확인 (문제가 있으면 오류 메시지)"""
+        from backend.models.app_models import UserActivity
+
+        values = {'user_id': str(user_id), 'activity_type': activity_type, 'idempotency_key': idempotency_key}
+        for field in LIMITED_FIELDS:
+            limit = UserActivity.__table__.c[field].type.length
+            if values[field] is not None and len(values[field]) > limit:
+                return f"{field}는 {limit}자를 넘을 수 없습니다."
+        return None
+
+    def submit(self, user_id: str, activity_type: str, points: int, description: str | None = None,
+               idempotency_key: str | None = None, wait: bool = False) -> bool:
+        """
+        적립 요청 추가 (컬럼 길이를 넘으면 버퍼에 넣지 않음 - 같은 배치의 다른 적립까지 실패시키지 않도록)
+
+        같은 idempotency_key의 재시도는 원래 요청의 결과를 돌려받도록 성공으로 처리합니다.
+
+        Returns:
+            버퍼 기록 시 요청 접수 여부, 즉시 기록(wait 또는 스레드 없음) 시 실제 반영(또는 이미 반영) 여부
+        """
+        error = self.validate(user_id, activity_type, idempotency_key)
+        if error:
+            logger.warning(f"포인트 적립 거부: {error}")
+            with self._lock:
+                self.stats['invalid'] += 1
+            return False
+
+        entry = {
+            'user_id': str(user_id),
+            'activity_type': activity_type,
+            'points': int(points or 0),
+            'description': description,
+            'idempotency_key': idempotency_key,
+            'created_at': datetime.utcnow(),
+            'attempts': 0,
+            'status': None,
+        }
+        with self._lock:
+            if idempotency_key and idempotency_key in self._pending_keys:
+                # 이미 접수된 요청의 재시도
+                self.stats['duplicates'] += 1
+                return True
+            if idempotency_key:
+                self._pending_keys.add(idempotency_key)
+            self._buffer.append(entry)
+            self.stats['submitted'] += 1
+            full = len(self._buffer) >= self.MAX_BATCH
+
+        if wait or not self.is_running:
+            self.flush()
+            return entry['status'] in (APPLIED, DUPLICATE)
+        if full:
+            self._wakeup.set()
+        return True
+
+    # ------------------------------------------------------------------
+    # 일괄 기록
+    # ------------------------------------------------------------------
+    def flush(self) -> int:
+        """버퍼를 한 트랜잭션으로 기록 (반영된 적립 수)"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+
+            try:
+                applied = self._write(batch)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"포인트 원장 기록 실패 ({len(batch)}건): {e}")
+                if len(batch) == 1 or not any(entry['attempts'] for entry in batch):
+                    # 일시적 오류(다른 워커와의 키 경합 등)는 배치 그대로 재시도
+                    self._requeue(batch)
+                    return 0
+                # 다시 실패한 배치는 한 건씩 기록해 실패한 적립만 재시도/포기
+                applied, failed = self._write_each(batch)
+                self._requeue(failed)
+                batch = [entry for entry in batch if entry['status'] in (APPLIED, DUPLICATE, UNKNOWN_USER)]
+
+            with self._lock:
+                self._pending_keys.difference_update(
+                    entry['idempotency_key'] for entry in batch if entry['idempotency_key']
+                )
+                self.stats['flushes'] += 1
+                self.stats['applied'] += len(applied)
+                self.stats['duplicates'] += sum(entry['status'] == DUPLICATE for entry in batch)
+                self.stats['unknown_users'] += sum(entry['status'] == UNKNOWN_USER for entry in batch)
+            return len(applied)
+
+    def _requeue(self, batch: list[dict[str, Any]]) -> None:
+        retry = []
+        for entry in batch:
+            entry['attempts'] += 1
+            if entry['attempts'] < self.MAX_ATTEMPTS:
+                retry.append(entry)
+            else:
+                entry['status'] = FAILED
+                logger.error(f"포인트 적립 포기: {entry['user_id']} {entry['activity_type']} {entry['points']}")
+        with self._lock:
+            self._buffer[:0] = retry
+            self.stats['failed'] += len(batch) - len(retry)
+            self._pending_keys.difference_update(
+                entry['idempotency_key'] for entry in batch
+                if entry['status'] == FAILED and entry['idempotency_key']
+            )
+
+    @staticmethod
+    def _write_each(batch: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """적립을 한 건씩 각자의 트랜잭션으로 기록 (반영된 적립, 실패한 적립)"""
+        applied, failed = [], []
+        for entry in batch:
+            try:
+                applied.extend(PointsLedgerWriter._write([entry]))
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"포인트 적립 기록 실패: {entry['user_id']} {entry['activity_type']} - {e}")
+                failed.append(entry)
+        return applied, failed
+
+    @staticmethod
+    def _filter(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """이미 기록된 키와 없는 사용자를 걸러 기록할 적립만 반환"""
+        from backend.auth.models import User
+        from backend.models.app_models import UserActivity
+
+        keys = {entry['idempotency_key'] for entry in batch if entry['idempotency_key']}
+        recorded = set(db.session.execute(
+            select(UserActivity.idempotency_key).where(UserActivity.idempotency_key.in_(keys))
+        ).scalars()) if keys else set()
+        users = set(db.session.execute(
+            select(User.employee_id).where(User.employee_id.in_({entry['user_id'] for entry in batch}))
+        ).scalars())
+
+        events, seen = [], set()
+        for entry in batch:
+            key = entry['idempotency_key']
+            if key and (key in recorded or key in seen):
+                entry['status'] = DUPLICATE
+            elif entry['user_id'] not in users:
+                entry['status'] = UNKNOWN_USER
+            else:
+                if key:
+                    seen.add(key)
+                events.append(entry)
+        return events
+
+    @staticmethod
+    def _write(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        from backend.auth.models import User
+        from backend.models.app_models import UserActivity
+        from backend.services.progress_counters import ProgressCounterService
+        from backend.utils.points_system import PointsSystem
+
+        events = PointsLedgerWriter._filter(batch)
+        if not events:
+            return []
+
+        # 배지/챌린지 진행 카운터 (distinct 판정을 위해 원장 추가 전에 반영)
+        ProgressCounterService.record_many(
+            (entry['user_id'], entry['activity_type'], entry['description'], entry['created_at'])
+            for entry in events
+        )
+
+        # 원장 일괄 추가
+        db.session.execute(insert(UserActivity), [
+            {
+                'user_id': entry['user_id'],
+                'activity_type': entry['activity_type'],
+                'description': entry['description'],
+                'points_earned': entry['points'],
+                'idempotency_key': entry['idempotency_key'],
+                'created_at': entry['created_at'],
+            }
+            for entry in events
+        ])
+
+        # 사용자별 포인트 합산 UPDATE 한 번 (레벨도 같은 UPDATE에서 재계산)
+        deltas: dict[str, int] = defaultdict(int)
+        for entry in events:
+            deltas[entry['user_id']] += entry['points']
+        for user_id, delta in deltas.items():
+            total = func.coalesce(User.total_points, 0) + delta
+            db.session.execute(
+                update(User)
+                .where(User.employee_id == user_id)
+                .values(total_points=total, current_level=PointsSystem.level_expression(total))
+                .execution_options(synchronize_session=False)
+            )
+
+        # 다른 워커가 같은 키를 먼저 기록해 유니크 제약에 걸리면 flush()가 배치를 되돌려 재시도하고,
+        # 재시도에서는 DB 확인으로 걸러짐
+        db.session.commit()
+
+        for entry in events:
+            entry['status'] = APPLIED
+
+        PointsLedgerWriter._update_leaderboard(deltas, max(entry['created_at'] for entry in events))
+        return events
+
+    @staticmethod
+    def _update_leaderboard(deltas: dict[str, int], moment: datetime) -> None:
+        try:
+            from backend.auth.models import User
+            from backend.services.leaderboard import leaderboard
+
+            totals = dict(db.session.execute(
+                select(User.employee_id, User.total_points).where(User.employee_id.in_(deltas))
+            ).tuples())
+            for user_id, delta in deltas.items():
+                leaderboard.record_points(user_id, delta, totals.get(user_id) or 0, moment=moment)
+        except Exception as e:
+            logger.warning(f"리더보드 갱신 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 백그라운드 기록 스레드
+    # ------------------------------------------------------------------
+    def start(self, app) -> None:
+        self.app = app
+        if self.is_running:
+            return
+        self._thread = threading.Thread(target=self._run, name='points-ledger-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self._flush_at_exit)
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.FLUSH_INTERVAL)
+            self._wakeup.clear()
+            try:
+                with self.app.app_context():
+                    self.flush()
+                    db.session.remove()
+            except Exception as e:
+                logger.error(f"포인트 원장 기록 스레드 오류: {e}")
+                time.sleep(self.FLUSH_INTERVAL)
+
+    def _flush_at_exit(self) -> None:
+        if self.app is None or not self._buffer:
+            return
+        try:
+            with self.app.app_context():
+                self.flush()
+        except Exception as e:
+            logger.error(f"종료 시 포인트 원장 기록 실패: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self.stats, 'buffered': len(self._buffer), 'running': self.is_running}
+
+
+# 전역 포인트 원장 기록기
+points_ledger = PointsLedgerWriter()
+
+
+def setup_points_ledger(app):
+    """백그라운드 기록 스레드 시작 (테스트 설정에서는 요청마다 바로 기록)"""
+    if app.config.get('TESTING'):
+        return False
+    points_ledger.start(app)
+    return True
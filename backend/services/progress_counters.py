@@ -0,0 +1,278 @@
+"""
+활동 진행 카운터
+PointsSystem.earn_points가 활동을 기록할 때 (사용자, 활동 유형, 기간) 카운터를 같은 트랜잭션에서 올려,
+배지/챌린지 진행률을 사용자 활동 전체를 다시 훑지 않고 카운터 몇 행으로 답합니다.
+  - 기간: 'all'(누적), 'day:YYYY-MM-DD', 'week:YYYY-Www'(ISO 주), 'month:YYYY-MM'
+  - 요구사항 유형/챌린지 action → 합산할 카운터는 REQUIREMENT_COUNTERS 표로 선언합니다.
+  - '서로 다른 값'의 개수가 필요한 요구사항(다양한 감정 표현, 서로 다른 동료 등)은
+    '<활동 유형>:distinct' 카운터를 해당 기간에 처음 보는 description일 때만 올립니다.
+"""
+
+import logging
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from backend.app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+ALL_TIME = 'all'
+DISTINCT_SUFFIX = ':distinct'
+
+
+def distinct(activity_type: str) -> str:
+    """서로 다른 description 개수를 세는 카운터 이름"""
+    return f"{activity_type}{DISTINCT_SUFFIX}"
+
+
+# 요구사항 유형(배지 requirement_type, 챌린지 requirements 키/action) → 합산할 카운터
+REQUIREMENT_COUNTERS: dict[str, tuple[str, ...]] = {
+    # 방문
+    "first_restaurant_visit": ("first_restaurant_visit",),
+    "restaurant_visit_count": ("restaurant_visit",),
+    "different_restaurant": ("different_restaurant",),
+    "different_restaurant_count": ("different_restaurant",),
+    # 리뷰
+    "first_review": ("first_review",),
+    "review_count": ("review_write",),
+    "review_write_count": ("review_write",),
+    "photo_review_count": ("review_photo",),
+    "keyword_count": ("keyword_used",),
+    "emotion_variety": (distinct("emotion_expression"),),
+    "new_food_review_count": ("new_food_review",),
+    "korean_food_review_count": ("korean_food_review",),
+    "western_food_review_count": ("western_food_review",),
+    "chinese_food_review_count": ("chinese_food_review",),
+    "japanese_food_review_count": ("japanese_food_review",),
+    "cafe_review_count": ("cafe_review",),
+    "dessert_review_count": ("dessert_review",),
+    # 파티 / 랜덤런치
+    "first_party": ("first_party",),
+    "party_count": ("party_participate",),
+    "party_participate_count": ("party_participate",),
+    "party_create_count": ("party_create",),
+    "popular_party": ("popular_party_create",),
+    "first_random_lunch": ("first_random_lunch",),
+    "random_lunch_count": ("random_lunch_participate",),
+    "different_colleague_random_lunch": (distinct("random_lunch_participate"),),
+    "social_activity_count": ("party_participate", "random_lunch_participate"),
+    # 사회적 활동
+    "friend_meal_count": ("friend_meal",),
+    "friend_invite": ("friend_invite",),
+    "new_colleague_meal": ("new_colleague_meal",),
+    "new_colleague_meal_count": ("new_colleague_meal",),
+    "junior_colleague_meal_count": ("junior_colleague_meal",),
+    "different_colleague_count": ("different_colleague_meal",),
+    "different_time_meal": ("different_time_meal",),
+    # 챌린지 action
+    "record_lunch": ("restaurant_visit",),
+    "share_photo": ("review_photo",),
+    "take_photos": ("review_photo",),
+    "join_party": ("party_participate", "random_lunch_participate"),
+    "join_activities": ("party_participate", "random_lunch_participate"),
+    "visit_new_restaurant": ("different_restaurant",),
+    "visit_restaurants": ("different_restaurant",),
+    "write_review": ("review_write",),
+    "write_reviews": ("review_write",),
+    "dine_with_friend": ("friend_meal",),
+    "dine_with_friends": (distinct("friend_meal"),),
+    "healthy_choice": ("healthy_choice",),
+    "healthy_choices": ("healthy_choice",),
+    "on_time_lunch": ("on_time_lunch",),
+    "on_time_lunches": ("on_time_lunch",),
+}
+
+# description 기준 distinct 카운터를 유지할 활동 유형
+DISTINCT_ACTIVITY_TYPES = frozenset(
+    counter[:-len(DISTINCT_SUFFIX)]
+    for counters in REQUIREMENT_COUNTERS.values()
+    for counter in counters
+    if counter.endswith(DISTINCT_SUFFIX)
+)
+
+
+def period_keys(moment: datetime) -> list[str]:
+    """시각이 속한 모든 기간 키 (누적, 일, 주, 월)"""
+    year, week, _ = moment.isocalendar()
+    return [
+        ALL_TIME,
+        f"day:{moment:%Y-%m-%d}",
+        f"week:{year}-W{week:02d}",
+        f"month:{moment:%Y-%m}",
+    ]
+
+
+def period_start(period: str) -> datetime:
+    """기간 키의 시작 시각"""
+    if period == ALL_TIME:
+        return datetime.min
+    kind, value = period.split(':', 1)
+    if kind == 'day':
+        return datetime.strptime(value, '%Y-%m-%d')
+    if kind == 'week':
+        year, week = value.split('-W')
+        return datetime.fromisocalendar(int(year), int(week), 1)
+    return datetime.strptime(value, '%Y-%m')
+
+
+def requirement_progress(counts: dict[str, int], requirement_type: str) -> int:
+    """기간 카운터({활동 유형: 횟수})로 요구사항 진행률 계산 (알 수 없는 유형은 0)"""
+    return sum(counts.get(counter, 0) for counter in REQUIREMENT_COUNTERS.get(requirement_type, ()))
+
+
+class ProgressCounterService:
+    """(사용자, 활동 유형, 기간) 카운터 기록 및 조회"""
+
+    @staticmethod
+    def now() -> datetime:
+        # UserActivity.created_at과 같은 기준 시각
+        return datetime.utcnow()
+
+    @staticmethod
+    def current_period(kind: str, moment: datetime | None = None) -> str:
+        """'daily'/'weekly'/'monthly' 기간 키 (그 밖에는 누적)"""
+        keys = period_keys(moment or ProgressCounterService.now())
+        return {'daily': keys[1], 'weekly': keys[2], 'monthly': keys[3]}.get(kind, ALL_TIME)
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _new_value_periods(user_id: str, activity_type: str, description: str, keys: list[str]) -> list[str]:
+        """이 description이 처음 나오는 기간들 (이전 활동이 기간 시작 전이면 새 값)"""
+        from backend.models.app_models import UserActivity
+
+        last_seen = db.session.execute(
+            select(func.max(UserActivity.created_at)).where(
+                UserActivity.user_id == user_id,
+                UserActivity.activity_type == activity_type,
+                UserActivity.description == description,
+            )
+        ).scalar()
+        if last_seen is None:
+            return keys
+        return [key for key in keys if last_seen < period_start(key)]
+
+    @staticmethod
+    def _increment(user_id: str, activity_types: list[str], periods: list[str], amount: int = 1) -> None:
+        """카운터 행들을 amount만큼 증가 (없는 행은 생성)"""
+        from backend.models.app_models import ActivityCounter
+
+        if not activity_types or not periods:
+            return
+        wanted = {(activity_type, period) for activity_type in activity_types for period in periods}
+        matches = (
+            ActivityCounter.user_id == user_id,
+            ActivityCounter.activity_type.in_(activity_types),
+            ActivityCounter.period.in_(periods),
+        )
+        bump = (
+            update(ActivityCounter)
+            .where(*matches)
+            .values(count=ActivityCounter.count + amount)
+            .execution_options(synchronize_session=False)
+        )
+        if db.session.execute(bump).rowcount == len(wanted):
+            return
+
+        existing = set(db.session.execute(
+            select(ActivityCounter.activity_type, ActivityCounter.period).where(*matches)
+        ).tuples())
+        missing = [
+            {'user_id': user_id, 'activity_type': activity_type, 'period': period,
+             'count': amount, 'updated_at': datetime.utcnow()}
+            for activity_type, period in sorted(wanted - existing)
+        ]
+        savepoint = db.session.begin_nested()
+        try:
+            db.session.execute(insert(ActivityCounter), missing)
+            savepoint.commit()
+        except IntegrityError:
+            # 다른 요청이 일부 행을 먼저 만든 경우 - 여러 행 INSERT 전체가 취소되므로 행마다 다시 반영
+            savepoint.rollback()
+            for row in missing:
+                ProgressCounterService._insert_or_increment(row, amount)
+
+    @staticmethod
+    def _insert_or_increment(row: dict, amount: int) -> None:
+        """카운터 행 1개 생성 (이미 있으면 amount만큼 증가)"""
+        from backend.models.app_models import ActivityCounter
+
+        savepoint = db.session.begin_nested()
+        try:
+            db.session.execute(insert(ActivityCounter), [row])
+            savepoint.commit()
+        except IntegrityError:
+            savepoint.rollback()
+            db.session.execute(
+                update(ActivityCounter)
+                .where(ActivityCounter.user_id == row['user_id'],
+                       ActivityCounter.activity_type == row['activity_type'],
+                       ActivityCounter.period == row['period'])
+                .values(count=ActivityCounter.count + amount)
+                .execution_options(synchronize_session=False)
+            )
+
+    @staticmethod
+    def record(user_id: str, activity_type: str, description: str | None = None,
+               moment: datetime | None = None) -> None:
+        """
+        활동 1건을 카운터에 반영 (커밋은 호출자가 수행)
+
+        UserActivity 행을 세션에 추가하기 전에 호출해야 distinct 판정에서 자기 자신이 제외됩니다.
+        """
+        ProgressCounterService.record_many([(user_id, activity_type, description, moment)])
+
+    @staticmethod
+    def record_many(events: Iterable[tuple[str, str, str | None, datetime | None]]) -> None:
+        """
+        여러 활동을 묶어 반영 (같은 사용자/활동 유형/기간은 UPDATE 한 번)
+
+        Args:
+            events: (user_id, activity_type, description, moment) 목록
+        """
+        amounts: Counter[tuple[str, str, tuple[str, ...]]] = Counter()
+        seen_values = set()
+        for user_id, activity_type, description, moment in events:
+            keys = tuple(period_keys(moment or ProgressCounterService.now()))
+            amounts[(user_id, activity_type, keys)] += 1
+
+            if activity_type in DISTINCT_ACTIVITY_TYPES and description:
+                # 같은 배치 안에서 이미 센 값은 DB 확인 없이 건너뜀
+                if (user_id, activity_type, description, keys) in seen_values:
+                    continue
+                seen_values.add((user_id, activity_type, description, keys))
+                new_periods = ProgressCounterService._new_value_periods(
+                    user_id, activity_type, description, list(keys)
+                )
+                if new_periods:
+                    amounts[(user_id, distinct(activity_type), tuple(new_periods))] += 1
+
+        for (user_id, activity_type, keys), amount in amounts.items():
+            ProgressCounterService._increment(user_id, [activity_type], list(keys), amount)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_counts(user_id: str, periods: Iterable[str]) -> dict[str, dict[str, int]]:
+        """기간별 카운터 {기간: {활동 유형: 횟수}} (한 번의 조회)"""
+        from backend.models.app_models import ActivityCounter
+
+        periods = list(dict.fromkeys(periods))
+        counts: dict[str, dict[str, int]] = {period: {} for period in periods}
+        rows = db.session.execute(
+            select(ActivityCounter.period, ActivityCounter.activity_type, ActivityCounter.count)
+            .where(ActivityCounter.user_id == user_id, ActivityCounter.period.in_(periods))
+        )
+        for period, activity_type, count in rows:
+            counts[period][activity_type] = count
+        return counts
+
+
+# 전역 서비스 인스턴스
+progress_counter_service = ProgressCounterService()
@@ -0,0 +1,39 @@
+"""
+주기적으로 재구축하는 프로세스 내 인덱스
+식당 검색 색인, 위치 인덱스, 호환성 엔진처럼 DB 내용을 워커 메모리에 올려 두고 조회하는 구조의 공통 기반입니다.
+  - 같은 워커의 변경은 매퍼 이벤트로 바로 반영하거나 mark_dirty()로 다음 조회 때 재구축합니다.
+  - 다른 워커에서 생긴 변경은 이 워커에 이벤트가 오지 않으므로 REFRESH_INTERVAL이 지나면 DB에서 다시 읽습니다.
+"""
+
+import time
+
+
+class RefreshableIndex:
+    """변경 표시 또는 재구축 주기 경과 시 rebuild()로 다시 읽는 인덱스"""
+
+    # 다른 워커에서 발생한 변경을 반영하기 위한 최대 재구축 주기 (초)
+    REFRESH_INTERVAL = 300
+
+    def __init__(self):
+        self._dirty = True
+        self._built_at = 0.0
+
+    def rebuild(self) -> int:
+        """DB에서 다시 읽어 인덱스를 교체 (하위 클래스 구현)"""
+        raise NotImplementedError
+
+    def mark_dirty(self, *args) -> None:
+        """변경되었음을 표시 (다음 조회 시 재구축, 매퍼 이벤트 핸들러로도 사용)"""
+        self._dirty = True
+
+    def _mark_built(self) -> None:
+        self._dirty = False
+        self._built_at = time.monotonic()
+
+    @property
+    def is_stale(self) -> bool:
+        return self._dirty or time.monotonic() - self._built_at > self.REFRESH_INTERVAL
+
+    def _ensure_fresh(self) -> None:
+        if self.is_stale:
+            self.rebuild()
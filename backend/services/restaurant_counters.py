@@ -0,0 +1,108 @@
+"""
+식당 추천/저장 카운터 관리
+restaurants_v2의 비정규화 카운터(recommend_count, saved_count)를
+추천/저장 토글과 같은 트랜잭션에서 갱신하고, 주기적으로 실제 행 수와 대조해 보정합니다.
+"""
+
+import logging
+
+from sqlalchemy import case, func, select, update
+
+from backend.app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+class RestaurantCounterService:
+    """식당 카운터 갱신 및 보정 서비스"""
+
+    COUNTER_FIELDS = ('recommend_count', 'saved_count')
+
+    @staticmethod
+    def _source_model(field: str):
+        from backend.models.restaurant_models import RestaurantRecommendV2, RestaurantSavedV2
+
+        if field == 'recommend_count':
+            return RestaurantRecommendV2
+        if field == 'saved_count':
+            return RestaurantSavedV2
+        raise ValueError(f"지원하지 않는 카운터입니다: {field}")
+
+    @staticmethod
+    def increment(restaurant_id: int, field: str, delta: int = 1) -> None:
+        """
+        카운터를 원자적으로 증감 (커밋은 호출자가 수행)
+
+        UPDATE ... SET col = col + :delta 형태로 실행되어 동시 요청에서도 값이 유실되지 않습니다.
+        """
+        from backend.models.restaurant_models import RestaurantV2
+
+        if field not in RestaurantCounterService.COUNTER_FIELDS:
+            raise ValueError(f"지원하지 않는 카운터입니다: {field}")
+
+        new_value = func.coalesce(getattr(RestaurantV2, field), 0) + delta
+        db.session.execute(
+            update(RestaurantV2)
+            .where(RestaurantV2.id == restaurant_id)
+            # updated_at 자동 갱신(onupdate) 방지: 카운터 변경은 식당 정보 수정이 아님
+            .values({
+                field: case((new_value < 0, 0), else_=new_value),
+                'updated_at': RestaurantV2.updated_at,
+            })
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def get_counts(restaurant_id: int) -> dict[str, int]:
+        """현재 카운터 값 조회"""
+        from backend.models.restaurant_models import RestaurantV2
+
+        row = db.session.query(
+            RestaurantV2.recommend_count, RestaurantV2.saved_count
+        ).filter(RestaurantV2.id == restaurant_id).first()
+        if not row:
+            return {'recommend_count': 0, 'saved_count': 0}
+        return {'recommend_count': row[0] or 0, 'saved_count': row[1] or 0}
+
+    @staticmethod
+    def reconcile() -> dict[str, int]:
+        """
+        카운터를 실제 추천/저장 행 수와 대조해 보정
+
+        Returns:
+            카운터별 보정된 식당 수
+        """
+        from backend.models.restaurant_models import RestaurantV2
+
+        repaired = {}
+        try:
+            for field in RestaurantCounterService.COUNTER_FIELDS:
+                source = RestaurantCounterService._source_model(field)
+                actual = (
+                    select(func.count(source.id))
+                    .where(source.restaurant_id == RestaurantV2.id)
+                    .correlate(RestaurantV2)
+                    .scalar_subquery()
+                )
+                column = getattr(RestaurantV2, field)
+                result = db.session.execute(
+                    update(RestaurantV2)
+                    .where(func.coalesce(column, -1) != actual)
+                    .values({field: actual, 'updated_at': RestaurantV2.updated_at})
+                    .execution_options(synchronize_session=False)
+                )
+                repaired[field] = result.rowcount or 0
+
+            db.session.commit()
+            logger.info(f"식당 카운터 보정 완료: {repaired}")
+            return repaired
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"식당 카운터 보정 실패: {e}")
+            raise
+
+
+def reconcile_restaurant_counters() -> dict[str, int]:
+    """주기 작업용 카운터 보정 진입점"""
+    return RestaurantCounterService.reconcile()
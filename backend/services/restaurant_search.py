@@ -0,0 +1,312 @@
+"""
+식당 검색 엔진
+식당명/카테고리/주소를 문자 n-gram(1~2글자) 역색인으로 메모리에 보관하여
+한글 부분 문자열 검색, 관련도 정렬, 접두어 자동완성을 제공합니다.
+PostgreSQL에서는 pg_trgm 인덱스(add_restaurant_search_trgm 마이그레이션)가 DB 폴백 검색을 가속합니다.
+"""
+
+import bisect
+import logging
+import re
+import threading
+import unicodedata
+from collections.abc import Callable
+
+from backend.services.refreshable import RefreshableIndex
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+_PUNCTUATION = re.compile(r'[^\w]+', re.UNICODE)
+
+# 필드별 가중치 (식당명 > 카테고리 > 주소)
+FIELD_WEIGHTS = {'name': 3.0, 'category': 2.0, 'address': 1.0}
+
+
+def normalize(text: str | None) -> str:
+    """검색용 정규화 (NFKC, 소문자, 공백/기호 제거)"""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).lower()
+    return _PUNCTUATION.sub('', _WHITESPACE.sub('', text))
+
+
+def ngrams(text: str) -> set[str]:
+    """정규화된 문자열의 1-gram, 2-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def query_grams(term: str) -> set[str]:
+    """검색어 후보 추출용 n-gram (2글자 이상이면 bigram만 사용)"""
+    if len(term) < 2:
+        return set(term)
+    return {term[i:i + 2] for i in range(len(term) - 1)}
+
+
+def gram_coverage(query: set[str], target: set[str]) -> float:
+    """검색어 n-gram 중 대상 문자열에 포함된 비율 (긴 식당명 안의 오타도 허용)"""
+    if not query or not target:
+        return 0.0
+    return len(query & target) / len(query)
+
+
+class RestaurantSearchIndex(RefreshableIndex):
+    """식당 n-gram 역색인"""
+
+    # 정확히 일치하는 결과가 없을 때 사용하는 n-gram 포함률 하한
+    FUZZY_THRESHOLD = 0.6
+
+    def __init__(self, model_loader: Callable):
+        super().__init__()
+        self._model_loader = model_loader
+        self._lock = threading.Lock()
+        self._docs: dict[int, dict] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._prefix_keys: list[tuple[str, int]] = []
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _make_doc(restaurant_id: int, name: str, category: str | None, address: str | None,
+                  rating: float | None = None) -> dict:
+        fields = {
+            'name': normalize(name),
+            'category': normalize(category),
+            'address': normalize(address),
+        }
+        words = [normalize(w) for w in _WHITESPACE.split(name or '') if normalize(w)]
+        return {
+            'id': restaurant_id,
+            'name': name or '',
+            'fields': fields,
+            'grams': {field: ngrams(value) for field, value in fields.items()},
+            'prefixes': {fields['name'], *words} - {''},
+            'rating': rating or 0.0,
+        }
+
+    def _index_doc(self, doc: dict, keep_sorted: bool = True):
+        restaurant_id = doc['id']
+        self._docs[restaurant_id] = doc
+        for grams in doc['grams'].values():
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(restaurant_id)
+        for key in doc['prefixes']:
+            if keep_sorted:
+                bisect.insort(self._prefix_keys, (key, restaurant_id))
+            else:
+                self._prefix_keys.append((key, restaurant_id))
+
+    def _unindex_doc(self, restaurant_id: int):
+        doc = self._docs.pop(restaurant_id, None)
+        if not doc:
+            return
+        for grams in doc['grams'].values():
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(restaurant_id)
+                    if not posting:
+                        del self._postings[gram]
+        for key in doc['prefixes']:
+            pos = bisect.bisect_left(self._prefix_keys, (key, restaurant_id))
+            if pos < len(self._prefix_keys) and self._prefix_keys[pos] == (key, restaurant_id):
+                del self._prefix_keys[pos]
+
+    def load(self, rows) -> int:
+        """(id, 이름, 카테고리, 주소, 평점) 목록으로 색인을 교체"""
+        with self._lock:
+            self._docs, self._postings, self._prefix_keys = {}, {}, []
+            for row in rows:
+                self._index_doc(self._make_doc(*row), keep_sorted=False)
+            self._prefix_keys.sort()
+            self._mark_built()
+            return len(self._docs)
+
+    def upsert(self, restaurant_id: int, name: str, category: str | None = None,
+               address: str | None = None, rating: float | None = None):
+        """식당 한 건을 색인에 추가/갱신"""
+        doc = self._make_doc(restaurant_id, name, category, address, rating)
+        with self._lock:
+            self._unindex_doc(restaurant_id)
+            self._index_doc(doc)
+
+    def remove(self, restaurant_id: int):
+        """식당 한 건을 색인에서 제거"""
+        with self._lock:
+            self._unindex_doc(restaurant_id)
+
+    def rebuild(self) -> int:
+        """DB에서 식당을 읽어 색인을 재구축 (앱 컨텍스트 필요)"""
+        model = self._model_loader()
+        query = model.query.with_entities(
+            model.id, model.name, model.category, model.address, model.rating
+        )
+        if hasattr(model, 'is_active'):
+            query = query.filter(model.is_active == True)
+        count = self.load(query.all())
+        logger.info(f"식당 검색 색인 구축 완료 ({model.__tablename__}): {count}개")
+        return count
+
+    def on_change(self, mapper, connection, target):
+        """ORM 변경 이벤트 → 증분 색인"""
+        if getattr(target, 'is_active', True) is False:
+            self.remove(target.id)
+        else:
+            self.upsert(target.id, target.name, target.category, target.address, target.rating)
+
+    def on_delete(self, mapper, connection, target):
+        self.remove(target.id)
+
+    @property
+    def size(self) -> int:
+        return len(self._docs)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def _candidates(self, term: str) -> set[int]:
+        postings = [self._postings.get(gram, set()) for gram in query_grams(term)]
+        if not postings:
+            return set()
+        postings.sort(key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    @staticmethod
+    def _term_score(doc: dict, term: str) -> float:
+        score = 0.0
+        for field, weight in FIELD_WEIGHTS.items():
+            value = doc['fields'][field]
+            if not value or term not in value:
+                continue
+            if value == term:
+                score = max(score, weight * 3)
+            elif value.startswith(term):
+                score = max(score, weight * 2)
+            else:
+                score = max(score, weight)
+        return score
+
+    def search(self, query: str, limit: int | None = None, fuzzy: bool = True) -> list[tuple[int, float]]:
+        """
+        검색어에 일치하는 식당을 관련도순으로 조회
+
+        공백으로 구분된 각 단어가 식당명/카테고리/주소 중 하나에 부분 문자열로 포함되어야 하며,
+        일치 결과가 없으면 n-gram 유사도로 오타를 허용한 결과를 반환합니다.
+
+        Returns:
+            [(식당 ID, 점수), ...] (점수 내림차순)
+        """
+        self._ensure_fresh()
+        terms = [normalize(t) for t in _WHITESPACE.split(query or '')]
+        terms = [t for t in terms if t]
+        if not terms:
+            return []
+
+        candidates = None
+        for term in terms:
+            found = self._candidates(term)
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                break
+
+        results = []
+        for restaurant_id in candidates or ():
+            doc = self._docs.get(restaurant_id)
+            if not doc:
+                continue
+            scores = [self._term_score(doc, term) for term in terms]
+            if all(scores):
+                results.append((restaurant_id, sum(scores), doc))
+
+        if not results and fuzzy:
+            results = self._fuzzy_search(terms)
+
+        results.sort(key=lambda r: (-r[1], -r[2]['rating'], r[2]['name']))
+        ranked = [(restaurant_id, round(score, 3)) for restaurant_id, score, _ in results]
+        return ranked[:limit] if limit is not None else ranked
+
+    def _fuzzy_search(self, terms: list[str]) -> list[tuple[int, float, dict]]:
+        term_grams = ngrams(''.join(terms))
+        pool = set()
+        for gram in query_grams(''.join(terms)):
+            pool |= self._postings.get(gram, set())
+
+        results = []
+        for restaurant_id in pool:
+            doc = self._docs.get(restaurant_id)
+            if not doc:
+                continue
+            similarity = max(
+                gram_coverage(term_grams, doc['grams'][field]) * weight / FIELD_WEIGHTS['name']
+                for field, weight in FIELD_WEIGHTS.items()
+            )
+            if similarity >= self.FUZZY_THRESHOLD:
+                results.append((restaurant_id, similarity, doc))
+        return results
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> list[dict]:
+        """식당명(또는 식당명 내 단어) 접두어 자동완성"""
+        self._ensure_fresh()
+        key = normalize(prefix)
+        if not key:
+            return []
+
+        start = bisect.bisect_left(self._prefix_keys, (key, -1))
+        matches = {}
+        for indexed_key, restaurant_id in self._prefix_keys[start:]:
+            if not indexed_key.startswith(key):
+                break
+            doc = self._docs.get(restaurant_id)
+            if not doc:
+                continue
+            full_name_match = doc['fields']['name'].startswith(key)
+            if restaurant_id not in matches or full_name_match:
+                matches[restaurant_id] = (full_name_match, doc)
+
+        ordered = sorted(
+            matches.values(),
+            key=lambda m: (not m[0], -m[1]['rating'], len(m[1]['name']), m[1]['name'])
+        )
+        return [{'id': doc['id'], 'name': doc['name']} for _, doc in ordered[:limit]]
+
+
+def _load_restaurant_v2():
+    from backend.models.restaurant_models import RestaurantV2
+    return RestaurantV2
+
+
+def _load_legacy_restaurant():
+    from backend.models.app_models import Restaurant
+    return Restaurant
+
+
+# 전역 검색 색인 인스턴스
+restaurant_search_index = RestaurantSearchIndex(_load_restaurant_v2)
+legacy_restaurant_search_index = RestaurantSearchIndex(_load_legacy_restaurant)
+
+
+def setup_search_index(app):
+    """식당 변경 이벤트 연결 및 시작 시 색인 구축"""
+    from sqlalchemy import event
+
+    for index in (restaurant_search_index, legacy_restaurant_search_index):
+        model = index._model_loader()
+        listeners = (
+            ('after_insert', index.on_change),
+            ('after_update', index.on_change),
+            ('after_delete', index.on_delete),
+        )
+        for event_name, handler in listeners:
+            if not event.contains(model, event_name, handler):
+                event.listen(model, event_name, handler)
+
+        try:
+            with app.app_context():
+                index.rebuild()
+        except Exception as e:
+            # 테이블이 아직 없으면 첫 검색 시 구축
+            logger.warning(f"식당 검색 색인 초기 구축 건너뜀 ({model.__tablename__}): {e}")
+    return True
@@ -0,0 +1,244 @@
+"""
+데이터 보존 정책 (만료 데이터 정리)
+테이블별 정책에 따라 오래된 행을 작은 묶음으로 나눠 삭제합니다.
+묶음마다 DELETE ... WHERE id IN (SELECT id ... LIMIT n) 한 번과 커밋 한 번만 실행하므로
+잠금은 묶음 하나 동안만 유지되고, 묶음 사이에는 잠시 쉬어 다른 요청의 쓰기가 먼저 처리되도록 합니다.
+실행 결과로 정책별 삭제 행 수와 회수한 크기(텍스트 컬럼 길이 합, 파일 크기)를 보고합니다.
+"""
+
+import importlib
+import logging
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, delete, func, select
+
+from backend.app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """테이블별 보존 정책"""
+
+    name: str
+    model_path: str  # 'module:Model' (순환 import를 피하기 위해 실행 시점에 로드)
+    condition: Callable[[Any, datetime], Any]  # (모델, 기준 시각) → 삭제 대상 WHERE 조건
+    max_age: timedelta
+    size_columns: tuple[str, ...] = ()  # 회수 크기 집계에 쓰는 텍스트 컬럼
+    batch_size: int = 1000
+
+    def resolve_model(self):
+        module_name, _, model_name = self.model_path.partition(':')
+        return getattr(importlib.import_module(module_name), model_name)
+
+
+def _deleted_message_ids():
+    from backend.models.app_models import ChatMessage
+
+    return select(ChatMessage.id).where(ChatMessage.is_deleted.is_(True))
+
+
+# 기본 정책 (보존 기간은 RETENTION_MAX_AGE_DAYS 설정으로 정책별 변경 가능)
+POLICIES: dict[str, RetentionPolicy] = {
+    policy.name: policy
+    for policy in (
+        # 읽은 알림은 읽은 지 30일 후 삭제
+        RetentionPolicy(
+            name='read_notifications',
+            model_path='backend.models.app_models:ChatNotification',
+            condition=lambda model, cutoff: and_(model.is_read.is_(True), model.read_at < cutoff),
+            max_age=timedelta(days=30),
+            size_columns=('title', 'message'),
+        ),
+        # 읽지 않았더라도 180일이 지난 알림은 삭제
+        RetentionPolicy(
+            name='stale_notifications',
+            model_path='backend.models.app_models:ChatNotification',
+            condition=lambda model, cutoff: model.created_at < cutoff,
+            max_age=timedelta(days=180),
+            size_columns=('title', 'message'),
+        ),
+        # 삭제된 메시지의 검색 인덱스
+        RetentionPolicy(
+            name='deleted_message_search_index',
+            model_path='backend.models.app_models:MessageSearchIndex',
+            condition=lambda model, cutoff: and_(
+                model.message_id.in_(_deleted_message_ids()), model.created_at < cutoff
+            ),
+            max_age=timedelta(0),
+            size_columns=('search_text',),
+        ),
+        # 무효화된 토큰은 리프레시 토큰 수명(1년)이 지나면 토큰 자체가 만료되므로 블랙리스트에서 제거
+        RetentionPolicy(
+            name='revoked_tokens',
+            model_path='backend.auth.models:RevokedToken',
+            condition=lambda model, cutoff: model.revoked_at < cutoff,
+            max_age=timedelta(days=366),
+            size_columns=('token_hash',),
+        ),
+    )
+}
+
+# 임시 업로드 파일 정책 이름 (파일 시스템)
+TEMP_UPLOADS = 'temp_uploads'
+TEMP_UPLOAD_MAX_AGE = timedelta(hours=24)
+
+
+class RetentionService:
+    """보존 정책 실행 서비스"""
+
+    BATCH_PAUSE_SECONDS = 0.05  # 묶음 사이 대기 시간
+    MAX_BATCHES_PER_RUN = 200  # 정책당 한 번 실행의 최대 묶음 수 (남은 행은 다음 실행에서 처리)
+    FILE_BATCH_SIZE = 500
+
+    @staticmethod
+    def _empty_report() -> dict[str, Any]:
+        return {'rows': 0, 'bytes': 0, 'batches': 0, 'seconds': 0.0}
+
+    @staticmethod
+    def purge(policy: RetentionPolicy, max_age: timedelta | None = None, now: datetime | None = None,
+              pause: float | None = None, max_batches: int | None = None) -> dict[str, Any]:
+        """
+        정책 하나를 묶음 단위로 실행
+
+        Returns:
+            {'rows': 삭제 행 수, 'bytes': 회수 크기, 'batches': 묶음 수, 'seconds': 소요 시간}
+            중간에 실패하면 'error'가 추가되고, 그 전까지 커밋된 묶음은 유지됩니다.
+        """
+        pause = RetentionService.BATCH_PAUSE_SECONDS if pause is None else pause
+        max_batches = max_batches or RetentionService.MAX_BATCHES_PER_RUN
+        cutoff = (now or datetime.utcnow()) - (policy.max_age if max_age is None else max_age)
+        report = RetentionService._empty_report()
+        started = time.perf_counter()
+
+        try:
+            model = policy.resolve_model()
+            condition = policy.condition(model, cutoff)
+            size_expr = None
+            if policy.size_columns:
+                size_expr = sum(func.coalesce(func.length(getattr(model, column)), 0) for column in policy.size_columns)
+            # RETURNING을 지원하면 삭제와 크기 집계를 한 문장으로 처리
+            use_returning = size_expr is not None and db.engine.dialect.delete_returning
+
+            while report['batches'] < max_batches:
+                chunk = select(model.id).where(condition).order_by(model.id).limit(policy.batch_size)
+                statement = (
+                    delete(model)
+                    .where(model.id.in_(chunk))
+                    .execution_options(synchronize_session=False)
+                )
+                if use_returning:
+                    sizes = db.session.execute(statement.returning(size_expr)).scalars().all()
+                    deleted = len(sizes)
+                    report['bytes'] += sum(size or 0 for size in sizes)
+                else:
+                    deleted = db.session.execute(statement).rowcount or 0
+                db.session.commit()
+
+                report['rows'] += deleted
+                report['batches'] += 1
+                if deleted < policy.batch_size:
+                    break
+                time.sleep(pause)
+
+        except Exception as e:
+            db.session.rollback()
+            report['error'] = str(e)
+            logger.error(f"보존 정책 실행 실패: {policy.name} - {e}")
+
+        report['seconds'] = round(time.perf_counter() - started, 3)
+        return report
+
+    @staticmethod
+    def purge_temp_files(folder: str, max_age: timedelta = TEMP_UPLOAD_MAX_AGE,
+                         pause: float | None = None) -> dict[str, Any]:
+        """임시 업로드 폴더에서 오래된 파일을 묶음 단위로 삭제"""
+        pause = RetentionService.BATCH_PAUSE_SECONDS if pause is None else pause
+        report = RetentionService._empty_report()
+        started = time.perf_counter()
+        if not os.path.isdir(folder):
+            return report
+
+        cutoff = time.time() - max_age.total_seconds()
+        in_batch = 0
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_ctime >= cutoff:
+                        continue
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    report['rows'] += 1
+                    report['bytes'] += stat.st_size
+                    in_batch += 1
+                    if in_batch >= RetentionService.FILE_BATCH_SIZE:
+                        report['batches'] += 1
+                        in_batch = 0
+                        time.sleep(pause)
+        except OSError as e:
+            report['error'] = str(e)
+            logger.error(f"임시 파일 정리 실패: {folder} - {e}")
+
+        if in_batch:
+            report['batches'] += 1
+        report['seconds'] = round(time.perf_counter() - started, 3)
+        return report
+
+    @staticmethod
+    def configured_max_age(name: str) -> timedelta | None:
+        """앱 설정(RETENTION_MAX_AGE_DAYS = {정책 이름: 일수})의 보존 기간"""
+        from flask import current_app, has_app_context
+
+        if not has_app_context():
+            return None
+        days = (current_app.config.get('RETENTION_MAX_AGE_DAYS') or {}).get(name)
+        return timedelta(days=days) if days is not None else None
+
+    @staticmethod
+    def run(names: list[str] | None = None) -> dict[str, dict[str, Any]]:
+        """
+        보존 정책 실행 (기본: 모든 정책 + 임시 업로드 파일)
+
+        Returns:
+            정책 이름별 실행 결과
+        """
+        selected = names or [*POLICIES, TEMP_UPLOADS]
+        results = {}
+        for name in selected:
+            max_age = RetentionService.configured_max_age(name)
+            if name == TEMP_UPLOADS:
+                from backend.utils.file_manager import file_manager
+
+                results[name] = RetentionService.purge_temp_files(
+                    os.path.join(file_manager.upload_folder, 'temp'), max_age or TEMP_UPLOAD_MAX_AGE
+                )
+            elif name in POLICIES:
+                results[name] = RetentionService.purge(POLICIES[name], max_age=max_age)
+            else:
+                logger.warning(f"알 수 없는 보존 정책: {name}")
+                continue
+            result = results[name]
+            logger.info(
+                f"보존 정책 {name}: {result['rows']}개 삭제, {result['bytes']}바이트 회수, "
+                f"{result['batches']}개 묶음, {result['seconds']}초"
+            )
+        return results
+
+
+def run_retention() -> dict[str, dict[str, Any]]:
+    """모든 보존 정책 실행 (Celery 주기 작업용)"""
+    results = RetentionService.run()
+    total_rows = sum(result['rows'] for result in results.values())
+    total_bytes = sum(result['bytes'] for result in results.values())
+    return {'rows': total_rows, 'bytes': total_bytes, 'policies': results}
@@ -0,0 +1,339 @@
+"""
+반복 일정 구체화 서비스
+마스터 일정(PersonalSchedule)을 오늘 기준 앞뒤 일정 범위(롤링 호라이즌)만큼 날짜별 인스턴스로 펼쳐
+schedule_instances 테이블에 저장합니다. 월/주 화면은 (employee_id, instance_date) 인덱스 범위 조회로 처리하고,
+구체화 범위 밖의 조회만 반복 규칙으로 직접 계산합니다.
+마스터 일정이 바뀌면 해당 일정만, 예외가 바뀌면 해당 날짜만 같은 플러시 안에서 다시 펼칩니다.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.orm.attributes import set_committed_value
+
+from backend.app.extensions import db
+from backend.services.schedule_service import ScheduleService, _as_date
+
+logger = logging.getLogger(__name__)
+
+# 인스턴스 값에 영향을 주는 마스터 일정 필드
+MATERIALIZED_FIELDS = (
+    'employee_id', 'title', 'start_date', 'time', 'restaurant', 'location', 'description',
+    'is_recurring', 'recurrence_type', 'recurrence_interval', 'recurrence_end_date',
+)
+OVERRIDE_FIELDS = ('title', 'time', 'restaurant', 'location', 'description')
+
+
+class ScheduleMaterializer:
+    """마스터 일정 → 날짜별 인스턴스 구체화 및 조회"""
+
+    LOOKBACK_DAYS = 90
+    HORIZON_DAYS = 365
+    BATCH_SIZE = 500
+
+    # ------------------------------------------------------------------
+    # 구체화 범위
+    # ------------------------------------------------------------------
+    @staticmethod
+    def window(master, today: date | None = None) -> tuple[date, date]:
+        """마스터 일정의 구체화 범위 (시작일 이전은 제외)"""
+        today = today or date.today()
+        start = max(_as_date(master.start_date), today - timedelta(days=ScheduleMaterializer.LOOKBACK_DAYS))
+        return start, today + timedelta(days=ScheduleMaterializer.HORIZON_DAYS)
+
+    @staticmethod
+    def _query_span(master, start_date: date, end_date: date) -> tuple[date, date] | None:
+        """조회 기간 중 마스터 일정이 발생할 수 있는 구간 (없으면 None)"""
+        anchor = _as_date(master.start_date)
+        if not master.is_recurring:
+            return (anchor, anchor) if start_date <= anchor <= end_date else None
+        last = end_date
+        if master.recurrence_end_date:
+            last = min(last, _as_date(master.recurrence_end_date))
+        first = max(start_date, anchor)
+        return (first, last) if first <= last else None
+
+    @staticmethod
+    def is_covered(master, start_date: date, end_date: date) -> bool:
+        """조회 기간이 구체화 범위 안에 있는지"""
+        span = ScheduleMaterializer._query_span(master, start_date, end_date)
+        if span is None:
+            return True
+        if master.materialized_from is None or master.materialized_until is None:
+            return False
+        return master.materialized_from <= span[0] and span[1] <= master.materialized_until
+
+    # ------------------------------------------------------------------
+    # 인스턴스 행 생성
+    # ------------------------------------------------------------------
+    @staticmethod
+    def build_rows(master, dates: list[date], exceptions: dict[date, Any]) -> list[dict[str, Any]]:
+        """발생 날짜에 예외(삭제/수정)를 적용한 인스턴스 행"""
+        rows = []
+        for instance_date in dates:
+            exception = exceptions.get(instance_date)
+            if exception is not None and exception.is_deleted:
+                continue
+            row = {
+                'master_schedule_id': master.id,
+                'employee_id': master.employee_id,
+                'instance_date': instance_date,
+                'exception_id': None,
+                **{field: getattr(master, field) for field in OVERRIDE_FIELDS},
+            }
+            if exception is not None and exception.is_modified:
+                for field in OVERRIDE_FIELDS:
+                    value = getattr(exception, f'new_{field}')
+                    if value:
+                        row[field] = value
+                row['exception_id'] = exception.id
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _load_exceptions(connection, master_id: int, start_date: date, end_date: date) -> dict[date, Any]:
+        from backend.models.schedule_models import ScheduleException
+
+        table = ScheduleException.__table__
+        result = connection.execute(
+            select(table).where(
+                table.c.original_schedule_id == master_id,
+                table.c.exception_date >= datetime.combine(start_date, datetime.min.time()),
+                table.c.exception_date <= datetime.combine(end_date, datetime.max.time())
+            )
+        )
+        return {_as_date(row.exception_date): row for row in result}
+
+    @staticmethod
+    def _fill(connection, master, start_date: date, end_date: date) -> int:
+        from backend.models.schedule_models import ScheduleInstance
+
+        dates = ScheduleService.occurrence_dates(master, start_date, end_date)
+        if not dates:
+            return 0
+        exceptions = ScheduleMaterializer._load_exceptions(connection, master.id, start_date, end_date)
+        rows = ScheduleMaterializer.build_rows(master, dates, exceptions)
+        if rows:
+            connection.execute(insert(ScheduleInstance), rows)
+        return len(rows)
+
+    @staticmethod
+    def _set_window(connection, master, start_date: date, end_date: date) -> None:
+        from backend.models.schedule_models import PersonalSchedule
+
+        connection.execute(
+            update(PersonalSchedule.__table__)
+            .where(PersonalSchedule.__table__.c.id == master.id)
+            .values(materialized_from=start_date, materialized_until=end_date)
+        )
+        if isinstance(master, PersonalSchedule):
+            # ORM 객체는 변경 표시 없이 현재 값만 맞춤
+            set_committed_value(master, 'materialized_from', start_date)
+            set_committed_value(master, 'materialized_until', end_date)
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    @staticmethod
+    def rematerialize(connection, master, today: date | None = None) -> int:
+        """마스터 일정의 인스턴스를 구체화 범위 전체에 대해 다시 생성"""
+        from backend.models.schedule_models import ScheduleInstance
+
+        connection.execute(delete(ScheduleInstance).where(ScheduleInstance.master_schedule_id == master.id))
+        start_date, end_date = ScheduleMaterializer.window(master, today)
+        count = ScheduleMaterializer._fill(connection, master, start_date, end_date)
+        ScheduleMaterializer._set_window(connection, master, start_date, end_date)
+        return count
+
+    @staticmethod
+    def refresh_date(connection, master_id: int, instance_date: date) -> None:
+        """예외가 바뀐 날짜 하나만 다시 생성"""
+        from backend.models.schedule_models import PersonalSchedule, ScheduleInstance
+
+        master = connection.execute(
+            select(PersonalSchedule.__table__).where(PersonalSchedule.__table__.c.id == master_id)
+        ).first()
+        if master is None or master.materialized_from is None:
+            return
+        if not master.materialized_from <= instance_date <= master.materialized_until:
+            return
+
+        connection.execute(
+            delete(ScheduleInstance).where(
+                ScheduleInstance.master_schedule_id == master_id,
+                ScheduleInstance.instance_date == instance_date
+            )
+        )
+        ScheduleMaterializer._fill(connection, master, instance_date, instance_date)
+
+    @staticmethod
+    def extend_horizon(today: date | None = None) -> dict[str, int]:
+        """
+        구체화 범위를 오늘 기준으로 연장 (주기 작업)
+        구체화되지 않은 일정은 전체를 생성하고, 나머지는 늘어난 날짜만 추가합니다.
+        """
+        from backend.models.schedule_models import PersonalSchedule
+
+        today = today or date.today()
+        horizon = today + timedelta(days=ScheduleMaterializer.HORIZON_DAYS)
+        table = PersonalSchedule.__table__
+        stats = {'materialized': 0, 'extended': 0, 'instances': 0}
+
+        try:
+            connection = db.session.connection()
+            masters = connection.execute(
+                select(table).where(or_(table.c.materialized_until.is_(None), table.c.materialized_until < horizon))
+            ).all()
+
+            for index, master in enumerate(masters, start=1):
+                if master.materialized_from is None or master.materialized_until is None:
+                    stats['instances'] += ScheduleMaterializer.rematerialize(connection, master, today)
+                    stats['materialized'] += 1
+                else:
+                    stats['instances'] += ScheduleMaterializer._fill(
+                        connection, master, master.materialized_until + timedelta(days=1), horizon
+                    )
+                    ScheduleMaterializer._set_window(connection, master, master.materialized_from, horizon)
+                    stats['extended'] += 1
+                if index % ScheduleMaterializer.BATCH_SIZE == 0:
+                    db.session.commit()
+                    connection = db.session.connection()
+
+            db.session.commit()
+            logger.info(f"반복 일정 구체화 범위 연장 완료: {stats}")
+            return stats
+
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"반복 일정 구체화 범위 연장 실패: {e}")
+            raise
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def get_instances(employee_id: str, start_date: date, end_date: date) -> list[dict[str, Any]]:
+        """
+        사용자의 기간 내 개인일정 인스턴스
+
+        구체화 범위 안의 일정은 schedule_instances 범위 조회로,
+        범위 밖(먼 과거/미래, 아직 구체화되지 않은 일정)은 규칙 계산 + 예외 적용으로 만듭니다.
+        """
+        from sqlalchemy import and_
+
+        from backend.models.schedule_models import PersonalSchedule, ScheduleException, ScheduleInstance
+
+        range_start = datetime.combine(start_date, datetime.min.time())
+        range_end = datetime.combine(end_date, datetime.max.time())
+        masters = PersonalSchedule.query.filter(
+            PersonalSchedule.employee_id == employee_id,
+            PersonalSchedule.start_date <= range_end,
+            or_(
+                PersonalSchedule.start_date >= range_start,
+                and_(
+                    PersonalSchedule.is_recurring == True,
+                    or_(PersonalSchedule.recurrence_end_date.is_(None),
+                        PersonalSchedule.recurrence_end_date >= range_start)
+                )
+            )
+        ).all()
+
+        covered, uncovered = {}, []
+        for master in masters:
+            if ScheduleMaterializer._query_span(master, start_date, end_date) is None:
+                continue
+            if ScheduleMaterializer.is_covered(master, start_date, end_date):
+                covered[master.id] = master
+            else:
+                uncovered.append(master)
+
+        instances = []
+        if covered:
+            rows = ScheduleInstance.query.filter(
+                ScheduleInstance.employee_id == employee_id,
+                ScheduleInstance.instance_date.between(start_date, end_date)
+            ).order_by(ScheduleInstance.instance_date, ScheduleInstance.id).all()
+            for row in rows:
+                master = covered.get(row.master_schedule_id)
+                if master is None:
+                    continue
+                instance = ScheduleService._create_instance_dict(master, row.instance_date)
+                instance.update({field: getattr(row, field) for field in OVERRIDE_FIELDS})
+                if row.exception_id is not None:
+                    instance['has_exception'] = True
+                    instance['exception_id'] = row.exception_id
+                instances.append(instance)
+
+        if uncovered:
+            computed = []
+            for master in uncovered:
+                computed.extend(ScheduleService.calculate_recurring_instances(master, start_date, end_date))
+            exceptions = ScheduleException.query.filter(
+                ScheduleException.original_schedule_id.in_([master.id for master in uncovered]),
+                ScheduleException.exception_date >= range_start,
+                ScheduleException.exception_date <= range_end
+            ).all()
+            instances.extend(ScheduleService.apply_exceptions(computed, exceptions))
+
+        return instances
+
+    # ------------------------------------------------------------------
+    # 매퍼 이벤트
+    # ------------------------------------------------------------------
+    @staticmethod
+    def on_schedule_insert(mapper, connection, target):
+        ScheduleMaterializer.rematerialize(connection, target)
+
+    @staticmethod
+    def on_schedule_update(mapper, connection, target):
+        from sqlalchemy import inspect
+
+        state = inspect(target)
+        if any(state.attrs[field].history.has_changes() for field in MATERIALIZED_FIELDS):
+            ScheduleMaterializer.rematerialize(connection, target)
+
+    @staticmethod
+    def on_schedule_delete(mapper, connection, target):
+        from backend.models.schedule_models import ScheduleInstance
+
+        connection.execute(delete(ScheduleInstance).where(ScheduleInstance.master_schedule_id == target.id))
+
+    @staticmethod
+    def on_exception_change(mapper, connection, target):
+        from sqlalchemy import inspect
+
+        dates = {_as_date(target.exception_date)}
+        dates.update(_as_date(value) for value in inspect(target).attrs.exception_date.history.deleted if value)
+        for instance_date in dates:
+            ScheduleMaterializer.refresh_date(connection, target.original_schedule_id, instance_date)
+
+
+# 전역 서비스 인스턴스
+schedule_materializer = ScheduleMaterializer()
+
+
+def extend_schedule_horizon() -> dict[str, int]:
+    """주기 작업용 구체화 범위 연장 진입점"""
+    return ScheduleMaterializer.extend_horizon()
+
+
+def setup_schedule_materializer(app):
+    """마스터 일정/예외 매퍼 이벤트 연결"""
+    from sqlalchemy import event
+
+    from backend.models.schedule_models import PersonalSchedule, ScheduleException
+
+    listeners = [
+        (PersonalSchedule, 'after_insert', ScheduleMaterializer.on_schedule_insert),
+        (PersonalSchedule, 'after_update', ScheduleMaterializer.on_schedule_update),
+        (PersonalSchedule, 'after_delete', ScheduleMaterializer.on_schedule_delete),
+    ]
+    for event_name in ('after_insert', 'after_update', 'after_delete'):
+        listeners.append((ScheduleException, event_name, ScheduleMaterializer.on_exception_change))
+
+    for target, event_name, handler in listeners:
+        if not event.contains(target, event_name, handler):
+            event.listen(target, event_name, handler)
+    return True
@@ -1,3 +1,4 @@
+from calendar import monthrange
 from datetime import datetime, date, timedelta
 from typing import Any
 from backend.app.extensions import db
@@ -5,9 +6,62 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
 class ScheduleService:
     """반복 일정 계산과 관리를 담당하는 서비스 클래스"""
 
+    @staticmethod
+    def occurrence_dates(master_schedule, start_date: date, end_date: date) -> list[date]:
+        """
+        마스터 일정이 특정 기간에 발생하는 날짜 목록
+        시작 날짜부터 하루씩 걷지 않고 기간 내 첫 발생일로 바로 이동합니다.
+        """
+        anchor = _as_date(master_schedule.start_date)
+        if not master_schedule.is_recurring:
+            return [anchor] if start_date <= anchor <= end_date else []
+
+        last = end_date
+        if master_schedule.recurrence_end_date:
+            last = min(last, _as_date(master_schedule.recurrence_end_date))
+        first = max(start_date, anchor)
+        if first > last:
+            return []
+
+        interval = max(1, master_schedule.recurrence_interval or 1)
+        if master_schedule.recurrence_type == 'monthly':
+            return ScheduleService._monthly_dates(anchor, interval, first, last)
+
+        # daily/weekly (알 수 없는 유형은 매일로 처리)
+        step = {'daily': interval, 'weekly': 7 * interval}.get(master_schedule.recurrence_type, 1)
+        offset = (first - anchor).days
+        current = anchor + timedelta(days=-(-offset // step) * step)
+        dates = []
+        while current <= last:
+            dates.append(current)
+            current += timedelta(days=step)
+        return dates
+
+    @staticmethod
+    def _monthly_dates(anchor: date, interval: int, first: date, last: date) -> list[date]:
+        """월 단위 반복 날짜 (해당 일이 없는 달은 건너뜀)"""
+        months = (first.year - anchor.year) * 12 + first.month - anchor.month
+        offset = max(0, months // interval) * interval
+        dates = []
+        while True:
+            year_offset, month_index = divmod(anchor.month - 1 + offset, 12)
+            year, month = anchor.year + year_offset, month_index + 1
+            if date(year, month, 1) > last:
+                return dates
+            if anchor.day <= monthrange(year, month)[1]:
+                current = date(year, month, anchor.day)
+                if first <= current <= last:
+                    dates.append(current)
+            offset += interval
+
     @staticmethod
     def calculate_recurring_instances(
         master_schedule,
@@ -25,52 +79,10 @@ class ScheduleService:
         Returns:
             계산된 일정 인스턴스들의 리스트
         """
-        if not master_schedule.is_recurring:
-            # 반복 일정이 아닌 경우 단일 일정으로 처리
-            if start_date <= master_schedule.start_date.date() <= end_date:
-                return [ScheduleService._create_instance_dict(master_schedule, master_schedule.start_date.date())]
-            return []
-
-        instances = []
-        current_date = master_schedule.start_date.date()
-
-        # 반복 종료 날짜 확인
-        max_date = end_date
-        if master_schedule.recurrence_end_date:
-            max_date = min(end_date, master_schedule.recurrence_end_date.date())
-
-        while current_date <= max_date:
-            if start_date <= current_date <= end_date:
-                # 해당 기간에 포함되는 경우에만 인스턴스 생성
-                instance = ScheduleService._create_instance_dict(master_schedule, current_date)
-                instances.append(instance)
-
-            # 다음 반복 날짜 계산
-            current_date = ScheduleService._calculate_next_date(
-                current_date,
-                master_schedule.recurrence_type,
-                master_schedule.recurrence_interval
-            )
-
-        return instances
-
-    @staticmethod
-    def _calculate_next_date(current_date: date, recurrence_type: str, interval: int) -> date:
-        """다음 반복 날짜를 계산"""
-        if recurrence_type == 'daily':
-            return current_date + timedelta(days=interval)
-        elif recurrence_type == 'weekly':
-            return current_date + timedelta(weeks=interval)
-        elif recurrence_type == 'monthly':
-            # 월 단위 계산 (간단한 방식)
-            year = current_date.year
-            month = current_date.month + interval
-            while month > 12:
-                year += 1
-                month -= 12
-            return date(year, month, current_date.day)
-        else:
-            return current_date + timedelta(days=1)  # 기본값
+        return [
+            ScheduleService._create_instance_dict(master_schedule, instance_date)
+            for instance_date in ScheduleService.occurrence_dates(master_schedule, start_date, end_date)
+        ]
 
     @staticmethod
     def _create_instance_dict(master_schedule, instance_date: date) -> dict[str, Any]:
@@ -111,19 +123,19 @@ class ScheduleService:
         if not exceptions:
             return instances
 
-        # 예외를 날짜별로 그룹화
+        # 예외를 (마스터 일정, 날짜)별로 그룹화
         exception_map = {}
         for exception in exceptions:
             exception_date = exception.exception_date.date().isoformat()
-            exception_map[exception_date] = exception
+            exception_map[(exception.original_schedule_id, exception_date)] = exception
 
         # 각 인스턴스에 예외 적용
         result = []
         for instance in instances:
-            instance_date = instance['date']
+            key = (instance['master_schedule_id'], instance['date'])
 
-            if instance_date in exception_map:
-                exception = exception_map[instance_date]
+            if key in exception_map:
+                exception = exception_map[key]
 
                 if exception.is_deleted:
                     # 해당 날짜 삭제
@@ -172,80 +184,70 @@ class ScheduleService:
             end_date: 종료 날짜
             
         Returns:
-            해당 기간의 모든 일정 (개인일정 + 파티일정)
+            해당 기간의 모든 일정 (개인일정 + 파티일정), 조회 중 오류가 나면 빈 목록
         """
         try:
-            from models.schedule_models import PersonalSchedule, ScheduleException
-            all_instances = []
-
-            # 1. 개인일정 조회 및 처리
-            master_schedules = PersonalSchedule.query.filter(
-                PersonalSchedule.employee_id == employee_id,
-                PersonalSchedule.start_date <= datetime.combine(end_date, datetime.min.time())
-            ).all()
-
-            # 개인일정 예외들 조회
-            exceptions = ScheduleException.query.join(PersonalSchedule).filter(
-                PersonalSchedule.employee_id == employee_id,
-                ScheduleException.exception_date >= datetime.combine(start_date, datetime.min.time()),
-                ScheduleException.exception_date <= datetime.combine(end_date, datetime.max.time())
-            ).all()
-
-            # 각 마스터 일정에 대해 반복 인스턴스 계산
-            for master_schedule in master_schedules:
-                instances = ScheduleService.calculate_recurring_instances(
-                    master_schedule, start_date, end_date
-                )
-                all_instances.extend(instances)
-
-            # 개인일정 예외 적용
-            final_instances = ScheduleService.apply_exceptions(all_instances, exceptions)
-
-            # 2. 파티일정 조회 및 처리
-            from models.app_models import Party, PartyMember
-
-            # 사용자가 참여한 파티들 조회
-            parties = Party.query.join(PartyMember).filter(
-                PartyMember.employee_id == employee_id,
-                Party.party_date >= start_date.strftime('%Y-%m-%d'),
-                Party.party_date <= end_date.strftime('%Y-%m-%d')
-            ).all()
-
-            # 파티를 일정 형식으로 변환
-            for party in parties:
-                party_instance = {
-                    'id': f"party_{party.id}",
-                    'master_schedule_id': None,
-                    'date': party.party_date,
-                    'title': party.title,
-                    'time': party.party_time,
-                    'restaurant': party.restaurant_name,
-                    'location': party.meeting_location or '',
-                    'description': f"파티 (최대 {party.max_members}명, 현재 {party.current_members}명)",
-                    'employee_id': employee_id,
-                    'is_recurring': False,
-                    'recurrence_type': None,
-                    'recurrence_interval': None,
-                    'created_by': party.host_employee_id,
-                    'created_at': party.created_at.isoformat() if party.created_at else None,
-                    'type': 'party',  # 파티 구분을 위한 타입 추가
-                    'party_id': party.id,
-                    'current_members': party.current_members,
-                    'max_members': party.max_members
-                }
-                final_instances.append(party_instance)
-
-            # 3. 날짜별로 그룹화
-            grouped_schedules = ScheduleService._group_by_date(final_instances)
-
-            logger.info(f"일정 조회 완료: {employee_id}, {start_date} ~ {end_date}, 총 {len(final_instances)}개 인스턴스 (개인일정 + 파티)")
-
-            return grouped_schedules
-
+            return ScheduleService.query_schedules_for_period(employee_id, start_date, end_date)
         except Exception as e:
             logger.error(f"일정 조회 중 오류 발생: {e}")
             return []
 
+    @staticmethod
+    def query_schedules_for_period(
+        employee_id: str,
+        start_date: date,
+        end_date: date
+    ) -> list[dict[str, Any]]:
+        """
+        get_schedules_for_period와 같지만 조회 오류를 그대로 전달
+        (결과를 캐시하는 호출자가 일시적 오류를 빈 일정으로 저장하지 않도록)
+        """
+        from backend.services.schedule_materializer import ScheduleMaterializer
+
+        # 1. 개인일정 (구체화된 범위는 인덱스 범위 조회, 범위 밖은 규칙으로 계산)
+        final_instances = ScheduleMaterializer.get_instances(employee_id, start_date, end_date)
+
+        # 2. 파티일정 조회 및 처리
+        from backend.models.app_models import Party, PartyMember
+
+        # 사용자가 참여한 파티들 조회
+        parties = Party.query.join(PartyMember).filter(
+            PartyMember.employee_id == employee_id,
+            Party.party_date >= start_date,
+            Party.party_date <= end_date
+        ).all()
+
+        # 파티를 일정 형식으로 변환
+        for party in parties:
+            party_instance = {
+                'id': f"party_{party.id}",
+                'master_schedule_id': None,
+                'date': party.party_date.isoformat(),
+                'title': party.title,
+                'time': party.party_time.strftime('%H:%M') if party.party_time else None,
+                'restaurant': party.restaurant_name,
+                'location': party.meeting_location or '',
+                'description': f"파티 (최대 {party.max_members}명, 현재 {party.current_members}명)",
+                'employee_id': employee_id,
+                'is_recurring': False,
+                'recurrence_type': None,
+                'recurrence_interval': None,
+                'created_by': party.host_employee_id,
+                'created_at': party.created_at.isoformat() if party.created_at else None,
+                'type': 'party',  # 파티 구분을 위한 타입 추가
+                'party_id': party.id,
+                'current_members': party.current_members,
+                'max_members': party.max_members
+            }
+            final_instances.append(party_instance)
+
+        # 3. 날짜별로 그룹화
+        grouped_schedules = ScheduleService._group_by_date(final_instances)
+
+        logger.info(f"일정 조회 완료: {employee_id}, {start_date} ~ {end_date}, 총 {len(final_instances)}개 인스턴스 (개인일정 + 파티)")
+
+        return grouped_schedules
+
     @staticmethod
     def _group_by_date(instances: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """일정 인스턴스들을 날짜별로 그룹화"""
@@ -267,7 +269,7 @@ class ScheduleService:
     def create_master_schedule(schedule_data: dict[str, Any]):
         """마스터 일정 생성"""
         try:
-            from models.schedule_models import PersonalSchedule
+            from backend.models.schedule_models import PersonalSchedule
             schedule = PersonalSchedule(**schedule_data)
             db.session.add(schedule)
             db.session.commit()
@@ -284,7 +286,7 @@ class ScheduleService:
     def update_master_schedule(schedule_id: int, update_data: dict[str, Any]) -> bool:
         """마스터 일정 수정 (모든 반복 일정 수정)"""
         try:
-            from models.schedule_models import PersonalSchedule
+            from backend.models.schedule_models import PersonalSchedule
             schedule = PersonalSchedule.query.get(schedule_id)
             if not schedule:
                 return False
@@ -308,7 +310,7 @@ class ScheduleService:
     def delete_master_schedule(schedule_id: int) -> bool:
         """마스터 일정 삭제 (모든 반복 일정 삭제)"""
         try:
-            from models.schedule_models import PersonalSchedule
+            from backend.models.schedule_models import PersonalSchedule
             schedule = PersonalSchedule.query.get(schedule_id)
             if not schedule:
                 return False
@@ -332,7 +334,7 @@ class ScheduleService:
     ):
         """일정 예외 생성 (이 날짜만 수정/삭제)"""
         try:
-            from models.schedule_models import ScheduleException
+            from backend.models.schedule_models import ScheduleException
             exception = ScheduleException(
                 original_schedule_id=master_schedule_id,
                 exception_date=datetime.combine(exception_date, datetime.min.time()),
@@ -109,62 +109,25 @@ class BadgeSystem:
         return [badge for badge in all_badges if badge.category == category]
 
     @staticmethod
-    def check_badge_earned(user_id: str, badge: Badge) -> tuple[bool, int]:
-        """배지 획득 여부 및 진행률 확인"""
+    def check_badge_earned(user_id: str, badge: Badge, counts: dict[str, int] | None = None) -> tuple[bool, int]:
+        """
+        배지 획득 여부 및 진행률 확인
+
+        Args:
+            counts: 누적 진행 카운터 {활동 유형: 횟수} (여러 배지를 확인할 때 한 번만 조회하도록 전달)
+        """
         try:
-            from backend.models.app_models import UserActivity
-
-            # 사용자 활동 기록 조회
-            activities = UserActivity.query.filter_by(user_id=user_id).all()
-
-            # 요구사항에 따른 진행률 계산
-            progress = 0
-            if badge.requirement_type == "first_restaurant_visit":
-                progress = len([a for a in activities if a.activity_type == "first_restaurant_visit"])
-            elif badge.requirement_type == "restaurant_visit_count":
-                progress = len([a for a in activities if a.activity_type == "restaurant_visit"])
-            elif badge.requirement_type == "first_review":
-                progress = len([a for a in activities if a.activity_type == "first_review"])
-            elif badge.requirement_type == "review_count":
-                progress = len([a for a in activities if a.activity_type == "review_write"])
-            elif badge.requirement_type == "photo_review_count":
-                progress = len([a for a in activities if a.activity_type == "review_photo"])
-            elif badge.requirement_type == "keyword_count":
-                progress = len([a for a in activities if a.activity_type == "keyword_used"])
-            elif badge.requirement_type == "emotion_variety":
-                progress = len(set([a.description for a in activities if a.activity_type == "emotion_expression"]))
-            elif badge.requirement_type == "first_party":
-                progress = len([a for a in activities if a.activity_type == "first_party"])
-            elif badge.requirement_type == "party_count":
-                progress = len([a for a in activities if a.activity_type == "party_participate"])
-            elif badge.requirement_type == "party_create_count":
-                progress = len([a for a in activities if a.activity_type == "party_create"])
-            elif badge.requirement_type == "popular_party":
-                progress = len([a for a in activities if a.activity_type == "popular_party_create"])
-            elif badge.requirement_type == "first_random_lunch":
-                progress = len([a for a in activities if a.activity_type == "first_random_lunch"])
-            elif badge.requirement_type == "random_lunch_count":
-                progress = len([a for a in activities if a.activity_type == "random_lunch_participate"])
-            elif badge.requirement_type == "different_colleague_random_lunch":
-                progress = len(set([a.description for a in activities if a.activity_type == "random_lunch_participate"]))
-            elif badge.requirement_type == "korean_food_review_count":
-                progress = len([a for a in activities if a.activity_type == "korean_food_review"])
-            elif badge.requirement_type == "western_food_review_count":
-                progress = len([a for a in activities if a.activity_type == "western_food_review"])
-            elif badge.requirement_type == "chinese_food_review_count":
-                progress = len([a for a in activities if a.activity_type == "chinese_food_review"])
-            elif badge.requirement_type == "japanese_food_review_count":
-                progress = len([a for a in activities if a.activity_type == "japanese_food_review"])
-            elif badge.requirement_type == "cafe_review_count":
-                progress = len([a for a in activities if a.activity_type == "cafe_review"])
-            elif badge.requirement_type == "dessert_review_count":
-                progress = len([a for a in activities if a.activity_type == "dessert_review"])
-            elif badge.requirement_type == "friend_meal_count":
-                progress = len([a for a in activities if a.activity_type == "friend_meal"])
-            elif badge.requirement_type == "new_colleague_meal_count":
-                progress = len([a for a in activities if a.activity_type == "new_colleague_meal"])
-            elif badge.requirement_type == "junior_colleague_meal_count":
-                progress = len([a for a in activities if a.activity_type == "junior_colleague_meal"])
+            from backend.services.progress_counters import (
+                ALL_TIME,
+                ProgressCounterService,
+                requirement_progress,
+            )
+
+            if counts is None:
+                counts = ProgressCounterService.get_counts(user_id, [ALL_TIME])[ALL_TIME]
+
+            # 요구사항 유형 → 카운터 표(REQUIREMENT_COUNTERS)로 진행률 계산
+            progress = requirement_progress(counts, badge.requirement_type)
 
             # 배지 획득 여부 확인
             is_earned = progress >= badge.requirement_count
@@ -180,10 +143,14 @@ class BadgeSystem:
         """사용자의 배지 정보 반환"""
         try:
             from backend.models.app_models import UserBadge
+            from backend.services.progress_counters import ALL_TIME, ProgressCounterService
 
             # 사용자가 획득한 배지 조회
             user_badges = UserBadge.query.filter_by(user_id=user_id).all()
-            earned_badge_ids = [ub.badge_id for ub in user_badges]
+            earned_badge_ids = {str(ub.badge_id) for ub in user_badges}
+
+            # 모든 배지의 진행률을 누적 카운터 한 번 조회로 계산
+            counts = ProgressCounterService.get_counts(user_id, [ALL_TIME])[ALL_TIME]
 
             # 모든 배지 정보 가져오기
             all_badges = BadgeSystem.get_all_badges()
@@ -191,12 +158,12 @@ class BadgeSystem:
             # 사용자별 배지 정보 구성
             user_badge_info = []
             for badge in all_badges:
-                is_earned = badge.id in earned_badge_ids
+                is_earned = badge.badge_id in earned_badge_ids
                 progress = 0
 
                 if not is_earned:
                     # 미획득 배지의 경우 진행률 확인
-                    _, progress = BadgeSystem.check_badge_earned(user_id, badge)
+                    _, progress = BadgeSystem.check_badge_earned(user_id, badge, counts)
 
                 user_badge_info.append({
                     "id": badge.badge_id,
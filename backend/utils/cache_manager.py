@@ -214,6 +214,23 @@ class ChatCacheManager(CacheManager):
         key = f"unread_count:{user_id}:{chat_type}:{chat_id}"
         return self.get(key)
 
+    def cache_inbox(self, user_id: str, variant: str, page: dict, ttl: int = 300):
+        """사용자 채팅방 목록(inbox) 페이지 캐시 (조회 조건별로 한 키에 보관)"""
+        key = f"inbox:{user_id}"
+        pages = self.get(key) or {}
+        pages[variant] = page
+        return self.set(key, pages, ttl)
+
+    def get_cached_inbox(self, user_id: str, variant: str) -> dict | None:
+        """캐시된 채팅방 목록 페이지 조회"""
+        pages = self.get(f"inbox:{user_id}")
+        return pages.get(variant) if pages else None
+
+    def invalidate_inbox(self, *user_ids: str):
+        """사용자 채팅방 목록 캐시 무효화"""
+        for user_id in user_ids:
+            self.delete(f"inbox:{user_id}")
+
     def invalidate_chat_cache(self, chat_type: str, chat_id: int):
         """채팅 관련 캐시 무효화"""
         patterns = [
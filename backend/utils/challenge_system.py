@@ -45,6 +45,39 @@ class Challenge:
         else:  # SPECIAL
             self.expires_at = self.created_at + timedelta(days=30)  # 기본 30일
 
+        # 타입에 따른 시작 시간 설정 (SPECIAL은 생성 시점부터)
+        day_start = self.created_at.replace(hour=0, minute=0, second=0, microsecond=0)
+        if type == ChallengeType.DAILY:
+            self.start_date = day_start
+        elif type == ChallengeType.WEEKLY:
+            self.start_date = day_start - timedelta(days=self.created_at.weekday())
+        elif type == ChallengeType.MONTHLY:
+            self.start_date = day_start.replace(day=1)
+        else:
+            self.start_date = self.created_at
+
+    @property
+    def challenge_id(self) -> str:
+        return self.id
+
+    @property
+    def challenge_type(self) -> ChallengeType:
+        return self.type
+
+    @property
+    def end_date(self) -> datetime:
+        return self.expires_at
+
+    def requirement_items(self) -> list[tuple[str, int]]:
+        """요구사항 목록 [(요구사항 유형, 필요 횟수)] ({"action", "count"} 형식도 지원)"""
+        if "action" in self.requirements:
+            return [(self.requirements["action"], self.requirements.get("count", 1))]
+        return list(self.requirements.items())
+
+    @property
+    def requirement_count(self) -> int:
+        return sum(count for _, count in self.requirement_items())
+
 class ChallengeSystem:
     """챌린지 시스템 관리 클래스"""
 
@@ -269,89 +302,86 @@ class ChallengeSystem:
         """특별 미션 목록 반환 (상시 진행)"""
         challenges = [
             Challenge(
-                "special_first_visit", "첫 발걸음", "첫 식당 방문",
-                ChallengeType.SPECIAL, 100, {"first_restaurant_visit": 1},
-                datetime.min, datetime.max
+                id="special_first_visit",
+                name="첫 발걸음",
+                description="첫 식당 방문",
+                points=100,
+                type=ChallengeType.SPECIAL,
+                requirements={"first_restaurant_visit": 1},
+                category="탐험"
             ),
             Challenge(
-                "special_first_review", "첫 이야기", "첫 리뷰 작성",
-                ChallengeType.SPECIAL, 80, {"first_review": 1},
-                datetime.min, datetime.max
+                id="special_first_review",
+                name="첫 이야기",
+                description="첫 리뷰 작성",
+                points=80,
+                type=ChallengeType.SPECIAL,
+                requirements={"first_review": 1},
+                category="리뷰"
             ),
             Challenge(
-                "special_first_party", "첫 만남", "첫 파티 참여",
-                ChallengeType.SPECIAL, 120, {"first_party": 1},
-                datetime.min, datetime.max
+                id="special_first_party",
+                name="첫 만남",
+                description="첫 파티 참여",
+                points=120,
+                type=ChallengeType.SPECIAL,
+                requirements={"first_party": 1},
+                category="소통"
             ),
             Challenge(
-                "special_first_random_lunch", "첫 도전", "첫 랜덤런치",
-                ChallengeType.SPECIAL, 150, {"first_random_lunch": 1},
-                datetime.min, datetime.max
+                id="special_first_random_lunch",
+                name="첫 도전",
+                description="첫 랜덤런치",
+                points=150,
+                type=ChallengeType.SPECIAL,
+                requirements={"first_random_lunch": 1},
+                category="소통"
             ),
             Challenge(
-                "special_friend_invite", "친구 초대", "친구 초대하기",
-                ChallengeType.SPECIAL, 200, {"friend_invite": 1},
-                datetime.min, datetime.max
+                id="special_friend_invite",
+                name="친구 초대",
+                description="친구 초대하기",
+                points=200,
+                type=ChallengeType.SPECIAL,
+                requirements={"friend_invite": 1},
+                category="소통"
             )
         ]
 
         return challenges
 
     @staticmethod
-    def check_challenge_progress(user_id: str, challenge: Challenge) -> tuple[int, bool]:
-        """챌린지 진행률 확인"""
+    def get_progress_counts(user_id: str) -> dict[str, dict[str, int]]:
+        """현재 일/주/월/누적 기간의 진행 카운터 (한 번의 조회)"""
+        from backend.services.progress_counters import ProgressCounterService, period_keys
+
+        return ProgressCounterService.get_counts(user_id, period_keys(ProgressCounterService.now()))
+
+    @staticmethod
+    def check_challenge_progress(user_id: str, challenge: Challenge,
+                                 counts: dict[str, dict[str, int]] | None = None) -> tuple[int, bool]:
+        """
+        챌린지 진행률 확인
+
+        Args:
+            counts: get_progress_counts() 결과 (여러 챌린지를 확인할 때 한 번만 조회하도록 전달)
+        """
         try:
-            from backend.models.app_models import UserActivity
+            from backend.services.progress_counters import ProgressCounterService, requirement_progress
 
-            # 챌린지 기간 내 활동 확인
-            activities = UserActivity.query.filter(
-                UserActivity.user_id == user_id,
-                UserActivity.created_at >= challenge.start_date,
-                UserActivity.created_at < challenge.end_date
-            ).all()
+            if counts is None:
+                counts = ChallengeSystem.get_progress_counts(user_id)
 
-            # 요구사항에 따른 진행률 계산
-            progress = 0
-            for requirement_type, required_count in challenge.requirements.items():
-                if requirement_type == "review_count":
-                    progress = len([a for a in activities if a.activity_type == "review_write"])
-                elif requirement_type == "photo_review_count":
-                    progress = len([a for a in activities if a.activity_type == "review_photo"])
-                elif requirement_type == "social_activity_count":
-                    progress = len([a for a in activities if a.activity_type in ["party_participate", "random_lunch_participate"]])
-                elif requirement_type == "friend_meal_count":
-                    progress = len([a for a in activities if a.activity_type == "friend_meal"])
-                elif requirement_type == "new_food_review_count":
-                    progress = len([a for a in activities if a.activity_type == "new_food_review"])
-                elif requirement_type == "different_time_meal":
-                    progress = len([a for a in activities if a.activity_type == "different_time_meal"])
-                elif requirement_type == "different_restaurant":
-                    progress = len([a for a in activities if a.activity_type == "different_restaurant"])
-                elif requirement_type == "party_participate_count":
-                    progress = len([a for a in activities if a.activity_type == "party_participate"])
-                elif requirement_type == "review_write_count":
-                    progress = len([a for a in activities if a.activity_type == "review_write"])
-                elif requirement_type == "random_lunch_count":
-                    progress = len([a for a in activities if a.activity_type == "random_lunch_participate"])
-                elif requirement_type == "new_colleague_meal":
-                    progress = len([a for a in activities if a.activity_type == "new_colleague_meal"])
-                elif requirement_type == "different_restaurant_count":
-                    progress = len([a for a in activities if a.activity_type == "different_restaurant"])
-                elif requirement_type == "different_colleague_count":
-                    progress = len([a for a in activities if a.activity_type == "different_colleague_meal"])
-                elif requirement_type == "first_restaurant_visit":
-                    progress = len([a for a in activities if a.activity_type == "first_restaurant_visit"])
-                elif requirement_type == "first_review":
-                    progress = len([a for a in activities if a.activity_type == "first_review"])
-                elif requirement_type == "first_party":
-                    progress = len([a for a in activities if a.activity_type == "first_party"])
-                elif requirement_type == "first_random_lunch":
-                    progress = len([a for a in activities if a.activity_type == "first_random_lunch"])
-                elif requirement_type == "friend_invite":
-                    progress = len([a for a in activities if a.activity_type == "friend_invite"])
+            # 챌린지 기간(일/주/월/누적)의 카운터로 요구사항별 진행률 계산
+            period = ProgressCounterService.current_period(challenge.type.value)
+            period_counts = counts.get(period, {})
 
-            # 완료 여부 확인
-            is_completed = progress >= required_count
+            progress = 0
+            is_completed = True
+            for requirement_type, required_count in challenge.requirement_items():
+                current = requirement_progress(period_counts, requirement_type)
+                progress += min(current, required_count)
+                is_completed = is_completed and current >= required_count
 
             return progress, is_completed
 
@@ -22,6 +22,15 @@ def format_korean_time(dt):
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
+def to_date_key(value):
+    """date/datetime/'YYYY-MM-DD' 문자열을 'YYYY-MM-DD' 날짜 키로 변환"""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d").date().isoformat()
+
+
 def get_next_recurrence_date(current_date, recurrence_type, interval=1):
     """반복 일정의 다음 날짜 계산"""
     if not isinstance(current_date, date):
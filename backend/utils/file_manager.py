@@ -4,12 +4,19 @@
 """
 
 import os
-import uuid
+import re
 import hashlib
+import time
+import tempfile
 import mimetypes
+from contextlib import contextmanager
 from datetime import datetime
-from PIL import Image
 from werkzeug.utils import secure_filename
+try:
+    import fcntl
+except ImportError:
+    # Windows에는 fcntl이 없어 파일 잠금 없이 동작 (단일 프로세스 개발 환경)
+    fcntl = None
 try:
     import magic
 except ImportError:
@@ -20,6 +27,16 @@ except ImportError:
 class FileManager:
     """파일 관리 클래스"""
 
+    # 업로드 스트림을 한 번에 읽는 크기
+    CHUNK_SIZE = 1024 * 1024
+    # MIME 타입 판별에 쓰는 앞부분 크기
+    SNIFF_SIZE = 2048
+    # 재개 가능한 업로드 ID (임시 파일 이름으로 쓰이므로 경로 문자 금지)
+    UPLOAD_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{8,64}$')
+    # 내용 해시 잠금 대기 (eventlet 허브를 막지 않도록 잠들며 다시 시도)
+    BLOB_LOCK_TIMEOUT = 10
+    BLOB_LOCK_POLL_INTERVAL = 0.01
+
     def __init__(self, upload_folder='uploads', max_file_size=10*1024*1024):  # 10MB
         self.upload_folder = upload_folder
         self.max_file_size = max_file_size
@@ -41,6 +58,11 @@ class FileManager:
         # 업로드 폴더 생성
         self._create_upload_folders()
 
+    @property
+    def variants_folder(self):
+        """이미지 변형(썸네일, 중간 크기, WebP) 저장 위치 (backend/services/image_variants.py)"""
+        return os.path.join(self.upload_folder, 'blobs', 'variants')
+
     def _create_upload_folders(self):
         """업로드 폴더 구조 생성"""
         folders = [
@@ -51,6 +73,8 @@ class FileManager:
             os.path.join(self.upload_folder, 'videos'),
             os.path.join(self.upload_folder, 'audio'),
             os.path.join(self.upload_folder, 'archives'),
+            os.path.join(self.upload_folder, 'blobs'),
+            self.variants_folder,
             os.path.join(self.upload_folder, 'temp')
         ]
 
@@ -67,155 +91,327 @@ class FileManager:
 
         return 'unknown'
 
-    def _generate_unique_filename(self, original_filename):
-        """고유한 파일명 생성"""
-        ext = os.path.splitext(original_filename)[1].lower()
-        unique_id = str(uuid.uuid4())
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return f"{timestamp}_{unique_id}{ext}"
+    def _detect_mime_type(self, head, filename):
+        """앞부분 바이트로 MIME 타입 판별 (python-magic이 없으면 파일명 기준)"""
+        if magic:
+            return magic.from_buffer(head, mime=True)
+        mime_type, _ = mimetypes.guess_type(filename)
+        return mime_type or 'application/octet-stream'
+
+    def _validate_mime_type(self, mime_type, file_type):
+        """파일 타입별 허용 MIME 타입 검증"""
+        type_names = {
+            'image': '이미지',
+            'document': '문서',
+            'video': '비디오',
+            'audio': '오디오',
+            'archive': '압축 파일'
+        }
+        if mime_type not in self.allowed_mime_types.get(file_type, set()):
+            return False, f"지원하지 않는 {type_names.get(file_type, '파일')} 형식입니다."
+        return True, "파일이 유효합니다."
 
-    def _validate_file(self, file, file_type):
-        """파일 유효성 검증"""
-        # 파일 크기 검증
-        if len(file.read()) > self.max_file_size:
-            file.seek(0)  # 파일 포인터 리셋
-            return False, "파일 크기가 너무 큽니다. (최대 10MB)"
+    def _size_limit_message(self):
+        return f"파일 크기가 너무 큽니다. (최대 {self.max_file_size // (1024 * 1024)}MB)"
 
-        file.seek(0)  # 파일 포인터 리셋
+    def _receive_stream(self, stream, filename, file_type):
+        """
+        업로드 스트림을 한 번만 읽으면서 크기 제한 확인, SHA-256 계산, 임시 파일 기록을 함께 수행
 
-        # MIME 타입 검증
+        Returns:
+            ({'temp_path', 'content_hash', 'file_size', 'mime_type'}, 메시지) - 실패 시 (None, 오류 메시지)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        mime_type = None
+        fd, temp_path = tempfile.mkstemp(dir=os.path.join(self.upload_folder, 'temp'), suffix='.upload')
         try:
-            if magic:
-                mime_type = magic.from_buffer(file.read(1024), mime=True)
-            else:
-                # magic 모듈이 없는 경우 mimetypes 사용
-                file.seek(0)
-                mime_type, _ = mimetypes.guess_type(file.filename)
-                if not mime_type:
-                    mime_type = 'application/octet-stream'
-            file.seek(0)
-
-            if file_type == 'image' and mime_type not in self.allowed_mime_types['image']:
-                return False, "지원하지 않는 이미지 형식입니다."
-            elif file_type == 'document' and mime_type not in self.allowed_mime_types['document']:
-                return False, "지원하지 않는 문서 형식입니다."
-            elif file_type == 'video' and mime_type not in self.allowed_mime_types['video']:
-                return False, "지원하지 않는 비디오 형식입니다."
-            elif file_type == 'audio' and mime_type not in self.allowed_mime_types['audio']:
-                return False, "지원하지 않는 오디오 형식입니다."
-            elif file_type == 'archive' and mime_type not in self.allowed_mime_types['archive']:
-                return False, "지원하지 않는 압축 파일 형식입니다."
+            with os.fdopen(fd, 'wb') as out:
+                while True:
+                    chunk = stream.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if mime_type is None:
+                        # 첫 조각에서 형식을 확인해 허용되지 않는 파일은 끝까지 받지 않음
+                        mime_type = self._detect_mime_type(chunk[:self.SNIFF_SIZE], filename)
+                        is_valid, message = self._validate_mime_type(mime_type, file_type)
+                        if not is_valid:
+                            raise ValueError(message)
+                    size += len(chunk)
+                    if size > self.max_file_size:
+                        raise ValueError(self._size_limit_message())
+                    digest.update(chunk)
+                    out.write(chunk)
+
+            if mime_type is None:
+                raise ValueError("빈 파일은 업로드할 수 없습니다.")
 
         except Exception as e:
-            return False, f"파일 검증 중 오류가 발생했습니다: {str(e)}"
-
-        return True, "파일이 유효합니다."
-
-    def _create_thumbnail(self, image_path, thumbnail_path, size=(200, 200)):
-        """이미지 썸네일 생성"""
+            self._discard(temp_path)
+            if isinstance(e, ValueError):
+                return None, str(e)
+            return None, f"파일 수신 중 오류가 발생했습니다: {str(e)}"
+
+        return {
+            'temp_path': temp_path,
+            'content_hash': digest.hexdigest(),
+            'file_size': size,
+            'mime_type': mime_type
+        }, "파일이 유효합니다."
+
+    def _discard(self, path):
         try:
-            with Image.open(image_path) as img:
-                # 이미지 회전 정보 처리
-                if hasattr(img, '_getexif'):
-                    exif = img._getexif()
-                    if exif is not None:
-                        orientation = exif.get(0x0112)
-                        if orientation == 3:
-                            img = img.rotate(180, expand=True)
-                        elif orientation == 6:
-                            img = img.rotate(270, expand=True)
-                        elif orientation == 8:
-                            img = img.rotate(90, expand=True)
-
-                # 썸네일 생성
-                img.thumbnail(size, Image.Resampling.LANCZOS)
-
-                # RGB 모드로 변환 (PNG 투명도 처리)
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                    img = background
-
-                img.save(thumbnail_path, 'JPEG', quality=85, optimize=True)
-                return True
-        except Exception as e:
-            print(f"썸네일 생성 실패: {e}")
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _blob_path(self, content_hash, mime_type, filename):
+        """내용 해시 기반 저장 경로 (uploads/blobs/ab/cd/<sha256>.<확장자>)"""
+        ext = mimetypes.guess_extension(mime_type) or os.path.splitext(filename)[1].lower()
+        return os.path.join(self.upload_folder, 'blobs', content_hash[:2], content_hash[2:4], f"{content_hash}{ext}")
+
+    @staticmethod
+    def _try_lock(file):
+        """열린 파일에 배타 잠금 시도 (기다리지 않음, 닫으면 풀림)"""
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
             return False
 
+    @contextmanager
+    def blob_lock(self, content_hash):
+        """
+        같은 내용 해시의 저장과 삭제를 직렬화하는 잠금 (워커 프로세스 간 공유)
+        잠금 파일은 해시 앞 두 글자로 나눠 씁니다.
+        """
+        if not content_hash:
+            yield
+            return
+
+        lock_folder = os.path.join(self.upload_folder, 'locks')
+        os.makedirs(lock_folder, exist_ok=True)
+        with open(os.path.join(lock_folder, f"{content_hash[:2]}.lock"), 'a') as lock_file:
+            deadline = time.monotonic() + self.BLOB_LOCK_TIMEOUT
+            while not self._try_lock(lock_file):
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"파일 잠금을 얻지 못했습니다: {content_hash}")
+                time.sleep(self.BLOB_LOCK_POLL_INTERVAL)
+            yield
+
+    def _store_blob(self, received, original_filename, file_type, user_id):
+        """
+        받은 임시 파일의 내용 해시 저장 경로 결정
+        파일은 첨부파일 행을 커밋한 뒤 finalize_blob()이 옮깁니다. 그 사이 같은 내용의 마지막 첨부파일이
+        삭제돼도 임시 파일로 저장소를 되살릴 수 있도록 임시 파일을 남겨 둡니다.
+        """
+        content_hash = received['content_hash']
+        blob_path = self._blob_path(content_hash, received['mime_type'], original_filename)
+        deduplicated = os.path.exists(blob_path)
+
+        # 이미지 변형은 요청 밖에서 내용마다 한 번만 생성 (이미 있으면 바로 사용)
+        thumbnail_path = None
+        variant_status = None
+        if file_type == 'image':
+            from backend.services.image_variants import PENDING, READY, variant_path, variants_ready
+
+            thumbnail_path = variant_path(self.variants_folder, content_hash, 'thumb')
+            variant_status = READY if variants_ready(self.variants_folder, content_hash) else PENDING
+
+        file_metadata = {
+            'original_filename': original_filename,
+            'unique_filename': os.path.basename(blob_path),
+            'file_path': blob_path,
+            'thumbnail_path': thumbnail_path,
+            'file_size': received['file_size'],
+            'file_type': file_type,
+            'mime_type': received['mime_type'],
+            'file_hash': content_hash,
+            'variant_status': variant_status,
+            'deduplicated': deduplicated,
+            'temp_path': received['temp_path'],
+            'uploaded_by': user_id,
+            'uploaded_at': datetime.utcnow().isoformat(),
+            'is_processed': True
+        }
+        if deduplicated:
+            return file_metadata, "파일이 성공적으로 업로드되었습니다. (같은 파일 재사용)"
+        return file_metadata, "파일이 성공적으로 업로드되었습니다."
+
     def upload_file(self, file, file_type='image', user_id=None):
-        """파일 업로드"""
+        """파일 업로드 (스트리밍으로 한 번만 읽고, 같은 내용은 한 번만 저장)"""
         try:
             # 파일명 보안 처리
             original_filename = secure_filename(file.filename)
             if not original_filename:
                 return None, "유효하지 않은 파일명입니다."
 
-            # 파일 유효성 검증
-            is_valid, message = self._validate_file(file, file_type)
-            if not is_valid:
+            if file_type not in self.allowed_extensions:
+                return None, "지원하지 않는 파일 타입입니다."
+
+            received, message = self._receive_stream(file.stream, original_filename, file_type)
+            if not received:
                 return None, message
 
-            # 고유한 파일명 생성
-            unique_filename = self._generate_unique_filename(original_filename)
-
-            # 파일 타입별 저장 경로 결정
-            if file_type == 'image':
-                save_path = os.path.join(self.upload_folder, 'images', unique_filename)
-                thumbnail_path = os.path.join(self.upload_folder, 'images', 'thumbnails', f"thumb_{unique_filename}")
-            elif file_type == 'document':
-                save_path = os.path.join(self.upload_folder, 'documents', unique_filename)
-                thumbnail_path = None
-            elif file_type == 'video':
-                save_path = os.path.join(self.upload_folder, 'videos', unique_filename)
-                thumbnail_path = None
-            elif file_type == 'audio':
-                save_path = os.path.join(self.upload_folder, 'audio', unique_filename)
-                thumbnail_path = None
-            elif file_type == 'archive':
-                save_path = os.path.join(self.upload_folder, 'archives', unique_filename)
-                thumbnail_path = None
+            return self._store_blob(received, original_filename, file_type, user_id)
+
+        except Exception as e:
+            return None, f"파일 업로드 중 오류가 발생했습니다: {str(e)}"
+
+    def finalize_blob(self, file_metadata):
+        """
+        첨부파일 행을 커밋한 뒤 임시 파일을 저장소로 옮김 (같은 내용이 이미 있으면 임시 파일만 삭제)
+        삭제와 같은 해시 잠금 안에서 확인하므로, 행 커밋 전에 저장소가 삭제됐다면 여기서 되살립니다.
+        """
+        temp_path = file_metadata.pop('temp_path', None)
+        if not temp_path:
+            return
+
+        blob_path = file_metadata['file_path']
+        with self.blob_lock(file_metadata['file_hash']):
+            if os.path.exists(blob_path):
+                self._discard(temp_path)
             else:
-                return None, "지원하지 않는 파일 타입입니다."
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.replace(temp_path, blob_path)
 
-            # 파일 저장
-            file.save(save_path)
-
-            # 파일 해시 생성
-            file_hash = self._generate_file_hash(save_path)
-
-            # 이미지인 경우 썸네일 생성
-            if file_type == 'image' and thumbnail_path:
-                self._create_thumbnail(save_path, thumbnail_path)
-
-            # 파일 메타데이터 생성
-            file_metadata = {
-                'original_filename': original_filename,
-                'unique_filename': unique_filename,
-                'file_path': save_path,
-                'thumbnail_path': thumbnail_path,
-                'file_size': os.path.getsize(save_path),
-                'file_type': file_type,
-                'mime_type': mimetypes.guess_type(save_path)[0],
-                'file_hash': file_hash,
-                'uploaded_by': user_id,
-                'uploaded_at': datetime.utcnow().isoformat(),
-                'is_processed': True
-            }
+    def schedule_variants(self, file_metadata):
+        """업로드한 이미지의 변형 생성을 요청 밖으로 예약 (첨부파일 행을 커밋한 뒤 호출)"""
+        from backend.services.image_variants import PENDING, image_variants
+
+        if file_metadata.get('variant_status') != PENDING:
+            return None
+        return image_variants.enqueue(file_metadata['file_hash'], file_metadata['file_path'], self.variants_folder)
+
+    def _part_path(self, upload_id):
+        return os.path.join(self.upload_folder, 'temp', f"{upload_id}.part")
 
-            return file_metadata, "파일이 성공적으로 업로드되었습니다."
+    def _done_path(self, upload_id):
+        return os.path.join(self.upload_folder, 'temp', f"{upload_id}.done")
+
+    def _completed_size(self, upload_id):
+        """완료 표시가 남은 업로드의 전체 크기 (완료되지 않았으면 None)"""
+        try:
+            with open(self._done_path(upload_id)) as f:
+                return int(f.read() or 0)
+        except FileNotFoundError:
+            return None
+
+    def get_upload_offset(self, upload_id):
+        """재개 가능한 업로드에서 지금까지 받은 바이트 수 (잘못된 ID면 None)"""
+        if not self.UPLOAD_ID_PATTERN.match(upload_id or ''):
+            return None
+        completed = self._completed_size(upload_id)
+        if completed is not None:
+            return completed
+        try:
+            return os.path.getsize(self._part_path(upload_id))
+        except FileNotFoundError:
+            return 0
+
+    def append_upload_chunk(self, upload_id, offset, stream, filename, total_size,
+                            file_type='image', user_id=None):
+        """
+        재개 가능한 업로드 조각 추가
+        offset이 지금까지 받은 크기와 같을 때만 이어 붙이고, 마지막 조각을 받으면 내용 해시 저장소로 옮깁니다.
+
+        Returns:
+            ({'upload_id', 'received', 'complete', 'file_metadata'}, 메시지) - 실패 시 (None, 오류 메시지)
+            위치가 어긋나면 ({'upload_id', 'received', 'conflict': True}, 메시지) - received부터 다시 보내면 됨
+            이미 완료된 업로드면 ({'upload_id', 'received', 'conflict': True, 'complete': True}, 메시지)
+        """
+        try:
+            original_filename = secure_filename(filename or '')
+            received = self.get_upload_offset(upload_id)
+            if received is None:
+                return None, "유효하지 않은 업로드 ID입니다."
+            if not original_filename:
+                return None, "유효하지 않은 파일명입니다."
+            if file_type not in self.allowed_extensions:
+                return None, "지원하지 않는 파일 타입입니다."
+            if total_size <= 0:
+                return None, "파일 크기가 올바르지 않습니다."
+            if total_size > self.max_file_size:
+                return None, self._size_limit_message()
+            # 응답을 못 받은 마지막 조각을 다시 보내도 첨부파일이 또 생기지 않도록 완료된 업로드는 충돌로 응답
+            if self._completed_size(upload_id) is not None:
+                return self._already_complete(upload_id, received)
+            if offset != received:
+                return self._offset_conflict(upload_id, received)
+
+            part_path = self._part_path(upload_id)
+            with open(part_path, 'ab') as out:
+                # 같은 조각이 동시에 다시 오면 먼저 잠근 요청만 이어 붙이고, 위치는 잠근 뒤 다시 확인
+                # (기다리면 eventlet 허브가 멈추므로 잠겨 있으면 바로 충돌로 응답)
+                if not self._try_lock(out):
+                    return self._offset_conflict(upload_id, received)
+                completed = self._completed_size(upload_id)
+                if completed is not None:
+                    return self._already_complete(upload_id, completed)
+                received = os.fstat(out.fileno()).st_size
+                if offset != received:
+                    return self._offset_conflict(upload_id, received)
+
+                while received < total_size:
+                    chunk = stream.read(min(self.CHUNK_SIZE, total_size - received))
+                    if not chunk:
+                        break
+                    if received == 0:
+                        # 첫 조각에서 형식을 확인해 허용되지 않는 파일은 받지 않음
+                        mime_type = self._detect_mime_type(chunk[:self.SNIFF_SIZE], original_filename)
+                        is_valid, message = self._validate_mime_type(mime_type, file_type)
+                        if not is_valid:
+                            out.close()
+                            self._discard(part_path)
+                            return None, message
+                    out.write(chunk)
+                    received += len(chunk)
+
+                if received >= total_size:
+                    # 잠금을 풀기 전에 완료를 표시해 이후 재전송은 모두 완료 충돌이 됨 (임시 파일 정리 때 함께 삭제)
+                    with open(self._done_path(upload_id), 'w') as done:
+                        done.write(str(received))
+
+            result = {'upload_id': upload_id, 'received': received, 'complete': received >= total_size}
+            if not result['complete']:
+                return result, "조각을 받았습니다."
+
+            # 마지막 조각: 조립된 파일을 한 번 읽어 해시를 계산 (저장소로는 finalize_blob()이 이동)
+            content_hash, head = self._hash_file(part_path)
+            file_metadata, message = self._store_blob({
+                'temp_path': part_path,
+                'content_hash': content_hash,
+                'file_size': received,
+                'mime_type': self._detect_mime_type(head, original_filename)
+            }, original_filename, file_type, user_id)
+            result['file_metadata'] = file_metadata
+            return result, message
 
         except Exception as e:
             return None, f"파일 업로드 중 오류가 발생했습니다: {str(e)}"
 
-    def _generate_file_hash(self, file_path):
-        """파일 해시 생성"""
-        hash_md5 = hashlib.md5()
+    @staticmethod
+    def _offset_conflict(upload_id, received):
+        return {'upload_id': upload_id, 'received': received, 'conflict': True}, \
+            "업로드 위치가 맞지 않습니다. 받은 위치부터 다시 보내주세요."
+
+    @staticmethod
+    def _already_complete(upload_id, received):
+        return {'upload_id': upload_id, 'received': received, 'conflict': True, 'complete': True}, \
+            "이미 완료된 업로드입니다."
+
+    def _hash_file(self, file_path):
+        """파일 SHA-256 해시와 앞부분 바이트"""
+        digest = hashlib.sha256()
+        head = b''
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                if not head:
+                    head = chunk[:self.SNIFF_SIZE]
+                digest.update(chunk)
+        return digest.hexdigest(), head
 
     def delete_file(self, file_path):
         """파일 삭제"""
@@ -247,24 +443,18 @@ class FileManager:
             return None
 
     def cleanup_temp_files(self, max_age_hours=24):
-        """임시 파일 정리"""
-        try:
-            temp_folder = os.path.join(self.upload_folder, 'temp')
-            if not os.path.exists(temp_folder):
-                return
-
-            current_time = datetime.now().timestamp()
-            max_age_seconds = max_age_hours * 3600
-
-            for filename in os.listdir(temp_folder):
-                file_path = os.path.join(temp_folder, filename)
-                if os.path.isfile(file_path):
-                    file_age = current_time - os.path.getctime(file_path)
-                    if file_age > max_age_seconds:
-                        os.remove(file_path)
-                        print(f"임시 파일 삭제: {filename}")
-        except Exception as e:
-            print(f"임시 파일 정리 중 오류: {e}")
+        """임시 파일 정리 (삭제 파일 수와 회수 크기 반환)"""
+        from datetime import timedelta
+        from backend.services.retention import RetentionService
+
+        result = RetentionService.purge_temp_files(
+            os.path.join(self.upload_folder, 'temp'), timedelta(hours=max_age_hours)
+        )
+        if 'error' in result:
+            print(f"임시 파일 정리 중 오류: {result['error']}")
+        elif result['rows']:
+            print(f"임시 파일 {result['rows']}개 삭제 ({result['bytes']}바이트)")
+        return result
 
     def get_storage_info(self):
         """저장소 정보 조회"""
@@ -99,7 +99,8 @@ class FriendInviteSystem:
                 user_id=invitee_id,
                 activity_type="friend_invite",
                 points=50,
-                description="친구 초대 보상"
+                description="친구 초대 보상",
+                idempotency_key=f"friend_invite:{invitee_id}:invitee"
             )
 
             if success:
@@ -110,7 +111,8 @@ class FriendInviteSystem:
                         user_id=inviter_id,
                         activity_type="friend_invite",
                         points=50,
-                        description="친구 초대 성공 보상"
+                        description="친구 초대 성공 보상",
+                        idempotency_key=f"friend_invite:{invitee_id}:inviter"
                     )
 
                 return True
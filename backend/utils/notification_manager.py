@@ -4,13 +4,29 @@
 """
 
 from datetime import datetime, timedelta
+from sqlalchemy import insert, select
 from backend.app.extensions import db
 from backend.models.app_models import ChatNotification, NotificationSettings
-from flask_socketio import emit
+from backend.realtime.fanout import emit_to_user, emit_to_users
+from backend.realtime.presence import presence
 
 class NotificationManager:
     """알림 관리 클래스"""
 
+    # 알림 타입별 사용자 설정 필드 (목록에 없는 타입은 항상 전송)
+    PREFERENCE_FIELDS = {
+        'new_message': 'message_notifications',
+        'mention': 'mention_notifications',
+        'reaction': 'chat_notifications',
+        'chat_invite': 'chat_notifications',
+        'chat_leave': 'chat_notifications',
+        'system': 'chat_notifications',
+    }
+    # 대량 알림을 요청 밖에서 처리하는 Celery 태스크 (backend/app/celery_config.py)
+    BULK_TASK_NAME = 'celery_config.send_bulk_notification_task'
+    # 수신자 설정 조회 시 IN 절에 넣는 최대 사용자 수
+    SETTINGS_CHUNK_SIZE = 500
+
     def __init__(self, socketio=None):
         self.socketio = socketio
         self.notification_types = {
@@ -89,17 +105,15 @@ class NotificationManager:
 
     def _should_send_notification(self, settings, notification_type):
         """알림 전송 여부 확인"""
-        if notification_type == 'new_message':
-            return settings.message_notifications
-        elif notification_type == 'mention':
-            return settings.mention_notifications
-        elif notification_type in ['reaction', 'chat_invite', 'chat_leave', 'system']:
-            return settings.chat_notifications
-        return True
+        field = self.PREFERENCE_FIELDS.get(notification_type)
+        if field is None:
+            return True
+        return getattr(settings, field)
 
     def _send_realtime_notification(self, notification):
-        """실시간 알림 전송"""
-        if not self.socketio:
+        """실시간 알림 전송 (어느 워커에 연결된 세션이든 메시지 큐를 통해 전달)"""
+        # 접속 중이 아니면 저장된 알림으로 다음 접속 시 조회
+        if not presence.is_online(notification.user_id):
             return
 
         try:
@@ -120,11 +134,11 @@ class NotificationManager:
             }
 
             # 사용자에게 직접 전송
-            emit('new_notification', notification_data, room=f"user_{notification.user_id}")
+            emit_to_user(notification.user_id, 'new_notification', notification_data)
 
             # 긴급 알림인 경우 추가 처리
             if self.notification_types.get(notification.notification_type, {}).get('priority') == 'high':
-                emit('urgent_notification', notification_data, room=f"user_{notification.user_id}")
+                emit_to_user(notification.user_id, 'urgent_notification', notification_data)
 
         except Exception as e:
             print(f"실시간 알림 전송 실패: {e}")
@@ -307,61 +321,145 @@ class NotificationManager:
             return None, f"알림 설정 조회 중 오류가 발생했습니다: {str(e)}"
 
     def cleanup_expired_notifications(self, days=30):
-        """만료된 알림 정리"""
-        try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days)
-
-            # 만료된 알림 삭제
-            expired_notifications = ChatNotification.query.filter(
-                ChatNotification.expires_at.isnot(None),
-                ChatNotification.expires_at < datetime.utcnow()
+        """만료된 알림 정리 (보존 정책으로 묶음 단위 삭제)"""
+        from backend.services.retention import POLICIES, RetentionService
+
+        # 오래된 읽은 알림, 기한이 지난 알림
+        results = [
+            RetentionService.purge(POLICIES['read_notifications'], max_age=timedelta(days=days)),
+            RetentionService.purge(POLICIES['stale_notifications']),
+        ]
+        total_deleted = sum(result['rows'] for result in results)
+        errors = [result['error'] for result in results if 'error' in result]
+        if errors:
+            return False, f"알림 정리 중 오류가 발생했습니다: {errors[0]} ({total_deleted}개 정리됨)"
+        return True, f"{total_deleted}개의 만료된 알림이 정리되었습니다."
+
+    def _load_settings(self, user_ids):
+        """수신자들의 알림 설정을 한 번에 조회 (user_id → 설정 행)"""
+        settings = {}
+        for start in range(0, len(user_ids), self.SETTINGS_CHUNK_SIZE):
+            rows = db.session.execute(
+                select(
+                    NotificationSettings.user_id,
+                    NotificationSettings.message_notifications,
+                    NotificationSettings.mention_notifications,
+                    NotificationSettings.chat_notifications,
+                ).where(NotificationSettings.user_id.in_(user_ids[start:start + self.SETTINGS_CHUNK_SIZE]))
             ).all()
+            settings.update((row.user_id, row) for row in rows)
+        return settings
 
-            for notification in expired_notifications:
-                db.session.delete(notification)
+    def _enqueue_bulk_notification(self, **task_kwargs):
+        """대량 알림을 Celery 워커로 넘김 (브로커를 쓸 수 없으면 None - 호출한 곳에서 바로 처리)"""
+        from flask import current_app, has_app_context
+        from backend.app.cache_manager import cache_manager
 
-            # 오래된 읽은 알림 삭제
-            old_read_notifications = ChatNotification.query.filter(
-                ChatNotification.is_read == True,
-                ChatNotification.read_at < cutoff_date
-            ).all()
+        celery_app = current_app.extensions.get('celery') if has_app_context() else None
+        if celery_app is None or cache_manager.offline_mode or not cache_manager.redis_client:
+            return None
+        try:
+            return celery_app.send_task(self.BULK_TASK_NAME, kwargs=task_kwargs).id
+        except Exception as e:
+            print(f"대량 알림 작업 등록 실패, 바로 전송합니다: {e}")
+            return None
 
-            for notification in old_read_notifications:
-                db.session.delete(notification)
+    def _send_bulk_realtime_notification(self, user_ids, notification_type, title, message,
+                                         chat_type, chat_id, message_id, created_at):
+        """접속 중인 수신자들에게 같은 알림을 한 번에 전송 (사용자 방 목록으로 emit 1회)"""
+        online_users = presence.online_users(user_ids)
+        if not online_users:
+            return 0
 
-            db.session.commit()
+        try:
+            # 알림 ID는 사용자마다 다르므로 싣지 않음 - 목록 API로 조회
+            notification_data = {
+                'id': None,
+                'chat_type': chat_type,
+                'chat_id': chat_id,
+                'message_id': message_id,
+                'notification_type': notification_type,
+                'title': title,
+                'message': message,
+                'is_read': False,
+                'created_at': created_at.isoformat(),
+                'icon': self.notification_types.get(notification_type, {}).get('icon', '🔔'),
+                'priority': self.notification_types.get(notification_type, {}).get('priority', 'normal')
+            }
 
-            total_deleted = len(expired_notifications) + len(old_read_notifications)
-            return True, f"{total_deleted}개의 만료된 알림이 정리되었습니다."
+            emit_to_users(online_users, 'new_notification', notification_data)
+
+            # 긴급 알림인 경우 추가 처리
+            if notification_data['priority'] == 'high':
+                emit_to_users(online_users, 'urgent_notification', notification_data)
 
         except Exception as e:
-            db.session.rollback()
-            return False, f"알림 정리 중 오류가 발생했습니다: {str(e)}"
+            print(f"실시간 대량 알림 전송 실패: {e}")
+        return len(online_users)
+
+    def send_bulk_notification(self, user_ids, notification_type, title, message,
+                               chat_type=None, chat_id=None, message_id=None,
+                               related_data=None, background=False):
+        """
+        대량 알림 전송
+        설정 조회 1회, 알림 일괄 INSERT 1회, 커밋 1회, 실시간 전송 1회로 처리합니다.
+        background=True면 Celery 워커에서 처리합니다.
+        """
+        if notification_type not in self.notification_types:
+            return False, "지원하지 않는 알림 타입입니다."
+        if not chat_type or chat_id is None:
+            return False, "chat_type과 chat_id는 필수입니다."
+
+        # 중복 수신자 제거 (순서 유지)
+        recipients = list(dict.fromkeys(str(user_id) for user_id in user_ids if user_id))
+
+        if background:
+            task_id = self._enqueue_bulk_notification(
+                user_ids=recipients,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                chat_type=chat_type,
+                chat_id=chat_id,
+                message_id=message_id,
+            )
+            if task_id:
+                return True, f"대량 알림 전송이 예약되었습니다: {len(recipients)}명 (작업 ID: {task_id})"
 
-    def send_bulk_notification(self, user_ids, notification_type, title, message, **kwargs):
-        """대량 알림 전송"""
         try:
-            success_count = 0
-            failed_count = 0
-
-            for user_id in user_ids:
-                notification, result_message = self.create_notification(
-                    user_id=user_id,
-                    notification_type=notification_type,
-                    title=title,
-                    message=message,
-                    **kwargs
-                )
-
-                if notification:
-                    success_count += 1
-                else:
-                    failed_count += 1
-
-            return True, f"대량 알림 전송 완료: 성공 {success_count}개, 실패 {failed_count}개"
+            settings = self._load_settings(recipients)
+            targets = [
+                user_id for user_id in recipients
+                if user_id not in settings or self._should_send_notification(settings[user_id], notification_type)
+            ]
+
+            created_at = datetime.utcnow()
+            if targets:
+                db.session.execute(insert(ChatNotification), [
+                    {
+                        'user_id': user_id,
+                        'chat_type': chat_type,
+                        'chat_id': chat_id,
+                        'message_id': message_id,
+                        'notification_type': notification_type,
+                        'title': title,
+                        'message': message,
+                        'is_read': False,
+                        'created_at': created_at,
+                    }
+                    for user_id in targets
+                ])
+            db.session.commit()
 
         except Exception as e:
+            db.session.rollback()
             return False, f"대량 알림 전송 중 오류가 발생했습니다: {str(e)}"
 
+        self._send_bulk_realtime_notification(
+            targets, notification_type, title, message, chat_type, chat_id, message_id, created_at
+        )
+
+        return True, f"대량 알림 전송 완료: 성공 {len(targets)}개, 실패 {len(recipients) - len(targets)}개"
+
 # 전역 알림 매니저 인스턴스
 notification_manager = NotificationManager()
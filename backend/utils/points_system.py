@@ -6,25 +6,29 @@ db = SQLAlchemy()
 class PointsSystem:
     """포인트 시스템 관리 클래스"""
 
+    # 레벨별 시작 포인트 (2레벨부터)
+    LEVEL_THRESHOLDS = (5000, 15000, 30000, 50000, 80000, 120000, 200000)
+
     @staticmethod
     def calculate_level(points: int) -> int:
         """포인트에 따른 레벨 계산"""
-        if points < 5000:
-            return 1      # 점심 루키
-        elif points < 15000:
-            return 2      # 점심 애호가
-        elif points < 30000:
-            return 3      # 점심 탐험가
-        elif points < 50000:
-            return 4      # 점심 전문가
-        elif points < 80000:
-            return 5      # 점심 마스터
-        elif points < 120000:
-            return 6      # 점심 전설
-        elif points < 200000:
-            return 7      # 점심 신화
-        else:
-            return 8      # 점심 제왕
+        # 1: 점심 루키, 2: 점심 애호가, 3: 점심 탐험가, 4: 점심 전문가,
+        # 5: 점심 마스터, 6: 점심 전설, 7: 점심 신화, 8: 점심 제왕
+        for level, threshold in enumerate(PointsSystem.LEVEL_THRESHOLDS, start=1):
+            if points < threshold:
+                return level
+        return len(PointsSystem.LEVEL_THRESHOLDS) + 1
+
+    @staticmethod
+    def level_expression(points):
+        """calculate_level과 같은 규칙의 SQL 식 (포인트 UPDATE에서 레벨을 함께 계산)"""
+        from sqlalchemy import case
+
+        return case(
+            *[(points < threshold, level)
+              for level, threshold in enumerate(PointsSystem.LEVEL_THRESHOLDS, start=1)],
+            else_=len(PointsSystem.LEVEL_THRESHOLDS) + 1
+        )
 
     @staticmethod
     def get_level_title(level: int) -> str:
@@ -77,29 +81,22 @@ class PointsSystem:
         return points_map.get(activity_type, 0)
 
     @staticmethod
-    def earn_points(user_id: str, activity_type: str, points: int, description: str = None) -> bool:
-        """포인트 획득 처리"""
+    def earn_points(user_id: str, activity_type: str, points: int, description: str = None,
+                    idempotency_key: str = None, wait: bool = False) -> bool:
+        """
+        포인트 획득 처리 (포인트 원장 버퍼에 추가)
+
+        적립은 버퍼에 모았다가 묶어서 기록합니다 (활동 일괄 INSERT, 사용자별 포인트/레벨 UPDATE 한 번).
+        wait=True이면 즉시 기록하고 실제 반영 여부를 반환합니다.
+        같은 idempotency_key로 다시 요청하면 적립하지 않습니다.
+        """
         try:
-            from backend.auth.models import User
-            from backend.models.app_models import UserActivity
-            from backend.app.extensions import db
-
-            # 사용자 포인트 업데이트
-            user = User.query.filter_by(employee_id=user_id).first()
-            if user:
-                user.total_points += points
-                user.current_level = PointsSystem.calculate_level(user.total_points)
-                db.session.commit()
-
-                # 활동 기록
-                activity = UserActivity(user_id, activity_type, points, description)
-                db.session.add(activity)
-                db.session.commit()
+            from backend.services.points_ledger import points_ledger
 
-                return True
+            return points_ledger.submit(user_id, activity_type, points, description,
+                                        idempotency_key=idempotency_key, wait=wait)
         except Exception as e:
             print(f"포인트 획득 실패: {e}")
-            db.session.rollback()
             return False
 
     @staticmethod
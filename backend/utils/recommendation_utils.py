@@ -1,29 +1,30 @@
 """
 추천 시스템 관련 유틸리티 함수들
 """
+import json
 import random
 from datetime import datetime, timedelta
-from backend.models.app_models import Party, PartyMember
+
+import numpy as np
+from sqlalchemy import insert
+
+from backend.app.extensions import db
+from backend.models.app_models import DailyRecommendation
 from backend.auth.models import User
+from backend.services.availability import availability_service
+from backend.services.compatibility import CompatibilityEngine, compatibility_engine
+
+# 사용자별 추천 계산 시 살펴볼 상위 후보 수
+RECOMMENDATION_CANDIDATES = 20
+# DailyRecommendation 일괄 저장 단위
+RECOMMENDATION_INSERT_CHUNK = 1000
 
 
 def get_available_users_for_date(date_str):
     """특정 날짜에 사용할 수 있는 사용자 목록 반환"""
     try:
-        # 해당 날짜에 이미 파티에 참여한 사용자들 조회
-        party_participants = _get_party_participants(date_str)
-
-        # 해당 날짜에 개인 일정이 있는 사용자들 조회
-        scheduled_users = _get_scheduled_users(date_str)
-
-        # 모든 사용자 ID 조회
-        all_user_ids = _get_all_user_ids()
-
-        # 사용 가능한 사용자 = 전체 - (파티 참여자 + 일정 있는 사용자)
-        unavailable_users = set(party_participants + scheduled_users)
-        available_users = [uid for uid in all_user_ids if uid not in unavailable_users]
-
-        print(f"DEBUG: 날짜 {date_str} - 전체 사용자: {len(all_user_ids)}, 사용 가능: {len(available_users)}")
+        available_users = sorted(availability_service.get_available_user_ids(date_str))
+        print(f"DEBUG: 날짜 {date_str} - 사용 가능: {len(available_users)}")
         return available_users
 
     except Exception as e:
@@ -31,67 +32,28 @@ def get_available_users_for_date(date_str):
         return []
 
 
-def _get_party_participants(date_str):
-    """특정 날짜의 파티 참여자들 조회"""
-    try:
-        parties = Party.query.filter(Party.party_date == date_str).all()
-        participants = []
-
-        for party in parties:
-            # 호스트 추가
-            participants.append(party.host_employee_id)
-
-            # 멤버들 추가
-            members = PartyMember.query.filter(PartyMember.party_id == party.id).all()
-            for member in members:
-                participants.append(member.employee_id)
-
-        return list(set(participants))  # 중복 제거
-
-    except Exception as e:
-        print(f"ERROR: _get_party_participants 실행 중 오류: {e}")
-        return []
-
-
-def _get_scheduled_users(date_str):
-    """특정 날짜에 개인 일정이 있는 사용자들 조회"""
-    try:
-        from models.schedule_models import PersonalSchedule
-
-        schedules = PersonalSchedule.query.filter(
-            PersonalSchedule.schedule_date == date_str
-        ).all()
-
-        return [schedule.employee_id for schedule in schedules]
-
-    except Exception as e:
-        print(f"ERROR: _get_scheduled_users 실행 중 오류: {e}")
-        return []
-
-
-def _get_all_user_ids():
-    """모든 사용자 ID 조회"""
-    try:
-        # 실제 데이터베이스에서 사용자 조회
-        users = User.query.all()
-        if users:
-            return [user.employee_id for user in users]
-
-        # 데이터베이스에 사용자가 없으면 빈 리스트 반환
-        return []
+def load_available_users(date_str):
+    """특정 날짜에 참여 가능한 활성 사용자 객체 목록 (활성 사용자 1회 조회 + 가용성 비트맵)"""
+    available_ids = availability_service.get_available_user_ids(date_str)
+    users = User.query.filter(User.is_active == True).order_by(User.employee_id).all()
+    return [user for user in users if str(user.employee_id) in available_ids]
 
-    except Exception as e:
-        print(f"ERROR: _get_all_user_ids 실행 중 오류: {e}")
-        return []
 
+def generate_efficient_groups(scored_users, target_date_str, requester_id, pair_scores=None):
+    """
+    효율적인 그룹 생성
 
-def generate_efficient_groups(scored_users, target_date_str, requester_id):
-    """효율적인 그룹 생성"""
+    Args:
+        scored_users: 요청자와의 호환성 점수 내림차순 후보 목록
+        pair_scores: 후보끼리의 호환성 행렬 (scored_users 순서, 있으면 3인 그룹 구성에 사용)
+    """
     try:
         recommendations = []
 
         # 3인 그룹 생성 (최우선)
-        three_person_groups = _create_three_person_groups(scored_users, target_date_str, requester_id)
+        three_person_groups = _create_three_person_groups(
+            scored_users, target_date_str, requester_id, pair_scores=pair_scores
+        )
         recommendations.extend(three_person_groups)
 
         # 2인 그룹 생성
@@ -109,8 +71,13 @@ def generate_efficient_groups(scored_users, target_date_str, requester_id):
         return []
 
 
-def _create_three_person_groups(scored_users, target_date_str, requester_id, max_groups=6):
-    """3인 그룹 생성"""
+def _create_three_person_groups(scored_users, target_date_str, requester_id, max_groups=6, pair_scores=None):
+    """3인 그룹 생성 (요청자 + 후보 2명)"""
+    if pair_scores is not None and len(scored_users) >= 2:
+        return _create_cohesive_three_person_groups(
+            scored_users, target_date_str, requester_id, max_groups, pair_scores
+        )
+
     groups = []
     used_users = set()
 
@@ -136,6 +103,26 @@ def _create_three_person_groups(scored_users, target_date_str, requester_id, max
     return groups
 
 
+def _create_cohesive_three_person_groups(scored_users, target_date_str, requester_id, max_groups, pair_scores):
+    """요청자와의 점수 + 후보 간 점수 합이 높은 후보 쌍부터 겹치지 않게 선택"""
+    requester_scores = np.asarray([user['compatibility_score'] for user in scored_users], dtype=np.float32)
+    combined = requester_scores[:, None] + requester_scores[None, :] + pair_scores
+    first, second = np.triu_indices(len(scored_users), k=1)
+    order = np.argsort(-combined[first, second], kind='stable')
+
+    groups = []
+    used = set()
+    for k in order:
+        a, b = int(first[k]), int(second[k])
+        if a in used or b in used:
+            continue
+        groups.append(create_recommendation([scored_users[a], scored_users[b]], target_date_str, requester_id))
+        used.update((a, b))
+        if len(groups) >= max_groups:
+            break
+    return groups
+
+
 def _create_two_person_groups(scored_users, target_date_str, requester_id, max_groups=3):
     """2인 그룹 생성"""
     groups = []
@@ -244,32 +231,9 @@ def get_user_preference(user_id, preference_type):
 
 
 def calculate_compatibility_score_cached(user1, user2):
-    """호환성 점수 계산 (캐시된 버전)"""
+    """호환성 점수 계산 (음식 선호 60% + 점심 성향 40%, 호환성 엔진의 인코딩된 프로필 사용)"""
     try:
-        # 음식 선호도 호환성
-        food_prefs1 = set(get_user_preference(user1, "food"))
-        food_prefs2 = set(get_user_preference(user2, "food"))
-
-        food_compatibility = 0
-        if food_prefs1 and food_prefs2:
-            intersection = len(food_prefs1.intersection(food_prefs2))
-            union = len(food_prefs1.union(food_prefs2))
-            food_compatibility = (intersection / union) * 100 if union > 0 else 0
-
-        # 점심 스타일 호환성
-        style_prefs1 = set(get_user_preference(user1, "lunch_style"))
-        style_prefs2 = set(get_user_preference(user2, "lunch_style"))
-
-        style_compatibility = 0
-        if style_prefs1 and style_prefs2:
-            intersection = len(style_prefs1.intersection(style_prefs2))
-            union = len(style_prefs1.union(style_prefs2))
-            style_compatibility = (intersection / union) * 100 if union > 0 else 0
-
-        # 전체 호환성 점수 (가중 평균)
-        total_score = (food_compatibility * 0.6 + style_compatibility * 0.4)
-
-        return round(total_score, 1)
+        return round(compatibility_engine.pair_score(user1, user2, kind='preference'), 1)
 
     except Exception as e:
         print(f"ERROR: calculate_compatibility_score_cached 실행 중 오류: {e}")
@@ -298,75 +262,117 @@ def calculate_pattern_score_cached(user1, user2):
         return random.randint(60, 85)  # 기본값
 
 
-def generate_recommendation_cache():
-    """추천 캐시 생성"""
+def build_recommendations(users, target_date_str, candidates=RECOMMENDATION_CANDIDATES):
+    """
+    참여 가능한 사용자 전체에 대한 추천 그룹 일괄 계산
+
+    호환성 행렬을 행 블록 단위로 계산하고, 사용자별 상위 후보와 후보 간 점수로 그룹을 구성합니다.
+
+    Returns:
+        {사용자 ID: 추천 그룹 목록}
+    """
+    # 대상 사용자만 담은 스냅샷 엔진 (재구축하지 않으므로 실행 내내 행 순서 고정)
+    engine = CompatibilityEngine(auto_refresh=False)
+    engine.load(users)
+    nicknames = {str(user.employee_id): user.nickname for user in users}
+
+    user_ids, blocks = engine.score_blocks(kind='preference')
+    if len(user_ids) < 2:
+        return {}
+    k = min(candidates, len(user_ids) - 1)
+
+    results = {}
+    for start, block in blocks:
+        # 자기 자신은 후보에서 제외
+        block[np.arange(len(block)), np.arange(start, start + len(block))] = -np.inf
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        for offset in range(len(block)):
+            requester_id = user_ids[start + offset]
+            candidate_ids = [user_ids[c] for c in top[offset]]
+            scored_users = [
+                {
+                    'user_id': candidate_id,
+                    'nickname': nicknames.get(candidate_id) or f'사용자{candidate_id}',
+                    'compatibility_score': round(float(score), 1),
+                }
+                for candidate_id, score in zip(candidate_ids, top_scores[offset], strict=True)
+            ]
+            _, pair_scores = engine.score_matrix(candidate_ids, kind='preference')
+            results[requester_id] = generate_efficient_groups(
+                scored_users, target_date_str, requester_id, pair_scores=pair_scores
+            )
+    return results
+
+
+def save_recommendations(target_date_str, recommendations):
+    """날짜별 추천 결과를 DailyRecommendation에 일괄 저장 (기존 결과 교체)"""
+    generated_at = datetime.utcnow()
+    rows = [
+        {
+            'date': target_date_str,
+            'employee_id': employee_id,
+            'group_members': json.dumps(groups, ensure_ascii=False),
+            'created_at': generated_at,
+        }
+        for employee_id, groups in recommendations.items()
+    ]
+
+    DailyRecommendation.query.filter(
+        DailyRecommendation.date == target_date_str,
+        DailyRecommendation.employee_id.isnot(None)
+    ).delete(synchronize_session=False)
+    for start in range(0, len(rows), RECOMMENDATION_INSERT_CHUNK):
+        db.session.execute(insert(DailyRecommendation), rows[start:start + RECOMMENDATION_INSERT_CHUNK])
+    db.session.commit()
+    return len(rows)
+
+
+def get_user_recommendations(employee_id, target_date_str):
+    """저장된 사용자별 추천 조회 (없으면 None)"""
+    row = DailyRecommendation.query.filter_by(
+        date=target_date_str, employee_id=str(employee_id)
+    ).order_by(DailyRecommendation.id.desc()).first()
+    if not row:
+        return None
+    return {
+        "date": row.date,
+        "recommendations": json.loads(row.group_members),
+        "generated_at": row.created_at.isoformat() if row.created_at else None
+    }
+
+
+def generate_recommendation_cache(target_date_str=None):
+    """추천 캐시 생성 (기본값: 내일)"""
     try:
-        from utils.datetime_utils import get_seoul_today
+        if target_date_str is None:
+            from backend.utils.datetime_utils import get_seoul_today
 
-        today = get_seoul_today()
-        tomorrow = today + timedelta(days=1)
-        tomorrow_str = tomorrow.strftime("%Y-%m-%d")
+            tomorrow = get_seoul_today() + timedelta(days=1)
+            target_date_str = tomorrow.strftime("%Y-%m-%d")
 
-        # 사용 가능한 사용자들 조회
-        available_users = get_available_users_for_date(tomorrow_str)
+        # 사용 가능한 사용자들 조회 (단일 쿼리)
+        available_users = load_available_users(target_date_str)
 
         if len(available_users) < 2:
             print("WARNING: 추천 생성을 위한 충분한 사용자가 없습니다.")
-            return {"message": "사용자가 부족합니다", "date": tomorrow_str}
-
-        # 각 사용자에 대한 추천 생성
-        cache_data = {}
-
-        for user_id in available_users[:10]:  # 최대 10명에 대해서만 캐시 생성
-            try:
-                # 다른 사용자들과의 호환성 점수 계산
-                scored_users = []
-                for other_user_id in available_users:
-                    if other_user_id != user_id:
-                        compatibility = calculate_compatibility_score_cached(user_id, other_user_id)
-
-                        other_user = User.query.filter_by(employee_id=other_user_id).first()
-                        if other_user:
-                            user_data = {
-                                "employee_id": other_user.employee_id,
-                                "nickname": other_user.nickname,
-                                "food_preferences": getattr(other_user, 'food_preferences', ''),
-                                "lunch_style": getattr(other_user, 'lunch_style', ''),
-                                "allergies": getattr(other_user, 'allergies', ''),
-                                "preferred_time": getattr(other_user, 'preferred_time', '12:00')
-                            }
-                        else:
-                            user_data = {}
-
-                        scored_users.append({
-                            'user_id': other_user_id,
-                            'nickname': user_data.get('nickname', f'사용자{other_user_id}'),
-                            'compatibility_score': compatibility
-                        })
-
-                # 호환성 점수로 정렬
-                scored_users.sort(key=lambda x: x['compatibility_score'], reverse=True)
-
-                # 추천 그룹 생성
-                recommendations = generate_efficient_groups(scored_users[:20], tomorrow_str, user_id)
-
-                cache_data[user_id] = {
-                    "date": tomorrow_str,
-                    "recommendations": recommendations,
-                    "generated_at": datetime.now().isoformat()
-                }
+            return {"message": "사용자가 부족합니다", "date": target_date_str}
 
-            except Exception as e:
-                print(f"ERROR: 사용자 {user_id}에 대한 추천 생성 실패: {e}")
-                continue
+        recommendations = build_recommendations(available_users, target_date_str)
+        saved = save_recommendations(target_date_str, recommendations)
 
-        print(f"SUCCESS: {len(cache_data)}명에 대한 추천 캐시 생성 완료")
+        print(f"SUCCESS: {saved}명에 대한 추천 캐시 생성 완료")
         return {
-            "message": f"{len(cache_data)}명에 대한 추천 캐시 생성 완료",
-            "date": tomorrow_str,
-            "users_count": len(cache_data)
+            "message": f"{saved}명에 대한 추천 캐시 생성 완료",
+            "date": target_date_str,
+            "users_count": saved
         }
 
     except Exception as e:
+        db.session.rollback()
         print(f"ERROR: generate_recommendation_cache 실행 중 오류: {e}")
         return {"error": str(e)}
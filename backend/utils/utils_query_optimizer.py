@@ -3,15 +3,18 @@
 효율적인 데이터베이스 쿼리를 위한 도구들을 제공합니다.
 """
 
-from sqlalchemy import func, desc, asc
+from sqlalchemy import func, desc, asc, and_, or_
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 from backend.app.extensions import db
 from backend.models.app_models import (
-    ChatMessage, MessageStatus, MessageReaction, ChatRoomMember
+    ChatMessage, MessageStatus, MessageReaction, MessageAttachment, ChatRoomMember
 )
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
+import base64
+import binascii
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,34 +23,133 @@ class QueryOptimizer:
     """쿼리 최적화 클래스"""
 
     @staticmethod
-    def get_messages_optimized(chat_type: str, chat_id: int, limit: int = 50, offset: int = 0,
-                              include_reactions: bool = True, include_attachments: bool = True) -> list[dict]:
-        """최적화된 메시지 조회"""
+    def encode_message_cursor(message: ChatMessage) -> str | None:
+        """메시지의 (created_at, id)를 불투명한 페이지 커서 문자열로 변환 (created_at이 없는 이전 메시지는 None)"""
+        if message.created_at is None:
+            return None
+        raw = f"{message.created_at.isoformat()}|{message.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode_message_cursor(cursor: str) -> tuple[datetime, int]:
+        """페이지 커서를 (created_at, id)로 복원 (형식이 잘못되면 ValueError)"""
         try:
-            # 기본 쿼리
-            query = ChatMessage.query.filter_by(
-                chat_type=chat_type,
-                chat_id=chat_id,
-                is_deleted=False
-            )
+            padded = cursor + '=' * (-len(cursor) % 4)
+            created_at, message_id = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(message_id)
+        except (ValueError, UnicodeDecodeError, binascii.Error) as e:
+            raise ValueError(f"잘못된 페이지 커서입니다: {cursor}") from e
 
-            # 관련 데이터 미리 로드
-            if include_reactions:
-                query = query.options(joinedload(ChatMessage.reactions))
+    @staticmethod
+    def get_message_page(chat_type: str, chat_id: int, limit: int = 50, before: str = None,
+                         after: str = None, include_deleted: bool = True) -> dict[str, Any]:
+        """
+        (created_at, id) 키셋 기반 메시지 페이지 조회
+
+        OFFSET 없이 idx_chat_message_chat 인덱스 범위를 바로 탐색하므로
+        스크롤 깊이와 관계없이 일정한 비용으로 조회됩니다.
+
+        Args:
+            before: 이 커서보다 이전(오래된) 메시지 조회 (기본: 최신 메시지부터)
+            after: 이 커서보다 이후(새로운) 메시지 조회
+
+        Returns:
+            messages: 최신순 ChatMessage 목록
+            has_more: 요청 방향으로 더 조회할 메시지가 있는지 여부
+            before_cursor / after_cursor: 이전/이후 페이지 조회용 커서
+        """
+        query = ChatMessage.query.filter(
+            ChatMessage.chat_type == chat_type,
+            ChatMessage.chat_id == chat_id
+        )
+        if not include_deleted:
+            query = query.filter(ChatMessage.is_deleted == False)
+
+        if after:
+            created_at, message_id = QueryOptimizer.decode_message_cursor(after)
+            query = query.filter(or_(
+                ChatMessage.created_at > created_at,
+                and_(ChatMessage.created_at == created_at, ChatMessage.id > message_id)
+            )).order_by(asc(ChatMessage.created_at), asc(ChatMessage.id))
+        else:
+            if before:
+                created_at, message_id = QueryOptimizer.decode_message_cursor(before)
+                query = query.filter(or_(
+                    ChatMessage.created_at < created_at,
+                    and_(ChatMessage.created_at == created_at, ChatMessage.id < message_id)
+                ))
+            query = query.order_by(desc(ChatMessage.created_at), desc(ChatMessage.id))
+
+        # 다음 페이지 존재 여부는 한 건을 더 읽어 판단 (전체 count 생략)
+        messages = query.limit(limit + 1).all()
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+        if after:
+            messages.reverse()
+
+        # created_at이 없는 메시지는 커서 비교에 걸리지 않으므로 가장 가까운 시각이 있는 메시지로 커서를 만듦
+        cursors = [cursor for cursor in map(QueryOptimizer.encode_message_cursor, messages) if cursor]
+        return {
+            'messages': messages,
+            'has_more': has_more,
+            'before_cursor': cursors[-1] if cursors else before,
+            'after_cursor': cursors[0] if cursors else after,
+        }
 
-            if include_attachments:
-                query = query.options(joinedload(ChatMessage.attachments))
+    @staticmethod
+    def get_sender_nicknames(employee_ids) -> dict[str, str]:
+        """발신자 닉네임 일괄 조회 (페이지당 한 번)"""
+        from backend.auth.models import User
 
-            # 정렬 및 페이징
-            messages = query.order_by(desc(ChatMessage.created_at))\
-                           .offset(offset)\
-                           .limit(limit)\
-                           .all()
+        employee_ids = {employee_id for employee_id in employee_ids if employee_id}
+        if not employee_ids:
+            return {}
+        rows = db.session.query(User.employee_id, User.nickname)\
+            .filter(User.employee_id.in_(employee_ids))\
+            .all()
+        return {row.employee_id: row.nickname for row in rows}
+
+    @staticmethod
+    def get_messages_optimized(chat_type: str, chat_id: int, limit: int = 50, before: str = None,
+                               after: str = None, include_reactions: bool = True,
+                               include_attachments: bool = True) -> dict[str, Any]:
+        """최적화된 메시지 조회 (키셋 페이지네이션, 반응/첨부파일 일괄 로드)"""
+        try:
+            page = QueryOptimizer.get_message_page(
+                chat_type, chat_id, limit=limit, before=before, after=after, include_deleted=False
+            )
+            messages = page['messages']
+            message_ids = [message.id for message in messages]
+
+            # 관련 데이터는 페이지 단위로 한 번씩만 조회
+            reactions_by_message = defaultdict(list)
+            if include_reactions and message_ids:
+                for reaction in MessageReaction.query.filter(MessageReaction.message_id.in_(message_ids)).all():
+                    reactions_by_message[reaction.message_id].append({
+                        'id': reaction.id,
+                        'user_id': reaction.user_id,
+                        'reaction_type': reaction.reaction_type,
+                        'created_at': reaction.created_at.isoformat()
+                    })
+
+            attachments_by_message = defaultdict(list)
+            if include_attachments and message_ids:
+                for attachment in MessageAttachment.query.filter(MessageAttachment.message_id.in_(message_ids)).all():
+                    attachments_by_message[attachment.message_id].append({
+                        'id': attachment.id,
+                        'file_name': attachment.file_name,
+                        'file_path': attachment.file_path,
+                        'file_size': attachment.file_size,
+                        'file_type': attachment.file_type,
+                        'mime_type': attachment.mime_type,
+                        'thumbnail_path': attachment.thumbnail_path,
+                        'created_at': attachment.created_at.isoformat()
+                    })
 
             # 결과 변환
             result = []
             for message in messages:
-                message_data = {
+                result.append({
                     'id': message.id,
                     'chat_type': message.chat_type,
                     'chat_id': message.chat_id,
@@ -61,65 +163,35 @@ class QueryOptimizer:
                     'deleted_at': message.deleted_at.isoformat() if message.deleted_at else None,
                     'reply_to_message_id': message.reply_to_message_id,
                     'created_at': message.created_at.isoformat(),
-                    'reactions': [],
-                    'attachments': []
-                }
-
-                # 반응 데이터 추가
-                if include_reactions and hasattr(message, 'reactions'):
-                    for reaction in message.reactions:
-                        message_data['reactions'].append({
-                            'id': reaction.id,
-                            'user_id': reaction.user_id,
-                            'reaction_type': reaction.reaction_type,
-                            'created_at': reaction.created_at.isoformat()
-                        })
-
-                # 첨부파일 데이터 추가
-                if include_attachments and hasattr(message, 'attachments'):
-                    for attachment in message.attachments:
-                        message_data['attachments'].append({
-                            'id': attachment.id,
-                            'file_name': attachment.file_name,
-                            'file_path': attachment.file_path,
-                            'file_size': attachment.file_size,
-                            'file_type': attachment.file_type,
-                            'mime_type': attachment.mime_type,
-                            'thumbnail_path': attachment.thumbnail_path,
-                            'created_at': attachment.created_at.isoformat()
-                        })
+                    'reactions': reactions_by_message.get(message.id, []),
+                    'attachments': attachments_by_message.get(message.id, [])
+                })
 
-                result.append(message_data)
-
-            return result
+            return {
+                'messages': result,
+                'has_more': page['has_more'],
+                'before_cursor': page['before_cursor'],
+                'after_cursor': page['after_cursor'],
+            }
 
         except SQLAlchemyError as e:
             logger.error(f"메시지 조회 실패: {e}")
-            return []
+            return {'messages': [], 'has_more': False, 'before_cursor': before, 'after_cursor': after}
 
     @staticmethod
     def get_unread_count_optimized(user_id: str, chat_type: str = None, chat_id: int = None) -> int:
-        """최적화된 읽지 않은 메시지 수 조회"""
+        """최적화된 읽지 않은 메시지 수 조회 (채팅방별 읽음 커서 카운터 사용)"""
+        from backend.services.chat_unread import ChatUnreadService
+
         try:
-            # 서브쿼리로 읽지 않은 메시지 ID 조회
-            unread_message_ids = db.session.query(ChatMessage.id)\
-                .filter(ChatMessage.chat_type == chat_type if chat_type else True)\
-                .filter(ChatMessage.chat_id == chat_id if chat_id else True)\
-                .filter(ChatMessage.sender_employee_id != user_id)\
-                .filter(ChatMessage.is_deleted == False)\
-                .except_(
-                    db.session.query(MessageStatus.message_id)\
-                    .filter(MessageStatus.user_id == user_id)\
-                    .filter(MessageStatus.is_read == True)
-                ).subquery()
-
-            # 읽지 않은 메시지 수 계산
-            count = db.session.query(func.count(ChatMessage.id))\
-                .filter(ChatMessage.id.in_(
-                    db.session.query(unread_message_ids.c.id)
-                )).scalar()
-
-            return count or 0
+            if chat_type and chat_id:
+                return ChatUnreadService.get_unread_count(user_id, chat_type, chat_id)
+
+            counts = ChatUnreadService.get_unread_counts(user_id)
+            if chat_type:
+                prefix = f"{chat_type}:"
+                return sum(count for room, count in counts.items() if room.startswith(prefix))
+            return sum(counts.values())
 
         except SQLAlchemyError as e:
             logger.error(f"읽지 않은 메시지 수 조회 실패: {e}")
@@ -138,6 +210,10 @@ class QueryOptimizer:
                 .limit(limit)\
                 .all()
 
+            # 모든 채팅방의 읽지 않은 수를 한 번에 조회
+            from backend.services.chat_unread import ChatUnreadService
+            unread_counts = ChatUnreadService.get_unread_counts(user_id)
+
             result = []
             for room in chat_rooms:
                 # 최신 메시지 조회
@@ -148,10 +224,7 @@ class QueryOptimizer:
                     .order_by(desc(ChatMessage.created_at))\
                     .first()
 
-                # 읽지 않은 메시지 수 조회
-                unread_count = QueryOptimizer.get_unread_count_optimized(
-                    user_id, room.chat_type, room.chat_id
-                )
+                unread_count = unread_counts.get(ChatUnreadService.room_key(room.chat_type, room.chat_id), 0)
 
                 room_data = {
                     'id': f"{room.chat_type}_{room.chat_id}",
@@ -293,6 +366,16 @@ class QueryOptimizer:
                     'read_at': datetime.utcnow()
                 }, synchronize_session=False)
 
+            # 채팅방별로 가장 마지막 메시지까지 읽음 커서 이동
+            from backend.services.chat_unread import ChatUnreadService
+            latest_per_room = db.session.query(
+                ChatMessage.chat_type, ChatMessage.chat_id, func.max(ChatMessage.id)
+            ).filter(ChatMessage.id.in_(message_ids))\
+             .group_by(ChatMessage.chat_type, ChatMessage.chat_id)\
+             .all()
+            for chat_type, chat_id, last_message_id in latest_per_room:
+                ChatUnreadService.mark_read(user_id, chat_type, chat_id, last_message_id)
+
             db.session.commit()
             return True
 
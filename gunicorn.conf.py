@@ -1,13 +1,14 @@
 # Gunicorn 설정 파일
-# 안정성을 위한 sync worker 사용 (WebSocket 비활성화)
+# Socket.IO 장기 연결을 위해 eventlet 비동기 worker 사용
+# 워커 간 실시간 이벤트는 Redis 메시지 큐(backend/app/realtime_system.py)로 전달됩니다.
 
 import os
 
 # 기본 설정
 bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
-workers = 2  # CPU 코어 수에 맞춰 조정
-worker_class = "sync"  # 안정적인 sync worker 사용
-worker_connections = 1000
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))  # CPU 코어 수에 맞춰 조정
+worker_class = "eventlet"  # 워커당 수천 개의 WebSocket 연결을 그린스레드로 처리
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 5000))  # 워커당 동시 연결 수
 
 # 타임아웃 설정
 timeout = 30
@@ -19,7 +20,8 @@ errorlog = "-"
 loglevel = "info"
 
 # 프로세스 설정
-preload_app = True
+# eventlet monkey patch와 Redis pub/sub 리스너가 워커마다 만들어지도록 fork 후에 앱을 로드
+preload_app = False
 max_requests = 1000
 max_requests_jitter = 50
 
@@ -29,5 +31,26 @@ worker_tmp_dir = "/dev/shm"  # 메모리 기반 임시 디렉토리
 # 환경변수
 raw_env = [
     'FLASK_ENV=production',
-    'PYTHONPATH=/opt/render/project/src'
+    'PYTHONPATH=/opt/render/project/src',
+    # gunicorn은 sticky session을 지원하지 않으므로 여러 워커에서는 long-polling 대신 websocket만 사용
+    f"SOCKETIO_TRANSPORTS={'websocket' if workers > 1 else 'websocket,polling'}",
 ]
+
+
+def post_fork(server, worker):
+    """
+    psycopg2 대기를 eventlet 그린스레드 전환으로 바꿈
+    (패치하지 않으면 DB 조회 동안 워커의 허브 전체가 멈춰 다른 소켓과 Socket.IO 하트비트가 처리되지 않음)
+    """
+    if worker_class == "eventlet":
+        from psycogreen.eventlet import patch_psycopg
+
+        patch_psycopg()
+        server.log.info(f"psycopg2 eventlet 대기 콜백 설정 (worker {worker.pid})")
+
+
+def worker_exit(server, worker):
+    """워커 종료 전 이미지 변형 프로세스 풀 정리 (eventlet에서는 종료 시점 자동 정리가 멈춤)"""
+    from backend.services.image_variants import image_variants
+
+    image_variants.shutdown()
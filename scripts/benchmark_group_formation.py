@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+그룹 편성 엔진 벤치마크
+무작위 분할(기존 random.sample 방식) 대비 그룹 점수 총합과 소요 시간을 비교합니다.
+
+사용법:
+    python scripts/benchmark_group_formation.py --users 100 1000 10000 --time-limit 10
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FOODS = ['한식', '중식', '일식', '양식', '분식', '아시안', '채식', '패스트푸드']
+STYLES = ['빠른 식사', '대화 중심', '맛집 탐방', '가성비', '건강식', '혼밥 선호']
+TIMES = ['11:30', '12:00', '12:30', '13:00']
+ALLERGIES = [None, ['견과류'], ['갑각류'], ['유제품']]
+
+
+def make_users(count, rng):
+    return {
+        f'user_{i}': {
+            'foodPreferences': rng.sample(FOODS, rng.randint(1, 3)),
+            'lunchStyle': rng.sample(STYLES, rng.randint(1, 2)),
+            'preferredTime': rng.choice(TIMES),
+            'allergies': rng.choice(ALLERGIES),
+        }
+        for i in range(count)
+    }
+
+
+def random_partition(user_ids, rng):
+    """기존 방식: 크기를 무작위로 뽑아 순서대로 자르기"""
+    user_ids = list(user_ids)
+    rng.shuffle(user_ids)
+    groups = []
+    while user_ids:
+        size = rng.choices([2, 3, 4], weights=[0.2, 0.6, 0.2])[0]
+        if len(user_ids) - size == 1:
+            size += 1 if size < 4 else -1
+        groups.append(user_ids[:size])
+        user_ids = user_ids[size:]
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description='그룹 편성 엔진 벤치마크')
+    parser.add_argument('--users', type=int, nargs='+', default=[100, 1000, 10000], help='사용자 수')
+    parser.add_argument('--time-limit', type=float, default=10.0, help='편성당 최대 탐색 시간(초)')
+    parser.add_argument('--date', default='2025-01-15', help='편성 날짜')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    from backend.app.group_matching import calculate_group_score
+    from backend.services.group_formation import GroupFormationSolver
+
+    print(f"{'사용자':>8} {'무작위 점수':>12} {'초기해 점수':>12} {'최적화 점수':>12} {'개선율':>8} {'반복':>10} {'시간(초)':>9}")
+    for count in args.users:
+        rng = random.Random(args.seed)
+        users = make_users(count, rng)
+
+        baseline = sum(
+            calculate_group_score(group, users, args.date)
+            for group in random_partition(users, rng)
+        )
+
+        started = time.perf_counter()
+        result = GroupFormationSolver(users, args.date, seed=args.seed).solve(time_limit=args.time_limit)
+        elapsed = time.perf_counter() - started
+
+        # 엔진 점수가 calculate_group_score와 일치하는지 확인
+        verified = sum(calculate_group_score(group, users, args.date) for group in result['groups'])
+        assert verified == result['total_score'], (verified, result['total_score'])
+        assert sorted(u for group in result['groups'] for u in group) == sorted(users)
+
+        improvement = (result['total_score'] / baseline - 1) * 100 if baseline else 0
+        print(f"{count:>8} {baseline:>12.0f} {result['initial_score']:>12.0f} {result['total_score']:>12.0f} "
+              f"{improvement:>7.1f}% {result['iterations']:>10} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
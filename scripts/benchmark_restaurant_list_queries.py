@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+식당 목록 API 쿼리 수 벤치마크
+페이지 크기와 관계없이 요청당 SQL 실행 횟수가 일정한지 확인합니다.
+
+사용법:
+    python scripts/benchmark_restaurant_list_queries.py --restaurants 700
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class QueryCounter:
+    """SQLAlchemy 엔진 실행 횟수 카운터"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args, **kwargs):
+        self.count += 1
+
+    def __enter__(self):
+        from sqlalchemy import event
+        self.count = 0
+        event.listen(self.engine, 'before_cursor_execute', self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        from sqlalchemy import event
+        event.remove(self.engine, 'before_cursor_execute', self._on_execute)
+
+
+def seed(db, restaurant_count: int, users: int = 30):
+    """테스트용 식당/추천/저장 데이터 생성"""
+    from backend.models.restaurant_models import RestaurantV2, RestaurantRecommendV2, RestaurantSavedV2
+    from backend.services.restaurant_counters import RestaurantCounterService
+
+    rng = random.Random(7)
+    restaurants = [
+        RestaurantV2(
+            name=f"식당{i:04d}",
+            address="서울시 강남구",
+            latitude=37.5 + rng.uniform(-0.03, 0.03),
+            longitude=127.0 + rng.uniform(-0.03, 0.03),
+            category=rng.choice(['한식', '중식', '일식', '양식']),
+        )
+        for i in range(restaurant_count)
+    ]
+    db.session.add_all(restaurants)
+    db.session.flush()
+
+    for restaurant in restaurants:
+        for user_id in rng.sample(range(users), rng.randint(0, 5)):
+            db.session.add(RestaurantRecommendV2(restaurant_id=restaurant.id, user_id=str(user_id)))
+        for user_id in rng.sample(range(users), rng.randint(0, 5)):
+            db.session.add(RestaurantSavedV2(restaurant_id=restaurant.id, user_id=str(user_id)))
+    db.session.commit()
+
+    # 시드 데이터는 카운터를 거치지 않았으므로 보정 작업으로 채움
+    RestaurantCounterService.reconcile()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='식당 목록 API 쿼리 수 벤치마크')
+    parser.add_argument('--restaurants', type=int, default=700, help='생성할 식당 수')
+    args = parser.parse_args()
+
+    os.environ.setdefault('OFFLINE_MODE', 'true')
+
+    from backend.app.app_factory import create_app
+    from backend.app.extensions import db
+
+    app = create_app('testing')
+
+    # Blueprint 등록 이후 import (backend 경로가 sys.path에 추가됨)
+    from backend.api.restaurants_v2 import get_restaurants
+
+    with app.app_context():
+        db.create_all()
+        seed(db, args.restaurants)
+
+        print(f"\n📊 식당 {args.restaurants}개 기준 요청당 쿼리 수")
+        print(f"{'정렬':<10}{'limit':>8}{'쿼리 수':>10}{'응답 시간(ms)':>16}")
+
+        for sort in ('name', 'rating', 'distance'):
+            for limit in (10, 50, 100):
+                url = f"/api/restaurants/?sort={sort}&limit={limit}&lat=37.5&lng=127.0&radius=5"
+                with app.test_request_context(url):
+                    # 위치 인덱스 워밍업 (최초 구축 쿼리 제외)
+                    get_restaurants()
+                    db.session.expunge_all()
+                    with QueryCounter(db.engine) as counter:
+                        started = time.perf_counter()
+                        get_restaurants()
+                        elapsed = (time.perf_counter() - started) * 1000
+                    db.session.expunge_all()
+                print(f"{sort:<10}{limit:>8}{counter.count:>10}{elapsed:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+실시간 알림 전달 지연 부하 테스트
+N개의 Socket.IO 클라이언트를 서버(여러 gunicorn 워커)에 연결하고,
+서버 밖 프로세스에서 Redis 메시지 큐로 알림을 보내 모든 워커를 거쳐 전달되기까지의 지연을 측정합니다.
+
+준비:
+    pip install websocket-client
+    REDIS_URL=redis://localhost:6379/0 gunicorn --config gunicorn.conf.py backend.app.wsgi:app
+
+사용법:
+    python scripts/load_test_realtime.py --connections 1000 --messages 500
+    python scripts/load_test_realtime.py --connections 10000 --mode broadcast --messages 20
+    python scripts/load_test_realtime.py --url http://localhost:5000 --message-queue redis://localhost:6379/0
+"""
+
+# 클라이언트 수천 개를 그린스레드로 실행
+import eventlet
+
+eventlet.monkey_patch()
+
+import os
+import sys
+import time
+import random
+import argparse
+from collections import Counter
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def connect_client(url: str, user_id: str, timeout: float, latencies: list, counters: Counter):
+    """클라이언트 연결 및 인증 (인증 응답까지의 시간 반환, 실패 시 None)"""
+    import socketio
+
+    client = socketio.Client(reconnection=False)
+    authenticated = eventlet.event.Event()
+
+    @client.on('auth_success')
+    def on_auth_success(data):
+        authenticated.send(True)
+
+    @client.on('new_notification')
+    def on_notification(notification):
+        sent_at = notification.get('data', {}).get('sent_at')
+        if sent_at:
+            latencies.append(time.time() - sent_at)
+        counters['received'] += 1
+
+    started = time.perf_counter()
+    try:
+        client.connect(url, transports=['websocket'], wait_timeout=timeout)
+        client.emit('authenticate', {'user_id': user_id})
+        with eventlet.Timeout(timeout):
+            authenticated.wait()
+    except (Exception, eventlet.Timeout) as e:
+        counters['connect_failed'] += 1
+        counters[f"error:{type(e).__name__}"] += 1
+        return client, None
+    return client, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='실시간 알림 전달 지연 부하 테스트')
+    parser.add_argument('--url', default='http://localhost:5000', help='Socket.IO 서버 URL')
+    parser.add_argument('--message-queue', default=os.environ.get('REDIS_URL', 'redis://localhost:6379/0'),
+                        help='서버와 같은 메시지 큐 URL')
+    parser.add_argument('--connections', type=int, default=1000, help='동시 연결 수')
+    parser.add_argument('--ramp', type=int, default=200, help='동시에 연결을 시도하는 클라이언트 수')
+    parser.add_argument('--mode', choices=['unicast', 'broadcast'], default='unicast',
+                        help='unicast: 메시지마다 임의의 사용자 1명, broadcast: 메시지마다 전체 사용자')
+    parser.add_argument('--messages', type=int, default=500, help='보낼 메시지 수')
+    parser.add_argument('--rate', type=float, default=200.0, help='초당 보낼 메시지 수')
+    parser.add_argument('--timeout', type=float, default=30.0, help='연결/전달 대기 시간 (초)')
+    args = parser.parse_args()
+
+    from flask_socketio import SocketIO
+
+    from backend.realtime.fanout import CHANNEL, user_room
+
+    latencies: list[float] = []
+    counters = Counter()
+    user_ids = [f"load_{index}" for index in range(args.connections)]
+
+    # 1) 연결
+    pool = eventlet.GreenPool(args.ramp)
+    started = time.perf_counter()
+    results = list(pool.imap(
+        lambda user_id: connect_client(args.url, user_id, args.timeout, latencies, counters),
+        user_ids,
+    ))
+    connect_elapsed = time.perf_counter() - started
+    clients = [client for client, _ in results]
+    connect_times = [elapsed for _, elapsed in results if elapsed is not None]
+    connected = len(connect_times)
+    print(f"\n🔌 연결 {connected}/{args.connections}개, {connect_elapsed:.1f}초")
+    print(f"   연결+인증 p50 {percentile(connect_times, 0.5) * 1000:.0f}ms, "
+          f"p99 {percentile(connect_times, 0.99) * 1000:.0f}ms")
+
+    # 2) 서버 밖에서 메시지 큐로 전송 (어느 워커에 연결된 클라이언트든 받아야 함)
+    emitter = SocketIO(message_queue=args.message_queue, channel=CHANNEL)
+    rng = random.Random(7)
+    interval = 1.0 / args.rate if args.rate > 0 else 0
+    expected = 0
+    for seq in range(args.messages):
+        notification = {'type': 'load_test', 'data': {'seq': seq, 'sent_at': time.time()}}
+        if args.mode == 'broadcast':
+            emitter.emit('new_notification', notification)
+            expected += connected
+        else:
+            emitter.emit('new_notification', notification, to=user_room(rng.choice(user_ids)))
+            expected += 1
+        if interval:
+            eventlet.sleep(interval)
+
+    # 3) 전달 대기
+    if args.mode == 'unicast' and connected < args.connections:
+        # 연결에 실패한 사용자에게 보낸 메시지는 전달되지 않음
+        expected = round(expected * connected / args.connections)
+    deadline = time.time() + args.timeout
+    while counters['received'] < expected and time.time() < deadline:
+        eventlet.sleep(0.1)
+
+    print(f"\n📨 {args.mode} {args.messages}건 → 전달 {counters['received']}/{expected}건")
+    print(f"   지연 p50 {percentile(latencies, 0.5) * 1000:.1f}ms, "
+          f"p95 {percentile(latencies, 0.95) * 1000:.1f}ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.1f}ms, "
+          f"max {max(latencies, default=0) * 1000:.1f}ms")
+    errors = {key: count for key, count in counters.items() if key.startswith('error:')}
+    if errors:
+        print(f"   연결 오류: {errors}")
+
+    for client in clients:
+        try:
+            client.disconnect()
+        except Exception:
+            pass
+
+    if connected < args.connections or counters['received'] < expected:
+        print("\n❌ 연결 실패 또는 미전달 메시지 있음")
+        sys.exit(1)
+    print("\n✅ 모든 연결에 메시지 전달 완료")
+
+
+if __name__ == "__main__":
+    main()
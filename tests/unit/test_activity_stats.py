@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+사용자 활동 통계 엔진 단위 테스트
+스트릭 계산, 캐시된 통계의 증분 반영, 커밋 후 캐시 갱신/무효화를 검증합니다.
+"""
+
+from datetime import date
+
+import pytest
+
+from backend.app import cache_manager
+from backend.services import activity_stats
+from backend.services.activity_stats import (
+    DASHBOARD,
+    ActivityStatsService,
+    apply_delta,
+    streak_from_dates,
+)
+
+
+def make_period_entry():
+    return {
+        'computed_at': '2026-10-17T12:00:00',
+        'start_date': '2026-10-10T12:00:00',
+        'counts': {'reviews_written': 0, 'parties_hosted': 0, 'parties_joined': 0,
+                   'random_lunches': 0, 'personal_schedules': 0},
+        'categories': {},
+    }
+
+
+def make_dashboard_entry():
+    return {
+        'computed_at': '2026-10-17T12:00:00',
+        'week_start': '2026-10-12',
+        'counts': {'total_lunches': 3, 'parties_hosted': 0, 'parties_joined': 0,
+                   'total_reviews': 0, 'week_visits': 1},
+        'categories': {'한식': 3},
+        'activity_dates': ['2026-10-16'],
+    }
+
+
+@pytest.fixture
+def store(monkeypatch):
+    data = {}
+
+    def set_cache(key, value, expire_seconds=0):
+        data[key] = value
+        return True
+
+    monkeypatch.setattr(cache_manager.cache_manager, 'set_cache', set_cache)
+    monkeypatch.setattr(cache_manager.cache_manager, 'get_cache', data.get)
+    monkeypatch.setattr(cache_manager.cache_manager, 'delete_cache', lambda key: data.pop(key, None) is not None)
+    return data
+
+
+class TestStreak:
+    """스트릭 계산 테스트"""
+
+    def test_counts_consecutive_days_from_today(self):
+        today = date(2026, 10, 17)
+        dates = [date(2026, 10, 17), date(2026, 10, 16), date(2026, 10, 15), date(2026, 10, 13)]
+        assert streak_from_dates(dates, today) == 3
+
+    def test_no_activity_today_breaks_streak(self):
+        assert streak_from_dates([date(2026, 10, 16)], date(2026, 10, 17)) == 0
+
+    def test_limit(self):
+        today = date(2026, 10, 17)
+        dates = [date.fromordinal(today.toordinal() - i) for i in range(40)]
+        assert streak_from_dates(dates, today, limit=30) == 30
+
+
+class TestApplyDelta:
+    """증분 반영 테스트"""
+
+    def test_period_entry(self):
+        entry = make_period_entry()
+        apply_delta(entry, 'week', 'visit', {'category': '일식', 'date': '2026-10-17'})
+        apply_delta(entry, 'week', 'visit', {'category': '일식', 'date': '2026-10-01'})
+        apply_delta(entry, 'week', 'party', {'is_from_match': True, 'date': '2026-10-20'})
+        apply_delta(entry, 'week', 'member', {'party_created_at': '2026-10-01T09:00:00'})
+        apply_delta(entry, 'week', 'member', {'party_created_at': '2026-10-17T09:00:00'})
+        assert entry['categories'] == {'일식': 1}
+        assert entry['counts']['parties_hosted'] == 1
+        assert entry['counts']['random_lunches'] == 1
+        assert entry['counts']['parties_joined'] == 1
+
+    def test_dashboard_entry(self):
+        entry = make_dashboard_entry()
+        apply_delta(entry, DASHBOARD, 'visit', {'category': '한식', 'date': '2026-10-17'})
+        apply_delta(entry, DASHBOARD, 'party', {'is_from_match': False, 'date': '2026-10-17'})
+        assert entry['counts']['total_lunches'] == 4
+        assert entry['counts']['week_visits'] == 2
+        assert entry['counts']['parties_hosted'] == 1
+        assert entry['activity_dates'] == ['2026-10-17', '2026-10-16']
+
+
+class TestFlushPending:
+    """커밋 후 캐시 갱신 테스트"""
+
+    def test_applies_deltas_to_cached_periods(self, store):
+        store['activity_stats:1:week'] = make_period_entry()
+        ActivityStatsService.apply_pending([('1', 'review', {}), ('1', 'schedule', {})])
+        counts = store['activity_stats:1:week']['counts']
+        assert counts['reviews_written'] == 1 and counts['personal_schedules'] == 1
+        # 캐시되지 않은 기간은 만들지 않음
+        assert 'activity_stats:1:month' not in store
+
+    def test_change_invalidates_user(self, store):
+        store['activity_stats:1:week'] = make_period_entry()
+        store['activity_stats:1:dashboard'] = make_dashboard_entry()
+        store['activity_stats:2:week'] = make_period_entry()
+        ActivityStatsService.apply_pending([('1', 'review', {}), ('1', 'invalidate', {})])
+        assert set(store) == {'activity_stats:2:week'}
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+참여 가능 사용자 비트맵 캐시 단위 테스트
+바쁜 사용자 조회를 대체하여 비트맵 계산, 캐시 재사용, 무효화를 검증합니다.
+"""
+
+import pytest
+
+from backend.services.availability import AvailabilityService
+
+
+BUSY = {
+    '2026-10-20': {'2', '3'},
+    '2026-10-21': {'4', 'inactive'},
+}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    availability = AvailabilityService()
+    availability._ids = ['1', '2', '3', '4', '5']
+    availability._position = {employee_id: i for i, employee_id in enumerate(availability._ids)}
+    availability._all_mask = (1 << len(availability._ids)) - 1
+    monkeypatch.setattr(availability, '_ensure_fresh', lambda: None)
+
+    calls = []
+
+    def query_busy(start_key, end_key):
+        calls.append((start_key, end_key))
+        return {key: users for key, users in BUSY.items() if start_key <= key <= end_key}
+
+    monkeypatch.setattr(availability, '_query_busy', query_busy)
+    availability.calls = calls
+    return availability
+
+
+class TestAvailabilityService:
+    """참여 가능 사용자 캐시 테스트"""
+
+    def test_single_date(self, service):
+        assert service.get_available_user_ids('2026-10-20') == {'1', '4', '5'}
+        assert service.count_available('2026-10-20') == 3
+        assert service.is_available('1', '2026-10-20')
+        assert not service.is_available('2', '2026-10-20')
+        assert not service.is_available('unknown', '2026-10-20')
+
+    def test_range_uses_one_query_and_caches(self, service):
+        result = service.get_available_user_ids_for_range('2026-10-19', '2026-10-21')
+        assert result == {
+            '2026-10-19': {'1', '2', '3', '4', '5'},
+            '2026-10-20': {'1', '4', '5'},
+            '2026-10-21': {'1', '2', '3', '5'},
+        }
+        assert service.calls == [('2026-10-19', '2026-10-21')]
+
+        service.get_available_user_ids('2026-10-20')
+        assert len(service.calls) == 1
+
+    def test_invalidate_date(self, service):
+        service.get_available_user_ids_for_range('2026-10-20', '2026-10-21')
+        service.invalidate('2026-10-21')
+        service.get_available_user_ids_for_range('2026-10-20', '2026-10-21')
+        assert service.calls[-1] == ('2026-10-21', '2026-10-21')
+
+    def test_invalid_range(self, service):
+        with pytest.raises(ValueError):
+            service.get_available_user_ids_for_range('2026-10-21', '2026-10-20')
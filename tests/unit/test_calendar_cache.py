@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+캘린더 응답 캐시 단위 테스트
+일정 계산과 캐시 저장소를 대체하여 월 단위 캐시 재사용, 버전 무효화, ETag를 검증합니다.
+"""
+
+from datetime import date
+
+import pytest
+
+from backend.app import cache_manager
+from backend.services import calendar_cache
+from backend.services.calendar_cache import CalendarCacheService, month_starts
+from backend.services.schedule_service import ScheduleService
+
+
+@pytest.fixture
+def store(monkeypatch):
+    data = {}
+
+    def set_cache(key, value, expire_seconds=0):
+        data[key] = value
+        return True
+
+    monkeypatch.setattr(cache_manager.cache_manager, 'set_cache', set_cache)
+    monkeypatch.setattr(cache_manager.cache_manager, 'get_cache', data.get)
+    monkeypatch.setattr(cache_manager.cache_manager, 'delete_cache', lambda key: data.pop(key, None) is not None)
+    return data
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    calls = []
+    events = {'2026-10-20': '점심', '2026-11-03': '회식'}
+
+    def query_schedules_for_period(employee_id, start_date, end_date):
+        if events.get('fail'):
+            raise RuntimeError('DB 연결 실패')
+        calls.append((start_date, end_date))
+        return [
+            {'date': key, 'events': [{'title': title}]}
+            for key, title in sorted(events.items())
+            if start_date.isoformat() <= key <= end_date.isoformat()
+        ]
+
+    monkeypatch.setattr(ScheduleService, 'query_schedules_for_period', staticmethod(query_schedules_for_period))
+    return calls, events
+
+
+class TestCalendarCache:
+    """월 단위 캐시 및 ETag 테스트"""
+
+    def test_month_starts(self):
+        assert month_starts(date(2026, 10, 20), date(2027, 1, 5)) == [
+            date(2026, 10, 1), date(2026, 11, 1), date(2026, 12, 1), date(2027, 1, 1)
+        ]
+
+    def test_range_is_sliced_from_cached_months(self, store, computed):
+        calls, _ = computed
+        groups, etag = CalendarCacheService.get_range('1', date(2026, 10, 15), date(2026, 11, 10))
+        assert [group['date'] for group in groups] == ['2026-10-20', '2026-11-03']
+        assert calls == [(date(2026, 10, 1), date(2026, 10, 31)), (date(2026, 11, 1), date(2026, 11, 30))]
+
+        again, same_etag = CalendarCacheService.get_range('1', date(2026, 10, 15), date(2026, 11, 10))
+        assert again == groups and same_etag == etag
+        assert len(calls) == 2
+
+        narrower, other_etag = CalendarCacheService.get_range('1', date(2026, 10, 21), date(2026, 10, 31))
+        assert narrower == [] and other_etag != etag
+
+    def test_commit_invalidates_user_months(self, store, computed):
+        calls, events = computed
+        _, etag = CalendarCacheService.get_range('1', date(2026, 10, 1), date(2026, 10, 31))
+
+        events['2026-10-21'] = '추가'
+        CalendarCacheService.invalidate_employees({'1'})
+
+        groups, new_etag = CalendarCacheService.get_range('1', date(2026, 10, 1), date(2026, 10, 31))
+        assert [group['date'] for group in groups] == ['2026-10-20', '2026-10-21']
+        assert new_etag != etag
+        assert len(calls) == 2
+
+    def test_without_cache_store_still_returns_etag(self, monkeypatch, computed):
+        monkeypatch.setattr(cache_manager.cache_manager, 'set_cache', lambda *args, **kwargs: False)
+        monkeypatch.setattr(cache_manager.cache_manager, 'get_cache', lambda key: None)
+        calls, _ = computed
+
+        _, first = CalendarCacheService.get_range('1', date(2026, 10, 1), date(2026, 10, 31))
+        _, second = CalendarCacheService.get_range('1', date(2026, 10, 1), date(2026, 10, 31))
+        assert first == second
+        assert len(calls) == 2
+
+    def test_query_error_is_not_cached(self, store, computed):
+        calls, events = computed
+        events['fail'] = True
+        with pytest.raises(RuntimeError):
+            CalendarCacheService.get_range('1', date(2026, 10, 1), date(2026, 10, 31))
+        assert 'calendar:1:2026-10' not in store
+
+        del events['fail']
+        groups, _ = CalendarCacheService.get_range('1', date(2026, 10, 1), date(2026, 10, 31))
+        assert [group['date'] for group in groups] == ['2026-10-20']
+        assert len(calls) == 1
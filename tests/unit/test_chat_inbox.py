@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+채팅방 목록 서비스 단위 테스트
+캐시된 첫 페이지에도 읽음 처리 후의 읽지 않은 수가 반영되는지 검증합니다.
+"""
+
+from backend.services.chat_inbox import ChatInboxService
+from backend.services.chat_unread import ChatUnreadService
+
+
+class _FakeInboxCache:
+    def __init__(self):
+        self.pages = {}
+
+    def get_cached_inbox(self, employee_id, variant):
+        return self.pages.get((employee_id, variant))
+
+    def cache_inbox(self, employee_id, variant, page, ttl=None):
+        self.pages[(employee_id, variant)] = page
+
+
+def test_cached_page_uses_current_unread_counts(monkeypatch):
+    from backend.utils import cache_manager as cache_module
+
+    cache = _FakeInboxCache()
+    monkeypatch.setattr(cache_module, 'chat_cache_manager', cache)
+    page = {"chats": [{"id": 1, "type": "party"}, {"id": 2, "type": "dm"}], "has_more": False, "next_cursor": None}
+    monkeypatch.setattr(ChatInboxService, '_query_inbox', staticmethod(lambda *args: page))
+
+    counts = {'party:1': 3}
+    monkeypatch.setattr(ChatUnreadService, 'get_unread_counts', staticmethod(lambda user_id: dict(counts)))
+
+    first = ChatInboxService.get_inbox('1')
+    assert [chat['unread_count'] for chat in first['chats']] == [3, 0]
+
+    # 읽음 처리 후 캐시된 페이지를 다시 조회
+    counts['party:1'] = 0
+    second = ChatInboxService.get_inbox('1')
+    assert [chat['unread_count'] for chat in second['chats']] == [0, 0]
+    assert all('unread_count' not in chat for chat in cache.pages[('1', '*:20')]['chats'])
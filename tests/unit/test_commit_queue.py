@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+커밋 후 작업 큐 단위 테스트
+커밋되면 모은 작업을 한 번에 처리하고, 롤백되면 버리는지 검증합니다.
+"""
+
+import pytest
+from sqlalchemy import Integer, create_engine, event
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from backend.services.commit_queue import CommitQueue
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = 'item'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+@pytest.fixture
+def queue():
+    handled = []
+    queue = CommitQueue('test_commit_queue', handled.append)
+    # 여러 번 연결해도 한 번만 처리
+    queue.register()
+    queue.register()
+    yield queue, handled
+    event.remove(Session, 'after_commit', queue.flush)
+    event.remove(Session, 'after_rollback', queue.discard)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+class TestCommitQueue:
+    """커밋/롤백 처리 테스트"""
+
+    def test_commit_flushes_once(self, queue, session):
+        queue, handled = queue
+        item = Item()
+        session.add(item)
+        queue.pending(item).update({'1', '2'})
+        queue.pending(item).add('1')
+        session.commit()
+        session.commit()
+        assert handled == [{'1', '2'}]
+
+    def test_rollback_discards(self, queue, session):
+        queue, handled = queue
+        item = Item()
+        session.add(item)
+        queue.pending(item).add('1')
+        session.rollback()
+        session.commit()
+        assert handled == []
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+사용자 호환성 엔진 단위 테스트
+벡터 연산 결과가 사용자 쌍별 직접 계산과 일치하는지 검증합니다.
+"""
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.services.compatibility import CompatibilityEngine, extract_profile
+
+
+FOODS = ['한식', '중식', '일식', '양식', '분식', '아시안']
+STYLES = ['조용한', '대화', '빠른', '맛집탐방']
+HOBBIES = ['등산', '독서', '게임', '영화', '축구']
+
+
+def make_user(i, rng):
+    return SimpleNamespace(
+        employee_id=str(i),
+        is_active=True,
+        department=rng.choice(['개발', '영업', '인사', None]),
+        level=rng.randint(1, 6),
+        age=rng.choice([None, rng.randint(23, 55)]),
+        hobbies=','.join(rng.sample(HOBBIES, rng.randint(0, 3))),
+        preferences=','.join(rng.sample(FOODS, rng.randint(0, 3))),
+        food_preferences=','.join(rng.sample(FOODS, rng.randint(0, 3))),
+        lunch_preference=','.join(rng.sample(STYLES, rng.randint(0, 2))),
+    )
+
+
+def reference_match_score(u1, u2):
+    p1, p2 = extract_profile(u1), extract_profile(u2)
+    score = 0
+    if p1['department'] and p1['department'] == p2['department']:
+        score += 30
+    level_diff = abs(p1['level'] - p2['level'])
+    score += 20 if level_diff <= 1 else 10 if level_diff <= 2 else 0
+    age_diff = abs(p1['age'] - p2['age']) if p1['age'] is not None and p2['age'] is not None else 0
+    score += 15 if age_diff <= 3 else 10 if age_diff <= 5 else 0
+    score += len(p1['hobbies'] & p2['hobbies']) * 5
+    score += len(p1['preferences'] & p2['preferences']) * 4
+    return min(score, 100)
+
+
+def reference_preference_score(u1, u2):
+    p1, p2 = extract_profile(u1), extract_profile(u2)
+
+    def jaccard(a, b):
+        return len(a & b) / len(a | b) * 100 if a and b else 0
+
+    return jaccard(p1['food'], p2['food']) * 0.6 + jaccard(p1['style'], p2['style']) * 0.4
+
+
+@pytest.fixture
+def users():
+    rng = random.Random(3)
+    return [make_user(i, rng) for i in range(1, 61)]
+
+
+@pytest.fixture
+def engine(users):
+    compatibility = CompatibilityEngine()
+    compatibility.load(users)
+    return compatibility
+
+
+class TestCompatibilityEngine:
+    """호환성 엔진 테스트"""
+
+    def test_scores_for_matches_reference(self, engine, users):
+        ids, scores = engine.scores_for('1')
+        by_id = {u.employee_id: u for u in users}
+
+        assert '1' not in ids
+        assert len(ids) == len(users) - 1
+        expected = [reference_match_score(by_id['1'], by_id[uid]) for uid in ids]
+        assert scores == pytest.approx(expected)
+
+    def test_preference_matrix_matches_reference(self, engine, users):
+        ids, matrix = engine.score_matrix([u.employee_id for u in users[:20]], kind='preference')
+        by_id = {u.employee_id: u for u in users}
+
+        for i, a in enumerate(ids):
+            for j, b in enumerate(ids):
+                expected = 0 if i == j else reference_preference_score(by_id[a], by_id[b])
+                assert matrix[i, j] == pytest.approx(expected, abs=1e-3)
+
+    def test_matrix_is_symmetric(self, engine):
+        _, matrix = engine.score_matrix()
+        assert np.allclose(matrix, matrix.T)
+
+    def test_score_blocks_match_matrix(self, engine, monkeypatch):
+        monkeypatch.setattr(CompatibilityEngine, 'MATRIX_BLOCK', 16)
+        ids, matrix = engine.score_matrix(kind='preference')
+        block_ids, blocks = engine.score_blocks(kind='preference')
+
+        assert block_ids == ids
+        stacked = np.vstack([block for _, block in blocks])
+        assert np.allclose(stacked, matrix)
+
+    def test_candidate_filter(self, engine):
+        ids, scores = engine.scores_for('1', candidate_ids=['2', '3', 'missing'])
+        assert ids == ['2', '3']
+        assert len(scores) == 2
+
+    def test_refresh_user_updates_row(self, engine, users):
+        user = users[0]
+        user.food_preferences = '한식,중식'
+        user.lunch_preference = '대화'
+        other = users[1]
+        other.food_preferences = '한식,중식'
+        other.lunch_preference = '대화'
+
+        engine.refresh_user(user)
+        engine.refresh_user(other)
+
+        assert engine.pair_score('1', '2', kind='preference') == pytest.approx(100.0)
+
+    def test_refresh_user_with_new_token_and_new_user(self, engine, users):
+        newcomer = make_user(999, random.Random(1))
+        newcomer.hobbies = '서핑'
+        users[0].hobbies = '서핑'
+
+        engine.refresh_user(newcomer)
+        engine.refresh_user(users[0])
+
+        assert '999' in engine
+        assert engine.pair_score('1', '999') == pytest.approx(reference_match_score(users[0], newcomer))
+
+    def test_inactive_user_removed(self, engine, users):
+        users[4].is_active = False
+        engine.refresh_user(users[4])
+
+        assert users[4].employee_id not in engine
+        assert engine.pair_score('1', users[4].employee_id) == 0.0
+
+    def test_snapshot_engine_never_rebuilds(self, users, monkeypatch):
+        snapshot = CompatibilityEngine(auto_refresh=False)
+        snapshot.load(users[:10])
+        monkeypatch.setattr(CompatibilityEngine, 'REFRESH_INTERVAL', -1)
+        monkeypatch.setattr(snapshot, 'rebuild', lambda: pytest.fail('스냅샷 엔진이 재구축됨'))
+
+        ids, blocks = snapshot.score_blocks(kind='preference')
+        assert len(ids) == 10
+        assert sum(len(block) for _, block in blocks) == 10
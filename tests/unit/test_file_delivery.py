@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+첨부파일 전달 단위 테스트
+내용 해시 ETag, 조건부/Range 요청, 캐시 헤더와 프록시 위임 모드를 검증합니다.
+"""
+
+import pytest
+from flask import Flask
+
+from backend.services.file_delivery import FileDeliveryService
+from backend.utils.file_manager import file_manager
+
+CONTENT_HASH = 'ab' * 32
+
+
+@pytest.fixture
+def blob(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_manager, 'upload_folder', str(tmp_path))
+    path = tmp_path / 'blobs' / 'ab' / 'ab' / f'{CONTENT_HASH}.mp4'
+    path.parent.mkdir(parents=True)
+    path.write_bytes(bytes(range(256)) * 4)
+    return path
+
+
+@pytest.fixture
+def app(blob):
+    app = Flask(__name__)
+
+    @app.route('/file')
+    def serve():
+        return FileDeliveryService.send(
+            str(blob), 'video/mp4', etag=FileDeliveryService.etag(CONTENT_HASH),
+            download_name='동영상.mp4', as_attachment=False
+        )
+
+    return app
+
+
+class TestSendFile:
+    """기본 모드 (Flask가 직접 전송)"""
+
+    def test_strong_etag_and_immutable(self, app):
+        response = app.test_client().get('/file')
+        assert response.status_code == 200
+        assert response.headers['ETag'] == f'"{CONTENT_HASH}"'
+        cache_control = response.headers['Cache-Control']
+        assert 'immutable' in cache_control and 'private' in cache_control
+        assert 'no-cache' not in cache_control
+        assert f'max-age={FileDeliveryService.IMMUTABLE_MAX_AGE}' in cache_control
+        assert response.headers['Accept-Ranges'] == 'bytes'
+
+    def test_if_none_match_returns_304(self, app):
+        response = app.test_client().get('/file', headers={'If-None-Match': f'"{CONTENT_HASH}"'})
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_range_returns_partial_content(self, app):
+        response = app.test_client().get('/file', headers={'Range': 'bytes=256-511'})
+        assert response.status_code == 206
+        assert response.headers['Content-Range'] == 'bytes 256-511/1024'
+        assert response.data == bytes(range(256))
+
+    def test_non_ascii_download_name(self, app):
+        disposition = app.test_client().get('/file').headers['Content-Disposition']
+        assert disposition.startswith('inline')
+        assert "filename*=UTF-8''%EB%8F%99%EC%98%81%EC%83%81.mp4" in disposition
+
+    def test_legacy_file_without_hash(self):
+        assert FileDeliveryService.etag(None) is None
+        assert FileDeliveryService.etag(CONTENT_HASH, 'thumb') == f'{CONTENT_HASH}-thumb'
+
+
+class TestOffload:
+    """프록시 위임 모드"""
+
+    def test_x_accel_redirect(self, app):
+        app.config['FILE_DELIVERY_MODE'] = 'x-accel'
+        response = app.test_client().get('/file')
+        assert response.status_code == 200
+        assert response.headers['X-Accel-Redirect'] == f'/protected-files/blobs/ab/ab/{CONTENT_HASH}.mp4'
+        assert response.data == b''
+        assert response.headers['ETag'] == f'"{CONTENT_HASH}"'
+
+    def test_x_accel_conditional(self, app):
+        app.config['FILE_DELIVERY_MODE'] = 'x-accel'
+        response = app.test_client().get('/file', headers={'If-None-Match': f'"{CONTENT_HASH}"'})
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_x_sendfile_uses_absolute_path(self, app, blob):
+        app.config['FILE_DELIVERY_MODE'] = 'x-sendfile'
+        response = app.test_client().get('/file')
+        assert response.headers['X-Sendfile'] == str(blob)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+파일 저장소 단위 테스트
+스트리밍 업로드의 크기 제한과 내용 해시 중복 제거, 재개 가능한 조각 업로드를 검증합니다.
+"""
+
+import fcntl
+import hashlib
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from backend.utils import file_manager as file_manager_module
+from backend.utils.file_manager import FileManager
+
+CONTENT = b'%PDF-1.4 ' + b'x' * 5000
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # python-magic 유무와 관계없이 파일명으로 형식 판별
+    monkeypatch.setattr(file_manager_module, 'magic', None)
+    manager = FileManager(upload_folder=str(tmp_path), max_file_size=8000)
+    manager.CHUNK_SIZE = 1024
+    return manager
+
+
+def _upload(name, data):
+    return SimpleNamespace(filename=name, stream=io.BytesIO(data))
+
+
+class TestStreamingUpload:
+    """스트리밍 업로드 테스트"""
+
+    def test_identical_content_is_stored_once(self, manager, tmp_path):
+        first, _ = manager.upload_file(_upload('a.pdf', CONTENT), 'document')
+        manager.finalize_blob(first)
+        second, message = manager.upload_file(_upload('b.pdf', CONTENT), 'document')
+        manager.finalize_blob(second)
+
+        assert first['file_hash'] == hashlib.sha256(CONTENT).hexdigest()
+        assert second['file_path'] == first['file_path'] and second['deduplicated']
+        assert '재사용' in message
+        with open(first['file_path'], 'rb') as f:
+            assert f.read() == CONTENT
+        assert 'temp_path' not in second
+        assert os.listdir(tmp_path / 'temp') == []
+
+    def test_finalize_restores_blob_deleted_before_commit(self, manager):
+        first, _ = manager.upload_file(_upload('a.pdf', CONTENT), 'document')
+        manager.finalize_blob(first)
+        second, _ = manager.upload_file(_upload('b.pdf', CONTENT), 'document')
+        assert second['deduplicated']
+
+        # 두 번째 행을 커밋하기 전에 마지막 첨부파일이 삭제돼 저장소 파일이 사라짐
+        with manager.blob_lock(first['file_hash']):
+            os.remove(first['file_path'])
+        manager.finalize_blob(second)
+
+        with open(second['file_path'], 'rb') as f:
+            assert f.read() == CONTENT
+
+    def test_blob_lock_times_out_while_held(self, manager):
+        manager.BLOB_LOCK_TIMEOUT = 0.05
+        with manager.blob_lock('ab' * 32):
+            with pytest.raises(TimeoutError):
+                with manager.blob_lock('ab' * 32):
+                    pass
+
+    def test_size_limit_stops_stream(self, manager, tmp_path):
+        metadata, message = manager.upload_file(_upload('big.pdf', CONTENT * 2), 'document')
+        assert metadata is None and '너무 큽니다' in message
+        assert os.listdir(tmp_path / 'temp') == []
+
+    def test_disallowed_type_rejected(self, manager):
+        metadata, message = manager.upload_file(_upload('a.exe', CONTENT), 'document')
+        assert metadata is None and '문서 형식' in message
+
+
+class TestResumableUpload:
+    """재개 가능한 조각 업로드 테스트"""
+
+    def test_resume_from_received_offset(self, manager):
+        upload_id = 'upload-0001'
+        total = len(CONTENT)
+        result, _ = manager.append_upload_chunk(upload_id, 0, io.BytesIO(CONTENT[:2000]), 'a.pdf', total, 'document')
+        assert result == {'upload_id': upload_id, 'received': 2000, 'complete': False}
+
+        # 같은 조각을 다시 보내면 받은 위치를 알려줌
+        result, _ = manager.append_upload_chunk(upload_id, 0, io.BytesIO(CONTENT[:2000]), 'a.pdf', total, 'document')
+        assert result['conflict'] and result['received'] == manager.get_upload_offset(upload_id) == 2000
+
+        result, _ = manager.append_upload_chunk(upload_id, 2000, io.BytesIO(CONTENT[2000:]), 'a.pdf', total, 'document')
+        assert result['complete']
+        assert result['file_metadata']['file_hash'] == hashlib.sha256(CONTENT).hexdigest()
+        manager.finalize_blob(result['file_metadata'])
+        assert manager.get_upload_offset(upload_id) == total
+        assert os.path.exists(result['file_metadata']['file_path'])
+
+    @pytest.mark.parametrize('finalized', [False, True])
+    def test_replayed_final_chunk_is_rejected(self, manager, finalized):
+        upload_id = 'upload-0004'
+        total = len(CONTENT)
+        result, _ = manager.append_upload_chunk(upload_id, 0, io.BytesIO(CONTENT), 'a.pdf', total, 'document')
+        assert result['complete']
+        if finalized:
+            manager.finalize_blob(result['file_metadata'])
+
+        # 응답을 못 받은 클라이언트가 마지막 요청을 다시 보내도 완료로 처리하지 않음
+        for offset, body in ((total, b''), (0, CONTENT)):
+            replay, _ = manager.append_upload_chunk(upload_id, offset, io.BytesIO(body), 'a.pdf', total, 'document')
+            assert replay == {'upload_id': upload_id, 'received': total, 'conflict': True, 'complete': True}
+        if finalized:
+            assert not os.path.exists(manager._part_path(upload_id))
+        else:
+            assert os.path.getsize(manager._part_path(upload_id)) == total
+
+    def test_concurrent_chunk_is_rejected_while_part_is_locked(self, manager):
+        upload_id = 'upload-0002'
+        total = len(CONTENT)
+        manager.append_upload_chunk(upload_id, 0, io.BytesIO(CONTENT[:2000]), 'a.pdf', total, 'document')
+
+        # 같은 조각을 보내는 다른 요청이 파일을 잡고 있으면 이어 붙이지 않음
+        with open(manager._part_path(upload_id), 'ab') as other:
+            fcntl.flock(other, fcntl.LOCK_EX)
+            result, _ = manager.append_upload_chunk(upload_id, 2000, io.BytesIO(CONTENT[2000:4000]), 'a.pdf', total, 'document')
+        assert result['conflict'] and manager.get_upload_offset(upload_id) == 2000
+
+    def test_offset_is_rechecked_under_lock(self, manager, monkeypatch):
+        upload_id = 'upload-0003'
+        total = len(CONTENT)
+        manager.append_upload_chunk(upload_id, 0, io.BytesIO(CONTENT[:2000]), 'a.pdf', total, 'document')
+
+        # 잠그기 전에 읽은 위치가 오래된 경우 (다른 요청이 그 사이에 이어 붙임)
+        monkeypatch.setattr(manager, 'get_upload_offset', lambda _: 0)
+        result, _ = manager.append_upload_chunk(upload_id, 0, io.BytesIO(CONTENT[:2000]), 'a.pdf', total, 'document')
+        assert result['conflict'] and result['received'] == 2000
+        assert os.path.getsize(manager._part_path(upload_id)) == 2000
+
+    def test_invalid_upload_id(self, manager):
+        assert manager.get_upload_offset('../etc') is None
+        result, _ = manager.append_upload_chunk('../etc', 0, io.BytesIO(CONTENT), 'a.pdf', len(CONTENT), 'document')
+        assert result is None
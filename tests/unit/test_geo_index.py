@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+식당 위치 인덱스 단위 테스트
+반경 검색 결과가 단순 Haversine 전수 계산과 일치하는지 검증합니다.
+"""
+
+import random
+from math import radians, cos, sin, asin, sqrt
+
+import pytest
+
+from backend.services.geo_index import RestaurantGeoIndex
+
+
+def brute_force_distance(lat1, lng1, lat2, lng2):
+    """RestaurantV2.calculate_distance와 동일한 계산"""
+    lat1, lng1, lat2, lng2 = map(radians, (lat1, lng1, lat2, lng2))
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lng2 - lng1) / 2) ** 2
+    return round(2 * asin(sqrt(a)) * 6371, 2)
+
+
+@pytest.fixture
+def rows():
+    rng = random.Random(42)
+    return [
+        (i, 37.5 + rng.uniform(-0.05, 0.05), 127.0 + rng.uniform(-0.05, 0.05))
+        for i in range(1, 501)
+    ]
+
+
+@pytest.fixture
+def index(rows):
+    geo_index = RestaurantGeoIndex()
+    geo_index.load(rows)
+    return geo_index
+
+
+def expected_within(rows, lat, lng, radius):
+    result = []
+    for restaurant_id, r_lat, r_lng in rows:
+        distance = brute_force_distance(r_lat, r_lng, lat, lng)
+        if distance <= radius:
+            result.append((distance, restaurant_id))
+    result.sort()
+    return [(restaurant_id, distance) for distance, restaurant_id in result]
+
+
+class TestRestaurantGeoIndex:
+    """위치 인덱스 테스트"""
+
+    def test_query_radius_matches_brute_force(self, index, rows):
+        """반경 검색 결과가 전수 계산과 동일"""
+        page, total = index.query_radius(37.5, 127.0, 2.0)
+        expected = expected_within(rows, 37.5, 127.0, 2.0)
+
+        assert total == len(expected)
+        assert [rid for rid, _ in page] == [rid for rid, _ in expected]
+        assert [d for _, d in page] == pytest.approx([d for _, d in expected])
+
+    def test_query_radius_pagination(self, index, rows):
+        """페이지 범위만 반환하고 전체 개수는 유지"""
+        expected = expected_within(rows, 37.5, 127.0, 3.0)
+
+        page, total = index.query_radius(37.5, 127.0, 3.0, offset=5, limit=10)
+
+        assert total == len(expected)
+        assert [rid for rid, _ in page] == [rid for rid, _ in expected[5:15]]
+
+    def test_query_radius_offset_past_end(self, index):
+        """마지막 페이지 이후는 빈 결과"""
+        page, total = index.query_radius(37.5, 127.0, 1.0, offset=10_000, limit=10)
+        assert page == []
+        assert total > 0
+
+    def test_query_radius_candidate_filter(self, index, rows):
+        """후보 ID 집합으로 결과 제한"""
+        allowed = {rid for rid, _, _ in rows if rid % 3 == 0}
+
+        page, total = index.query_radius(37.5, 127.0, 5.0, candidate_ids=allowed)
+
+        assert page
+        assert all(rid in allowed for rid, _ in page)
+        assert total == len([e for e in expected_within(rows, 37.5, 127.0, 5.0) if e[0] in allowed])
+
+    def test_empty_index(self):
+        """비어 있는 인덱스"""
+        geo_index = RestaurantGeoIndex()
+        geo_index.load([])
+
+        assert geo_index.query_radius(37.5, 127.0, 5.0) == ([], 0)
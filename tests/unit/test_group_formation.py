@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+그룹 편성 엔진 단위 테스트
+엔진 점수가 calculate_group_score와 일치하는지, 모든 사용자가 2~4명 그룹에 한 번씩 배정되는지 검증합니다.
+"""
+
+import random
+
+import pytest
+
+from backend.app.group_matching import calculate_group_score, generate_groups
+from backend.services.group_formation import GroupFormationSolver, _PairScores, initial_group_sizes
+
+DATE = '2025-01-15'
+FOODS = ['한식', '중식', '일식', '양식', '분식']
+STYLES = ['빠른 식사', '대화 중심', '맛집 탐방', '가성비']
+
+
+def make_users(count, seed=7):
+    rng = random.Random(seed)
+    return {
+        f'user_{i}': {
+            'foodPreferences': rng.sample(FOODS, rng.randint(0, 3)),
+            'lunchStyle': rng.sample(STYLES, rng.randint(1, 2)),
+            'preferredTime': rng.choice(['12:00', '12:30', None]),
+            'allergies': rng.choice([None, ['견과류'], []]),
+        }
+        for i in range(count)
+    }
+
+
+def assert_partition(groups, users):
+    members = [u for group in groups for u in group]
+    assert sorted(members) == sorted(users)
+    assert all(2 <= len(group) <= 4 for group in groups)
+
+
+class TestGroupFormation:
+    """그룹 편성 엔진 테스트"""
+
+    @pytest.mark.parametrize('count', [2, 4, 5, 7, 30])
+    def test_partition_covers_everyone(self, count):
+        users = make_users(count)
+        result = GroupFormationSolver(users, DATE, seed=1).solve()
+        assert_partition(result['groups'], users)
+
+    def test_initial_sizes(self):
+        assert initial_group_sizes(1) == []
+        assert initial_group_sizes(4) == [4]
+        assert sorted(initial_group_sizes(7)) == [3, 4]
+        assert sorted(initial_group_sizes(8)) == [2, 3, 3]
+
+    def test_scores_match_calculate_group_score(self):
+        users = make_users(40)
+        result = GroupFormationSolver(users, DATE, seed=3).solve()
+        expected = [calculate_group_score(group, users, DATE) for group in result['groups']]
+        assert result['group_scores'] == expected
+        assert result['total_score'] == sum(expected)
+
+    def test_bitset_pairs_match_matrix(self, monkeypatch):
+        users = make_users(25)
+        ids = list(users)
+        with_matrix = _PairScores(ids, users)
+        monkeypatch.setattr(_PairScores, 'MATRIX_LIMIT', 0)
+        bitsets = _PairScores(ids, users)
+        assert bitsets.matrix is None
+        for i in range(len(ids)):
+            assert bitsets.row(i).tolist() == with_matrix.row(i).tolist()
+            for j in range(len(ids)):
+                if i != j:
+                    assert bitsets.pair(i, j) == with_matrix.pair(i, j)
+
+    def test_annealing_improves_greedy_start(self):
+        users = make_users(120)
+        result = GroupFormationSolver(users, DATE, seed=5).solve()
+        assert result['total_score'] >= result['initial_score']
+
+    def test_generate_groups_is_deterministic_per_date(self):
+        users = make_users(20)
+        first = generate_groups(users, DATE, 'user_0', num_groups=3)
+        second = generate_groups(users, DATE, 'user_0', num_groups=3)
+        assert len(first) == 3
+        assert [g['members'] for g in first] == [g['members'] for g in second]
+        assert [g['score'] for g in first] == sorted((g['score'] for g in first), reverse=True)
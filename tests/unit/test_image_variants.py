@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+이미지 변형 생성기 단위 테스트
+변형 크기/형식, 투명 이미지 처리, 상태 기록과 중복 작업 차단을 검증합니다.
+"""
+
+import pytest
+from PIL import Image
+
+from backend.services import image_variants as variants_module
+from backend.services.image_variants import FAILED, READY, VARIANTS, ImageVariantProcessor, render_variants
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    calls = []
+    monkeypatch.setattr(variants_module, 'record_variant_status',
+                        lambda content_hash, status: calls.append((content_hash, status)) or 1)
+    return calls
+
+
+class TestRender:
+    """변형 생성 테스트"""
+
+    def test_large_jpeg_variants(self, tmp_path):
+        source = tmp_path / 'photo.jpg'
+        Image.new('RGB', (4000, 3000), (10, 100, 200)).save(source, 'JPEG')
+
+        paths = render_variants(str(source), 'ab' * 32, str(tmp_path / 'variants'))
+        assert set(paths) == set(VARIANTS)
+        with Image.open(paths['thumb']) as thumb:
+            assert thumb.format == 'JPEG' and thumb.size == (200, 150)
+        with Image.open(paths['medium']) as medium:
+            assert medium.size == (1280, 960)
+        with Image.open(paths['webp']) as webp:
+            assert webp.format == 'WEBP' and webp.size == (1280, 960)
+
+    def test_transparent_png_is_flattened(self, tmp_path):
+        source = tmp_path / 'logo.png'
+        Image.new('RGBA', (300, 100), (0, 0, 0, 0)).save(source, 'PNG')
+
+        paths = render_variants(str(source), 'cd' * 32, str(tmp_path / 'variants'))
+        with Image.open(paths['thumb']) as thumb:
+            assert thumb.mode == 'RGB' and thumb.getpixel((0, 0)) == (255, 255, 255)
+
+
+class TestProcessor:
+    """작업 관리 테스트"""
+
+    def test_inline_records_status(self, tmp_path, recorded):
+        source = tmp_path / 'photo.png'
+        Image.new('RGB', (50, 50)).save(source, 'PNG')
+        processor = ImageVariantProcessor()
+
+        assert processor.enqueue('ef' * 32, str(source), str(tmp_path / 'variants')) == 'inline'
+        assert processor.enqueue('00' * 32, str(tmp_path / 'missing.png'), str(tmp_path / 'variants')) == 'inline'
+        assert recorded == [('ef' * 32, READY), ('00' * 32, FAILED)]
+
+    def test_inflight_content_is_not_queued_twice(self, recorded):
+        processor = ImageVariantProcessor()
+        processor._inflight.add('ab' * 32)
+        assert processor.enqueue('ab' * 32, 'unused', 'unused') == 'duplicate'
+        assert recorded == []
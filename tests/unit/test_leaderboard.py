@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+포인트 리더보드 단위 테스트
+정렬 인덱스의 순위(동점 처리), 상위 N명, 내 주변 조회와 적립 반영을 검증합니다.
+"""
+
+import random
+
+import pytest
+
+from backend.services.leaderboard import RankIndex, LeaderboardService
+
+
+def naive_rank(scores, member):
+    return sum(score > scores[member] for score in scores.values()) + 1
+
+
+@pytest.fixture
+def service(monkeypatch):
+    scores = {'a': 300, 'b': 200, 'c': 200, 'd': 100, 'e': 0}
+    monkeypatch.setattr(LeaderboardService, '_redis', staticmethod(lambda: None))
+    monkeypatch.setattr(LeaderboardService, 'load_scores', staticmethod(lambda period: dict(scores)))
+    return LeaderboardService()
+
+
+class TestRankIndex:
+    """정렬 인덱스 테스트"""
+
+    def test_matches_naive_rank_after_updates(self):
+        rng = random.Random(7)
+        scores = {f"u{i}": rng.randint(0, 50) for i in range(200)}
+        index = RankIndex(scores)
+        for _ in range(500):
+            member = f"u{rng.randint(0, 249)}"
+            delta = rng.randint(0, 20)
+            scores[member] = scores.get(member, 0) + delta
+            index.add(member, delta)
+
+        assert len(index) == len(scores)
+        for member in scores:
+            assert index.higher_count(index.score(member)) + 1 == naive_rank(scores, member)
+        ordered = index.ordered(0, len(index))
+        assert [score for _, score in ordered] == sorted(scores.values(), reverse=True)
+
+
+class TestLeaderboardService:
+    """순위/상위/주변 조회 테스트"""
+
+    def test_rank_shares_ties(self, service):
+        assert service.rank('b') == {'rank': 2, 'score': 200, 'total': 5}
+        assert service.rank('c')['rank'] == 2
+        assert service.rank('d')['rank'] == 4
+        # 보드에 없는 사용자는 0점
+        assert service.rank('zz') == {'rank': 5, 'score': 0, 'total': 5}
+
+    def test_top_and_around(self, service):
+        assert [(e['employee_id'], e['rank']) for e in service.top(3)] == [('a', 1), ('b', 2), ('c', 2)]
+        around = service.around('c', radius=1)
+        assert [(e['employee_id'], e['rank']) for e in around] == [('b', 2), ('c', 2), ('d', 4)]
+        assert service.around('zz') == []
+
+    def test_record_points_updates_loaded_boards(self, service):
+        service.rank('d')
+        service.rank('d', 'weekly')
+        service.record_points('d', 250, 350)
+        assert service.rank('d') == {'rank': 1, 'score': 350, 'total': 5}
+        assert service.rank('d', 'weekly')['score'] == 350
+
+    def test_unknown_board(self, service):
+        with pytest.raises(ValueError):
+            service.top(board='monthly')
+
+
+class TestRedisLeaderboard:
+    """Redis 보드 적재/갱신 테스트"""
+
+    @pytest.fixture
+    def redis_service(self, monkeypatch):
+        import fakeredis
+
+        client = fakeredis.FakeRedis(decode_responses=True)
+        monkeypatch.setattr(LeaderboardService, '_redis', staticmethod(lambda: client))
+        return LeaderboardService(), client
+
+    def test_all_time_board_expires(self, redis_service, monkeypatch):
+        service, client = redis_service
+        monkeypatch.setattr(LeaderboardService, 'load_scores', staticmethod(lambda period, members=None: {'a': 10}))
+        service.rank('a')
+        assert 0 < client.ttl('leaderboard:all') <= LeaderboardService.BOARD_TTL['all_time']
+
+    def test_points_during_rebuild_are_kept(self, redis_service, monkeypatch):
+        service, client = redis_service
+        db_scores = {'a': 100, 'b': 50}
+
+        def load_scores(period, members=None):
+            snapshot = dict(db_scores)
+            if members is None and 'c' not in db_scores:
+                # 적재 조회 직후 다른 요청의 적립이 커밋됨
+                db_scores['c'] = 200
+                service.record_points('c', 200, 200)
+            return {m: s for m, s in snapshot.items() if members is None or m in members}
+
+        monkeypatch.setattr(LeaderboardService, 'load_scores', staticmethod(load_scores))
+        assert service.rank('c') == {'rank': 1, 'score': 200, 'total': 3}
+        assert not client.exists('leaderboard:all:rebuilding', 'leaderboard:all:changed')
+
+        service.record_points('a', 150, 250)
+        assert service.top(1) == [{'employee_id': 'a', 'score': 250, 'rank': 1}]
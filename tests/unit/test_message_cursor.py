@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+채팅 메시지 페이지 커서 단위 테스트
+커서 인코딩과 (created_at, id) 키셋 페이지 조회를 검증합니다.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from backend.app.extensions import db
+from backend.models.app_models import ChatMessage
+from backend.utils.utils_query_optimizer import QueryOptimizer
+
+START = datetime(2026, 3, 1, 12, 0)
+
+
+class TestMessageCursor:
+    """(created_at, id) 커서 인코딩 테스트"""
+
+    def test_round_trip(self):
+        message = SimpleNamespace(id=1234, created_at=datetime(2026, 3, 1, 12, 30, 5, 123456))
+
+        cursor = QueryOptimizer.encode_message_cursor(message)
+
+        assert '=' not in cursor
+        assert QueryOptimizer.decode_message_cursor(cursor) == (message.created_at, 1234)
+
+    def test_round_trip_without_microseconds(self):
+        message = SimpleNamespace(id=7, created_at=datetime(2026, 3, 1, 12, 0))
+
+        cursor = QueryOptimizer.encode_message_cursor(message)
+
+        assert QueryOptimizer.decode_message_cursor(cursor) == (message.created_at, 7)
+
+    def test_message_without_created_at_has_no_cursor(self):
+        assert QueryOptimizer.encode_message_cursor(SimpleNamespace(id=7, created_at=None)) is None
+
+    @pytest.mark.parametrize('cursor', ['zzz', '', 'bm90LWEtY3Vyc29y', 'MjAyNi0wMS0wMXxhYmM'])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError):
+            QueryOptimizer.decode_message_cursor(cursor)
+
+
+@pytest.fixture
+def chat():
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        ChatMessage.__table__.create(db.engine)
+        # 1분 간격 메시지 6개 (4번째는 삭제됨), 다른 채팅방 메시지 1개
+        for n in range(6):
+            db.session.add(ChatMessage(chat_type='party', chat_id=1, sender_employee_id='1', sender_nickname='a',
+                                       message=f"m{n}", is_deleted=n == 3, created_at=START + timedelta(minutes=n)))
+        db.session.add(ChatMessage(chat_type='party', chat_id=2, sender_employee_id='1', sender_nickname='a',
+                                   message='other', created_at=START))
+        db.session.commit()
+        yield
+        db.session.remove()
+
+
+def _texts(page):
+    return [message.message for message in page['messages']]
+
+
+class TestMessagePage:
+    """키셋 페이지 조회 테스트"""
+
+    def test_latest_page_then_before(self, chat):
+        page = QueryOptimizer.get_message_page('party', 1, limit=2)
+        assert _texts(page) == ['m5', 'm4'] and page['has_more']
+
+        page = QueryOptimizer.get_message_page('party', 1, limit=2, before=page['before_cursor'])
+        assert _texts(page) == ['m3', 'm2'] and page['has_more']
+
+        page = QueryOptimizer.get_message_page('party', 1, limit=2, before=page['before_cursor'])
+        assert _texts(page) == ['m1', 'm0'] and not page['has_more']
+
+    def test_after_returns_newer_messages_latest_first(self, chat):
+        oldest = QueryOptimizer.get_message_page('party', 1, limit=6)['before_cursor']
+
+        page = QueryOptimizer.get_message_page('party', 1, limit=3, after=oldest)
+        assert _texts(page) == ['m3', 'm2', 'm1'] and page['has_more']
+
+        page = QueryOptimizer.get_message_page('party', 1, limit=3, after=page['after_cursor'])
+        assert _texts(page) == ['m5', 'm4'] and not page['has_more']
+
+    def test_exact_limit_has_no_more(self, chat):
+        page = QueryOptimizer.get_message_page('party', 1, limit=6)
+        assert len(page['messages']) == 6 and not page['has_more']
+
+    def test_deleted_messages_can_be_excluded(self, chat):
+        page = QueryOptimizer.get_message_page('party', 1, limit=10, include_deleted=False)
+        assert _texts(page) == ['m5', 'm4', 'm2', 'm1', 'm0']
+
+    def test_message_without_created_at_does_not_break_page(self, chat):
+        db.session.add(ChatMessage(chat_type='party', chat_id=3, sender_employee_id='1', sender_nickname='a',
+                                   message='legacy'))
+        db.session.flush()
+        db.session.execute(db.update(ChatMessage).where(ChatMessage.chat_id == 3).values(created_at=None))
+        db.session.add(ChatMessage(chat_type='party', chat_id=3, sender_employee_id='1', sender_nickname='a',
+                                   message='new', created_at=START))
+        db.session.commit()
+
+        page = QueryOptimizer.get_message_page('party', 3, limit=10)
+        assert sorted(_texts(page)) == ['legacy', 'new']
+        assert page['before_cursor'] == page['after_cursor'] == QueryOptimizer.encode_message_cursor(
+            next(message for message in page['messages'] if message.message == 'new'))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+파티 참가 서비스 단위 테스트
+정원/중복 참여 판정을 좌석 확보 결과(PartyMembershipService.join)로 하고 도메인 오류로 바꾸는지 검증합니다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+import structlog
+
+from backend.application.services import party_service as party_service_module
+from backend.application.services.party_service import PartyService
+from backend.core.exceptions import PartyDomainError
+from backend.services.party_membership import ALREADY_MEMBER, JOINED, PARTY_FULL, PartyMembershipService
+
+
+class _FakeUnitOfWork:
+    def __init__(self):
+        party = SimpleNamespace(is_active=True, is_past=lambda: False, is_host=lambda user_id: user_id == 1)
+        self.parties = SimpleNamespace(find_by_id=lambda party_id: party)
+        self.users = SimpleNamespace(
+            find_by_employee_id=lambda employee_id: SimpleNamespace(id=SimpleNamespace(value=2))
+        )
+        # 멤버 저장소로 직접 추가하면 좌석 확보 없이 정원을 넘길 수 있음
+        self.party_members = SimpleNamespace(save=lambda member: pytest.fail('좌석 확보 없이 멤버 추가'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def join_result(monkeypatch):
+    # 서비스는 structlog 형식(키워드 인자)으로 로그를 남김
+    monkeypatch.setattr(party_service_module, 'logger', structlog.get_logger())
+    calls = []
+
+    def set_result(result):
+        def join(party_id, employee_id):
+            calls.append((party_id, employee_id))
+            return result
+        monkeypatch.setattr(PartyMembershipService, 'join', staticmethod(join))
+        return calls
+
+    return set_result
+
+
+def test_join_reserves_seat(join_result):
+    calls = join_result(JOINED)
+    assert PartyService(_FakeUnitOfWork()).join_party(7, 'E2') is True
+    assert calls == [(7, 'E2')]
+
+
+@pytest.mark.parametrize('result, message', [
+    (PARTY_FULL, '가득 찼습니다'),
+    (ALREADY_MEMBER, '이미 참가한 파티'),
+])
+def test_rejections_become_domain_errors(join_result, result, message):
+    join_result(result)
+    with pytest.raises(PartyDomainError, match=message):
+        PartyService(_FakeUnitOfWork()).join_party(7, 'E2')
+
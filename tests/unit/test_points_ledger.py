@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+포인트 원장 버퍼 기록기 단위 테스트
+버퍼 내 중복 키 차단, 기록 실패 시 재시도/포기, SQL 레벨 계산식을 검증합니다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, literal, select
+
+from backend.services import points_ledger as ledger_module
+from backend.services.points_ledger import APPLIED, DUPLICATE, FAILED, PointsLedgerWriter
+from backend.utils.points_system import PointsSystem
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    monkeypatch.setattr(ledger_module, 'db', SimpleNamespace(session=SimpleNamespace(rollback=lambda: None)))
+    monkeypatch.setattr(PointsLedgerWriter, 'is_running', property(lambda self: True))
+    return PointsLedgerWriter()
+
+
+class TestBuffer:
+    """버퍼링 테스트"""
+
+    def test_pending_key_is_accepted_once(self, writer):
+        assert writer.submit('1', 'review_write', 10, idempotency_key='review:1')
+        # 재시도는 성공으로 응답하지만 버퍼에는 한 번만 들어감
+        assert writer.submit('1', 'review_write', 10, idempotency_key='review:1')
+        assert writer.submit('1', 'review_write', 10)
+        assert writer.get_stats()['buffered'] == 2
+        assert writer.get_stats()['duplicates'] == 1
+
+    def test_recorded_key_retry_succeeds_when_waiting(self, writer, monkeypatch):
+        def write(batch):
+            for entry in batch:
+                entry['status'] = DUPLICATE
+            return []
+
+        monkeypatch.setattr(PointsLedgerWriter, '_write', staticmethod(write))
+        assert writer.submit('1', 'review_write', 10, idempotency_key='review:1', wait=True)
+        assert writer.get_stats()['applied'] == 0
+
+    def test_flush_writes_whole_buffer_once(self, writer, monkeypatch):
+        batches = []
+
+        def write(batch):
+            batches.append(list(batch))
+            for entry in batch:
+                entry['status'] = APPLIED
+            return batch
+
+        monkeypatch.setattr(PointsLedgerWriter, '_write', staticmethod(write))
+        for n in range(5):
+            writer.submit(str(n % 2), 'review_write', 10, idempotency_key=f"k{n}")
+        assert writer.flush() == 5
+        assert len(batches) == 1 and len(batches[0]) == 5
+        # 기록된 키는 버퍼 중복 확인 대상에서 빠지고 DB 확인으로 넘어감
+        assert writer.submit('0', 'review_write', 10, idempotency_key='k0')
+
+    def test_failed_flush_requeues_then_gives_up(self, writer, monkeypatch):
+        def write(batch):
+            raise RuntimeError('db down')
+
+        monkeypatch.setattr(PointsLedgerWriter, '_write', staticmethod(write))
+        writer.submit('1', 'review_write', 10, idempotency_key='k')
+        entry = writer._buffer[0]
+
+        for _ in range(PointsLedgerWriter.MAX_ATTEMPTS - 1):
+            assert writer.flush() == 0
+            assert writer._buffer == [entry]
+        writer.flush()
+        assert writer._buffer == [] and entry['status'] == FAILED
+        assert writer.get_stats()['failed'] == 1
+        assert writer.submit('1', 'review_write', 10, idempotency_key='k')
+
+    def test_overlong_fields_are_rejected(self, writer):
+        assert not writer.submit('1', 'x' * 51, 10)
+        assert not writer.submit('1', 'review_write', 10, idempotency_key='k' * 129)
+        assert writer.get_stats()['buffered'] == 0
+        assert writer.get_stats()['invalid'] == 2
+
+    def test_bad_entry_does_not_fail_the_batch(self, writer, monkeypatch):
+        batches = []
+
+        def write(batch):
+            batches.append(len(batch))
+            if any(entry['description'] == 'bad' for entry in batch):
+                raise RuntimeError('value too long')
+            for entry in batch:
+                entry['status'] = APPLIED
+            return batch
+
+        monkeypatch.setattr(PointsLedgerWriter, '_write', staticmethod(write))
+        for n in range(4):
+            writer.submit(str(n), 'review_write', 10, description='bad' if n == 2 else None,
+                          idempotency_key=f"k{n}")
+        entries = list(writer._buffer)
+
+        # 첫 실패는 배치 그대로 재시도, 다시 실패하면 한 건씩 기록
+        assert writer.flush() == 0
+        assert writer.flush() == 3
+        assert batches[:2] == [4, 4] and batches[2:] == [1, 1, 1, 1]
+        assert [entry['status'] for entry in entries] == [APPLIED, APPLIED, None, APPLIED]
+        assert writer._buffer == [entries[2]]
+
+        while writer._buffer:
+            writer.flush()
+        assert entries[2]['status'] == FAILED
+        assert writer.get_stats()['failed'] == 1
+        assert writer.get_stats()['applied'] == 3
+
+
+class TestLevelExpression:
+    """SQL 레벨 계산식 테스트"""
+
+    def test_matches_calculate_level(self):
+        engine = create_engine('sqlite://')
+        samples = [0, 4999, 5000, 14999, 15000, 49999, 79999, 119999, 199999, 200000, 999999]
+        with engine.connect() as connection:
+            for points in samples:
+                level = connection.execute(select(PointsSystem.level_expression(literal(points)))).scalar()
+                assert level == PointsSystem.calculate_level(points)
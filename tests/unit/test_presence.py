@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+실시간 접속 현황 레지스트리 단위 테스트
+여러 워커(레지스트리 인스턴스)가 같은 Redis를 공유할 때의 세션 집계, 만료, 알림 대상 결정을 검증합니다.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from flask_socketio import SocketIO
+
+from backend.realtime import notification_system as notification_module
+from backend.realtime.notification_system import NotificationSystem
+from backend.realtime.presence import ONLINE_KEY, PresenceRegistry
+from backend.utils import notification_manager as manager_module
+from backend.utils.notification_manager import NotificationManager
+
+fakeredis = pytest.importorskip('fakeredis')
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def workers(redis_client):
+    return PresenceRegistry(redis_client), PresenceRegistry(redis_client)
+
+
+class TestSharedPresence:
+    """Redis 공유 접속 현황 테스트"""
+
+    def test_sessions_across_workers(self, workers):
+        first, second = workers
+        assert first.connect('u1', 'sid-a')
+        assert not second.connect('u1', 'sid-b')
+        assert second.is_online('u1')
+        assert sorted(first.sessions('u1')) == ['sid-a', 'sid-b']
+
+        # 다른 워커에 세션이 남아 있으면 온라인 유지
+        assert first.disconnect('sid-a') == ('u1', False)
+        assert first.is_online('u1')
+        assert second.disconnect('sid-b') == ('u1', True)
+        assert not first.is_online('u1')
+        # 이 워커의 세션이 아니면 무시
+        assert first.disconnect('sid-b') == (None, False)
+
+    def test_online_users_filter(self, workers):
+        first, second = workers
+        first.connect('u1', 'sid-a')
+        second.connect('u2', 'sid-b')
+        assert sorted(first.online_users()) == ['u1', 'u2']
+        assert second.online_users(['u2', 'u3', 'u1']) == ['u2', 'u1']
+        assert first.online_users([]) == []
+
+    def test_crashed_worker_expires(self, workers, redis_client, monkeypatch):
+        first, second = workers
+        now = [1_000_000.0]
+        monkeypatch.setattr('backend.realtime.presence.time.time', lambda: now[0])
+        first.connect('u1', 'sid-a')
+        second.connect('u2', 'sid-b')
+
+        # second 워커는 해제를 기록하지 못하고 종료, first만 하트비트
+        now[0] += PresenceRegistry.TTL_SECONDS - 1
+        assert first.heartbeat() == 1
+        now[0] += 2
+        first.heartbeat()
+        assert first.is_online('u1')
+        assert not first.is_online('u2')
+        assert redis_client.zscore(ONLINE_KEY, 'u2') is None
+
+    def test_reauthenticate_as_other_user(self, workers):
+        first, _ = workers
+        first.connect('u1', 'sid-a')
+        first.connect('u2', 'sid-a')
+        assert not first.is_online('u1')
+        assert first.sessions('u2') == ['sid-a']
+
+
+class TestLocalPresence:
+    """Redis가 없을 때 (단일 프로세스) 테스트"""
+
+    def test_memory_registry(self, monkeypatch):
+        registry = PresenceRegistry()
+        monkeypatch.setattr(registry, '_redis', lambda: None)
+        assert registry.connect('u1', 'sid-a')
+        assert not registry.connect('u1', 'sid-b')
+        assert registry.online_users(['u1', 'u2']) == ['u1']
+        assert registry.disconnect('sid-a') == ('u1', False)
+        assert registry.disconnect('sid-b') == ('u1', True)
+        assert not registry.is_online('u1')
+
+
+class TestNotificationFanout:
+    """알림 전송 대상 결정 테스트"""
+
+    def test_bulk_notification_emits_to_online_users_only(self, workers, monkeypatch):
+        first, second = workers
+        first.connect('u1', 'sid-a')
+        second.connect('u3', 'sid-c')
+        sent = []
+        monkeypatch.setattr(notification_module, 'emit_to_users',
+                            lambda user_ids, event, data: sent.append((user_ids, event)) or True)
+
+        statements, commits = [], []
+        session = SimpleNamespace(
+            execute=lambda statement, rows=None: statements.append(rows),
+            commit=lambda: commits.append(True),
+            rollback=lambda: None,
+        )
+        system = NotificationSystem(socketio=None, db=SimpleNamespace(session=session))
+        system.presence = first
+        assert system.send_bulk_notification(['u1', 'u2', 'u3', 'u1'], 'party_invite') == 2
+        # 수신자 전원을 INSERT 한 번, 커밋 한 번으로 저장
+        assert len(statements) == 1 and [row['user_id'] for row in statements[0]] == ['u1', 'u2', 'u3']
+        assert {(row['chat_type'], row['chat_id']) for row in statements[0]} == {('system', 0)}
+        assert len(commits) == 1
+        # 접속한 사용자 방 목록으로 한 번만 전송
+        assert sent == [(['u1', 'u3'], 'new_notification')]
+
+    def test_party_notification_is_saved_per_participant(self, workers, monkeypatch):
+        first, _ = workers
+        monkeypatch.setattr(notification_module, 'emit_to_users', lambda user_ids, event, data: True)
+        statements = []
+        session = SimpleNamespace(
+            execute=lambda statement, rows=None: statements.append(rows),
+            commit=lambda: None,
+            rollback=lambda: None,
+        )
+        system = NotificationSystem(socketio=None, db=SimpleNamespace(session=session))
+        system.presence = first
+        monkeypatch.setattr(system, 'get_party_participants', lambda party_id: ['u1', 'u2', 'host'])
+
+        system.send_party_notification(7, 'party_update', exclude_user='host')
+        assert [(row['user_id'], row['chat_type'], row['chat_id']) for row in statements[0]] == [
+            ('u1', 'party', 7), ('u2', 'party', 7)
+        ]
+        assert statements[0][0]['title'] == '파티 정보 변경'
+
+    def test_manager_bulk_notification_single_transaction(self, workers, monkeypatch):
+        first, _ = workers
+        first.connect('u1', 'sid-a')
+        statements, commits, sent = [], [], []
+        session = SimpleNamespace(
+            execute=lambda statement, rows=None: statements.append(rows),
+            commit=lambda: commits.append(True),
+            rollback=lambda: None,
+        )
+        monkeypatch.setattr(manager_module, 'db', SimpleNamespace(session=session))
+        monkeypatch.setattr(manager_module, 'presence', first)
+        monkeypatch.setattr(manager_module, 'emit_to_users',
+                            lambda user_ids, event, data: sent.append((user_ids, event)) or True)
+        manager = NotificationManager()
+        # u2는 메시지 알림을 껐고, 나머지는 설정이 없으면 전송
+        monkeypatch.setattr(manager, '_load_settings', lambda user_ids: {
+            'u2': SimpleNamespace(message_notifications=False),
+        })
+
+        success, message = manager.send_bulk_notification(
+            ['u1', 'u2', 'u3', 'u1'], 'new_message', '새 메시지', '안녕하세요',
+            chat_type='party', chat_id=1,
+        )
+        assert success and '성공 2개, 실패 1개' in message
+        assert len(statements) == 1 and [row['user_id'] for row in statements[0]] == ['u1', 'u3']
+        assert len(commits) == 1
+        assert sent == [(['u1'], 'new_notification')]
+
+        # 채팅 정보가 없으면 저장할 수 없으므로 바로 실패
+        assert not manager.send_bulk_notification(['u1'], 'new_message', '새 메시지', '안녕하세요')[0]
+
+
+class TestChatSocket:
+    """채팅 소켓 이벤트 테스트"""
+
+    def test_join_chat_does_not_trust_payload_user(self, workers, monkeypatch):
+        # backend.app 초기화가 이 모듈을 불러오므로 앱 패키지가 먼저 로드된 뒤 import
+        from backend.realtime import advanced_chat_system as chat_module
+
+        registry, _ = workers
+        monkeypatch.setattr(chat_module, 'presence', registry)
+        app = Flask(__name__)
+        socketio = SocketIO(app, async_mode='threading')
+        chat_module.AdvancedChatSystem(socketio)
+
+        client = socketio.test_client(app)
+        client.emit('join_chat', {'chat_type': 'party', 'chat_id': 1, 'user_id': 'victim'})
+
+        rooms = socketio.server.manager.rooms['/']
+        assert 'party_1' in rooms
+        # 인증하지 않은 세션은 다른 사용자의 알림 방에 참가하거나 접속 현황에 등록되지 않음
+        assert 'user_victim' not in rooms
+        assert not registry.is_online('victim')
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+활동 진행 카운터 단위 테스트
+기간 키 계산, 요구사항 → 카운터 표, 카운터 기반 배지/챌린지 진행률을 검증합니다.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from backend.models.app_models import ActivityCounter
+from backend.services import progress_counters as counters_module
+from backend.services.progress_counters import (
+    ALL_TIME,
+    DISTINCT_ACTIVITY_TYPES,
+    REQUIREMENT_COUNTERS,
+    ProgressCounterService,
+    distinct,
+    period_keys,
+    period_start,
+    requirement_progress,
+)
+from backend.utils.badge_system import BadgeSystem
+from backend.utils.challenge_system import ChallengeSystem
+
+
+class TestPeriods:
+    """기간 키 테스트"""
+
+    def test_period_keys(self):
+        assert period_keys(datetime(2026, 10, 17, 12, 30)) == [
+            ALL_TIME, 'day:2026-10-17', 'week:2026-W42', 'month:2026-10'
+        ]
+        # ISO 주는 연도를 넘어갈 수 있음
+        assert period_keys(datetime(2027, 1, 1))[2] == 'week:2026-W53'
+
+    def test_period_start(self):
+        assert period_start('day:2026-10-17') == datetime(2026, 10, 17)
+        assert period_start('week:2026-W42') == datetime(2026, 10, 12)
+        assert period_start('month:2026-10') == datetime(2026, 10, 1)
+        assert period_start(ALL_TIME) == datetime.min
+
+    def test_current_period(self):
+        moment = datetime(2026, 10, 17)
+        assert ProgressCounterService.current_period('daily', moment) == 'day:2026-10-17'
+        assert ProgressCounterService.current_period('weekly', moment) == 'week:2026-W42'
+        assert ProgressCounterService.current_period('special', moment) == ALL_TIME
+
+
+class TestRequirementCounters:
+    """요구사항 → 카운터 표 테스트"""
+
+    def test_every_badge_requirement_is_mapped(self):
+        for badge in BadgeSystem.get_all_badges():
+            assert badge.requirement_type in REQUIREMENT_COUNTERS
+
+    def test_every_challenge_requirement_is_mapped(self):
+        for challenges in ChallengeSystem.get_user_challenges('1').values():
+            for challenge in challenges:
+                for requirement_type, _ in challenge.requirement_items():
+                    assert requirement_type in REQUIREMENT_COUNTERS
+
+    def test_progress_sums_mapped_counters(self):
+        counts = {'party_participate': 2, 'random_lunch_participate': 3, 'emotion_expression': 9,
+                  distinct('emotion_expression'): 4}
+        assert requirement_progress(counts, 'social_activity_count') == 5
+        assert requirement_progress(counts, 'emotion_variety') == 4
+        assert requirement_progress(counts, 'unknown') == 0
+        assert 'emotion_expression' in DISTINCT_ACTIVITY_TYPES
+
+
+class TestProgressFromCounters:
+    """카운터 기반 배지/챌린지 진행률 테스트"""
+
+    def test_badge_progress(self):
+        badge = next(b for b in BadgeSystem.get_all_badges() if b.badge_id == 'explorer_start')
+        assert BadgeSystem.check_badge_earned('1', badge, {'restaurant_visit': 4}) == (False, 4)
+        assert BadgeSystem.check_badge_earned('1', badge, {'restaurant_visit': 10}) == (True, 10)
+
+    def test_challenge_uses_its_period(self):
+        weekly = next(c for c in ChallengeSystem.get_weekly_challenges() if c.id == 'weekly_2')
+        special = next(c for c in ChallengeSystem.get_special_challenges() if c.id == 'special_first_party')
+        now = ProgressCounterService.now()
+        day_key, week_key = period_keys(now)[1:3]
+        counts = {
+            ALL_TIME: {'first_party': 1, 'party_participate': 9},
+            day_key: {'party_participate': 1},
+            week_key: {'party_participate': 1, 'random_lunch_participate': 1},
+        }
+        assert weekly.requirement_count == 3
+        assert ChallengeSystem.check_challenge_progress('1', weekly, counts) == (2, False)
+
+        counts[week_key]['random_lunch_participate'] = 5
+        assert ChallengeSystem.check_challenge_progress('1', weekly, counts) == (3, True)
+        assert ChallengeSystem.check_challenge_progress('1', special, counts) == (1, True)
+
+
+class _RacingSession:
+    """기존 행 조회 직후 다른 요청이 카운터 행 하나를 먼저 만드는 세션"""
+
+    def __init__(self, session, competing_row):
+        self.session = session
+        self.competing_row = competing_row
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def execute(self, statement, *args, **kwargs):
+        result = self.session.execute(statement, *args, **kwargs)
+        if isinstance(statement, Select) and self.competing_row:
+            rows = list(result.tuples())
+            self.session.execute(insert(ActivityCounter), [self.competing_row])
+            self.competing_row = None
+            return SimpleNamespace(tuples=lambda: rows)
+        return result
+
+
+class TestIncrement:
+    """카운터 증가 테스트"""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine('sqlite://')
+        ActivityCounter.__table__.create(engine)
+        with Session(engine) as session:
+            yield session
+
+    @staticmethod
+    def _counts(session):
+        return dict(session.execute(
+            select(ActivityCounter.period, ActivityCounter.count).where(ActivityCounter.user_id == '1')
+        ).tuples().all())
+
+    def test_creates_and_bumps_rows(self, session, monkeypatch):
+        monkeypatch.setattr(counters_module, 'db', SimpleNamespace(session=session))
+        periods = period_keys(datetime(2026, 10, 17))
+        ProgressCounterService._increment('1', ['review_write'], periods, 2)
+        ProgressCounterService._increment('1', ['review_write'], periods[:2])
+        assert self._counts(session) == dict.fromkeys(periods, 2) | dict.fromkeys(periods[:2], 3)
+
+    def test_row_created_concurrently_keeps_other_rows(self, session, monkeypatch):
+        periods = period_keys(datetime(2026, 10, 17))
+        competing_row = {'user_id': '1', 'activity_type': 'review_write', 'period': ALL_TIME, 'count': 5}
+        monkeypatch.setattr(counters_module, 'db', SimpleNamespace(session=_RacingSession(session, competing_row)))
+
+        ProgressCounterService._increment('1', ['review_write'], periods)
+
+        # 누적 행은 증가, 나머지 기간 행은 새로 생성
+        assert self._counts(session) == {ALL_TIME: 6, **dict.fromkeys(periods[1:], 1)}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+식당 검색 색인 단위 테스트
+한글 부분 문자열 검색, 관련도 정렬, 오타 허용, 자동완성을 검증합니다.
+"""
+
+import pytest
+
+from backend.services.restaurant_search import RestaurantSearchIndex
+
+
+ROWS = [
+    (1, "맛있는 김치찌개", "한식", "서울시 강남구 역삼동", 4.0),
+    (2, "김치찌개 전문점", "한식", "서울시 서초구", 4.5),
+    (3, "북경 반점", "중식", "서울시 강남구", 3.5),
+    (4, "스시 오마카세", "일식", "성남시 분당구", 4.8),
+    (5, "강남 돈까스", "일식", "서울시 강남구 논현동", 4.1),
+]
+
+
+@pytest.fixture
+def index():
+    search_index = RestaurantSearchIndex(lambda: None)
+    search_index.load(ROWS)
+    return search_index
+
+
+def ids(results):
+    return [restaurant_id for restaurant_id, _ in results]
+
+
+class TestRestaurantSearchIndex:
+    """검색 색인 테스트"""
+
+    def test_korean_substring_match(self, index):
+        """단어 중간의 한글 부분 문자열도 검색"""
+        assert set(ids(index.search("김치"))) == {1, 2}
+        assert ids(index.search("오마카")) == [4]
+
+    def test_whitespace_insensitive(self, index):
+        """검색어/식당명의 띄어쓰기 차이 무시"""
+        assert ids(index.search("스시오마카세")) == [4]
+
+    def test_multi_term_requires_all_terms(self, index):
+        """여러 단어는 모두 포함되어야 함"""
+        assert ids(index.search("강남 일식")) == [5]
+
+    def test_name_match_ranks_above_address(self, index):
+        """식당명 일치가 주소 일치보다 우선"""
+        results = ids(index.search("강남"))
+        assert results[0] == 5
+        assert set(results) == {1, 3, 5}
+
+    def test_prefix_match_ranks_above_infix(self, index):
+        """식당명 접두어 일치가 중간 일치보다 우선"""
+        assert ids(index.search("김치찌개")) == [2, 1]
+
+    def test_fuzzy_fallback(self, index):
+        """일치 결과가 없으면 오타를 허용"""
+        assert ids(index.search("김치찌게")) and set(ids(index.search("김치찌게"))) <= {1, 2}
+        assert index.search("김치찌게", fuzzy=False) == []
+
+    def test_no_match(self, index):
+        assert index.search("파스타") == []
+        assert index.search("   ") == []
+
+    def test_autocomplete(self, index):
+        """식당명 및 식당명 내 단어 접두어 자동완성"""
+        assert [s['id'] for s in index.autocomplete("김치")] == [2, 1]
+        assert [s['id'] for s in index.autocomplete("오마")] == [4]
+        assert index.autocomplete("") == []
+
+    def test_upsert_and_remove(self, index):
+        """증분 갱신 반영"""
+        index.upsert(3, "북경 짜장", "중식", "서울시 강남구", 3.5)
+        assert index.search("반점") == []
+        assert ids(index.search("짜장")) == [3]
+
+        index.remove(3)
+        assert index.search("짜장") == []
+        assert index.autocomplete("북경") == []
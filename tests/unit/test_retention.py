@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+데이터 보존 정책 단위 테스트
+묶음 단위 삭제와 회수 크기 집계, 조건 밖 행 보존, 임시 파일 정리를 검증합니다.
+"""
+
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import Boolean, Column, DateTime, Integer, Text, create_engine, func, select
+from sqlalchemy.orm import Session, declarative_base
+
+from backend.services import retention as retention_module
+from backend.services.retention import RetentionPolicy, RetentionService
+
+Base = declarative_base()
+
+
+class Note(Base):
+    __tablename__ = 'note'
+
+    id = Column(Integer, primary_key=True)
+    body = Column(Text, nullable=False)
+    is_read = Column(Boolean, default=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+NOW = datetime(2026, 1, 31)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    monkeypatch.setattr(retention_module, 'db', SimpleNamespace(session=session, engine=engine))
+    monkeypatch.setattr(RetentionPolicy, 'resolve_model', lambda self: Note)
+    yield session
+    session.close()
+
+
+def _policy(batch_size):
+    return RetentionPolicy(
+        name='notes',
+        model_path='unused:Note',
+        condition=lambda model, cutoff: model.is_read.is_(True) & (model.created_at < cutoff),
+        max_age=timedelta(days=30),
+        size_columns=('body',),
+        batch_size=batch_size,
+    )
+
+
+class TestRowPolicies:
+    """테이블 정책 테스트"""
+
+    def test_deletes_in_batches_and_reports_size(self, session):
+        old = NOW - timedelta(days=40)
+        session.add_all([Note(body='x' * 10, is_read=True, created_at=old) for _ in range(7)])
+        # 읽지 않았거나 최근 행은 보존
+        session.add(Note(body='keep', is_read=False, created_at=old))
+        session.add(Note(body='keep', is_read=True, created_at=NOW))
+        session.commit()
+
+        result = RetentionService.purge(_policy(batch_size=3), now=NOW, pause=0)
+        assert result['rows'] == 7 and result['bytes'] == 70
+        assert result['batches'] == 3
+        assert session.scalar(select(func.count()).select_from(Note)) == 2
+
+    def test_max_batches_leaves_rest_for_next_run(self, session):
+        session.add_all([Note(body='x', is_read=True, created_at=NOW - timedelta(days=40)) for _ in range(5)])
+        session.commit()
+
+        result = RetentionService.purge(_policy(batch_size=2), now=NOW, pause=0, max_batches=1)
+        assert result['rows'] == 2
+        assert RetentionService.purge(_policy(batch_size=2), now=NOW, pause=0)['rows'] == 3
+
+
+class TestTempFiles:
+    """임시 파일 정리 테스트"""
+
+    def test_removes_only_old_files(self, tmp_path, monkeypatch):
+        (tmp_path / 'upload.bin').write_bytes(b'a' * 100)
+        created = os.stat(tmp_path / 'upload.bin').st_ctime
+
+        # 보존 기간 안이면 유지
+        monkeypatch.setattr(retention_module.time, 'time', lambda: created + 3600)
+        assert RetentionService.purge_temp_files(str(tmp_path), timedelta(hours=2), pause=0)['rows'] == 0
+        assert (tmp_path / 'upload.bin').exists()
+
+        monkeypatch.setattr(retention_module.time, 'time', lambda: created + 3 * 3600)
+        result = RetentionService.purge_temp_files(str(tmp_path), timedelta(hours=2), pause=0)
+        assert result['rows'] == 1 and result['bytes'] == 100
+        assert not (tmp_path / 'upload.bin').exists()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+반복 일정 구체화 단위 테스트
+발생 날짜 계산(첫 발생일로 바로 이동), 예외 적용, 구체화 범위 판정을 검증합니다.
+"""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.schedule_materializer import ScheduleMaterializer
+from backend.services.schedule_service import ScheduleService
+
+
+def make_master(**overrides):
+    values = {
+        'id': 1,
+        'employee_id': '1',
+        'title': '점심',
+        'time': '12:00',
+        'restaurant': '식당',
+        'location': '1층',
+        'description': None,
+        'start_date': datetime(2025, 1, 6),
+        'is_recurring': True,
+        'recurrence_type': 'weekly',
+        'recurrence_interval': 1,
+        'recurrence_end_date': None,
+        'materialized_from': None,
+        'materialized_until': None,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def walk_dates(master, start_date, end_date):
+    """하루씩 걸으며 계산하는 기준 구현 (daily/weekly)"""
+    step = master.recurrence_interval * (7 if master.recurrence_type == 'weekly' else 1)
+    current = master.start_date.date()
+    last = min(end_date, master.recurrence_end_date.date()) if master.recurrence_end_date else end_date
+    dates = []
+    while current <= last:
+        if current >= start_date:
+            dates.append(current)
+        current += timedelta(days=step)
+    return dates
+
+
+class TestOccurrenceDates:
+    """발생 날짜 계산 테스트"""
+
+    @pytest.mark.parametrize('recurrence_type,interval', [('daily', 1), ('daily', 3), ('weekly', 1), ('weekly', 2)])
+    def test_matches_day_by_day_walk(self, recurrence_type, interval):
+        master = make_master(recurrence_type=recurrence_type, recurrence_interval=interval,
+                             recurrence_end_date=datetime(2026, 11, 20))
+        for start_date, end_date in [(date(2024, 12, 1), date(2025, 2, 1)),
+                                     (date(2026, 10, 1), date(2026, 10, 31)),
+                                     (date(2026, 11, 15), date(2026, 12, 31))]:
+            assert ScheduleService.occurrence_dates(master, start_date, end_date) == \
+                walk_dates(master, start_date, end_date)
+
+    def test_monthly_skips_missing_days(self):
+        master = make_master(recurrence_type='monthly', start_date=datetime(2026, 1, 31))
+        dates = ScheduleService.occurrence_dates(master, date(2026, 1, 1), date(2026, 6, 30))
+        assert dates == [date(2026, 1, 31), date(2026, 3, 31), date(2026, 5, 31)]
+
+    def test_monthly_interval_starts_inside_window(self):
+        master = make_master(recurrence_type='monthly', recurrence_interval=2, start_date=datetime(2025, 1, 10))
+        dates = ScheduleService.occurrence_dates(master, date(2026, 2, 15), date(2026, 7, 31))
+        assert dates == [date(2026, 3, 10), date(2026, 5, 10), date(2026, 7, 10)]
+
+    def test_single_schedule(self):
+        master = make_master(is_recurring=False, start_date=datetime(2026, 10, 21))
+        assert ScheduleService.occurrence_dates(master, date(2026, 10, 1), date(2026, 10, 31)) == [date(2026, 10, 21)]
+        assert ScheduleService.occurrence_dates(master, date(2026, 11, 1), date(2026, 11, 30)) == []
+
+
+class TestScheduleMaterializer:
+    """인스턴스 행 생성 및 범위 판정 테스트"""
+
+    def test_build_rows_applies_exceptions(self):
+        master = make_master()
+        dates = [date(2026, 10, 12), date(2026, 10, 19), date(2026, 10, 26)]
+        exceptions = {
+            date(2026, 10, 19): SimpleNamespace(id=7, is_deleted=True, is_modified=False),
+            date(2026, 10, 26): SimpleNamespace(id=8, is_deleted=False, is_modified=True,
+                                                new_title='회식', new_time=None, new_restaurant=None,
+                                                new_location='2층', new_description=None),
+        }
+        rows = ScheduleMaterializer.build_rows(master, dates, exceptions)
+
+        assert [row['instance_date'] for row in rows] == [date(2026, 10, 12), date(2026, 10, 26)]
+        assert rows[0]['title'] == '점심' and rows[0]['exception_id'] is None
+        assert rows[1]['title'] == '회식'
+        assert rows[1]['time'] == '12:00'
+        assert rows[1]['location'] == '2층'
+        assert rows[1]['exception_id'] == 8
+
+    def test_is_covered(self):
+        master = make_master(materialized_from=date(2026, 7, 1), materialized_until=date(2027, 7, 1))
+        assert ScheduleMaterializer.is_covered(master, date(2026, 10, 1), date(2026, 10, 31))
+        assert not ScheduleMaterializer.is_covered(master, date(2026, 6, 1), date(2026, 7, 31))
+        assert not ScheduleMaterializer.is_covered(master, date(2027, 6, 1), date(2027, 8, 1))
+
+        # 반복 종료 이후 기간은 발생이 없으므로 구체화 범위와 무관
+        ended = make_master(recurrence_end_date=datetime(2026, 8, 1),
+                            materialized_from=date(2026, 7, 1), materialized_until=date(2027, 7, 1))
+        assert ScheduleMaterializer.is_covered(ended, date(2027, 8, 1), date(2027, 8, 31))
+
+        assert not ScheduleMaterializer.is_covered(make_master(), date(2026, 10, 1), date(2026, 10, 31))
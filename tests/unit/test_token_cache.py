@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+인증 토큰 캐시 단위 테스트
+블룸 필터, 검증 토큰 LRU의 만료/용량 제한, 무효화 반영을 검증합니다.
+"""
+
+import time
+
+from backend.auth.token_cache import BloomFilter, TokenCache, token_hash
+
+
+class TestBloomFilter:
+    """블룸 필터 테스트"""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000)
+        hashes = [token_hash(f"token-{i}") for i in range(1000)]
+        for value in hashes:
+            bloom.add(value)
+        assert all(value in bloom for value in hashes)
+        assert bloom.is_full
+
+    def test_false_positive_rate(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(token_hash(f"revoked-{i}"))
+        false_positives = sum(token_hash(f"valid-{i}") in bloom for i in range(10000))
+        assert false_positives < 300
+
+
+class TestTokenCache:
+    """검증 토큰 LRU 테스트"""
+
+    def test_expired_token_is_not_served(self):
+        cache = TokenCache()
+        cache.remember('a', {'user_id': 1, 'exp': time.time() + 60})
+        cache.remember('b', {'user_id': 2, 'exp': time.time() - 1})
+        assert cache.get_verified('a')['user_id'] == 1
+        assert cache.get_verified('b') is None
+
+    def test_lru_eviction(self):
+        cache = TokenCache()
+        cache.MAX_VERIFIED_TOKENS = 2
+        expires = time.time() + 60
+        cache.remember('a', {'exp': expires})
+        cache.remember('b', {'exp': expires})
+        cache.get_verified('a')
+        cache.remember('c', {'exp': expires})
+        assert cache.get_verified('b') is None
+        assert cache.get_verified('a') is not None
+
+    def test_mark_revoked_drops_verified_token(self):
+        cache = TokenCache()
+        hashed = token_hash('token')
+        cache.remember(hashed, {'exp': time.time() + 60})
+        cache.mark_revoked(hashed)
+        assert cache.get_verified(hashed) is None
+        assert hashed in cache._revoked